@@ -1,15 +1,31 @@
 """Audit API endpoints."""
+import json
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from pydantic import BaseModel
 from datetime import datetime
 
-from app.database import get_db
-from app.schemas.audit import AuditPackageResponse, AuditVerifyResponse
+from app.config import get_settings
+from app.database import get_db, async_session_maker
+from app.schemas.audit import (
+    AuditEventPage,
+    AuditEventResponse,
+    AuditPackageResponse,
+    AuditTraceResponse,
+    AuditVerifyResponse,
+)
 from app.schemas.common import CorrelatedResponse
 from app.services.audit import AuditService
+from app.services.audit_export import (
+    EXPORT_FORMATS,
+    build_export_query,
+    get_anchor,
+    stream_ndjson,
+    stream_columnar,
+)
 from app.api.deps import (
     get_correlation_id,
     get_current_user,
@@ -18,6 +34,7 @@ from app.api.deps import (
 )
 from app.models.user import User, UserRole
 from app.models.audit import AuditEvent, AuditEventType
+from app.models.tx_request import TxStatus, TERMINAL_STATUSES
 
 router = APIRouter(prefix="/v1/audit", tags=["Audit"])
 
@@ -31,9 +48,21 @@ class LoginEventResponse(BaseModel):
     correlation_id: str
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: a list of entity tags, compared weakly, or `*`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 @router.get("/packages/{tx_request_id}", response_model=CorrelatedResponse[AuditPackageResponse])
 async def get_audit_package(
     tx_request_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_db),
     audit_service: AuditService = Depends(get_audit_service),
     current_user: User = Depends(require_roles(UserRole.ADMIN, UserRole.COMPLIANCE)),
     correlation_id: str = Depends(get_correlation_id)
@@ -51,28 +80,46 @@ async def get_audit_package(
     - Confirmation status
     - All related audit events
     - Package hash for verification
+
+    Packages of transactions in a terminal state are served from the
+    package cache with an ETag (the package hash) and answer a matching
+    If-None-Match with 304. They change once more when their last events
+    are anchored in a Merkle batch, and are marked immutable after that.
     """
     try:
-        package = await audit_service.build_audit_package(
+        package = await audit_service.get_audit_package(
             tx_request_id,
             correlation_id
         )
-        
-        return CorrelatedResponse(
-            correlation_id=correlation_id,
-            data=package
-        )
+        await db.commit()
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    
+    if TxStatus(package.tx_request["status"]) in TERMINAL_STATUSES:
+        etag = f'"{package.package_hash}"'
+        # Final once every event has its Merkle inclusion proof
+        anchored = len(package.inclusion_proofs) == len(package.audit_events)
+        cache_control = "private, max-age=86400, immutable" if anchored else "private, no-cache"
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+    
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=package
+    )
 
 
 @router.get("/verify", response_model=CorrelatedResponse[AuditVerifyResponse])
 async def verify_audit_chain(
     from_sequence: Optional[int] = Query(None, description="Start verification from this sequence number"),
     to_sequence: Optional[int] = Query(None, description="End verification at this sequence number"),
+    incremental: bool = Query(False, description="Resume after the latest signed checkpoint"),
+    parallel: bool = Query(False, description="Re-hash segments across the verification process pool"),
     audit_service: AuditService = Depends(get_audit_service),
     current_user: User = Depends(require_roles(UserRole.ADMIN)),
     correlation_id: str = Depends(get_correlation_id)
@@ -84,10 +131,17 @@ async def verify_audit_chain(
     - Whether chain is valid (no tampering detected)
     - Number of events verified
     - Any errors found
+
+    With `incremental=true` only events after the latest checkpoint are
+    re-hashed. `parallel=true` spreads the re-hashing over worker processes.
+    This endpoint is read-only; `POST /verify` also records a checkpoint.
     """
     result = await audit_service.verify_chain(
         from_sequence=from_sequence,
-        to_sequence=to_sequence
+        to_sequence=to_sequence,
+        incremental=incremental,
+        parallel=parallel,
+        record_checkpoint=False,
     )
 
     return CorrelatedResponse(
@@ -96,6 +150,202 @@ async def verify_audit_chain(
     )
 
 
+@router.post("/verify", response_model=CorrelatedResponse[AuditVerifyResponse])
+async def checkpoint_audit_chain(
+    incremental: bool = Query(False, description="Resume after the latest signed checkpoint"),
+    parallel: bool = Query(False, description="Re-hash segments across the verification process pool"),
+    db: AsyncSession = Depends(get_db),
+    audit_service: AuditService = Depends(get_audit_service),
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    correlation_id: str = Depends(get_correlation_id)
+):
+    """
+    Verify the audit log hash chain and record a signed checkpoint.
+
+    A clean walk to the chain tail records a checkpoint that later
+    `incremental=true` verifications resume from.
+    """
+    result = await audit_service.verify_chain(
+        incremental=incremental,
+        verified_by=current_user.id,
+        parallel=parallel,
+    )
+    await db.commit()
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=result
+    )
+
+
+@router.get("/export")
+async def export_audit_events(
+    format: str = Query("ndjson", description="Export format: ndjson or columnar (gzip)"),
+    from_sequence: Optional[int] = Query(None, description="First sequence number to export"),
+    to_sequence: Optional[int] = Query(None, description="Last sequence number to export"),
+    from_time: Optional[datetime] = Query(None, description="Export events at or after this time"),
+    to_time: Optional[datetime] = Query(None, description="Export events at or before this time"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_roles(UserRole.ADMIN, UserRole.COMPLIANCE)),
+    correlation_id: str = Depends(get_correlation_id)
+):
+    """
+    Stream audit events for a sequence and/or time range.
+
+    Rows are read through a server-side cursor, so memory use is constant
+    regardless of range size. Each event includes prev_hash and hash so the
+    export can be re-hashed and its chain continuity verified offline; the
+    X-Audit-Anchor-* headers identify the event preceding the range.
+
+    - ndjson: one event object per line
+    - columnar: gzip-compressed lines of column blocks, one per cursor chunk
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {format}"
+        )
+    
+    query = build_export_query(from_sequence, to_sequence, from_time, to_time)
+    anchor = await get_anchor(db, query)
+    chunk_size = get_settings().audit_export_chunk_size
+    
+    headers = {"X-Correlation-ID": correlation_id}
+    if anchor:
+        headers["X-Audit-Anchor-Sequence"] = str(anchor["sequence_number"])
+        headers["X-Audit-Anchor-Hash"] = anchor["hash"]
+    
+    # The stream outlives the request-scoped session, so it opens its own
+    if format == "columnar":
+        headers["Content-Disposition"] = 'attachment; filename="audit-export.columnar.json.gz"'
+        return StreamingResponse(
+            stream_columnar(async_session_maker, query, chunk_size),
+            media_type="application/gzip",
+            headers=headers,
+        )
+    
+    headers["Content-Disposition"] = 'attachment; filename="audit-export.ndjson"'
+    return StreamingResponse(
+        stream_ndjson(async_session_maker, query, chunk_size),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
+@router.get("/traces/{trace_id}", response_model=CorrelatedResponse[AuditTraceResponse])
+async def get_audit_trace(
+    trace_id: str,
+    after_sequence: Optional[int] = Query(None, description="Return events after this sequence number"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
+    audit_service: AuditService = Depends(get_audit_service),
+    current_user: User = Depends(require_roles(UserRole.ADMIN, UserRole.COMPLIANCE)),
+    correlation_id: str = Depends(get_correlation_id)
+):
+    """
+    Reconstruct a request trace from its correlation ID (`trace_id`).
+
+    Returns every audit event logged under the correlation ID in chain order,
+    across all entities it touched (TX_REQUEST, KYT_CASE, SIGNING_PERMIT,
+    MPC_SESSION, ...), and the entity IDs per entity type. Long traces are
+    paged with `after_sequence` set to the previous `next_after_sequence`.
+    `archived_through_sequence` is set when earlier events of the trace may
+    have been archived to segment files.
+    """
+    events, next_after_sequence = await audit_service.search_events(
+        correlation_id=trace_id,
+        after_sequence=after_sequence,
+        limit=limit,
+    )
+    archived_through = await audit_service.archived_through(after_sequence=after_sequence)
+
+    entities = {}
+    for event in events:
+        if event.entity_type and event.entity_id:
+            ids = entities.setdefault(event.entity_type, [])
+            if event.entity_id not in ids:
+                ids.append(event.entity_id)
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=AuditTraceResponse(
+            correlation_id=trace_id,
+            events=[AuditEventResponse.model_validate(e) for e in events],
+            entities=entities,
+            has_more=next_after_sequence is not None,
+            next_after_sequence=next_after_sequence,
+            archived_through_sequence=archived_through,
+        )
+    )
+
+
+@router.get("/events", response_model=CorrelatedResponse[AuditEventPage])
+async def search_audit_events(
+    event_type: Optional[List[AuditEventType]] = Query(None, description="Filter by event type (repeatable)"),
+    actor_id: Optional[str] = Query(None, description="Filter by actor"),
+    entity_type: Optional[str] = Query(None, description="Filter by entity type"),
+    entity_id: Optional[str] = Query(None, description="Filter by entity ID"),
+    trace_id: Optional[str] = Query(None, description="Filter by correlation ID"),
+    payload: Optional[str] = Query(None, description='JSON object the payload must contain, e.g. {"chain": "ethereum"}'),
+    from_time: Optional[datetime] = Query(None, description="Events at or after this time"),
+    to_time: Optional[datetime] = Query(None, description="Events at or before this time"),
+    after_sequence: Optional[int] = Query(None, description="Return events after this sequence number"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
+    audit_service: AuditService = Depends(get_audit_service),
+    current_user: User = Depends(require_roles(UserRole.ADMIN, UserRole.COMPLIANCE)),
+    correlation_id: str = Depends(get_correlation_id)
+):
+    """
+    Search audit events in chain order.
+
+    Pages are keyed on sequence_number: pass the returned
+    `next_after_sequence` as `after_sequence` to continue, so deep pages
+    cost the same as the first. `payload` is matched by JSONB containment.
+    Archived partitions are not searched; `archived_through_sequence` is set
+    when matches may have been archived.
+    """
+    payload_contains = None
+    if payload is not None:
+        try:
+            payload_contains = json.loads(payload)
+        except ValueError:
+            payload_contains = None
+        if not isinstance(payload_contains, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="payload must be a JSON object"
+            )
+
+    try:
+        events, next_after_sequence = await audit_service.search_events(
+            correlation_id=trace_id,
+            event_types=event_type,
+            actor_id=actor_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            payload_contains=payload_contains,
+            from_time=from_time,
+            to_time=to_time,
+            after_sequence=after_sequence,
+            limit=limit,
+        )
+        archived_through = await audit_service.archived_through(after_sequence, from_time)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=AuditEventPage(
+            items=[AuditEventResponse.model_validate(e) for e in events],
+            has_more=next_after_sequence is not None,
+            next_after_sequence=next_after_sequence,
+            archived_through_sequence=archived_through,
+        )
+    )
+
+
 @router.get("/logins", response_model=CorrelatedResponse[List[LoginEventResponse]])
 async def get_recent_logins(
     limit: int = Query(20, le=100, description="Maximum number of login events to return"),
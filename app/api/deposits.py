@@ -1,6 +1,5 @@
 """Deposits API endpoints."""
 import hashlib
-import json
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
@@ -10,13 +9,17 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.canonical import canonical_dumps
 from app.database import get_db
 from app.models.audit import Deposit, AuditEventType, AuditEvent
 from app.models.wallet import Wallet
 from app.models.user import User, UserRole
 from app.api.deps import get_current_user, require_roles, get_correlation_id
 from app.services.audit import AuditService
-from app.schemas.audit import AuditEventResponse
+from app.services.event_stream import event_bus
+from app.services.webhooks import enqueue_webhooks
+from app.services.ledger import LedgerService
+from app.schemas.audit import AuditEventResponse, AuditInclusionProof
 
 router = APIRouter(prefix="/v1/deposits", tags=["Deposits"])
 
@@ -65,6 +68,7 @@ class DepositAuditPackageResponse(BaseModel):
     kyt_evaluation: Optional[dict] = None
     admin_decision: Optional[dict] = None
     audit_events: List[AuditEventResponse]
+    inclusion_proofs: List[AuditInclusionProof] = []
     package_hash: str
     generated_at: datetime
 
@@ -225,8 +229,9 @@ async def approve_deposit(
     """Approve a deposit (admin only) - credits the user balance."""
     from datetime import datetime
     
+    # Locked so concurrent decisions cannot both post to the ledger
     result = await db.execute(
-        select(Deposit).where(Deposit.id == deposit_id)
+        select(Deposit).where(Deposit.id == deposit_id).with_for_update()
     )
     deposit = result.scalar_one_or_none()
     
@@ -260,16 +265,19 @@ async def approve_deposit(
     deposit.status = "CREDITED"
     deposit.approved_by = str(current_user.id)
     deposit.approved_at = datetime.utcnow()
+    await LedgerService(db).deposit_credited(deposit)
     
     # Log audit event
     audit = AuditService(db)
-    await audit.log_event(
+    event = await audit.log_event(
         event_type=AuditEventType.DEPOSIT_APPROVED,
         actor_id=str(current_user.id),
         entity_refs={"deposit_id": str(deposit_id), "wallet_id": str(deposit.wallet_id)},
         payload={"amount": deposit.amount, "asset": deposit.asset},
         correlation_id=correlation_id,
     )
+    event_bus.publish_after_commit(db, event)
+    await enqueue_webhooks(db, event)
     
     await db.commit()
     await db.refresh(deposit)
@@ -324,6 +332,9 @@ async def get_deposit_audit_package(
     )
     events = list(events_result.scalars().all())
 
+    # Merkle inclusion proofs for events that have been anchored
+    inclusion_proofs = await AuditService(db).get_inclusion_proofs(events)
+
     # Extract KYT evaluation info
     kyt_eval = None
     admin_decision = None
@@ -384,12 +395,13 @@ async def get_deposit_audit_package(
             }
             for e in events
         ],
+        "inclusion_proofs": [p.model_dump() for p in inclusion_proofs],
         "generated_at": datetime.utcnow().isoformat(),
     }
 
     # Compute package hash
     package_hash = hashlib.sha256(
-        json.dumps(package_data, sort_keys=True, default=str).encode()
+        canonical_dumps(package_data).encode()
     ).hexdigest()
 
     return DepositAuditPackageResponse(
@@ -398,6 +410,7 @@ async def get_deposit_audit_package(
         kyt_evaluation=kyt_eval,
         admin_decision=admin_decision,
         audit_events=[AuditEventResponse.model_validate(e) for e in events],
+        inclusion_proofs=inclusion_proofs,
         package_hash=package_hash,
         generated_at=datetime.utcnow(),
     )
@@ -414,8 +427,9 @@ async def reject_deposit(
     """Reject a deposit (admin only)."""
     from datetime import datetime
     
+    # Locked so concurrent decisions cannot both post to the ledger
     result = await db.execute(
-        select(Deposit).where(Deposit.id == deposit_id)
+        select(Deposit).where(Deposit.id == deposit_id).with_for_update()
     )
     deposit = result.scalar_one_or_none()
     
@@ -437,16 +451,18 @@ async def reject_deposit(
     deposit.rejected_by = str(current_user.id)
     deposit.rejected_at = datetime.utcnow()
     deposit.rejection_reason = request.reason
+    await LedgerService(db).deposit_rejected(deposit)
     
     # Log audit event
     audit = AuditService(db)
-    await audit.log_event(
+    event = await audit.log_event(
         event_type=AuditEventType.DEPOSIT_REJECTED,
         actor_id=str(current_user.id),
         entity_refs={"deposit_id": str(deposit_id), "wallet_id": str(deposit.wallet_id)},
         payload={"amount": deposit.amount, "asset": deposit.asset, "reason": request.reason},
         correlation_id=correlation_id,
     )
+    event_bus.publish_after_commit(db, event)
     
     await db.commit()
     await db.refresh(deposit)
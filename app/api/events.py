@@ -0,0 +1,123 @@
+"""Event stream API endpoints."""
+import asyncio
+from typing import AsyncIterator, Optional, Set
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.database import get_db, async_session_maker
+from app.api.deps import get_current_user, get_correlation_id
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet
+from app.services.event_stream import Subscription, event_bus, replay_events
+
+router = APIRouter(prefix="/v1/events", tags=["Events"])
+
+# Audit events read per replay query
+REPLAY_PAGE_SIZE = 500
+
+
+async def _stream(
+    request: Request,
+    session_maker: async_sessionmaker,
+    subscription: Subscription,
+    after_sequence: Optional[int],
+) -> AsyncIterator[str]:
+    settings = get_settings()
+    last_sent = after_sequence
+    try:
+        while True:
+            if last_sent is not None:
+                # Catch up from the audit log (on resume, or after dropping events)
+                replayed = 0
+                cursor = last_sent
+                while cursor is not None and replayed < settings.event_stream_replay_limit:
+                    async with session_maker() as session:
+                        events, cursor = await replay_events(
+                            session, cursor, subscription.wallet_ids, REPLAY_PAGE_SIZE
+                        )
+                    replayed += REPLAY_PAGE_SIZE
+                    for stream_event in events:
+                        yield stream_event.to_sse()
+                        last_sent = stream_event.sequence
+                    if cursor is not None:
+                        last_sent = max(last_sent, cursor)
+                if cursor is not None:
+                    # Too far behind: the client should reload state over REST
+                    yield "event: reset\ndata: {}\n\n"
+                    return
+
+            subscription.overflowed = False
+            while not subscription.overflowed:
+                try:
+                    stream_event = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=settings.event_stream_keepalive
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                if stream_event.sequence is not None:
+                    if last_sent is not None and stream_event.sequence <= last_sent:
+                        continue  # Already replayed
+                    last_sent = stream_event.sequence
+                yield stream_event.to_sse()
+
+            # Events were dropped while we were slow: drain and replay them
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            if last_sent is None:
+                yield "event: reset\ndata: {}\n\n"
+                return
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    after_sequence: Optional[int] = Query(None, description="Resume after this audit sequence number"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    correlation_id: str = Depends(get_correlation_id)
+):
+    """
+    Server-Sent Events stream of transaction and deposit status changes.
+
+    Each event (`tx_status` or `deposit_status`) carries the entity ID, its
+    wallet and the new status; its `id` is the audit sequence number of the
+    change. Reconnecting clients send `Last-Event-ID` (or `after_sequence`)
+    and missed events are replayed from the audit log before live events
+    resume. `event: reset` means the client is too far behind to catch up
+    and should reload state over REST.
+
+    Admins see all wallets; other users see the wallets they hold a role on.
+    """
+    if after_sequence is None and last_event_id and last_event_id.isdigit():
+        after_sequence = int(last_event_id)
+
+    wallet_ids: Optional[Set[str]] = None
+    if current_user.role != UserRole.ADMIN:
+        result = await db.execute(
+            select(Wallet.id).where(Wallet.roles.any(user_id=current_user.id))
+        )
+        wallet_ids = set(result.scalars().all())
+
+    # Subscribe before replaying, so nothing committed in between is missed
+    subscription = event_bus.subscribe(wallet_ids)
+
+    # The stream outlives the request-scoped session, so it opens its own
+    return StreamingResponse(
+        _stream(request, async_session_maker, subscription, after_sequence),
+        media_type="text/event-stream",
+        headers={
+            "X-Correlation-ID": correlation_id,
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
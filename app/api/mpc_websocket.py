@@ -363,13 +363,15 @@ async def _finalize_signing(
         else:
             gas_price = int(gas_prices.get("legacy_gas_price", 20000000000))
 
+        chain_id = await ethereum_service.get_chain_id()
+
         # Convert all numeric fields to int (they may be Decimal from DB)
         tx_dict = {
             "nonce": int(tx.nonce) if tx.nonce is not None else 0,
             "to": Web3.to_checksum_address(tx.to_address),
             "value": int(value_wei),
             "gas": int(tx.gas_limit) if tx.gas_limit is not None else 21000,
-            "chainId": int(ethereum_service.chain_id),
+            "chainId": chain_id,
         }
 
         # Use legacy transactions for now (simpler to encode with manual signature)
@@ -388,7 +390,6 @@ async def _finalize_signing(
         # For EIP-155: v = chainId * 2 + 35 + recovery_id
         # IMPORTANT: MPC result.signature_v is already 27 or 28 (recovery_id + 27)
         # We need to extract recovery_id first, then apply EIP-155 formula
-        chain_id = int(ethereum_service.chain_id)
         recovery_id = result.signature_v - 27  # Extract recovery_id (0 or 1)
         v = chain_id * 2 + 35 + recovery_id
 
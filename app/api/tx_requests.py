@@ -1,12 +1,23 @@
 """Transaction request API endpoints."""
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.schemas.tx_request import TxRequestCreate, TxRequestResponse, ApprovalCreate, ApprovalResponse
+from app.config import get_settings
+from app.schemas.tx_request import (
+    TxRequestCreate,
+    TxRequestResponse,
+    TxRequestBatchCreate,
+    TxRequestBatchItemResult,
+    TxRequestBatchResponse,
+    ApprovalCreate,
+    ApprovalResponse,
+)
 from app.schemas.common import CorrelatedResponse
 from app.services.orchestrator import TxOrchestrator
+from app.services.admission import AdmissionRejected, tx_admission
 from app.api.deps import (
     get_correlation_id,
     get_idempotency_key,
@@ -20,6 +31,20 @@ from app.models.tx_request import TxStatus
 router = APIRouter(prefix="/v1/tx-requests", tags=["Transaction Requests"])
 
 
+@asynccontextmanager
+async def _admitted(db: AsyncSession, user: User, wallet_ids: Iterable[str]) -> AsyncIterator[None]:
+    """Hold an intake slot for the request; 429 with Retry-After when saturated."""
+    try:
+        async with tx_admission.admit(user.id, wallet_ids, db):
+            yield
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+
 @router.post("", response_model=CorrelatedResponse[TxRequestResponse])
 async def create_tx_request(
     tx_data: TxRequestCreate,
@@ -35,26 +60,92 @@ async def create_tx_request(
     This initiates the transaction workflow:
     SUBMITTED -> KYT -> POLICY -> APPROVALS -> SIGN -> BROADCAST -> CONFIRM
     
+    In queue pipeline mode the request is returned SUBMITTED and the
+    remaining stages run on the pipeline workers.
+    
     Supports idempotency via Idempotency-Key header.
+
+    Intake is admission controlled: when too many requests are in flight
+    (overall, for the caller or for the wallet) the request waits briefly,
+    then gets 429 with a Retry-After header.
     """
-    try:
-        tx = await orchestrator.create_tx_request(
-            tx_data,
+    async with _admitted(db, current_user, [tx_data.wallet_id]):
+        try:
+            tx = await orchestrator.create_tx_request(
+                tx_data,
+                current_user.id,
+                correlation_id,
+                idempotency_key
+            )
+            await db.commit()
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=TxRequestResponse.model_validate(tx)
+    )
+
+
+@router.post("/batch", response_model=CorrelatedResponse[TxRequestBatchResponse])
+async def create_tx_requests_batch(
+    batch: TxRequestBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    orchestrator: TxOrchestrator = Depends(get_orchestrator),
+    current_user: User = Depends(get_current_user),
+    correlation_id: str = Depends(get_correlation_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """
+    Create many transaction requests at once (payout runs).
+
+    Every item runs the same workflow as POST /v1/tx-requests; wallets,
+    policy and address book are loaded once for the batch, KYT screening
+    runs concurrently and audit events are written in bulk. Results are
+    returned per item in input order: an invalid item reports its error
+    without failing the others.
+
+    With an Idempotency-Key header, item i is deduplicated under
+    "<key>:<i>", so a retried payout file does not create duplicates.
+
+    A batch takes one intake slot, counted against each wallet it touches.
+    """
+    max_items = get_settings().tx_batch_max_items
+    if len(batch.items) > max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch exceeds {max_items} items"
+        )
+
+    async with _admitted(db, current_user, {item.wallet_id for item in batch.items}):
+        results = await orchestrator.create_tx_requests_batch(
+            batch.items,
             current_user.id,
             correlation_id,
             idempotency_key
         )
         await db.commit()
-        
-        return CorrelatedResponse(
-            correlation_id=correlation_id,
-            data=TxRequestResponse.model_validate(tx)
+
+    items = [
+        TxRequestBatchItemResult(
+            index=index,
+            tx_request=TxRequestResponse.model_validate(tx) if tx else None,
+            error=error
         )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+        for index, (tx, error) in enumerate(results)
+    ]
+    accepted = sum(1 for item in items if item.tx_request)
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=TxRequestBatchResponse(
+            items=items,
+            accepted=accepted,
+            rejected=len(items) - accepted
         )
+    )
 
 
 @router.get("")
@@ -24,8 +24,7 @@ from pydantic import BaseModel
 from app.models.user import User, UserRole
 from app.models.wallet import WalletType, CustodyBackend
 from app.services.mpc_coordinator import MPCCoordinator
-from app.models.audit import Deposit
-from sqlalchemy import select, func
+from app.services.ledger import LedgerService
 from decimal import Decimal
 
 router = APIRouter(prefix="/v1/wallets", tags=["Wallets"])
@@ -334,8 +333,9 @@ async def get_wallet_ledger_balance(
     """
     Get the internal ledger balance of a wallet.
 
-    This returns the sum of all CREDITED deposits (available balance)
-    and PENDING_ADMIN deposits (pending balance).
+    Available is CREDITED deposits less withdrawals that are in flight or
+    FINALIZED; pending is deposits awaiting admin approval. Both are read
+    from the wallet's materialized ledger balance.
 
     This is the balance users can actually withdraw, not the on-chain balance.
     """
@@ -352,51 +352,9 @@ async def get_wallet_ledger_balance(
             detail=f"Wallet {wallet_id} has no address"
         )
 
-    # Sum CREDITED deposits (available balance)
-    credited_result = await db.execute(
-        select(Deposit.amount)
-        .where(Deposit.wallet_id == wallet_id)
-        .where(Deposit.status == "CREDITED")
-    )
-    credited_deposits = credited_result.scalars().all()
-
-    # Sum PENDING_ADMIN deposits (pending balance)
-    pending_result = await db.execute(
-        select(Deposit.amount)
-        .where(Deposit.wallet_id == wallet_id)
-        .where(Deposit.status == "PENDING_ADMIN")
-    )
-    pending_deposits = pending_result.scalars().all()
-
-    # Sum FINALIZED withdrawals (subtract from balance)
-    from app.models.tx_request import TxRequest, TxStatus
-    finalized_withdrawals_result = await db.execute(
-        select(TxRequest.amount)
-        .where(TxRequest.wallet_id == wallet_id)
-        .where(TxRequest.status == TxStatus.FINALIZED)
-    )
-    finalized_withdrawals = finalized_withdrawals_result.scalars().all()
-
-    # Sum pending withdrawals (CONFIRMING status - subtract from available)
-    pending_withdrawals_result = await db.execute(
-        select(TxRequest.amount)
-        .where(TxRequest.wallet_id == wallet_id)
-        .where(TxRequest.status.in_([TxStatus.CONFIRMING, TxStatus.BROADCASTED, TxStatus.BROADCAST_PENDING]))
-    )
-    pending_withdrawals = pending_withdrawals_result.scalars().all()
-
-    # Calculate totals (amounts stored as strings/Decimal in wei)
-    deposits_available_wei = sum(int(amt) for amt in credited_deposits) if credited_deposits else 0
-    deposits_pending_wei = sum(int(amt) for amt in pending_deposits) if pending_deposits else 0
-
-    # Convert Decimal to int for withdrawals
-    from decimal import Decimal as Dec
-    finalized_withdrawals_wei = sum(int(Dec(str(amt))) for amt in finalized_withdrawals) if finalized_withdrawals else 0
-    pending_withdrawals_wei = sum(int(Dec(str(amt))) for amt in pending_withdrawals) if pending_withdrawals else 0
-
-    # Available balance = deposits - finalized withdrawals - pending withdrawals
-    available_wei = deposits_available_wei - finalized_withdrawals_wei - pending_withdrawals_wei
-    pending_wei = deposits_pending_wei
+    balance = await LedgerService(db).get_balance(wallet_id, "ETH")
+    available_wei = int(balance.available) if balance else 0
+    pending_wei = int(balance.pending) if balance else 0
 
     # Convert to ETH
     available_eth = Decimal(available_wei) / Decimal(10**18)
@@ -411,8 +369,8 @@ async def get_wallet_ledger_balance(
             available_wei=str(available_wei),
             pending_eth=str(pending_eth),
             pending_wei=str(pending_wei),
-            total_credited=len(credited_deposits),
-            total_pending=len(pending_deposits),
+            total_credited=balance.credited_deposits if balance else 0,
+            total_pending=balance.pending_deposits if balance else 0,
         )
     )
 
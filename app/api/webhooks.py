@@ -0,0 +1,125 @@
+"""Webhook subscription API endpoints."""
+import secrets
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.api.deps import get_correlation_id, require_admin
+from app.models.audit import AuditEventType
+from app.models.user import User
+from app.models.webhook import WebhookSubscription, WebhookDelivery
+from app.services.audit import AuditService
+from app.schemas.common import CorrelatedResponse
+from app.schemas.webhook import (
+    WebhookSubscriptionCreate,
+    WebhookSubscriptionCreated,
+    WebhookSubscriptionResponse,
+)
+
+router = APIRouter(prefix="/v1/webhooks", tags=["Webhooks"])
+
+
+@router.post("", response_model=CorrelatedResponse[WebhookSubscriptionCreated])
+async def create_subscription(
+    data: WebhookSubscriptionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    correlation_id: str = Depends(get_correlation_id),
+):
+    """
+    Subscribe an endpoint to webhook events (admin only).
+
+    Events are POSTed in batches as
+    `{"delivery_id": ..., "events": [{"id", "type", "created_at", "data"}]}`
+    and signed with the returned secret: `X-Webhook-Signature` is
+    Base64(HMAC-SHA256(secret, X-Webhook-Timestamp + "\\n" + body)). Failed
+    deliveries are retried with exponential backoff; event IDs are stable,
+    so receivers should deduplicate on them.
+    """
+    subscription = WebhookSubscription(
+        name=data.name,
+        url=data.url,
+        secret=secrets.token_urlsafe(32),
+        event_types=data.event_types,
+        wallet_ids=data.wallet_ids,
+        created_by=str(current_user.id),
+    )
+    db.add(subscription)
+    await db.flush()
+
+    audit = AuditService(db)
+    await audit.log_event(
+        event_type=AuditEventType.WEBHOOK_SUBSCRIPTION_CREATED,
+        correlation_id=correlation_id,
+        actor_id=str(current_user.id),
+        entity_type="WEBHOOK_SUBSCRIPTION",
+        entity_id=subscription.id,
+        payload={"name": data.name, "url": data.url, "event_types": data.event_types},
+    )
+    await db.commit()
+    await db.refresh(subscription)
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=WebhookSubscriptionCreated.model_validate(subscription),
+    )
+
+
+@router.get("", response_model=CorrelatedResponse[List[WebhookSubscriptionResponse]])
+async def list_subscriptions(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    correlation_id: str = Depends(get_correlation_id),
+):
+    """List active webhook subscriptions (admin only)."""
+    result = await db.execute(
+        select(WebhookSubscription)
+        .where(WebhookSubscription.is_active == True)  # noqa: E712
+        .order_by(WebhookSubscription.created_at.asc())
+    )
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data=[WebhookSubscriptionResponse.model_validate(s) for s in result.scalars().all()],
+    )
+
+
+@router.delete("/{subscription_id}")
+async def delete_subscription(
+    subscription_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    correlation_id: str = Depends(get_correlation_id),
+):
+    """Deactivate a webhook subscription (admin only). Queued deliveries are dropped."""
+    subscription = await db.get(WebhookSubscription, subscription_id)
+    if not subscription or not subscription.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhook subscription not found"
+        )
+    subscription.is_active = False
+    await db.execute(
+        update(WebhookDelivery)
+        .where(WebhookDelivery.subscription_id == subscription.id)
+        .where(WebhookDelivery.status == "PENDING")
+        .values(status="FAILED", last_error="Subscription deleted")
+    )
+
+    audit = AuditService(db)
+    await audit.log_event(
+        event_type=AuditEventType.WEBHOOK_SUBSCRIPTION_DELETED,
+        correlation_id=correlation_id,
+        actor_id=str(current_user.id),
+        entity_type="WEBHOOK_SUBSCRIPTION",
+        entity_id=subscription.id,
+        payload={"name": subscription.name, "url": subscription.url},
+    )
+    await db.commit()
+
+    return CorrelatedResponse(
+        correlation_id=correlation_id,
+        data={"message": "Webhook subscription deleted"}
+    )
@@ -0,0 +1,69 @@
+"""Canonical JSON encoding for hashing.
+
+Audit event hashes and policy snapshot hashes are defined over
+``json.dumps(obj, sort_keys=True, default=str)``. Everything here produces
+byte-identical output to that call, so existing hashes stay valid:
+
+- canonical_dumps: drop-in replacement backed by an iterencode function
+  built once, instead of a JSONEncoder (and its C encoder) per call
+- RecordEncoder: precompiled fast path for dicts with a fixed set of keys
+  (the audit hash envelope, policy rule snapshots); key order and key
+  encoding are worked out once, values are encoded individually
+
+Unlike json.dumps there is no circular reference check; hashed data is
+always a tree.
+"""
+import json
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from typing import Any
+
+# Same settings as json.dumps(obj, sort_keys=True, default=str)
+_ENCODER = json.JSONEncoder(sort_keys=True, default=str, check_circular=False)
+
+if c_make_encoder is not None:
+    _iterencode = c_make_encoder(
+        None, str, encode_basestring_ascii, None, ": ", ", ", True, False, True
+    )
+
+    def canonical_dumps(obj: Any) -> str:
+        """Equivalent to json.dumps(obj, sort_keys=True, default=str)."""
+        return "".join(_iterencode(obj, 0))
+else:
+    def canonical_dumps(obj: Any) -> str:
+        """Equivalent to json.dumps(obj, sort_keys=True, default=str)."""
+        return _ENCODER.encode(obj)
+
+
+def _encode_value(value: Any) -> str:
+    # Exact types only: subclasses (str enums, IntEnum) go through the encoder
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is int:
+        return int.__repr__(value)
+    return canonical_dumps(value)
+
+
+class RecordEncoder:
+    """Canonical encoder for dicts with a fixed set of string keys."""
+
+    def __init__(self, *keys: str):
+        self.keys = keys
+        order = sorted(range(len(keys)), key=lambda i: keys[i])
+        # (encoded "key": prefix, position of the value in encode() args)
+        self._fields = tuple(
+            (("{" if n == 0 else ", ") + encode_basestring_ascii(keys[i]) + ": ", i)
+            for n, i in enumerate(order)
+        )
+
+    def encode(self, *values: Any) -> str:
+        """Encode values given in constructor key order."""
+        if not self._fields:
+            return "{}"
+        return "".join([
+            prefix + _encode_value(values[i]) for prefix, i in self._fields
+        ]) + "}"
@@ -2,7 +2,7 @@
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.config import get_settings
 
@@ -13,6 +13,9 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.environment == "development",
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
 )
 
 # Session factory
@@ -23,6 +26,18 @@ async_session_maker = async_sessionmaker(
 )
 
 
+def begin_transaction(session: Session) -> None:
+    """
+    Begin the session's transaction now if none is active.
+
+    Work buffered until commit runs no SQL, and a rollback before any
+    statement has nothing to roll back, so it would fire no rollback
+    hooks. Callers buffering such work begin the transaction first.
+    """
+    if not session.in_transaction():
+        session.begin()
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     pass
@@ -21,10 +21,23 @@ from app.api import (
     audit_router,
 )
 from app.api.deposits import router as deposits_router
+from app.api.events import router as events_router
 from app.api.mpc_websocket import router as mpc_ws_router
 from app.api.kyt import router as kyt_router
 from app.api.groups import router as groups_router
+from app.api.webhooks import router as webhooks_router
+from app.services.audit_archive import AuditArchiver
+from app.services.audit_merkle import AuditAnchorer
+from app.services.audit_outbox import AuditChainHasher
+from app.services.audit_verify import shutdown_verify_pool
 from app.services.chain_listener import ChainListener
+from app.services.ethereum import close_async_web3, get_rpc_pool
+from app.services.tx_pipeline import TxPipelineWorkerPool
+from app.services.tx_recovery import TxRecoverySweeper
+from app.services.hot_wallet import HotWalletSender
+from app.services.webhooks import WebhookDispatcher
+from app.services.ledger import LedgerReconciler
+from app.services.admission import tx_admission
 from app.services.mpc_grpc_client import (
     initialize_mpc_signer_client,
     shutdown_mpc_signer_client,
@@ -43,11 +56,47 @@ settings = get_settings()
 chain_listener: Optional[ChainListener] = None
 chain_listener_task: Optional[asyncio.Task] = None
 
+# Global audit anchorer instance
+audit_anchorer: Optional[AuditAnchorer] = None
+audit_anchorer_task: Optional[asyncio.Task] = None
+
+# Global audit archiver instance
+audit_archiver: Optional[AuditArchiver] = None
+audit_archiver_task: Optional[asyncio.Task] = None
+
+# Global audit chain hasher instance (outbox chain mode only)
+audit_chain_hasher: Optional[AuditChainHasher] = None
+audit_chain_hasher_task: Optional[asyncio.Task] = None
+
+# Global transaction pipeline workers (queue pipeline mode only)
+tx_pipeline: Optional[TxPipelineWorkerPool] = None
+tx_pipeline_task: Optional[asyncio.Task] = None
+
+# Global stuck transaction recovery sweeper
+tx_recovery: Optional[TxRecoverySweeper] = None
+tx_recovery_task: Optional[asyncio.Task] = None
+
+# Global hot wallet sender (pipelined dev-signer sends)
+hot_wallet_sender: Optional[HotWalletSender] = None
+hot_wallet_sender_task: Optional[asyncio.Task] = None
+
+# Global outbound webhook dispatcher
+webhook_dispatcher: Optional[WebhookDispatcher] = None
+webhook_dispatcher_task: Optional[asyncio.Task] = None
+
+# Global ledger reconciler
+ledger_reconciler: Optional[LedgerReconciler] = None
+ledger_reconciler_task: Optional[asyncio.Task] = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global chain_listener, chain_listener_task
+    global chain_listener, chain_listener_task, audit_anchorer, audit_anchorer_task
+    global audit_archiver, audit_archiver_task, audit_chain_hasher, audit_chain_hasher_task
+    global tx_pipeline, tx_pipeline_task, tx_recovery, tx_recovery_task
+    global hot_wallet_sender, hot_wallet_sender_task
+    global webhook_dispatcher, webhook_dispatcher_task, ledger_reconciler, ledger_reconciler_task
     
     logger.info("Starting Collider Custody Service...")
 
@@ -71,6 +120,47 @@ async def lifespan(app: FastAPI):
     chain_listener_task = asyncio.create_task(chain_listener.start())
     logger.info("Chain listener started")
 
+    # Seal audit events into Merkle batches for inclusion proofs
+    audit_anchorer = AuditAnchorer(session_maker=async_session_maker)
+    audit_anchorer_task = asyncio.create_task(audit_anchorer.start())
+
+    # Pre-create monthly audit partitions and archive old ones
+    audit_archiver = AuditArchiver(session_maker=async_session_maker)
+    audit_archiver_task = asyncio.create_task(audit_archiver.start())
+
+    # Append outbox events to the audit chain in the background
+    if settings.audit_chain_mode == "outbox":
+        audit_chain_hasher = AuditChainHasher(session_maker=async_session_maker)
+        audit_chain_hasher_task = asyncio.create_task(audit_chain_hasher.start())
+        logger.info("Audit chain hasher started (outbox mode)")
+
+    # Run orchestrator pipeline stages from the job queue; API-only nodes
+    # set tx_pipeline_workers=0 and run scripts/run_pipeline_workers.py elsewhere
+    if settings.tx_pipeline_mode == "queue" and settings.tx_pipeline_workers > 0:
+        tx_pipeline = TxPipelineWorkerPool(session_maker=async_session_maker)
+        tx_pipeline_task = asyncio.create_task(tx_pipeline.start())
+
+    # Resume transactions stranded in signing or broadcast
+    if settings.tx_recovery_enabled:
+        tx_recovery = TxRecoverySweeper(session_maker=async_session_maker)
+        tx_recovery_task = asyncio.create_task(tx_recovery.start())
+
+    # Sign and send dev signer transactions with many nonces in flight
+    if settings.hot_wallet_sender_enabled:
+        hot_wallet_sender = HotWalletSender(session_maker=async_session_maker)
+        hot_wallet_sender_task = asyncio.create_task(hot_wallet_sender.start())
+
+    # Deliver queued webhook events to partner endpoints
+    if settings.webhook_enabled:
+        webhook_dispatcher = WebhookDispatcher(session_maker=async_session_maker)
+        webhook_dispatcher_task = asyncio.create_task(webhook_dispatcher.start())
+
+    # Check ledger balances against deposits and withdrawals (the first run
+    # builds balances for history that predates the ledger)
+    if settings.ledger_reconcile_enabled:
+        ledger_reconciler = LedgerReconciler(session_maker=async_session_maker)
+        ledger_reconciler_task = asyncio.create_task(ledger_reconciler.start())
+
     # Initialize MPC signer client if enabled
     if settings.mpc_signer_enabled:
         logger.info(f"Connecting to MPC signer at {settings.mpc_signer_url}...")
@@ -98,6 +188,81 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    if audit_anchorer:
+        await audit_anchorer.stop()
+    if audit_anchorer_task:
+        audit_anchorer_task.cancel()
+        try:
+            await audit_anchorer_task
+        except asyncio.CancelledError:
+            pass
+
+    if audit_archiver:
+        await audit_archiver.stop()
+    if audit_archiver_task:
+        audit_archiver_task.cancel()
+        try:
+            await audit_archiver_task
+        except asyncio.CancelledError:
+            pass
+
+    if audit_chain_hasher:
+        await audit_chain_hasher.stop()
+    if audit_chain_hasher_task:
+        audit_chain_hasher_task.cancel()
+        try:
+            await audit_chain_hasher_task
+        except asyncio.CancelledError:
+            pass
+
+    if tx_pipeline:
+        await tx_pipeline.stop()
+    if tx_pipeline_task:
+        tx_pipeline_task.cancel()
+        try:
+            await tx_pipeline_task
+        except asyncio.CancelledError:
+            pass
+
+    if tx_recovery:
+        await tx_recovery.stop()
+    if tx_recovery_task:
+        tx_recovery_task.cancel()
+        try:
+            await tx_recovery_task
+        except asyncio.CancelledError:
+            pass
+
+    if hot_wallet_sender:
+        await hot_wallet_sender.stop()
+    if hot_wallet_sender_task:
+        hot_wallet_sender_task.cancel()
+        try:
+            await hot_wallet_sender_task
+        except asyncio.CancelledError:
+            pass
+
+    if webhook_dispatcher:
+        await webhook_dispatcher.stop()
+    if webhook_dispatcher_task:
+        webhook_dispatcher_task.cancel()
+        try:
+            await webhook_dispatcher_task
+        except asyncio.CancelledError:
+            pass
+
+    if ledger_reconciler:
+        await ledger_reconciler.stop()
+    if ledger_reconciler_task:
+        ledger_reconciler_task.cancel()
+        try:
+            await ledger_reconciler_task
+        except asyncio.CancelledError:
+            pass
+
+    await close_async_web3()
+    shutdown_verify_pool()
+
     logger.info("Shutdown complete")
 
 
@@ -191,8 +356,10 @@ app.include_router(cases_router)
 app.include_router(policies_router)
 app.include_router(audit_router)
 app.include_router(deposits_router)
+app.include_router(events_router)
 app.include_router(kyt_router)
 app.include_router(groups_router)
+app.include_router(webhooks_router)
 app.include_router(mpc_ws_router, tags=["MPC WebSocket"])
 
 
@@ -202,7 +369,9 @@ async def health_check():
     return {
         "status": "healthy",
         "environment": settings.environment,
-        "chain_listener_running": chain_listener is not None and chain_listener._running
+        "chain_listener_running": chain_listener is not None and chain_listener._running,
+        "tx_admission": tx_admission.stats(),
+        "rpc_pool": get_rpc_pool().stats(),
     }
 
 
@@ -1,9 +1,12 @@
 """Database models package."""
 from app.models.user import User, UserRole
 from app.models.wallet import Wallet, WalletRole, WalletType, WalletRoleType, RiskProfile, CustodyBackend, WalletStatus
-from app.models.tx_request import TxRequest, TxType, TxStatus, Approval, KYTCase, VALID_TRANSITIONS
+from app.models.tx_request import (
+    TxRequest, TxType, TxStatus, Approval, KYTCase, VALID_TRANSITIONS, TERMINAL_STATUSES,
+    TxPipelineStage, TxPipelineJob,
+)
 from app.models.policy import Policy, PolicyType, DailyVolume
-from app.models.audit import AuditEvent, AuditEventType, Deposit
+from app.models.audit import AuditEvent, AuditEventType, AuditCheckpoint, AuditMerkleBatch, AuditArchiveSegment, AuditPackageCache, AuditOutbox, Deposit
 from app.models.mpc import (
     MPCKeyset, MPCKeysetStatus,
     MPCSession, MPCSessionType, MPCSessionStatus,
@@ -12,6 +15,10 @@ from app.models.mpc import (
     MPCErrorCategory,
 )
 from app.models.group import Group, GroupMember, GroupAddressBook, GroupPolicy, AddressKind
+from app.models.ledger import LedgerAccount, LedgerEntryType, LedgerEntry, LedgerBalance
+from app.models.webhook import WebhookSubscription, WebhookDelivery, WEBHOOK_EVENT_TYPES
+from app.models.nonce import NonceAccount, NonceAllocation
+from app.models.mempool import MempoolTx, MempoolTxKind, MempoolTxStatus
 from app.models.policy_set import PolicySet, PolicyRule, PolicyDecision, RETAIL_GROUP_ID, RETAIL_POLICY_SET_ID
 
 __all__ = [
@@ -28,13 +35,21 @@ __all__ = [
     "TxType",
     "TxStatus",
     "VALID_TRANSITIONS",
+    "TERMINAL_STATUSES",
     "Approval",
     "KYTCase",
+    "TxPipelineStage",
+    "TxPipelineJob",
     "Policy",
     "PolicyType",
     "DailyVolume",
     "AuditEvent",
     "AuditEventType",
+    "AuditCheckpoint",
+    "AuditMerkleBatch",
+    "AuditArchiveSegment",
+    "AuditPackageCache",
+    "AuditOutbox",
     "Deposit",
     # MPC models
     "MPCKeyset",
@@ -58,4 +73,20 @@ __all__ = [
     "PolicyDecision",
     "RETAIL_GROUP_ID",
     "RETAIL_POLICY_SET_ID",
+    # Ledger models
+    "LedgerAccount",
+    "LedgerEntryType",
+    "LedgerEntry",
+    "LedgerBalance",
+    # Webhook models
+    "WebhookSubscription",
+    "WebhookDelivery",
+    "WEBHOOK_EVENT_TYPES",
+    # Nonce models
+    "NonceAccount",
+    "NonceAllocation",
+    # Mempool models
+    "MempoolTx",
+    "MempoolTxKind",
+    "MempoolTxStatus",
 ]
@@ -1,15 +1,15 @@
 """Audit log model with hash chain for tamper evidence."""
 import enum
 import hashlib
-import json
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, Enum, DateTime, Text, Index
+from sqlalchemy import String, Enum, DateTime, Text, Index, Sequence, Integer, BigInteger
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.canonical import RecordEncoder
 from app.database import Base
 
 
@@ -84,19 +84,44 @@ class AuditEventType(str, enum.Enum):
     POLICY_RULE_UPDATED = "POLICY_RULE_UPDATED"
     POLICY_RULE_DELETED = "POLICY_RULE_DELETED"
 
+    # Webhook subscription events
+    WEBHOOK_SUBSCRIPTION_CREATED = "WEBHOOK_SUBSCRIPTION_CREATED"
+    WEBHOOK_SUBSCRIPTION_DELETED = "WEBHOOK_SUBSCRIPTION_DELETED"
+
     # Conditional control events
     KYT_SKIPPED = "KYT_SKIPPED"
     APPROVALS_SKIPPED = "APPROVALS_SKIPPED"
 
 
+# Fields hashed into every audit event, encoded as
+# json.dumps({...}, sort_keys=True, default=str)
+_HASH_RECORD = RecordEncoder(
+    "event_id", "timestamp", "event_type", "actor_id",
+    "entity_type", "entity_id", "payload", "prev_hash",
+)
+
+# Database sequence backing AuditEvent.sequence_number (see migration 005)
+AUDIT_EVENT_SEQUENCE = Sequence("audit_events_seq")
+
+
 class AuditEvent(Base):
-    """Append-only audit log with hash chain."""
+    """
+    Append-only audit log with hash chain.
+
+    In PostgreSQL the table is partitioned by month on timestamp (migration
+    008); old partitions are archived to segment files and detached.
+    """
     __tablename__ = "audit_events"
     
+    # Primary key includes the partition key, as in migration 008
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
-    sequence_number: Mapped[int] = mapped_column(autoincrement=True, nullable=False, unique=True)
+    sequence_number: Mapped[int] = mapped_column(
+        AUDIT_EVENT_SEQUENCE, nullable=False, index=True
+    )
     
-    timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, default=datetime.utcnow, nullable=False, index=True
+    )
     event_type: Mapped[AuditEventType] = mapped_column(Enum(AuditEventType), nullable=False, index=True)
     
     # Actor
@@ -123,6 +148,12 @@ class AuditEvent(Base):
     __table_args__ = (
         Index("ix_audit_events_entity", "entity_type", "entity_id"),
         Index("ix_audit_events_timestamp_type", "timestamp", "event_type"),
+        # Trace and search endpoints page by sequence_number (migration 011)
+        Index("ix_audit_events_correlation_sequence", "correlation_id", "sequence_number"),
+        Index(
+            "ix_audit_events_payload", "payload",
+            postgresql_using="gin", postgresql_ops={"payload": "jsonb_path_ops"}
+        ),
     )
     
     @staticmethod
@@ -137,20 +168,138 @@ class AuditEvent(Base):
         prev_hash: Optional[str]
     ) -> str:
         """Compute SHA-256 hash for the event."""
-        data = {
-            "event_id": event_id,
-            "timestamp": timestamp.isoformat(),
-            "event_type": event_type,
-            "actor_id": actor_id,
-            "entity_type": entity_type,
-            "entity_id": entity_id,
-            "payload": payload,
-            "prev_hash": prev_hash
-        }
-        canonical = json.dumps(data, sort_keys=True, default=str)
+        canonical = _HASH_RECORD.encode(
+            event_id,
+            timestamp.isoformat(),
+            event_type,
+            actor_id,
+            entity_type,
+            entity_id,
+            payload,
+            prev_hash,
+        )
         return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+class AuditOutbox(Base):
+    """
+    Audit event written by a request but not yet appended to the hash chain.
+
+    Used in ``outbox`` chain mode: rows are inserted in the caller's
+    transaction and moved into audit_events, in id order, by the background
+    AuditChainHasher.
+    """
+    __tablename__ = "audit_outbox"
+    
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    event_type: Mapped[AuditEventType] = mapped_column(Enum(AuditEventType), nullable=False)
+    actor_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    actor_type: Mapped[str] = mapped_column(String(50), default="USER")
+    entity_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    entity_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    entity_refs: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    payload: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    correlation_id: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+class AuditCheckpoint(Base):
+    """
+    Signed marker that the hash chain was verified up to a sequence number.
+
+    Incremental verification resumes from the latest checkpoint instead of
+    re-hashing the chain from genesis.
+    """
+    __tablename__ = "audit_checkpoints"
+    
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
+    
+    # Last verified event
+    sequence_number: Mapped[int] = mapped_column(nullable=False, index=True)
+    event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    
+    # Number of events walked to produce this checkpoint
+    events_verified: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    verified_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    verified_by: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    
+    # HMAC over (sequence_number, hash, verified_at)
+    signature: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+class AuditMerkleBatch(Base):
+    """
+    Merkle root over a contiguous range of audit events.
+
+    Leaves are the event hashes in sequence order; see
+    app/services/audit_merkle for the tree layout.
+    """
+    __tablename__ = "audit_merkle_batches"
+    
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
+    
+    # Inclusive sequence range covered by the batch
+    from_sequence: Mapped[int] = mapped_column(nullable=False, unique=True)
+    to_sequence: Mapped[int] = mapped_column(nullable=False, index=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    
+    root: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class AuditArchiveSegment(Base):
+    """
+    Manifest of an audit_events partition sealed into segment files.
+
+    The data file holds the events as gzip NDJSON (export format); the index
+    file holds fixed-width (sequence_number, prev_hash, hash) records that
+    can be memory-mapped to check chain continuity without decompressing.
+    """
+    __tablename__ = "audit_archive_segments"
+    
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
+    partition_name: Mapped[str] = mapped_column(String(63), nullable=False, unique=True)
+    
+    # Month covered by the partition, [from_time, to_time)
+    from_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    to_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    
+    # Chain range held by the segment
+    from_sequence: Mapped[int] = mapped_column(nullable=False)
+    to_sequence: Mapped[int] = mapped_column(nullable=False, index=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_prev_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    last_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    last_timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    
+    # Segment files and their digests
+    data_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    data_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    index_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    index_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class AuditPackageCache(Base):
+    """
+    Persisted audit package of a transaction in a terminal state.
+
+    Valid as long as the tx's last audit event is still last_sequence_number.
+    """
+    __tablename__ = "audit_package_cache"
+    
+    tx_request_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    last_sequence_number: Mapped[int] = mapped_column(nullable=False)
+    package: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    package_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class Deposit(Base):
     """Inbound deposit detection record."""
     __tablename__ = "deposits"
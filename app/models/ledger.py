@@ -0,0 +1,89 @@
+"""Double-entry wallet ledger and its materialized per-wallet balances."""
+import enum
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Numeric, Integer, BigInteger, Index, Enum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class LedgerAccount(str, enum.Enum):
+    """
+    Accounts funds move between.
+
+    AVAILABLE, RESERVED and PENDING are per wallet and asset and are
+    materialized on LedgerBalance; EXTERNAL (the chain) and RECONCILIATION
+    (corrections) are the counterparties.
+    """
+    AVAILABLE = "AVAILABLE"  # Withdrawable
+    RESERVED = "RESERVED"  # Held by withdrawals in flight
+    PENDING = "PENDING"  # Deposits awaiting admin approval
+    EXTERNAL = "EXTERNAL"
+    RECONCILIATION = "RECONCILIATION"
+
+
+class LedgerEntryType(str, enum.Enum):
+    """Why funds moved; each type has one fixed pair of accounts."""
+    DEPOSIT_DETECTED = "DEPOSIT_DETECTED"  # EXTERNAL -> PENDING
+    DEPOSIT_CREDITED = "DEPOSIT_CREDITED"  # PENDING -> AVAILABLE
+    DEPOSIT_REJECTED = "DEPOSIT_REJECTED"  # PENDING -> EXTERNAL
+    WITHDRAWAL_RESERVED = "WITHDRAWAL_RESERVED"  # AVAILABLE -> RESERVED
+    WITHDRAWAL_RELEASED = "WITHDRAWAL_RELEASED"  # RESERVED -> AVAILABLE
+    WITHDRAWAL_SETTLED = "WITHDRAWAL_SETTLED"  # RESERVED -> EXTERNAL
+    ADJUSTMENT = "ADJUSTMENT"  # RECONCILIATION <-> any wallet account
+
+
+class LedgerEntry(Base):
+    """
+    One movement of funds between two accounts of a wallet.
+
+    The amount (wei) leaves credit_account and enters debit_account; an
+    account's balance is the sum of its debits minus its credits.
+    """
+    __tablename__ = "ledger_entries"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    wallet_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    asset: Mapped[str] = mapped_column(String(50), nullable=False)
+    entry_type: Mapped[LedgerEntryType] = mapped_column(Enum(LedgerEntryType), nullable=False)
+    debit_account: Mapped[LedgerAccount] = mapped_column(Enum(LedgerAccount), nullable=False)
+    credit_account: Mapped[LedgerAccount] = mapped_column(Enum(LedgerAccount), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(78, 18), nullable=False)
+    ref_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # TX_REQUEST or DEPOSIT
+    ref_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_ledger_entries_wallet_asset", "wallet_id", "asset", "id"),
+        # A deposit or withdrawal moves through each step once
+        Index("ix_ledger_entries_ref", "ref_id", "entry_type", unique=True),
+    )
+
+
+class LedgerBalance(Base):
+    """
+    Materialized balances of one wallet and asset, in wei.
+
+    Updated in the same transaction as every LedgerEntry, under a row lock,
+    so balance checks read one row and concurrent withdrawals serialize.
+    """
+    __tablename__ = "ledger_balances"
+
+    wallet_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    asset: Mapped[str] = mapped_column(String(50), primary_key=True)
+    available: Mapped[Decimal] = mapped_column(Numeric(78, 18), default=0, server_default="0")
+    reserved: Mapped[Decimal] = mapped_column(Numeric(78, 18), default=0, server_default="0")
+    pending: Mapped[Decimal] = mapped_column(Numeric(78, 18), default=0, server_default="0")
+    credited_deposits: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    pending_deposits: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    reconciled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def amount(self, account: LedgerAccount) -> Decimal:
+        return Decimal(getattr(self, account.value.lower()) or 0)
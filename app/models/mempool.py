@@ -0,0 +1,65 @@
+"""Mempool state of transactions sent by the hot wallet sender."""
+import enum
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import String, Enum, DateTime, Numeric, Text, ForeignKey, Index, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MempoolTxKind(str, enum.Enum):
+    """What a signed version of a transaction is."""
+    ORIGINAL = "ORIGINAL"
+    REPLACEMENT = "REPLACEMENT"  # Same transaction and nonce, higher fees
+    CANCELLATION = "CANCELLATION"  # Zero-value transfer to self at the same nonce
+
+
+class MempoolTxStatus(str, enum.Enum):
+    """Where a signed version stands."""
+    PENDING = "PENDING"  # Sent (or about to be), not mined
+    MINED = "MINED"
+    REPLACED = "REPLACED"  # Another version with the same nonce was mined
+    DROPPED = "DROPPED"  # Nonce mined by a transaction that is none of the versions
+
+
+class MempoolTx(Base):
+    """
+    One signed version of a transaction sent from a hot wallet address.
+
+    A transaction starts with its ORIGINAL version; each fee bump or
+    cancellation adds another version with the same nonce. At most one
+    version per nonce is ever MINED, the others end up REPLACED.
+    """
+    __tablename__ = "mempool_txs"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    tx_request_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("tx_requests.id"), nullable=False, index=True
+    )
+    address: Mapped[str] = mapped_column(String(42), nullable=False)  # Lowercase
+    nonce: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    kind: Mapped[MempoolTxKind] = mapped_column(Enum(MempoolTxKind), nullable=False)
+    status: Mapped[MempoolTxStatus] = mapped_column(
+        Enum(MempoolTxStatus), default=MempoolTxStatus.PENDING, nullable=False
+    )
+    tx_hash: Mapped[str] = mapped_column(String(66), nullable=False, unique=True)
+    signed_tx: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Fees signed with: EIP-1559, or legacy gas_price
+    max_fee_per_gas: Mapped[Optional[Decimal]] = mapped_column(Numeric(36, 0), nullable=True)
+    max_priority_fee_per_gas: Mapped[Optional[Decimal]] = mapped_column(Numeric(36, 0), nullable=True)
+    gas_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(36, 0), nullable=True)
+
+    block_number: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # Once MINED
+    sent_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_mempool_txs_address_status_nonce", "address", "status", "nonce"),
+    )
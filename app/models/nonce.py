@@ -0,0 +1,44 @@
+"""Per-signer nonce allocation shared by every process through the database."""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, BigInteger, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class NonceAccount(Base):
+    """
+    Nonce state of one signer address.
+
+    Locked (SELECT ... FOR UPDATE) for every allocation, so allocations for
+    an address serialize across API workers and background workers.
+    """
+    __tablename__ = "nonce_accounts"
+
+    address: Mapped[str] = mapped_column(String(42), primary_key=True)  # Lowercase
+    next_nonce: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    chain_nonce: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # Pending nonce last read from the chain
+    synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class NonceAllocation(Base):
+    """
+    A nonce handed to a transaction and not yet seen by the chain.
+
+    Dropped once the chain's pending nonce passes it; reassigned to another
+    transaction if its own fails before reaching the network.
+    """
+    __tablename__ = "nonce_allocations"
+
+    address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    nonce: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    tx_request_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    allocated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_nonce_allocations_tx", "tx_request_id"),
+    )
@@ -1,7 +1,6 @@
 """Policy set models for versioned policy rules."""
 import enum
 import hashlib
-import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -11,9 +10,18 @@ from sqlalchemy import String, Enum, DateTime, Boolean, ForeignKey, Text, Intege
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.canonical import RecordEncoder
 from app.database import Base
 
 
+# Rule fields covered by PolicySet.snapshot_hash, encoded as
+# json.dumps([{...}, ...], sort_keys=True, default=str)
+_RULE_SNAPSHOT_RECORD = RecordEncoder(
+    "rule_id", "priority", "conditions", "decision",
+    "kyt_required", "approval_required", "approval_count",
+)
+
+
 class PolicyDecision(str, enum.Enum):
     """Policy rule decision."""
     ALLOW = "ALLOW"      # Allow and continue
@@ -57,19 +65,18 @@ class PolicySet(Base):
 
     def compute_snapshot_hash(self) -> str:
         """Compute SHA256 hash of rules for integrity verification."""
-        rules_data = [
-            {
-                "rule_id": r.rule_id,
-                "priority": r.priority,
-                "conditions": r.conditions,
-                "decision": r.decision.value,
-                "kyt_required": r.kyt_required,
-                "approval_required": r.approval_required,
-                "approval_count": r.approval_count,
-            }
+        rules_json = "[" + ", ".join(
+            _RULE_SNAPSHOT_RECORD.encode(
+                r.rule_id,
+                r.priority,
+                r.conditions,
+                r.decision.value,
+                r.kyt_required,
+                r.approval_required,
+                r.approval_count,
+            )
             for r in sorted(self.rules, key=lambda x: x.priority)
-        ]
-        rules_json = json.dumps(rules_data, sort_keys=True, default=str)
+        ) + "]"
         return hashlib.sha256(rules_json.encode()).hexdigest()
 
     def update_snapshot_hash(self) -> None:
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, List
 from uuid import uuid4
 
-from sqlalchemy import String, Enum, DateTime, Numeric, Text, ForeignKey, JSON, Index
+from sqlalchemy import String, Enum, DateTime, Numeric, Text, ForeignKey, JSON, Index, Integer, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -48,6 +48,8 @@ class TxStatus(str, enum.Enum):
     CONFIRMING = "CONFIRMING"
     CONFIRMED = "CONFIRMED"
     FINALIZED = "FINALIZED"
+    CANCELLED = "CANCELLED"  # Nonce taken by a cancellation or another transaction (hot wallet sender)
+    REVERTED = "REVERTED"  # Mined, but execution reverted on-chain
 
 
 # Valid state transitions (v2 flow: Policy → KYT → Approval → Sign)
@@ -87,15 +89,31 @@ VALID_TRANSITIONS = {
     TxStatus.SIGNED: [TxStatus.BROADCAST_PENDING],
     TxStatus.FAILED_SIGN: [],  # Terminal state
     # Broadcast → Confirm
-    TxStatus.BROADCAST_PENDING: [TxStatus.BROADCASTED, TxStatus.FAILED_BROADCAST],
+    TxStatus.BROADCAST_PENDING: [TxStatus.BROADCASTED, TxStatus.FAILED_BROADCAST, TxStatus.REVERTED],
     TxStatus.BROADCASTED: [TxStatus.CONFIRMING],
-    TxStatus.FAILED_BROADCAST: [TxStatus.BROADCAST_PENDING],  # Can retry
+    TxStatus.FAILED_BROADCAST: [TxStatus.BROADCAST_PENDING, TxStatus.REVERTED],  # Can retry
     # Confirm → Finalize
-    TxStatus.CONFIRMING: [TxStatus.CONFIRMED],
+    TxStatus.CONFIRMING: [TxStatus.CONFIRMED, TxStatus.CANCELLED, TxStatus.REVERTED],
     TxStatus.CONFIRMED: [TxStatus.FINALIZED],
     TxStatus.FINALIZED: [],  # Terminal state
+    TxStatus.CANCELLED: [],  # Terminal state
+    TxStatus.REVERTED: [],  # Terminal state: the nonce is used, retrying cannot succeed
 }
 
+# States with no outgoing transitions - a tx in one of these never changes again
+TERMINAL_STATUSES = frozenset(
+    status for status, next_states in VALID_TRANSITIONS.items() if not next_states
+)
+
+# In-flight states a tx can be stranded in (restart or RPC outage mid-step);
+# the recovery sweeper resumes transactions stuck in these
+RECOVERABLE_STATUSES = frozenset({
+    TxStatus.SIGN_PENDING,
+    TxStatus.SIGNED,
+    TxStatus.BROADCAST_PENDING,
+    TxStatus.FAILED_BROADCAST,
+})
+
 
 class TxRequest(Base):
     """Transaction request model."""
@@ -124,6 +142,9 @@ class TxRequest(Base):
     policy_result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     requires_approval: Mapped[bool] = mapped_column(default=False)
     required_approvals: Mapped[int] = mapped_column(default=0)
+    # Votes so far, updated under SELECT ... FOR UPDATE with each Approval
+    approved_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    rejected_count: Mapped[int] = mapped_column(default=0, server_default="0")
     
     # Signing and broadcast
     signed_tx: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -206,3 +227,43 @@ class KYTCase(Base):
     # Relationships
     tx_request: Mapped[Optional["TxRequest"]] = relationship("TxRequest", back_populates="kyt_case", uselist=False)
 
+
+
+class TxPipelineStage(str, enum.Enum):
+    """Orchestrator stage run by a pipeline job."""
+    POLICY = "POLICY"
+    KYT = "KYT"
+    SIGN = "SIGN"
+    BROADCAST = "BROADCAST"
+
+
+class TxPipelineJob(Base):
+    """
+    Durable job advancing a transaction request through one orchestrator stage.
+
+    Used in ``queue`` pipeline mode: jobs are inserted in the transaction
+    that makes a stage due and claimed by pipeline workers with
+    SELECT ... FOR UPDATE SKIP LOCKED. A job is deleted in the same
+    transaction that runs its stage; a job that fails is retried with
+    backoff, then kept with status FAILED.
+    """
+    __tablename__ = "tx_pipeline_jobs"
+    
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    tx_request_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("tx_requests.id"), nullable=False, index=True
+    )
+    stage: Mapped[TxPipelineStage] = mapped_column(Enum(TxPipelineStage), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="PENDING")  # PENDING or FAILED
+    correlation_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    actor_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    run_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_tx_pipeline_jobs_due", "status", "run_at", "id"),
+    )
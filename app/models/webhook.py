@@ -0,0 +1,60 @@
+"""Outbound webhook subscriptions and their durable delivery queue."""
+from datetime import datetime
+from typing import List, Optional
+from uuid import uuid4
+
+from sqlalchemy import String, DateTime, Boolean, ForeignKey, Text, JSON, Index, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+# Event types a subscription can receive
+WEBHOOK_EVENT_TYPES = ("tx.confirmed", "tx.finalized", "deposit.credited")
+
+
+class WebhookSubscription(Base):
+    """A partner endpoint receiving signed, batched event notifications."""
+    __tablename__ = "webhook_subscriptions"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    secret: Mapped[str] = mapped_column(String(255), nullable=False)  # HMAC-SHA256 signing key
+    event_types: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+    wallet_ids: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)  # None: all wallets
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_by: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class WebhookDelivery(Base):
+    """
+    One event queued for one subscription.
+
+    Rows are inserted in the transaction that records the event and are
+    sent by the WebhookDispatcher, many events per POST. Failed sends are
+    retried with backoff, then kept with status FAILED.
+    """
+    __tablename__ = "webhook_deliveries"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    subscription_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("webhook_subscriptions.id"), nullable=False
+    )
+    event_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="PENDING")  # PENDING, DELIVERED or FAILED
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_deliveries_due", "status", "next_attempt_at", "id"),
+        Index("ix_webhook_deliveries_subscription_event", "subscription_id", "event_id", unique=True),
+    )
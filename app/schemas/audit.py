@@ -1,6 +1,6 @@
 """Audit schemas."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel
 
 from app.models.audit import AuditEventType
@@ -26,6 +26,41 @@ class AuditEventResponse(BaseModel):
         from_attributes = True
 
 
+class AuditEventPage(BaseModel):
+    """One keyset page of audit events in sequence order."""
+    items: List[AuditEventResponse]
+    has_more: bool
+    next_after_sequence: Optional[int] = None  # Pass as after_sequence for the next page
+    archived_through_sequence: Optional[int] = None  # Matches up to here may be in archive segments
+
+
+class AuditTraceResponse(BaseModel):
+    """All audit events sharing a correlation ID, across entities."""
+    correlation_id: str
+    events: List[AuditEventResponse]
+    entities: Dict[str, List[str]]  # entity_type -> entity IDs touched by this page
+    has_more: bool
+    next_after_sequence: Optional[int] = None
+    archived_through_sequence: Optional[int] = None  # Events up to here may be in archive segments
+
+
+class AuditProofStep(BaseModel):
+    """Sibling hash on the path from a Merkle leaf to the root."""
+    position: str  # "left" or "right" of the running node
+    hash: str
+
+
+class AuditInclusionProof(BaseModel):
+    """Merkle inclusion proof of an audit event in its anchored batch."""
+    event_id: str
+    sequence_number: int
+    event_hash: str
+    batch_id: str
+    merkle_root: str
+    leaf_index: int
+    path: List[AuditProofStep]
+
+
 class AuditPackageResponse(BaseModel):
     """Schema for audit package - aggregated audit trail for a tx request."""
     tx_request_id: str
@@ -37,6 +72,8 @@ class AuditPackageResponse(BaseModel):
     broadcast: Optional[dict]
     confirmations: Optional[dict]
     audit_events: List[AuditEventResponse]
+    inclusion_proofs: List[AuditInclusionProof] = []  # Only for events already anchored
+    archived_through_sequence: Optional[int] = None  # Events up to here may be in archive segments
     package_hash: str  # Hash of the entire package for verification
     generated_at: datetime
 
@@ -50,4 +87,8 @@ class AuditVerifyResponse(BaseModel):
     last_event_id: Optional[str]
     chain_intact: bool
     errors: List[str] = []
+    resumed_from_sequence: Optional[int] = None  # Checkpoint the walk resumed after
+    last_sequence_number: Optional[int] = None
+    checkpoint_id: Optional[str] = None  # Checkpoint recorded by this verification
+    pending_outbox_events: int = 0  # Logged events not yet appended to the chain
 
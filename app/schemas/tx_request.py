@@ -42,6 +42,11 @@ class TxRequestCreate(BaseModel):
         }
 
 
+class TxRequestBatchCreate(BaseModel):
+    """Schema for submitting many transaction requests at once (payout runs)."""
+    items: List[TxRequestCreate] = Field(..., min_length=1)
+
+
 class TxRequestResponse(BaseModel):
     """Schema for transaction request response."""
     id: str
@@ -57,6 +62,8 @@ class TxRequestResponse(BaseModel):
     policy_result: Optional[dict]
     requires_approval: bool
     required_approvals: int
+    approved_count: int = 0
+    rejected_count: int = 0
     tx_hash: Optional[str]
     block_number: Optional[int]
     confirmations: int
@@ -70,6 +77,20 @@ class TxRequestResponse(BaseModel):
         from_attributes = True
 
 
+class TxRequestBatchItemResult(BaseModel):
+    """Outcome of one item of a batch submission."""
+    index: int
+    tx_request: Optional[TxRequestResponse] = None
+    error: Optional[str] = None
+
+
+class TxRequestBatchResponse(BaseModel):
+    """Per-item results of a batch submission, in input order."""
+    items: List[TxRequestBatchItemResult]
+    accepted: int
+    rejected: int
+
+
 class ApprovalCreate(BaseModel):
     """Schema for approving/rejecting a transaction."""
     decision: str = Field(..., pattern="^(APPROVED|REJECTED)$")
@@ -0,0 +1,42 @@
+"""Webhook subscription schemas for API."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.webhook import WEBHOOK_EVENT_TYPES
+
+
+class WebhookSubscriptionCreate(BaseModel):
+    """Subscribe an endpoint to webhook events."""
+    name: str = Field(..., min_length=1, max_length=255)
+    url: str = Field(..., pattern=r"^https?://", max_length=2048)
+    event_types: List[str] = Field(..., min_length=1)
+    wallet_ids: Optional[List[str]] = Field(None, description="Only these wallets (default: all)")
+
+    @field_validator("event_types")
+    @classmethod
+    def validate_event_types(cls, v: List[str]) -> List[str]:
+        unknown = set(v) - set(WEBHOOK_EVENT_TYPES)
+        if unknown:
+            raise ValueError(
+                f"Unknown event types {sorted(unknown)}; expected {list(WEBHOOK_EVENT_TYPES)}"
+            )
+        return sorted(set(v))
+
+
+class WebhookSubscriptionResponse(BaseModel):
+    """Webhook subscription details."""
+    id: str
+    name: str
+    url: str
+    event_types: List[str]
+    wallet_ids: Optional[List[str]]
+    is_active: bool
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class WebhookSubscriptionCreated(WebhookSubscriptionResponse):
+    """A new subscription, with the signing secret (only returned once)."""
+    secret: str
@@ -1,5 +1,5 @@
 """Address book service for group allow/deny lists."""
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from sqlalchemy import select, and_
@@ -185,7 +185,34 @@ class AddressBookService:
             - 'unknown': Address is not in any list
         """
         entry = await self.get_address_entry(group_id, address)
+        return self._entry_status(entry)
 
+    async def check_addresses(
+        self,
+        group_id: str,
+        addresses: List[str],
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Check many addresses against the group's address book in one query.
+
+        Returns (status, label) as in check_address, keyed by lowercased address.
+        """
+        wanted = {address.lower() for address in addresses}
+        entries = {}
+        if wanted:
+            result = await self.db.execute(
+                select(GroupAddressBook).where(
+                    and_(
+                        GroupAddressBook.group_id == group_id,
+                        GroupAddressBook.address.in_(wanted),
+                    )
+                )
+            )
+            entries = {entry.address: entry for entry in result.scalars().all()}
+        return {address: self._entry_status(entries.get(address)) for address in wanted}
+
+    @staticmethod
+    def _entry_status(entry: Optional[GroupAddressBook]) -> Tuple[str, Optional[str]]:
         if entry is None:
             return 'unknown', None
 
@@ -0,0 +1,168 @@
+"""Admission control for transaction intake.
+
+Every transaction request holds a pooled database connection and makes
+KYT calls for as long as it runs, so an unbounded burst of submissions
+exhausts the connection pool (surfacing as pool-timeout 500s) and the KYT
+provider's rate limit at the same time. The AdmissionController bounds
+intake instead:
+
+- at most tx_admission_max_concurrent requests run at once, at most
+  tx_admission_max_per_tenant for one caller and
+  tx_admission_max_per_wallet touching one wallet
+- requests over a limit wait in a bounded queue (tx_admission_max_queue)
+  for up to tx_admission_queue_timeout seconds; a queued request ends its
+  database transaction first, so it does not hold a connection while it
+  waits
+- a request that cannot queue, or times out waiting, is rejected with
+  AdmissionRejected, carrying a Retry-After estimate from recent service
+  times; the API answers 429
+
+Limits are per process.
+"""
+import asyncio
+import math
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+
+# Weight of the latest request in the moving average of service time
+_SERVICE_TIME_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted; retry after `retry_after` seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limits and a bounded wait queue for one kind of request."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.settings = get_settings()
+        self._condition = asyncio.Condition()
+        self._in_flight = 0
+        self._tenants: Counter = Counter()
+        self._wallets: Counter = Counter()
+        self._waiting = 0
+        self._waiting_tenants: Counter = Counter()
+        self._service_time = 1.0  # Moving average, seconds
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _can_run(self, tenant: str, wallet_ids: Iterable[str]) -> bool:
+        return (
+            self._in_flight < self.settings.tx_admission_max_concurrent
+            and self._tenants[tenant] < self.settings.tx_admission_max_per_tenant
+            and all(self._wallets[w] < self.settings.tx_admission_max_per_wallet for w in wallet_ids)
+        )
+
+    def _take(self, tenant: str, wallet_ids: Iterable[str]):
+        self._in_flight += 1
+        self._tenants[tenant] += 1
+        for wallet_id in wallet_ids:
+            self._wallets[wallet_id] += 1
+        self._admitted += 1
+
+    def _retry_after(self) -> int:
+        """Seconds until the requests ahead of a new one have likely drained."""
+        ahead = self._in_flight + self._waiting
+        rounds = ahead / max(self.settings.tx_admission_max_concurrent, 1)
+        return max(1, math.ceil(self._service_time * rounds))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self._rejected += 1
+        return AdmissionRejected(reason, self._retry_after())
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        tenant: str,
+        wallet_ids: Iterable[str],
+        db: Optional[AsyncSession] = None
+    ) -> AsyncIterator[None]:
+        """
+        Run the enclosed block once the request is within all limits.
+
+        If it has to wait, db's transaction (holding only the reads made so
+        far, such as authentication) is committed first, which returns its
+        connection to the pool. Raises AdmissionRejected when the queue is
+        full or the wait times out.
+        """
+        tenant = str(tenant)
+        wallet_ids = set(wallet_ids)
+
+        async with self._condition:
+            queued = not self._can_run(tenant, wallet_ids)
+            if queued:
+                if self._waiting >= self.settings.tx_admission_max_queue:
+                    raise self._reject("Transaction intake is saturated")
+                # One tenant may not take over the whole queue
+                if self._waiting_tenants[tenant] >= self.settings.tx_admission_max_per_tenant:
+                    raise self._reject("Too many queued requests for this tenant")
+                self._waiting += 1
+                self._waiting_tenants[tenant] += 1
+
+        if queued:
+            try:
+                if db is not None:
+                    await db.commit()
+                async with self._condition:
+                    await asyncio.wait_for(
+                        self._condition.wait_for(lambda: self._can_run(tenant, wallet_ids)),
+                        timeout=self.settings.tx_admission_queue_timeout,
+                    )
+                    self._take(tenant, wallet_ids)
+            except asyncio.TimeoutError:
+                self._timed_out += 1
+                raise self._reject("Timed out waiting for transaction intake capacity")
+            finally:
+                self._waiting -= 1
+                self._waiting_tenants[tenant] -= 1
+                if not self._waiting_tenants[tenant]:
+                    del self._waiting_tenants[tenant]
+        else:
+            self._take(tenant, wallet_ids)
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            async with self._condition:
+                self._in_flight -= 1
+                self._tenants[tenant] -= 1
+                if not self._tenants[tenant]:
+                    del self._tenants[tenant]
+                for wallet_id in wallet_ids:
+                    self._wallets[wallet_id] -= 1
+                    if not self._wallets[wallet_id]:
+                        del self._wallets[wallet_id]
+                self._service_time += _SERVICE_TIME_ALPHA * (elapsed - self._service_time)
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """Live queue depth and counters, for /health."""
+        return {
+            "in_flight": self._in_flight,
+            "queued": self._waiting,
+            "max_concurrent": self.settings.tx_admission_max_concurrent,
+            "max_queue": self.settings.tx_admission_max_queue,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "avg_service_seconds": round(self._service_time, 3),
+        }
+
+
+tx_admission = AdmissionController("tx_intake")
@@ -1,23 +1,112 @@
 """Audit service with hash-chain for tamper evidence."""
+import asyncio
 import hashlib
-import json
-from datetime import datetime
-from typing import Optional, List
+import hmac
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Optional, List, Tuple
 from uuid import uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, delete, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import event as sa_event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.util import await_only
 
-from app.models.audit import AuditEvent, AuditEventType
-from app.models.tx_request import TxRequest, Approval
-from app.schemas.audit import AuditPackageResponse, AuditEventResponse, AuditVerifyResponse
+from app.canonical import canonical_dumps
+from app.config import get_settings
+from app.database import begin_transaction
+from app.models.audit import (
+    AuditEvent,
+    AuditEventType,
+    AuditCheckpoint,
+    AuditMerkleBatch,
+    AuditArchiveSegment,
+    AuditPackageCache,
+    AuditOutbox,
+)
+from app.models.tx_request import TxRequest, Approval, TxStatus, TERMINAL_STATUSES
+from app.schemas.audit import (
+    AuditPackageResponse,
+    AuditEventResponse,
+    AuditVerifyResponse,
+    AuditInclusionProof,
+)
+from app.services.audit_merkle import merkle_root, merkle_proof
+from app.services.audit_verify import (
+    SegmentResult,
+    get_verify_pool,
+    get_verify_pool_workers,
+    verify_segment,
+)
+
+
+# Advisory lock key guarding the chain tail. Every writer appends under this
+# transaction-scoped lock, so sequence numbers and prev_hash links are assigned
+# in the same order across processes.
+AUDIT_CHAIN_LOCK_KEY = 0x41554454  # "AUDT"
+
+# Session.info key holding the chain tail (hash, timestamp) known to the current transaction
+_CHAIN_TAIL_KEY = "audit_chain_tail"
+
+# Session.info key holding the AuditServices with events logged outside batch()
+_DEFERRED_KEY = "audit_deferred"
+
+# Columns carried by an audit_outbox row (besides event_id)
+_OUTBOX_COLUMNS = (
+    "timestamp", "event_type", "actor_id", "actor_type", "entity_type",
+    "entity_id", "entity_refs", "payload", "correlation_id",
+)
+
+_AUDIT_COLUMNS = (
+    "id", "timestamp", "event_type", "actor_id", "actor_type", "entity_type",
+    "entity_id", "entity_refs", "payload", "correlation_id", "prev_hash", "hash",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _reset_chain_tail(session, transaction) -> None:
+    """Forget the cached chain tail once the outermost transaction ends."""
+    if transaction.parent is None:
+        session.info.pop(_CHAIN_TAIL_KEY, None)
+        # Rolled back (on commit they were flushed already)
+        for audit in session.info.pop(_DEFERRED_KEY, []):
+            audit._pending.clear()
+
+
+def _flush_deferred(session) -> None:
+    """Append events logged outside batch() right before the transaction commits."""
+    for audit in session.info.pop(_DEFERRED_KEY, []):
+        # Runs inside AsyncSession.commit()'s greenlet, so the async
+        # flush can be awaited from this sync event hook
+        await_only(audit.flush())
 
 
 class AuditService:
-    """Service for managing audit events with hash chain."""
+    """Service for managing audit events with hash chain.
+
+    Events are appended under a single advisory lock and take their sequence
+    numbers from the ``audit_events_seq`` database sequence. The chain tail
+    hash is read once per transaction and then kept in memory, so a writer
+    only pays for the lock and tail lookup on its first append.
+
+    Inside ``batch()`` events are buffered and hashed/written together in a
+    single multi-row INSERT when the outermost batch exits. Audit packages
+    queued with ``queue_package_cache()`` are cached right after that write.
+    Events logged outside a batch are buffered until the session commits,
+    so the chain lock is only held for the commit itself rather than for
+    the rest of the caller's transaction.
+    """
     
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.settings = get_settings()
+        self._pending: List[AuditEvent] = []
+        self._batch_depth = 0
+        self._package_cache_queue: List[str] = []
     
     async def log_event(
         self,
@@ -30,36 +119,16 @@ class AuditService:
         entity_refs: Optional[dict] = None,
         payload: Optional[dict] = None,
     ) -> AuditEvent:
-        """Create a new audit event with hash chain."""
-        # Get the previous event's hash
-        prev_event = await self._get_last_event()
-        prev_hash = prev_event.hash if prev_event else None
-        
-        # Get next sequence number
-        seq_result = await self.db.execute(
-            select(func.coalesce(func.max(AuditEvent.sequence_number), 0) + 1)
-        )
-        sequence_number = seq_result.scalar()
-        
-        event_id = str(uuid4())
-        timestamp = datetime.utcnow()
-        
-        # Compute hash
-        event_hash = AuditEvent.compute_hash(
-            event_id=event_id,
-            timestamp=timestamp,
-            event_type=event_type.value,
-            actor_id=actor_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            payload=payload,
-            prev_hash=prev_hash
-        )
-        
+        """Create a new audit event with hash chain.
+
+        The event is buffered and its ``sequence_number``, ``prev_hash`` and
+        ``hash`` are populated when it is flushed: when the enclosing
+        ``batch()`` exits or, outside of a batch, right before the session
+        commits (or on an explicit ``flush()``).
+        """
         event = AuditEvent(
-            id=event_id,
-            sequence_number=sequence_number,
-            timestamp=timestamp,
+            id=str(uuid4()),
+            timestamp=datetime.utcnow(),
             event_type=event_type,
             actor_id=actor_id,
             actor_type=actor_type,
@@ -68,15 +137,186 @@ class AuditService:
             entity_refs=entity_refs,
             payload=payload,
             correlation_id=correlation_id,
-            prev_hash=prev_hash,
-            hash=event_hash
         )
+        self._pending.append(event)
         
-        self.db.add(event)
-        await self.db.flush()
+        if self._batch_depth == 0:
+            self._defer_to_commit()
         
         return event
     
+    def _defer_to_commit(self) -> None:
+        """Flush the buffered events before the session's transaction commits."""
+        session = self.db.sync_session
+        # So that a rollback ends it (and discards the events) even if no
+        # SQL ran since they were logged
+        begin_transaction(session)
+        if not sa_event.contains(session, "before_commit", _flush_deferred):
+            sa_event.listen(session, "before_commit", _flush_deferred)
+        if not sa_event.contains(session, "after_transaction_end", _reset_chain_tail):
+            sa_event.listen(session, "after_transaction_end", _reset_chain_tail)
+        deferred = session.info.setdefault(_DEFERRED_KEY, [])
+        if self not in deferred:
+            deferred.append(self)
+    
+    def is_last_pending(self, event: AuditEvent) -> bool:
+        """Whether event is still buffered and nothing was logged after it."""
+        return bool(self._pending) and self._pending[-1] is event
+    
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["AuditService"]:
+        """
+        Group all events logged within one unit of work into one write.
+
+        Batches may be nested; events are flushed when the outermost batch
+        exits normally. If the unit of work raises, the buffered events are
+        discarded together with the caller's transaction.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pending.clear()
+                self._package_cache_queue.clear()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            await self.flush()
+            await self._cache_queued_packages()
+    
+    async def flush(self) -> None:
+        """
+        Write all buffered events in a single INSERT.
+
+        In ``outbox`` chain mode the events are queued unhashed in
+        audit_outbox, without touching the chain lock; the background
+        AuditChainHasher appends them to the chain later.
+        """
+        if not self._pending:
+            return
+        events, self._pending = self._pending, []
+        
+        if self.settings.audit_chain_mode == "outbox":
+            await self.db.execute(insert(AuditOutbox).values([
+                {"event_id": e.id, **{column: getattr(e, column) for column in _OUTBOX_COLUMNS}}
+                for e in events
+            ]))
+            return
+        
+        await self._append_to_chain(events)
+    
+    async def drain_outbox(self, limit: int) -> int:
+        """
+        Append up to `limit` queued outbox events to the chain, oldest first.
+
+        Returns the number of events appended. The caller commits.
+        """
+        # Lock the chain first so concurrent hashers drain in chain order
+        await self._acquire_chain_tail()
+        
+        result = await self.db.execute(
+            select(AuditOutbox).order_by(AuditOutbox.id.asc()).limit(limit)
+        )
+        queued = list(result.scalars().all())
+        if not queued:
+            return 0
+        
+        await self._append_to_chain([
+            AuditEvent(id=row.event_id, **{column: getattr(row, column) for column in _OUTBOX_COLUMNS})
+            for row in queued
+        ])
+        await self.db.execute(
+            delete(AuditOutbox).where(AuditOutbox.id.in_([row.id for row in queued]))
+        )
+        return len(queued)
+    
+    async def _append_to_chain(self, events: List[AuditEvent]) -> None:
+        """Hash events onto the chain tail and insert them in one statement."""
+        prev_hash, prev_timestamp = await self._acquire_chain_tail()
+        for event in events:
+            # Timestamps never decrease along the chain, so each monthly
+            # partition holds a contiguous sequence range
+            if prev_timestamp and event.timestamp < prev_timestamp:
+                event.timestamp = prev_timestamp
+            prev_timestamp = event.timestamp
+            event.prev_hash = prev_hash
+            event.hash = AuditEvent.compute_hash(
+                event_id=event.id,
+                timestamp=event.timestamp,
+                event_type=event.event_type.value,
+                actor_id=event.actor_id,
+                entity_type=event.entity_type,
+                entity_id=event.entity_id,
+                payload=event.payload,
+                prev_hash=prev_hash
+            )
+            prev_hash = event.hash
+        
+        rows = [{column: getattr(e, column) for column in _AUDIT_COLUMNS} for e in events]
+        
+        if self._is_postgres:
+            # sequence_number is filled by nextval() per row, in VALUES order
+            result = await self.db.execute(
+                insert(AuditEvent)
+                .values(rows)
+                .returning(AuditEvent.id, AuditEvent.sequence_number)
+            )
+            sequence_numbers = dict(result.all())
+            for event in events:
+                event.sequence_number = sequence_numbers[event.id]
+        else:
+            seq_result = await self.db.execute(
+                select(func.coalesce(func.max(AuditEvent.sequence_number), 0))
+            )
+            next_sequence = seq_result.scalar()
+            for event, row in zip(events, rows):
+                next_sequence += 1
+                event.sequence_number = row["sequence_number"] = next_sequence
+            await self.db.execute(insert(AuditEvent).values(rows))
+        
+        self.db.sync_session.info[_CHAIN_TAIL_KEY] = (prev_hash, prev_timestamp)
+    
+    @property
+    def _is_postgres(self) -> bool:
+        return self.db.bind is not None and self.db.bind.dialect.name == "postgresql"
+    
+    async def _acquire_chain_tail(self) -> Tuple[Optional[str], Optional[datetime]]:
+        """
+        Lock the chain and return the current tail (hash, timestamp).
+
+        The lock is transaction-scoped, so once taken the tail cannot move
+        underneath us and is served from memory until commit/rollback.
+        """
+        session = self.db.sync_session
+        if _CHAIN_TAIL_KEY in session.info:
+            return session.info[_CHAIN_TAIL_KEY]
+        
+        if not sa_event.contains(session, "after_transaction_end", _reset_chain_tail):
+            sa_event.listen(session, "after_transaction_end", _reset_chain_tail)
+        
+        if self._is_postgres:
+            await self.db.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {"key": AUDIT_CHAIN_LOCK_KEY}
+            )
+        
+        result = await self.db.execute(
+            select(AuditEvent.hash, AuditEvent.timestamp)
+            .order_by(AuditEvent.sequence_number.desc())
+            .limit(1)
+        )
+        row = result.first()
+        if row is not None:
+            tail = (row.hash, row.timestamp)
+        else:
+            # Every partition may have been archived
+            segment = await self.get_archived_predecessor()
+            tail = (segment.last_hash, segment.last_timestamp) if segment else (None, None)
+        session.info[_CHAIN_TAIL_KEY] = tail
+        return tail
+    
     async def _get_last_event(self) -> Optional[AuditEvent]:
         """Get the last audit event for hash chain continuation."""
         result = await self.db.execute(
@@ -88,6 +328,7 @@ class AuditService:
     
     async def get_last_audit_event(self) -> Optional[AuditEvent]:
         """Get the last audit event (public interface for SigningPermit anchor)."""
+        await self.flush()
         return await self._get_last_event()
     
     async def get_events_for_entity(
@@ -97,6 +338,7 @@ class AuditService:
         limit: int = 100
     ) -> List[AuditEvent]:
         """Get audit events for a specific entity."""
+        await self.flush()
         result = await self.db.execute(
             select(AuditEvent)
             .where(AuditEvent.entity_type == entity_type)
@@ -105,7 +347,62 @@ class AuditService:
             .limit(limit)
         )
         return list(result.scalars().all())
-    
+
+    async def search_events(
+        self,
+        correlation_id: Optional[str] = None,
+        event_types: Optional[List[AuditEventType]] = None,
+        actor_id: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        payload_contains: Optional[dict] = None,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        after_sequence: Optional[int] = None,
+        limit: int = 100
+    ) -> Tuple[List[AuditEvent], Optional[int]]:
+        """
+        Search audit events in sequence order with keyset pagination.
+
+        Returns (events, next_after_sequence); the cursor is None on the last
+        page. Pages continue with sequence_number > after_sequence instead of
+        OFFSET, so every page is an index range scan. payload_contains is a
+        JSONB containment (@>) predicate served by the payload GIN index.
+        Only attached partitions are searched; archived events are in the
+        segment files (see archived_through).
+        """
+        query = select(AuditEvent)
+        if correlation_id is not None:
+            query = query.where(AuditEvent.correlation_id == correlation_id)
+        if event_types:
+            query = query.where(AuditEvent.event_type.in_(event_types))
+        if actor_id is not None:
+            query = query.where(AuditEvent.actor_id == actor_id)
+        if entity_type is not None:
+            query = query.where(AuditEvent.entity_type == entity_type)
+        if entity_id is not None:
+            query = query.where(AuditEvent.entity_id == entity_id)
+        if payload_contains:
+            if not self._is_postgres:
+                raise ValueError("Payload predicates require PostgreSQL")
+            query = query.where(AuditEvent.payload.contains(payload_contains))
+        if from_time is not None:
+            query = query.where(AuditEvent.timestamp >= from_time)
+        if to_time is not None:
+            query = query.where(AuditEvent.timestamp <= to_time)
+        if after_sequence is not None:
+            query = query.where(AuditEvent.sequence_number > after_sequence)
+
+        # One extra row tells whether another page exists
+        result = await self.db.execute(
+            query.order_by(AuditEvent.sequence_number.asc()).limit(limit + 1)
+        )
+        events = list(result.scalars().all())
+        if len(events) <= limit:
+            return events, None
+        events = events[:limit]
+        return events, events[-1].sequence_number
+
     async def build_audit_package(
         self,
         tx_request_id: str,
@@ -123,6 +420,12 @@ class AuditService:
         
         # Get all audit events for this tx request
         events = await self.get_events_for_entity("TX_REQUEST", tx_request_id)
+        archived_through = await self.archived_through(from_time=tx_request.created_at)
+        if archived_through is not None:
+            logger.warning(
+                f"Audit package for {tx_request_id} omits events archived "
+                f"through sequence {archived_through}"
+            )
         
         # Get approvals
         approvals_result = await self.db.execute(
@@ -188,12 +491,16 @@ class AuditService:
             "audit_events": [
                 AuditEventResponse.model_validate(e) for e in events
             ],
+            "inclusion_proofs": [
+                p.model_dump() for p in await self.get_inclusion_proofs(events)
+            ],
+            "archived_through_sequence": archived_through,
             "generated_at": datetime.utcnow().isoformat()
         }
         
         # Compute package hash
         package_hash = hashlib.sha256(
-            json.dumps(package_data, sort_keys=True, default=str).encode()
+            canonical_dumps(package_data).encode()
         ).hexdigest()
         
         return AuditPackageResponse(
@@ -206,88 +513,456 @@ class AuditService:
             broadcast=broadcast_info,
             confirmations=confirmation_info,
             audit_events=package_data["audit_events"],
+            inclusion_proofs=package_data["inclusion_proofs"],
+            archived_through_sequence=archived_through,
             package_hash=package_hash,
             generated_at=datetime.utcnow()
         )
     
+    async def get_audit_package(
+        self,
+        tx_request_id: str,
+        correlation_id: str
+    ) -> AuditPackageResponse:
+        """
+        Get the audit package for a transaction request.
+
+        Packages of terminal transactions are served from the package cache
+        while no newer event exists for the tx; otherwise the package is
+        built and, if the tx is terminal, cached. Sealing a Merkle batch
+        drops the cached packages it adds inclusion proofs to.
+        """
+        await self.flush()
+        result = await self.db.execute(
+            select(AuditPackageCache).where(AuditPackageCache.tx_request_id == tx_request_id)
+        )
+        cached = result.scalar_one_or_none()
+        if cached and cached.last_sequence_number == await self._last_package_sequence(tx_request_id):
+            return AuditPackageResponse.model_validate(cached.package)
+        
+        package = await self.build_audit_package(tx_request_id, correlation_id)
+        if TxStatus(package.tx_request["status"]) in TERMINAL_STATUSES:
+            await self._store_package(package)
+        return package
+    
+    async def queue_package_cache(self, tx_request_id: str) -> None:
+        """Cache the package of a tx that reached a terminal state once its events are written."""
+        self._package_cache_queue.append(tx_request_id)
+        if self._batch_depth == 0:
+            await self.flush()
+            await self._cache_queued_packages()
+    
+    async def _cache_queued_packages(self) -> None:
+        queued, self._package_cache_queue = self._package_cache_queue, []
+        for tx_request_id in dict.fromkeys(queued):
+            package = await self.build_audit_package(tx_request_id, correlation_id="")
+            await self._store_package(package)
+    
+    async def _last_package_sequence(self, tx_request_id: str) -> Optional[int]:
+        """Sequence number of the last event that feeds the tx's package."""
+        result = await self.db.execute(
+            select(func.max(AuditEvent.sequence_number))
+            .where(AuditEvent.entity_type == "TX_REQUEST")
+            .where(AuditEvent.entity_id == tx_request_id)
+        )
+        return result.scalar()
+    
+    async def _store_package(self, package: AuditPackageResponse) -> None:
+        values = {
+            "tx_request_id": package.tx_request_id,
+            "last_sequence_number": await self._last_package_sequence(package.tx_request_id) or 0,
+            "package": package.model_dump(mode="json"),
+            "package_hash": package.package_hash,
+            "created_at": datetime.utcnow(),
+        }
+        if self._is_postgres:
+            stmt = pg_insert(AuditPackageCache).values(**values)
+            await self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[AuditPackageCache.tx_request_id],
+                set_={k: stmt.excluded[k] for k in values if k != "tx_request_id"},
+            ))
+        else:
+            await self.db.merge(AuditPackageCache(**values))
+            await self.db.flush()
+    
     async def verify_chain(
         self,
         from_sequence: Optional[int] = None,
-        to_sequence: Optional[int] = None
+        to_sequence: Optional[int] = None,
+        incremental: bool = False,
+        verified_by: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        parallel: bool = False,
+        record_checkpoint: bool = True,
     ) -> AuditVerifyResponse:
-        """Verify the integrity of the audit hash chain."""
-        query = select(AuditEvent).order_by(AuditEvent.sequence_number.asc())
+        """
+        Verify the integrity of the audit hash chain.
+
+        Events are streamed through a server-side cursor in chunks of
+        ``audit_verify_chunk_size`` rows, so memory use does not depend on the
+        range size. ``progress(events_walked, last_sequence)`` is called after
+        every chunk.
+
+        Each chunk is re-hashed as an independent segment. With
+        ``parallel=True`` segments are farmed out to the shared process pool
+        (``audit_verify_workers``) and stitched together at their boundaries,
+        keeping the hashing off the event loop.
+
+        With ``incremental=True`` (and no explicit ``from_sequence``) the walk
+        resumes after the latest signed checkpoint. Whenever a walk anchored at
+        genesis or at a checkpoint reaches the chain tail without errors, a new
+        checkpoint is recorded, unless ``record_checkpoint=False`` (read-only
+        walk). The caller commits the checkpoint.
+
+        Events still waiting in the outbox are not part of the chain yet and
+        are reported as ``pending_outbox_events``.
+        """
+        await self.flush()
+        
+        errors = []
+        prev_hash = None
+        checkpoint = None
+        anchored = from_sequence is None
+        
+        if from_sequence is None:
+            # Archived segments were verified when sealed; the walk over the
+            # live table starts from the tail of the latest one
+            archived = await self.get_archived_predecessor()
+            if archived:
+                prev_hash = archived.last_hash
+        
+        if incremental and from_sequence is None:
+            checkpoint = await self.get_latest_checkpoint()
+            if checkpoint and archived and checkpoint.sequence_number <= archived.to_sequence:
+                # Superseded by archival
+                checkpoint = None
+            if checkpoint:
+                checkpoint_error = await self._check_checkpoint(checkpoint)
+                if checkpoint_error:
+                    # Untrusted checkpoint - fall back to a walk from genesis
+                    errors.append(checkpoint_error)
+                    checkpoint = None
+                else:
+                    from_sequence = checkpoint.sequence_number + 1
+                    prev_hash = checkpoint.hash
+        elif from_sequence and from_sequence > 1:
+            # For the first event in range, get its expected prev_hash.
+            # Sequence numbers come from a DB sequence and may have gaps
+            # (rolled-back transactions), so look up the nearest predecessor.
+            prev_result = await self.db.execute(
+                select(AuditEvent.hash)
+                .where(AuditEvent.sequence_number < from_sequence)
+                .order_by(AuditEvent.sequence_number.desc())
+                .limit(1)
+            )
+            prev_hash = prev_result.scalar_one_or_none()
+            if prev_hash is None:
+                archived = await self.get_archived_predecessor(from_sequence)
+                prev_hash = archived.last_hash if archived else None
+        
+        query = select(
+            AuditEvent.id,
+            AuditEvent.sequence_number,
+            AuditEvent.timestamp,
+            AuditEvent.event_type,
+            AuditEvent.actor_id,
+            AuditEvent.entity_type,
+            AuditEvent.entity_id,
+            AuditEvent.payload,
+            AuditEvent.prev_hash,
+            AuditEvent.hash,
+        ).order_by(AuditEvent.sequence_number.asc())
         
         if from_sequence is not None:
             query = query.where(AuditEvent.sequence_number >= from_sequence)
         if to_sequence is not None:
             query = query.where(AuditEvent.sequence_number <= to_sequence)
         
-        result = await self.db.execute(query)
-        events = list(result.scalars().all())
+        chunk_size = self.settings.audit_verify_chunk_size
+        total = 0
+        verified = 0
+        first_event_id = None
+        last_segment: Optional[SegmentResult] = None
         
-        if not events:
-            return AuditVerifyResponse(
-                is_valid=True,
-                total_events=0,
-                verified_events=0,
-                first_event_id=None,
-                last_event_id=None,
-                chain_intact=True,
-                errors=[]
+        def absorb(segment: SegmentResult):
+            """Stitch a re-hashed segment onto the chain walked so far."""
+            nonlocal prev_hash, total, verified, first_event_id, last_segment
+            if segment.first_prev_hash != prev_hash:
+                errors.append(
+                    f"Event {segment.first_id} (seq {segment.first_sequence}): "
+                    f"prev_hash mismatch. Expected {prev_hash}, got {segment.first_prev_hash}"
+                )
+            errors.extend(segment.errors)
+            if first_event_id is None:
+                first_event_id = segment.first_id
+            prev_hash = segment.last_hash
+            total += segment.count
+            verified += segment.verified
+            last_segment = segment
+            
+            logger.info(f"Audit verification progress: {total} events, up to seq {segment.last_sequence}")
+            if progress:
+                progress(total, segment.last_sequence)
+        
+        pool = get_verify_pool() if parallel else None
+        max_in_flight = 2 * get_verify_pool_workers() if pool else 0
+        loop = asyncio.get_running_loop()
+        in_flight = deque()
+        
+        result = await self.db.stream(query.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions(chunk_size):
+            segment_rows = [tuple(row) for row in rows]
+            if pool is None:
+                absorb(verify_segment(segment_rows))
+                continue
+            
+            # Re-hash in worker processes while the next chunk is fetched;
+            # segments are stitched in order as they complete
+            in_flight.append(loop.run_in_executor(pool, verify_segment, segment_rows))
+            if len(in_flight) >= max_in_flight:
+                absorb(await in_flight.popleft())
+        
+        while in_flight:
+            absorb(await in_flight.popleft())
+        
+        new_checkpoint = None
+        if (
+            record_checkpoint
+            and not errors
+            and last_segment is not None
+            and to_sequence is None
+            and (anchored or checkpoint is not None)
+        ):
+            new_checkpoint = await self._record_checkpoint(
+                last_segment.last_sequence,
+                last_segment.last_id,
+                last_segment.last_hash,
+                total,
+                verified_by,
             )
         
-        errors = []
-        verified = 0
-        prev_hash = None
+        # Events logged in outbox mode that the hasher has not chained yet
+        pending_result = await self.db.execute(select(func.count()).select_from(AuditOutbox))
         
-        # For the first event in range, get its expected prev_hash
-        if from_sequence and from_sequence > 1:
-            prev_result = await self.db.execute(
-                select(AuditEvent)
-                .where(AuditEvent.sequence_number == from_sequence - 1)
+        return AuditVerifyResponse(
+            is_valid=len(errors) == 0,
+            total_events=total,
+            verified_events=verified,
+            first_event_id=first_event_id,
+            last_event_id=last_segment.last_id if last_segment else None,
+            chain_intact=len(errors) == 0,
+            errors=errors,
+            resumed_from_sequence=checkpoint.sequence_number if checkpoint else None,
+            last_sequence_number=last_segment.last_sequence if last_segment else None,
+            checkpoint_id=new_checkpoint.id if new_checkpoint else None,
+            pending_outbox_events=pending_result.scalar() or 0,
+        )
+    
+    async def get_latest_checkpoint(self) -> Optional[AuditCheckpoint]:
+        """Get the most advanced verification checkpoint."""
+        result = await self.db.execute(
+            select(AuditCheckpoint)
+            .order_by(AuditCheckpoint.sequence_number.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    def _sign_checkpoint(self, sequence_number: int, event_hash: str, verified_at: datetime) -> str:
+        """HMAC a checkpoint so it cannot be forged by writing to the table."""
+        message = f"{sequence_number}:{event_hash}:{verified_at.isoformat()}"
+        return hmac.new(
+            self.settings.audit_checkpoint_secret.encode(),
+            message.encode(),
+            hashlib.sha256
+        ).hexdigest()
+    
+    async def _check_checkpoint(self, checkpoint: AuditCheckpoint) -> Optional[str]:
+        """Return an error if the checkpoint is forged or no longer matches the chain."""
+        expected_sig = self._sign_checkpoint(
+            checkpoint.sequence_number, checkpoint.hash, checkpoint.verified_at
+        )
+        if not hmac.compare_digest(checkpoint.signature, expected_sig):
+            return f"Checkpoint {checkpoint.id} (seq {checkpoint.sequence_number}): invalid signature"
+        
+        result = await self.db.execute(
+            select(AuditEvent.hash)
+            .where(AuditEvent.sequence_number == checkpoint.sequence_number)
+        )
+        if result.scalar_one_or_none() != checkpoint.hash:
+            return (
+                f"Checkpoint {checkpoint.id} (seq {checkpoint.sequence_number}): "
+                f"event hash no longer matches checkpoint. Possible tampering detected."
             )
-            prev_event = prev_result.scalar_one_or_none()
-            if prev_event:
-                prev_hash = prev_event.hash
+        return None
+    
+    async def _record_checkpoint(
+        self,
+        sequence_number: int,
+        event_id: str,
+        event_hash: str,
+        events_verified: int,
+        verified_by: Optional[str] = None
+    ) -> AuditCheckpoint:
+        """Persist a signed checkpoint at the last verified event."""
+        verified_at = datetime.utcnow()
+        checkpoint = AuditCheckpoint(
+            id=str(uuid4()),
+            sequence_number=sequence_number,
+            event_id=event_id,
+            hash=event_hash,
+            events_verified=events_verified,
+            verified_at=verified_at,
+            verified_by=verified_by,
+            signature=self._sign_checkpoint(sequence_number, event_hash, verified_at),
+        )
+        self.db.add(checkpoint)
+        await self.db.flush()
+        return checkpoint
+    
+    async def seal_merkle_batches(
+        self,
+        force: bool = False,
+        max_batches: Optional[int] = None
+    ) -> List[AuditMerkleBatch]:
+        """
+        Anchor chained events into Merkle batches.
+
+        Full batches of ``audit_merkle_batch_size`` events are sealed as soon as
+        they exist; a trailing partial batch is sealed once its oldest event is
+        older than ``audit_merkle_batch_interval`` seconds, or with ``force``.
+        At most ``max_batches`` are sealed. The chain lock is held until the
+        caller commits, so background callers seal one batch per transaction.
+        """
+        await self.flush()
+        # Holding the chain lock guarantees every sequence number below the
+        # tail is committed, so no event can later appear inside a sealed range
+        await self._acquire_chain_tail()
         
-        for event in events:
-            # Check prev_hash matches
-            if event.prev_hash != prev_hash:
-                errors.append(
-                    f"Event {event.id} (seq {event.sequence_number}): "
-                    f"prev_hash mismatch. Expected {prev_hash}, got {event.prev_hash}"
-                )
+        result = await self.db.execute(select(func.max(AuditMerkleBatch.to_sequence)))
+        last_sequence = result.scalar() or 0
+        batch_size = self.settings.audit_merkle_batch_size
+        cutoff = datetime.utcnow() - timedelta(seconds=self.settings.audit_merkle_batch_interval)
+        
+        batches = []
+        while max_batches is None or len(batches) < max_batches:
+            result = await self.db.execute(
+                select(AuditEvent.sequence_number, AuditEvent.hash, AuditEvent.timestamp)
+                .where(AuditEvent.sequence_number > last_sequence)
+                .order_by(AuditEvent.sequence_number.asc())
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            if len(rows) < batch_size and not force and rows[0].timestamp > cutoff:
+                break
             
-            # Recompute hash and verify
-            expected_hash = AuditEvent.compute_hash(
-                event_id=event.id,
-                timestamp=event.timestamp,
-                event_type=event.event_type.value,
-                actor_id=event.actor_id,
-                entity_type=event.entity_type,
-                entity_id=event.entity_id,
-                payload=event.payload,
-                prev_hash=event.prev_hash
+            batch = AuditMerkleBatch(
+                id=str(uuid4()),
+                from_sequence=rows[0].sequence_number,
+                to_sequence=rows[-1].sequence_number,
+                event_count=len(rows),
+                root=merkle_root([row.hash for row in rows]),
             )
+            self.db.add(batch)
+            batches.append(batch)
+            last_sequence = batch.to_sequence
             
-            if event.hash != expected_hash:
-                errors.append(
-                    f"Event {event.id} (seq {event.sequence_number}): "
-                    f"hash mismatch. Possible tampering detected."
+            if len(rows) < batch_size:
+                break
+        
+        if batches:
+            await self.db.flush()
+            # Batches seal a prefix of the chain, so only cached packages
+            # whose last event is in the new range lack proofs they now have
+            await self.db.execute(
+                delete(AuditPackageCache)
+                .where(AuditPackageCache.last_sequence_number >= batches[0].from_sequence)
+            )
+        return batches
+    
+    async def get_inclusion_proofs(self, events: List[AuditEvent]) -> List[AuditInclusionProof]:
+        """Build Merkle inclusion proofs for the given events that are already anchored."""
+        if not events:
+            return []
+        
+        sequences = [e.sequence_number for e in events]
+        result = await self.db.execute(
+            select(AuditMerkleBatch)
+            .where(
+                AuditMerkleBatch.to_sequence >= min(sequences),
+                AuditMerkleBatch.from_sequence <= max(sequences),
+            )
+            .order_by(AuditMerkleBatch.from_sequence.asc())
+        )
+        
+        proofs = []
+        for batch in result.scalars().all():
+            members = [
+                e for e in events
+                if batch.from_sequence <= e.sequence_number <= batch.to_sequence
+            ]
+            if not members:
+                continue
+            
+            leaves_result = await self.db.execute(
+                select(AuditEvent.sequence_number, AuditEvent.hash)
+                .where(
+                    AuditEvent.sequence_number >= batch.from_sequence,
+                    AuditEvent.sequence_number <= batch.to_sequence,
                 )
-            else:
-                verified += 1
+                .order_by(AuditEvent.sequence_number.asc())
+            )
+            leaves = leaves_result.all()
+            if len(leaves) != batch.event_count:
+                # Part of the batch has been archived out of the live table
+                continue
+            leaf_index = {row.sequence_number: i for i, row in enumerate(leaves)}
+            leaf_hashes = [row.hash for row in leaves]
             
-            prev_hash = event.hash
+            for event in members:
+                index = leaf_index[event.sequence_number]
+                proofs.append(AuditInclusionProof(
+                    event_id=event.id,
+                    sequence_number=event.sequence_number,
+                    event_hash=event.hash,
+                    batch_id=batch.id,
+                    merkle_root=batch.root,
+                    leaf_index=index,
+                    path=merkle_proof(leaf_hashes, index),
+                ))
         
-        return AuditVerifyResponse(
-            is_valid=len(errors) == 0,
-            total_events=len(events),
-            verified_events=verified,
-            first_event_id=events[0].id if events else None,
-            last_event_id=events[-1].id if events else None,
-            chain_intact=len(errors) == 0,
-            errors=errors
+        return proofs
+    
+    async def get_archived_predecessor(
+        self,
+        before_sequence: Optional[int] = None
+    ) -> Optional[AuditArchiveSegment]:
+        """Get the latest archive segment, optionally ending before a sequence number."""
+        query = select(AuditArchiveSegment)
+        if before_sequence is not None:
+            query = query.where(AuditArchiveSegment.to_sequence < before_sequence)
+        result = await self.db.execute(
+            query.order_by(AuditArchiveSegment.to_sequence.desc()).limit(1)
         )
+        return result.scalar_one_or_none()
+
+    async def archived_through(
+        self,
+        after_sequence: Optional[int] = None,
+        from_time: Optional[datetime] = None
+    ) -> Optional[int]:
+        """
+        Last archived sequence number if archived events may match a query.
 
+        Archived partitions are detached, so queries over audit_events do not
+        see them. Returns None when the query starts after the archive.
+        """
+        segment = await self.get_archived_predecessor()
+        if segment is None:
+            return None
+        if after_sequence is not None and after_sequence >= segment.to_sequence:
+            return None
+        if from_time is not None and from_time >= segment.to_time:
+            return None
+        return segment.to_sequence
@@ -0,0 +1,330 @@
+"""Cold-segment archival of monthly audit_events partitions.
+
+Partitions older than ``audit_archive_after_months`` are sealed, oldest
+first, into two files under ``audit_archive_dir``:
+
+- <partition>.ndjson.gz  every event in export format (audit_export)
+- <partition>.idx        fixed-width (sequence_number, prev_hash, hash)
+                         records, memory-mappable for continuity checks
+
+Both files are re-read and verified against the chain (re-hash of every
+event, prev_hash links, link to the previous segment) before the manifest
+row is written and the partition is detached in the same transaction.
+A partition that fails verification is left attached and stops the run,
+so archived segments always form a contiguous prefix of the chain.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import AuditEvent, AuditArchiveSegment
+from app.services.audit_export import EXPORT_COLUMNS, build_export_query, export_values
+
+logger = logging.getLogger(__name__)
+
+# (sequence_number, prev_hash, hash); a NULL prev_hash is stored as zeros
+INDEX_RECORD = struct.Struct(">q32s32s")
+_NO_HASH = bytes(32)
+
+_PARTITION_PREFIX = "audit_events_p"
+
+
+def partition_name(month: date) -> str:
+    """Name of the audit_events partition holding the given month."""
+    return f"{_PARTITION_PREFIX}{month:%Y%m}"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after the month of `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _event_hash(row: dict) -> str:
+    return AuditEvent.compute_hash(
+        event_id=row["event_id"],
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+        event_type=row["event_type"],
+        actor_id=row["actor_id"],
+        entity_type=row["entity_type"],
+        entity_id=row["entity_id"],
+        payload=row["payload"],
+        prev_hash=row["prev_hash"],
+    )
+
+
+def verify_data_file(path: str, prev_hash: Optional[str]) -> Tuple[int, Optional[str]]:
+    """
+    Re-hash every event of a segment data file and check its links.
+
+    Returns (event_count, last_hash); raises ValueError on the first break.
+    """
+    count = 0
+    with gzip.open(path, "rt") as f:
+        for line in f:
+            row = json.loads(line)
+            if row["prev_hash"] != prev_hash:
+                raise ValueError(f"{path}: seq {row['sequence_number']} prev_hash mismatch")
+            if _event_hash(row) != row["hash"]:
+                raise ValueError(f"{path}: seq {row['sequence_number']} hash mismatch")
+            prev_hash = row["hash"]
+            count += 1
+    return count, prev_hash
+
+
+def verify_index_file(path: str, prev_hash: Optional[str]) -> Tuple[int, Optional[str]]:
+    """
+    Check chain continuity of a segment index file through mmap.
+
+    Returns (record_count, last_hash); raises ValueError on the first break.
+    """
+    expected = bytes.fromhex(prev_hash) if prev_hash else _NO_HASH
+    count = 0
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, prev_hash
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) % INDEX_RECORD.size:
+                raise ValueError(f"{path}: truncated index")
+            for sequence_number, record_prev, record_hash in INDEX_RECORD.iter_unpack(mm):
+                if record_prev != expected:
+                    raise ValueError(f"{path}: seq {sequence_number} prev_hash mismatch")
+                expected = record_hash
+                count += 1
+    return count, expected.hex()
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _SegmentWriter:
+    """Writes a segment's data and index files, checking the chain as it goes."""
+
+    def __init__(self, data_path: str, index_path: str, prev_hash: Optional[str]):
+        self.data_path = data_path
+        self.index_path = index_path
+        self.first_prev_hash = prev_hash
+        self.prev_hash = prev_hash
+        self.count = 0
+        self.first_sequence: Optional[int] = None
+        self.last_sequence: Optional[int] = None
+        self.last_timestamp: Optional[str] = None
+        self._data = gzip.open(data_path + ".tmp", "wt")
+        self._index = open(index_path + ".tmp", "wb")
+
+    def write_chunk(self, chunk: List[list]):
+        for values in chunk:
+            row = dict(zip(EXPORT_COLUMNS, values))
+            if row["prev_hash"] != self.prev_hash:
+                raise ValueError(f"seq {row['sequence_number']}: prev_hash mismatch")
+            if _event_hash(row) != row["hash"]:
+                raise ValueError(f"seq {row['sequence_number']}: hash mismatch")
+
+            self._data.write(json.dumps(row, default=str) + "\n")
+            self._index.write(INDEX_RECORD.pack(
+                row["sequence_number"],
+                bytes.fromhex(row["prev_hash"]) if row["prev_hash"] else _NO_HASH,
+                bytes.fromhex(row["hash"]),
+            ))
+
+            if self.first_sequence is None:
+                self.first_sequence = row["sequence_number"]
+            self.last_sequence = row["sequence_number"]
+            self.last_timestamp = row["timestamp"]
+            self.prev_hash = row["hash"]
+            self.count += 1
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+        os.replace(self.data_path + ".tmp", self.data_path)
+        os.replace(self.index_path + ".tmp", self.index_path)
+
+    def discard(self):
+        self._data.close()
+        self._index.close()
+        for path in (self.data_path + ".tmp", self.index_path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def verify(self) -> Tuple[str, str]:
+        """Re-read both files from disk, returns their sha256 digests."""
+        written = (self.count, self.prev_hash)
+        if verify_data_file(self.data_path, self.first_prev_hash) != written:
+            raise ValueError(f"{self.data_path}: data file does not match partition contents")
+        if verify_index_file(self.index_path, self.first_prev_hash) != written:
+            raise ValueError(f"{self.index_path}: index file does not match partition contents")
+        return _file_sha256(self.data_path), _file_sha256(self.index_path)
+
+
+class AuditArchiver:
+    """Background task that pre-creates and archives monthly audit_events partitions."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[int] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.audit_archive_interval
+        self._running = False
+
+    async def start(self):
+        """Start the archiver."""
+        self._running = True
+        logger.info("Audit archiver started")
+
+        while self._running:
+            try:
+                await self.run()
+            except Exception as e:
+                logger.error(f"Audit archiver error: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the archiver."""
+        self._running = False
+        logger.info("Audit archiver stopped")
+
+    async def run(self) -> List[AuditArchiveSegment]:
+        """Ensure upcoming partitions exist and archive all due ones."""
+        async with self.session_maker() as session:
+            if session.bind.dialect.name != "postgresql":
+                return []
+            await self._ensure_partitions(session)
+            await session.commit()
+            months = await self._attached_months(session)
+
+        cutoff = add_months(datetime.utcnow().date().replace(day=1), -self.settings.audit_archive_after_months)
+        segments = []
+        for month in months:
+            if month >= cutoff:
+                break
+            async with self.session_maker() as session:
+                segment = await self.archive_partition(session, month)
+                await session.commit()
+            if segment:
+                segments.append(segment)
+        return segments
+
+    async def _ensure_partitions(self, session: AsyncSession):
+        this_month = datetime.utcnow().date().replace(day=1)
+        months = {
+            add_months(this_month, offset)
+            for offset in range(self.settings.audit_partition_premake_months + 1)
+        }
+        # Events that fell into the default partition (the archiver was
+        # behind or disabled) are moved into their month's partition
+        result = await session.execute(text(
+            "SELECT DISTINCT date_trunc('month', timestamp)::date FROM audit_events_default"
+        ))
+        months.update(month for (month,) in result.all())
+        for month in sorted(months):
+            await session.execute(
+                text("SELECT audit_events_ensure_partition(:month)"),
+                {"month": month}
+            )
+
+    async def _attached_months(self, session: AsyncSession) -> List[date]:
+        result = await session.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'audit_events'"
+        ))
+        months = []
+        for (name,) in result.all():
+            suffix = name[len(_PARTITION_PREFIX):]
+            if name.startswith(_PARTITION_PREFIX) and len(suffix) == 6 and suffix.isdigit():
+                months.append(date(int(suffix[:4]), int(suffix[4:]), 1))
+        return sorted(months)
+
+    async def archive_partition(self, session: AsyncSession, month: date) -> Optional[AuditArchiveSegment]:
+        """
+        Seal one monthly partition into segment files and detach it.
+
+        Returns the manifest row, or None for an empty partition (which is
+        detached without a segment). The caller commits.
+        """
+        name = partition_name(month)
+        from_time = datetime(month.year, month.month, 1)
+        next_month = add_months(month, 1)
+        to_time = datetime(next_month.year, next_month.month, 1)
+
+        # Older partitions are always archived first, so the predecessor of
+        # this partition's first event is the tail of the latest segment
+        result = await session.execute(
+            select(AuditArchiveSegment)
+            .order_by(AuditArchiveSegment.to_sequence.desc())
+            .limit(1)
+        )
+        previous = result.scalar_one_or_none()
+
+        os.makedirs(self.settings.audit_archive_dir, exist_ok=True)
+        writer = _SegmentWriter(
+            os.path.join(self.settings.audit_archive_dir, f"{name}.ndjson.gz"),
+            os.path.join(self.settings.audit_archive_dir, f"{name}.idx"),
+            previous.last_hash if previous else None,
+        )
+
+        chunk_size = self.settings.audit_export_chunk_size
+        query = build_export_query().where(
+            AuditEvent.timestamp >= from_time,
+            AuditEvent.timestamp < to_time,
+        )
+        try:
+            stream = await session.stream(query.execution_options(yield_per=chunk_size))
+            async for rows in stream.partitions(chunk_size):
+                await asyncio.to_thread(writer.write_chunk, [export_values(row) for row in rows])
+        except Exception:
+            await asyncio.to_thread(writer.discard)
+            raise
+
+        segment = None
+        if not writer.count:
+            await asyncio.to_thread(writer.discard)
+        else:
+            await asyncio.to_thread(writer.close)
+            data_sha256, index_sha256 = await asyncio.to_thread(writer.verify)
+            segment = AuditArchiveSegment(
+                partition_name=name,
+                from_time=from_time,
+                to_time=to_time,
+                from_sequence=writer.first_sequence,
+                to_sequence=writer.last_sequence,
+                event_count=writer.count,
+                first_prev_hash=writer.first_prev_hash,
+                last_hash=writer.prev_hash,
+                last_timestamp=datetime.fromisoformat(writer.last_timestamp),
+                data_path=writer.data_path,
+                data_sha256=data_sha256,
+                index_path=writer.index_path,
+                index_sha256=index_sha256,
+            )
+            session.add(segment)
+            await session.flush()
+
+        await session.execute(text(f'ALTER TABLE audit_events DETACH PARTITION "{name}"'))
+        if self.settings.audit_archive_drop_detached:
+            await session.execute(text(f'DROP TABLE "{name}"'))
+
+        logger.info(f"Archived audit partition {name}: {writer.count} events")
+        return segment
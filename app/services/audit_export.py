@@ -0,0 +1,168 @@
+"""Streaming audit event export.
+
+Rows are read through a server-side cursor in chunks and encoded as they
+arrive, so memory use does not depend on the size of the exported range.
+
+Every exported event carries the fields that feed AuditEvent.compute_hash
+plus sequence_number/prev_hash/hash, so an export can be re-hashed and its
+chain continuity checked offline:
+
+    hash == sha256(json.dumps({event_id, timestamp, event_type, actor_id,
+                               entity_type, entity_id, payload, prev_hash},
+                              sort_keys=True))
+    row[n].prev_hash == row[n - 1].hash
+"""
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.audit import AuditEvent, AuditArchiveSegment
+
+EXPORT_FORMATS = ("ndjson", "columnar")
+
+# Exported columns, in output order
+EXPORT_COLUMNS = (
+    "sequence_number", "event_id", "timestamp", "event_type", "actor_id",
+    "actor_type", "entity_type", "entity_id", "entity_refs", "payload",
+    "correlation_id", "prev_hash", "hash",
+)
+
+
+def build_export_query(
+    from_sequence: Optional[int] = None,
+    to_sequence: Optional[int] = None,
+    from_time: Optional[datetime] = None,
+    to_time: Optional[datetime] = None,
+):
+    """Select exported columns for a sequence and/or time range."""
+    query = select(
+        AuditEvent.sequence_number,
+        AuditEvent.id,
+        AuditEvent.timestamp,
+        AuditEvent.event_type,
+        AuditEvent.actor_id,
+        AuditEvent.actor_type,
+        AuditEvent.entity_type,
+        AuditEvent.entity_id,
+        AuditEvent.entity_refs,
+        AuditEvent.payload,
+        AuditEvent.correlation_id,
+        AuditEvent.prev_hash,
+        AuditEvent.hash,
+    ).order_by(AuditEvent.sequence_number.asc())
+
+    if from_sequence is not None:
+        query = query.where(AuditEvent.sequence_number >= from_sequence)
+    if to_sequence is not None:
+        query = query.where(AuditEvent.sequence_number <= to_sequence)
+    if from_time is not None:
+        query = query.where(AuditEvent.timestamp >= from_time)
+    if to_time is not None:
+        query = query.where(AuditEvent.timestamp <= to_time)
+    return query
+
+
+async def get_anchor(db: AsyncSession, query) -> Optional[dict]:
+    """
+    Return the event just before the first exported one.
+
+    Its hash is the expected prev_hash of the first exported row.
+    """
+    first = (await db.execute(query.limit(1))).first()
+    if first is None:
+        return None
+    result = await db.execute(
+        select(AuditEvent.sequence_number, AuditEvent.hash)
+        .where(AuditEvent.sequence_number < first.sequence_number)
+        .order_by(AuditEvent.sequence_number.desc())
+        .limit(1)
+    )
+    anchor = result.first()
+    if anchor is not None:
+        return {"sequence_number": anchor.sequence_number, "hash": anchor.hash}
+
+    # The predecessor may live in an archived segment
+    result = await db.execute(
+        select(AuditArchiveSegment.to_sequence, AuditArchiveSegment.last_hash)
+        .where(AuditArchiveSegment.to_sequence < first.sequence_number)
+        .order_by(AuditArchiveSegment.to_sequence.desc())
+        .limit(1)
+    )
+    segment = result.first()
+    if segment is None:
+        return None
+    return {"sequence_number": segment.to_sequence, "hash": segment.last_hash}
+
+
+def export_values(row) -> list:
+    """Convert a result row to JSON-ready values in EXPORT_COLUMNS order."""
+    return [
+        row.sequence_number,
+        row.id,
+        row.timestamp.isoformat(),
+        getattr(row.event_type, "value", row.event_type),
+        row.actor_id,
+        row.actor_type,
+        row.entity_type,
+        row.entity_id,
+        row.entity_refs,
+        row.payload,
+        row.correlation_id,
+        row.prev_hash,
+        row.hash,
+    ]
+
+
+async def _stream_chunks(
+    session_maker: async_sessionmaker,
+    query,
+    chunk_size: int
+) -> AsyncIterator[List[list]]:
+    """Yield exported rows in chunks from a server-side cursor."""
+    async with session_maker() as session:
+        result = await session.stream(query.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions(chunk_size):
+            yield [export_values(row) for row in rows]
+
+
+async def stream_ndjson(
+    session_maker: async_sessionmaker,
+    query,
+    chunk_size: int
+) -> AsyncIterator[bytes]:
+    """One JSON object per event, one event per line."""
+    async for chunk in _stream_chunks(session_maker, query, chunk_size):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, values)), default=str) + "\n"
+            for values in chunk
+        ).encode()
+
+
+async def stream_columnar(
+    session_maker: async_sessionmaker,
+    query,
+    chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Gzip-compressed column blocks.
+
+    Each cursor chunk becomes one line of the decompressed stream:
+    {"count": n, "columns": {"<name>": [n values], ...}}
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    async for chunk in _stream_chunks(session_maker, query, chunk_size):
+        block = {
+            "count": len(chunk),
+            "columns": {
+                name: [values[i] for values in chunk]
+                for i, name in enumerate(EXPORT_COLUMNS)
+            },
+        }
+        data = compressor.compress((json.dumps(block, default=str) + "\n").encode())
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,144 @@
+"""Merkle batch anchoring for the audit hash chain.
+
+Consecutive audit events are grouped into batches whose Merkle root is
+stored in audit_merkle_batches. An event can then be proven against its
+batch root with a path of O(log n) sibling hashes instead of replaying the
+linear chain.
+
+Tree layout (RFC 6962 style domain separation):
+- leaf = sha256(0x00 || event.hash)
+- node = sha256(0x01 || left || right)
+- an unpaired node at the end of a level is promoted unchanged
+"""
+import asyncio
+import hashlib
+import logging
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def hash_leaf(event_hash: str) -> bytes:
+    """Hash an audit event hash into a Merkle leaf."""
+    return hashlib.sha256(_LEAF_PREFIX + bytes.fromhex(event_hash)).digest()
+
+
+def hash_node(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent."""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _next_level(level: List[bytes]) -> List[bytes]:
+    parents = [hash_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def merkle_root(event_hashes: List[str]) -> str:
+    """Compute the Merkle root of a batch of event hashes."""
+    if not event_hashes:
+        raise ValueError("Cannot build a Merkle tree without events")
+    level = [hash_leaf(h) for h in event_hashes]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0].hex()
+
+
+def merkle_proof(event_hashes: List[str], index: int) -> List[dict]:
+    """
+    Build the inclusion proof for the event at `index`.
+
+    Returns sibling steps from leaf to root, each
+    {"position": "left" | "right", "hash": hex}.
+    """
+    if not 0 <= index < len(event_hashes):
+        raise ValueError(f"Leaf index {index} out of range")
+    level = [hash_leaf(h) for h in event_hashes]
+    path = []
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            path.append({
+                "position": "left" if sibling < index else "right",
+                "hash": level[sibling].hex(),
+            })
+        level = _next_level(level)
+        index //= 2
+    return path
+
+
+def verify_inclusion(event_hash: str, path: List[dict], root: str) -> bool:
+    """Check an inclusion proof against a batch root."""
+    node = hash_leaf(event_hash)
+    for step in path:
+        sibling = bytes.fromhex(step["hash"])
+        if step["position"] == "left":
+            node = hash_node(sibling, node)
+        else:
+            node = hash_node(node, sibling)
+    return node.hex() == root
+
+
+class AuditAnchorer:
+    """Background task that periodically seals audit events into Merkle batches."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[int] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.audit_merkle_batch_interval
+        self._running = False
+
+    async def start(self):
+        """Start the anchorer."""
+        self._running = True
+        logger.info("Audit anchorer started")
+
+        while self._running:
+            try:
+                await self.anchor()
+            except Exception as e:
+                logger.error(f"Audit anchorer error: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the anchorer."""
+        self._running = False
+        logger.info("Audit anchorer stopped")
+
+    async def anchor(self) -> int:
+        """
+        Seal due batches, returns the number of batches created.
+
+        Each batch is sealed and committed in its own transaction, so the
+        audit chain lock is only held for one batch at a time; a backlog is
+        worked off audit_merkle_max_batches_per_run batches per run.
+        """
+        from app.services.audit import AuditService
+
+        sealed = 0
+        while sealed < self.settings.audit_merkle_max_batches_per_run:
+            async with self.session_maker() as session:
+                batches = await AuditService(session).seal_merkle_batches(max_batches=1)
+                await session.commit()
+            if not batches:
+                break
+            batch = batches[0]
+            logger.info(
+                f"Anchored audit events {batch.from_sequence}-{batch.to_sequence} "
+                f"under Merkle root {batch.root}"
+            )
+            sealed += 1
+        return sealed
@@ -0,0 +1,63 @@
+"""Background hasher for the audit outbox.
+
+In ``audit_chain_mode = "outbox"`` requests only insert unhashed rows into
+audit_outbox in their own transaction. AuditChainHasher appends them to the
+hash chain in large batches, so request latency does not depend on the
+chain lock. Several app instances may run a hasher; they serialize on the
+chain advisory lock.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.services.audit import AuditService
+
+logger = logging.getLogger(__name__)
+
+
+class AuditChainHasher:
+    """Background task that drains audit_outbox into the hash chain."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[float] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.audit_outbox_poll_interval
+        self._running = False
+
+    async def start(self):
+        """Start the hasher."""
+        self._running = True
+        logger.info("Audit chain hasher started")
+
+        while self._running:
+            try:
+                drained = await self.drain()
+            except Exception as e:
+                logger.error(f"Audit chain hasher error: {e}", exc_info=True)
+                drained = 0
+
+            # Keep going without sleeping while there is a backlog
+            if drained < self.settings.audit_outbox_batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the hasher."""
+        self._running = False
+        logger.info("Audit chain hasher stopped")
+
+    async def drain(self) -> int:
+        """Append one batch of outbox events to the chain, returns its size."""
+        async with self.session_maker() as session:
+            drained = await AuditService(session).drain_outbox(self.settings.audit_outbox_batch_size)
+            await session.commit()
+
+        if drained:
+            logger.debug(f"Appended {drained} outbox events to the audit chain")
+        return drained
@@ -0,0 +1,122 @@
+"""Segment re-hashing for audit chain verification.
+
+verify_chain splits the sequence range into segments (one per cursor chunk).
+Each segment is re-hashed independently - it only needs its own rows - and
+the caller stitches neighbouring segments together by comparing the first
+prev_hash of a segment with the last hash of the one before it.
+
+Segments are plain tuples so they can be shipped to a ProcessPoolExecutor,
+keeping the CPU-bound hashing off the event loop.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from app.config import get_settings
+from app.models.audit import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+# Row layout expected by verify_segment
+SEGMENT_COLUMNS = (
+    "id", "sequence_number", "timestamp", "event_type", "actor_id",
+    "entity_type", "entity_id", "payload", "prev_hash", "hash",
+)
+
+
+@dataclass
+class SegmentResult:
+    """Outcome of re-hashing one contiguous run of audit events."""
+    count: int = 0
+    verified: int = 0
+    first_id: Optional[str] = None
+    first_sequence: Optional[int] = None
+    first_prev_hash: Optional[str] = None
+    last_id: Optional[str] = None
+    last_sequence: Optional[int] = None
+    last_hash: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+
+
+def verify_segment(rows: Sequence[tuple]) -> SegmentResult:
+    """
+    Re-hash a segment and check the links inside it.
+
+    The link from the first row to the previous segment is left to the
+    caller, which knows the boundary hash.
+    """
+    result = SegmentResult()
+    prev_hash = None
+
+    for index, row in enumerate(rows):
+        (event_id, sequence_number, timestamp, event_type, actor_id,
+         entity_type, entity_id, payload, row_prev_hash, row_hash) = row
+
+        if index == 0:
+            result.first_id = event_id
+            result.first_sequence = sequence_number
+            result.first_prev_hash = row_prev_hash
+        elif row_prev_hash != prev_hash:
+            result.errors.append(
+                f"Event {event_id} (seq {sequence_number}): "
+                f"prev_hash mismatch. Expected {prev_hash}, got {row_prev_hash}"
+            )
+
+        expected_hash = AuditEvent.compute_hash(
+            event_id=event_id,
+            timestamp=timestamp,
+            event_type=getattr(event_type, "value", event_type),
+            actor_id=actor_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            payload=payload,
+            prev_hash=row_prev_hash
+        )
+
+        if row_hash != expected_hash:
+            result.errors.append(
+                f"Event {event_id} (seq {sequence_number}): "
+                f"hash mismatch. Possible tampering detected."
+            )
+        else:
+            result.verified += 1
+
+        prev_hash = row_hash
+        result.count += 1
+        result.last_id = event_id
+        result.last_sequence = sequence_number
+        result.last_hash = row_hash
+
+    return result
+
+
+# Process pool shared by all verifications in this process, and its size
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+
+
+def get_verify_pool() -> ProcessPoolExecutor:
+    """Get or create the audit verification process pool."""
+    global _pool, _pool_workers
+    if _pool is None:
+        workers = get_settings().audit_verify_workers or os.cpu_count() or 1
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+        logger.info(f"Audit verification pool started with {workers} workers")
+    return _pool
+
+
+def get_verify_pool_workers() -> int:
+    """Number of worker processes of the verification pool (0 if not started)."""
+    return _pool_workers
+
+
+def shutdown_verify_pool():
+    """Shutdown the audit verification process pool."""
+    global _pool, _pool_workers
+    if _pool:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
@@ -6,6 +6,7 @@ from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import get_settings
@@ -15,6 +16,9 @@ from app.services.audit import AuditService
 from app.services.wallet import WalletService
 from app.services.kyt import KYTService
 from app.services.ethereum import EthereumService
+from app.services.event_stream import event_bus
+from app.services.webhooks import enqueue_webhooks
+from app.services.ledger import LedgerService
 from app.services.orchestrator import TxOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -67,13 +71,15 @@ class ChainListener:
             kyt = KYTService(session, audit)
             ethereum = EthereumService(session, audit)
             
-            # Check pending transaction confirmations
-            await self._check_confirmations(session, audit, ethereum)
-            
-            # Check for inbound deposits
-            await self._check_deposits(session, audit, wallet_service, kyt, ethereum)
+            # Confirmation events from one poll are chained and written together
+            async with audit.batch():
+                # Check pending transaction confirmations
+                await self._check_confirmations(session, audit, ethereum)
             
             await session.commit()
+            
+            # Check for inbound deposits (committed one at a time)
+            await self._check_deposits(session, audit, wallet_service, kyt, ethereum)
     
     async def _check_confirmations(
         self,
@@ -86,83 +92,107 @@ class ChainListener:
         result = await session.execute(
             select(TxRequest).where(TxRequest.status == TxStatus.CONFIRMING)
         )
-        pending_txs = list(result.scalars().all())
+        # Balances are locked as txs are closed, so walk them in balance
+        # order (see ledger): one poll may close several per wallet
+        pending_txs = sorted(
+            (tx for tx in result.scalars().all() if tx.tx_hash),
+            key=lambda tx: (tx.wallet_id, tx.asset, tx.id)
+        )
+        if not pending_txs:
+            return
+        ledger = LedgerService(session)
         
-        for tx in pending_txs:
-            if not tx.tx_hash:
-                continue
-            
+        # All receipts in one batch, then the head once; the head is read
+        # second so it is never behind a receipt's block
+        try:
+            receipts = await ethereum.get_transaction_receipts([tx.tx_hash for tx in pending_txs])
+            current_block = await ethereum.get_block_number()
+        except Exception as rpc_error:
+            logger.warning(f"RPC connection failed while checking confirmations: {rpc_error}")
+            return
+        
+        for tx, receipt in zip(pending_txs, receipts):
             correlation_id = f"chain-listener-{uuid4()}"
             
             try:
-                try:
-                    confirmations = await ethereum.check_confirmations(
-                        tx.tx_hash,
-                        tx.id,
-                        correlation_id,
-                        self.settings.confirmation_blocks
-                    )
-                except Exception as rpc_error:
-                    logger.warning(f"RPC connection failed while checking confirmations for tx {tx.id}: {rpc_error}")
-                    continue
+                confirmations = await ethereum.check_confirmations(
+                    tx.tx_hash,
+                    tx.id,
+                    correlation_id,
+                    self.settings.confirmation_blocks,
+                    receipt=receipt or {},  # {}: not mined yet (None would refetch)
+                    current_block=current_block
+                )
                 
                 if confirmations is None:
                     continue
                 
                 if confirmations == -1:
-                    # Transaction failed
-                    tx.status = TxStatus.FAILED_BROADCAST
-                    await audit.log_event(
+                    # Reverted on-chain: terminal, the recovery sweeper
+                    # must not rebroadcast it
+                    tx.status = TxStatus.REVERTED
+                    await ledger.close_withdrawal(tx)
+                    event = await audit.log_event(
                         event_type=AuditEventType.TX_FAILED,
                         correlation_id=correlation_id,
                         actor_type="SYSTEM",
                         entity_type="TX_REQUEST",
                         entity_id=tx.id,
+                        entity_refs={"wallet_id": tx.wallet_id},
                         payload={
                             "tx_hash": tx.tx_hash,
                             "reason": "Transaction reverted on-chain"
                         }
                     )
+                    event_bus.publish_after_commit(session, event)
+                    await audit.queue_package_cache(tx.id)
                     continue
                 
                 tx.confirmations = confirmations
-                
-                # Get block number
-                receipt = await ethereum.get_transaction_receipt(tx.tx_hash)
-                if receipt:
-                    tx.block_number = receipt.get("blockNumber")
+                tx.block_number = receipt.get("blockNumber")
                 
                 if confirmations >= self.settings.confirmation_blocks:
                     tx.status = TxStatus.CONFIRMED
                     
-                    await audit.log_event(
+                    event = await audit.log_event(
                         event_type=AuditEventType.TX_CONFIRMED,
                         correlation_id=correlation_id,
                         actor_type="SYSTEM",
                         entity_type="TX_REQUEST",
                         entity_id=tx.id,
+                        entity_refs={"wallet_id": tx.wallet_id},
                         payload={
                             "tx_hash": tx.tx_hash,
                             "block_number": tx.block_number,
                             "confirmations": confirmations
                         }
                     )
+                    await enqueue_webhooks(session, event)
                     
                     # Finalize
                     tx.status = TxStatus.FINALIZED
+                    await ledger.close_withdrawal(tx)
                     
-                    await audit.log_event(
+                    event = await audit.log_event(
                         event_type=AuditEventType.TX_FINALIZED,
                         correlation_id=correlation_id,
                         actor_type="SYSTEM",
                         entity_type="TX_REQUEST",
                         entity_id=tx.id,
+                        entity_refs={"wallet_id": tx.wallet_id},
                         payload={
                             "tx_hash": tx.tx_hash,
+                            "block_number": tx.block_number,
                             "final_confirmations": confirmations
                         }
                     )
+                    event_bus.publish_after_commit(session, event)
+                    await enqueue_webhooks(session, event)
+                    await audit.queue_package_cache(tx.id)
                     
+            except SQLAlchemyError:
+                # The transaction is aborted: give up the whole poll
+                raise
             except Exception as e:
                 logger.error(f"Error checking confirmation for tx {tx.id}: {e}")
     
@@ -202,22 +232,28 @@ class ChainListener:
                 self._last_processed_block = to_block
                 return
             
-            # Get incoming transfers
-            transfers = await ethereum.get_incoming_transfers(
+            # Get incoming transfers; the scan may end early at a block the
+            # node does not have yet
+            transfers, to_block = await ethereum.get_incoming_transfers(
                 addresses,
                 from_block,
                 to_block
             )
             
+            # One transaction per deposit, so its balance row is locked only
+            # until its own commit, not through the KYT calls of the others
             for transfer in transfers:
-                await self._process_deposit(
-                    session, audit, wallet_service, kyt,
-                    transfer
-                )
+                async with audit.batch():
+                    await self._process_deposit(
+                        session, audit, wallet_service, kyt,
+                        transfer
+                    )
+                await session.commit()
             
             self._last_processed_block = to_block
             
         except Exception as e:
+            await session.rollback()
             logger.error(f"Error checking deposits: {e}")
     
     async def _process_deposit(
@@ -258,12 +294,13 @@ class ChainListener:
         session.add(deposit)
         
         # Log deposit detection
-        await audit.log_event(
+        event = await audit.log_event(
             event_type=AuditEventType.DEPOSIT_DETECTED,
             correlation_id=correlation_id,
             actor_type="SYSTEM",
             entity_type="WALLET",
             entity_id=wallet.id,
+            entity_refs={"deposit_id": deposit.id, "wallet_id": wallet.id},
             payload={
                 "tx_hash": tx_hash,
                 "from_address": transfer["from_address"],
@@ -271,6 +308,7 @@ class ChainListener:
                 "block_number": transfer["block_number"]
             }
         )
+        event_bus.publish_after_commit(session, event)
         
         # Run KYT on inbound
         kyt_result, kyt_case = await kyt.evaluate_inbound(
@@ -284,6 +322,9 @@ class ChainListener:
         if kyt_case:
             deposit.kyt_case_id = kyt_case.id
         
+        # Posted last: the balance row stays locked until the commit
+        await LedgerService(session).deposit_detected(deposit)
+        
         logger.info(
             f"Deposit detected: {tx_hash} to wallet {wallet.id}, "
             f"amount: {transfer['value']} wei, KYT: {kyt_result}"
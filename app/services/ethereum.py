@@ -1,54 +1,177 @@
-"""Ethereum connectivity service with RPC, retry logic, and nonce management."""
+"""Ethereum connectivity service with RPC, retry logic, and nonce management.
+
+RPC calls go through web3's native asyncio client (AsyncWeb3 over
+AsyncHTTPProvider), so they never block the event loop or need a thread.
+Each process keeps one client per RPC URL, shared by all the per-request
+EthereumService instances, whose aiohttp session holds a keep-alive pool
+of up to eth_rpc_pool_size connections.
+
+Bulk reads (the blocks of a deposit scan, the receipts of every confirming
+transaction) go out as JSON-RPC batches over the same pool: one HTTP round
+trip per eth_rpc_batch_size calls instead of one per call.
+
+Every call is routed through the process's RpcPool over the configured
+endpoints (see rpc_pool): reads to the healthiest, hedged and failed over,
+broadcasts to all of them.
+"""
 import asyncio
-import concurrent.futures
+import itertools
+import time
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterable, List, Tuple
 from datetime import datetime
 import logging
 
+import aiohttp
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from web3._utils.rpc_abi import RPC
 from web3.exceptions import TransactionNotFound
 import httpx
 
 from app.config import get_settings
 from app.models.audit import AuditEventType
 from app.services.audit import AuditService
+from app.services.nonce import NonceAllocator
+from app.services.rpc_pool import RpcPool, display_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Chain ID per configured set of RPC URLs; reads go to any endpoint of the
+# pool, so all of them must serve the same chain
+_chain_ids: Dict[Tuple[str, ...], int] = {}
 
-class NonceManager:
-    """Simple nonce manager to prevent nonce conflicts."""
-    
-    def __init__(self):
-        self._nonces: Dict[str, int] = {}
-        self._lock = asyncio.Lock()
-    
-    async def get_nonce(self, address: str, web3: Web3) -> int:
-        """Get next nonce for address, handling pending transactions."""
-        async with self._lock:
-            address_lower = address.lower()
-            
-            # Get on-chain nonce (including pending)
-            # Note: This is called from async context, but web3 is sync
-            # The caller should handle this appropriately
-            chain_nonce = web3.eth.get_transaction_count(address, "pending")
-            
-            # Use max of cached and chain nonce
-            cached = self._nonces.get(address_lower, 0)
-            nonce = max(chain_nonce, cached)
-            
-            # Increment for next use
-            self._nonces[address_lower] = nonce + 1
-            
-            return nonce
-    
-    async def reset_nonce(self, address: str):
-        """Reset cached nonce for address (e.g., after failed tx)."""
-        async with self._lock:
-            self._nonces.pop(address.lower(), None)
+# Latest fee snapshot per chain ID, shared by all transactions signed in its block
+_fee_snapshots: Dict[int, "FeeSnapshot"] = {}
+
+# Shared client per RPC URL: (event loop, client, its aiohttp session)
+_clients: Dict[str, Tuple[asyncio.AbstractEventLoop, AsyncWeb3, aiohttp.ClientSession]] = {}
+
+# Endpoint pool per configured set of RPC URLs
+_pools: Dict[Tuple[str, ...], RpcPool] = {}
+
+
+async def get_async_web3(rpc_url: str) -> AsyncWeb3:
+    """The process-wide client for rpc_url, created on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(rpc_url)
+    if entry is None or entry[0] is not loop or entry[2].closed:
+        settings = get_settings()
+        provider = AsyncHTTPProvider(
+            rpc_url,
+            request_kwargs={"timeout": aiohttp.ClientTimeout(total=settings.eth_rpc_timeout)},
+        )
+        if len(settings.eth_rpc_urls) > 1:
+            # web3 retries a failing endpoint for over a second; with fallbacks
+            # the pool fails over instead
+            provider.middlewares = ()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.eth_rpc_pool_size,
+                keepalive_timeout=settings.eth_rpc_keepalive,
+            ),
+            raise_for_status=True,
+        )
+        # web3 keeps one session per endpoint; if it already has a live one, use that
+        cached = await provider.cache_async_session(session)
+        if cached is not session:
+            await session.close()
+        entry = _clients[rpc_url] = (loop, AsyncWeb3(provider), cached)
+    return entry[1]
+
+
+async def rpc_batch(rpc_url: str, calls: List[Tuple[str, List[Any]]]) -> List[Optional[Any]]:
+    """
+    Make (method, params) calls as JSON-RPC batch requests.
+
+    Calls are sent eth_rpc_batch_size per HTTP request over the shared
+    session for rpc_url, the requests concurrently. Returns the raw results
+    in call order, None for a call the node answered with an error; raises
+    if a request as a whole fails.
+    """
+    await get_async_web3(rpc_url)
+    session = _clients[rpc_url][2]
+    settings = get_settings()
+    size = max(settings.eth_rpc_batch_size, 1)
+    timeout = aiohttp.ClientTimeout(total=settings.eth_rpc_timeout)
+
+    async def send(offset: int, chunk: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+        payload = [
+            {"jsonrpc": "2.0", "id": offset + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(chunk)
+        ]
+        async with session.post(rpc_url, json=payload, timeout=timeout) as response:
+            body = await response.json(content_type=None)
+        if not isinstance(body, list):
+            # Nodes answer a batch they refuse (e.g. too large) with a single error
+            raise ValueError(f"RPC batch of {len(chunk)} calls rejected: {body.get('error', body)}")
+        return body
+
+    responses = await asyncio.gather(
+        *(send(offset, calls[offset:offset + size]) for offset in range(0, len(calls), size))
+    )
+    results: List[Optional[Any]] = [None] * len(calls)
+    # Responses within a batch may come back in any order
+    for response in itertools.chain.from_iterable(responses):
+        if "error" in response:
+            logger.warning(f"RPC {calls[response['id']][0]} failed: {response['error']}")
+            continue
+        results[response["id"]] = response.get("result")
+    return results
+
+
+async def _head_block(rpc_url: str) -> int:
+    return await (await get_async_web3(rpc_url)).eth.block_number
+
+
+def get_rpc_pool() -> RpcPool:
+    """The process-wide pool over the configured RPC endpoints."""
+    urls = tuple(get_settings().eth_rpc_urls)
+    pool = _pools.get(urls)
+    if pool is None:
+        pool = _pools[urls] = RpcPool(list(urls), _head_block)
+    return pool
+
+
+async def close_async_web3():
+    """Close the shared RPC connection pools (on shutdown)."""
+    for pool in _pools.values():
+        pool.close()
+    for _, _, session in _clients.values():
+        if not session.closed:
+            await session.close()
+    _clients.clear()
+
+
+@dataclass
+class FeeSnapshot:
+    """Fee data (as returned by get_gas_price) observed at one block."""
+    block_number: int
+    fees: Dict[str, Optional[int]]
+
+
+@dataclass
+class SigningContext:
+    """Chain data needed to build and sign a transaction."""
+    chain_id: int
+    nonce: int
+    gas_limit: int
+    fees: Dict[str, Optional[int]]
+    block_number: int
+    fee_snapshot_reused: bool = False
+    latency_ms: Dict[str, float] = field(default_factory=dict)  # Per RPC call
+
+
+async def _timed(latency_ms: Dict[str, float], name: str, call):
+    """Await call, recording its wall time in milliseconds under name."""
+    started = time.perf_counter()
+    try:
+        return await call
+    finally:
+        latency_ms[name] = round((time.perf_counter() - started) * 1000, 1)
 
 
 class EthereumService:
@@ -58,26 +181,24 @@ class EthereumService:
         self.db = db
         self.audit = audit
         self.settings = get_settings()
-        self._web3: Optional[Web3] = None
-        self.nonce_manager = NonceManager()
     
     @property
-    def web3(self) -> Web3:
-        """Get Web3 instance (lazy loaded)."""
-        if self._web3 is None:
-            self._web3 = Web3(Web3.HTTPProvider(self.settings.eth_rpc_url))
-        return self._web3
+    def pool(self) -> RpcPool:
+        return get_rpc_pool()
     
-    @property
-    def chain_id(self) -> int:
-        """Get current chain ID."""
-        return self.web3.eth.chain_id
+    async def _read(self, fn: Callable[[AsyncWeb3], Awaitable[Any]]) -> Any:
+        """Await fn(client) on the pool's healthiest endpoint, hedged and with failover."""
+        async def call(rpc_url: str):
+            return await fn(await get_async_web3(rpc_url))
+        return await self.pool.read(call)
     
     async def get_gas_price(self) -> Dict[str, int]:
         """Get current gas prices (legacy and EIP-1559)."""
+        # Legacy gas price is needed either way, fetch it alongside fee history
+        gas_price = asyncio.ensure_future(self._read(lambda web3: web3.eth.gas_price))
         try:
             # Try EIP-1559 fee data first
-            fee_history = self.web3.eth.fee_history(1, "latest", [25, 50, 75])
+            fee_history = await self._read(lambda web3: web3.eth.fee_history(1, "latest", [25, 50, 75]))
             base_fee = fee_history["baseFeePerGas"][-1]
             
             # Calculate priority fees from history
@@ -87,12 +208,12 @@ class EthereumService:
                 "base_fee": base_fee,
                 "max_priority_fee": priority_fees[1] if len(priority_fees) > 1 else priority_fees[0],
                 "max_fee": base_fee * 2 + priority_fees[1] if len(priority_fees) > 1 else base_fee * 2,
-                "legacy_gas_price": self.web3.eth.gas_price
+                "legacy_gas_price": await gas_price
             }
         except Exception as e:
             logger.warning(f"Failed to get EIP-1559 fees: {e}, falling back to legacy")
             return {
-                "legacy_gas_price": self.web3.eth.gas_price,
+                "legacy_gas_price": await gas_price,
                 "base_fee": None,
                 "max_priority_fee": None,
                 "max_fee": None
@@ -115,21 +236,80 @@ class EthereumService:
             tx["data"] = data
         
         try:
-            estimate = self.web3.eth.estimate_gas(tx)
+            estimate = await self._read(lambda web3: web3.eth.estimate_gas(tx))
             # Add 20% buffer
             return int(estimate * 1.2)
         except Exception as e:
             logger.warning(f"Gas estimation failed: {e}, using default")
             return 21000 if not data else 100000
     
-    async def get_nonce(self, address: str) -> int:
-        """Get next nonce for address."""
-        return await self.nonce_manager.get_nonce(address, self.web3)
+    async def get_transaction_count(self, address: str, block: str = "pending") -> int:
+        """Transactions sent from address: mined ("latest") or including the mempool ("pending")."""
+        return await self._read(lambda web3: web3.eth.get_transaction_count(address, block))
+    
+    async def get_nonce(self, address: str, tx_request_id: str) -> int:
+        """Allocate the nonce tx_request_id signs with from address (see nonce)."""
+        chain_nonce = await self.get_transaction_count(address)
+        return await NonceAllocator(self.db.bind).allocate(address, tx_request_id, chain_nonce)
+    
+    async def get_chain_id(self) -> int:
+        """Get chain ID, fetched once per endpoint pool."""
+        urls = tuple(self.settings.eth_rpc_urls)
+        chain_id = _chain_ids.get(urls)
+        if chain_id is None:
+            chain_id = await self._read(lambda web3: web3.eth.chain_id)
+            _chain_ids[urls] = chain_id
+        return chain_id
+    
+    async def get_signing_context(
+        self,
+        from_address: str,
+        to_address: str,
+        value: int,
+        data: Optional[str] = None,
+        *,
+        tx_request_id: str
+    ) -> SigningContext:
+        """
+        Fetch chain ID, nonce, gas estimate and fees for signing concurrently.
+
+        Fee data is fetched once per block and shared by every transaction
+        signed in that block; the block number is read alongside the other
+        calls, so a transaction reusing the snapshot pays one round trip.
+        """
+        latency_ms: Dict[str, float] = {}
+        chain_id, nonce, gas_limit, block_number = await asyncio.gather(
+            _timed(latency_ms, "chain_id", self.get_chain_id()),
+            _timed(latency_ms, "nonce", self.get_nonce(from_address, tx_request_id)),
+            _timed(latency_ms, "estimate_gas", self.estimate_gas(from_address, to_address, value, data)),
+            _timed(latency_ms, "block_number", self.get_block_number()),
+        )
+        
+        snapshot = _fee_snapshots.get(chain_id)
+        reused = snapshot is not None and snapshot.block_number == block_number
+        if not reused:
+            fees = await _timed(latency_ms, "fees", self.get_gas_price())
+            snapshot = FeeSnapshot(block_number=block_number, fees=fees)
+            # Legacy-only fallback fees are not shared
+            if fees.get("base_fee") is not None:
+                _fee_snapshots[chain_id] = snapshot
+        
+        return SigningContext(
+            chain_id=chain_id,
+            nonce=nonce,
+            gas_limit=gas_limit,
+            fees=dict(snapshot.fees),
+            block_number=block_number,
+            fee_snapshot_reused=reused,
+            latency_ms=latency_ms,
+        )
     
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, ConnectionError))
+        retry=retry_if_exception_type(
+            (httpx.HTTPError, aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionError)
+        )
     )
     async def broadcast_transaction(
         self,
@@ -141,8 +321,14 @@ class EthereumService:
         Broadcast signed transaction to the network.
         Returns tx_hash on success.
         """
+        raw_tx = bytes.fromhex(signed_tx.replace("0x", ""))
+        
+        async def send(rpc_url: str):
+            return await (await get_async_web3(rpc_url)).eth.send_raw_transaction(raw_tx)
+        
         try:
-            tx_hash = self.web3.eth.send_raw_transaction(bytes.fromhex(signed_tx.replace("0x", "")))
+            # Every endpoint gets the transaction; the first to accept it answers
+            tx_hash, rpc_url = await self.pool.broadcast(send)
             tx_hash_hex = tx_hash.hex()
             
             # Log broadcast
@@ -154,77 +340,102 @@ class EthereumService:
                 entity_id=tx_request_id,
                 payload={
                     "tx_hash": tx_hash_hex,
-                    "rpc_url": self.settings.eth_rpc_url.split("@")[-1]  # Hide any auth in URL
+                    "rpc_url": display_url(rpc_url)  # Hide any auth in URL
                 }
             )
             
             return tx_hash_hex
             
         except Exception as e:
+            # A rebroadcast of a transaction the node already holds
+            if "already known" in str(e).lower():
+                logger.info(f"Tx {tx_request_id} already known to the node")
+                return Web3.keccak(raw_tx).hex()
             logger.error(f"Broadcast failed for tx {tx_request_id}: {e}")
             raise
     
-    async def get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
-        """Get transaction receipt if available."""
+    async def get_transaction_receipt(self, tx_hash: str, raise_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get transaction receipt if available.
+
+        None means not mined, or (unless raise_errors) that the RPC call failed.
+        """
         try:
-            # Run Web3 call in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                receipt = await loop.run_in_executor(
-                    executor,
-                    lambda: self.web3.eth.get_transaction_receipt(tx_hash)
-                )
+            receipt = await self._read(lambda web3: web3.eth.get_transaction_receipt(tx_hash))
             return dict(receipt) if receipt else None
         except TransactionNotFound:
             return None
         except Exception as e:
+            if raise_errors:
+                raise
             logger.warning(f"Failed to get receipt for {tx_hash}: {e}")
             return None
     
     async def get_block_number(self) -> int:
         """Get current block number."""
         try:
-            # Web3 calls are synchronous, but we're in async context
-            # Run in thread pool to avoid blocking
-            import concurrent.futures
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                block_number = await loop.run_in_executor(
-                    executor, 
-                    lambda: self.web3.eth.block_number
-                )
-            return block_number
+            return await self.pool.head()
         except Exception as e:
-            logger.error(f"Failed to get block number from {self.settings.eth_rpc_url}: {e}")
+            logger.error(f"Failed to get block number: {e}")
             raise
     
     async def get_block(self, block_number: int) -> Optional[Dict[str, Any]]:
         """Get block by number."""
         try:
-            # Run Web3 call in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                block = await loop.run_in_executor(
-                    executor,
-                    lambda: self.web3.eth.get_block(block_number, full_transactions=True)
-                )
+            block = await self._read(lambda web3: web3.eth.get_block(block_number, full_transactions=True))
             return dict(block) if block else None
         except Exception as e:
             logger.warning(f"Failed to get block {block_number}: {e}")
             return None
     
+    async def _batch(
+        self,
+        method: str,
+        params: List[List[Any]],
+        min_head: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """One batched call of method per params entry, results formatted as web3 does."""
+        calls = [(method, p) for p in params]
+        results = await self.pool.read(lambda rpc_url: rpc_batch(rpc_url, calls), min_head=min_head)
+        formatter = PYTHONIC_RESULT_FORMATTERS[method]
+        return [dict(formatter(result)) if result else None for result in results]
+    
+    async def get_blocks(self, block_numbers: Iterable[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get blocks (with full transactions) by number, batched; None for a missing block.
+
+        Read from an endpoint that has reached the highest of them, when the
+        pool knows of one.
+        """
+        block_numbers = list(block_numbers)
+        return await self._batch(
+            RPC.eth_getBlockByNumber,
+            [[hex(n), True] for n in block_numbers],
+            min_head=max(block_numbers, default=None),
+        )
+    
+    async def get_transaction_receipts(self, tx_hashes: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get receipts by transaction hash, batched; None where not yet mined."""
+        return await self._batch(RPC.eth_getTransactionReceipt, [[h] for h in tx_hashes])
+    
     async def check_confirmations(
         self,
         tx_hash: str,
         tx_request_id: str,
         correlation_id: str,
-        required_confirmations: int = 3
+        required_confirmations: int = 3,
+        receipt: Optional[Dict[str, Any]] = None,
+        current_block: Optional[int] = None
     ) -> Optional[int]:
         """
         Check transaction confirmations.
         Returns number of confirmations or None if not found.
+
+        Callers checking many transactions pass the receipt and current
+        block they already fetched, so no RPC call is made here.
         """
-        receipt = await self.get_transaction_receipt(tx_hash)
+        if receipt is None:
+            receipt = await self.get_transaction_receipt(tx_hash)
         if not receipt:
             return None
         
@@ -237,7 +448,8 @@ class EthereumService:
         if not tx_block:
             return 0
         
-        current_block = await self.get_block_number()
+        if current_block is None:
+            current_block = await self.get_block_number()
         confirmations = current_block - tx_block + 1
         
         if confirmations >= required_confirmations:
@@ -261,7 +473,8 @@ class EthereumService:
     
     async def get_balance(self, address: str) -> Decimal:
         """Get ETH balance for address."""
-        balance_wei = self.web3.eth.get_balance(Web3.to_checksum_address(address))
+        checksum_address = Web3.to_checksum_address(address)
+        balance_wei = await self._read(lambda web3: web3.eth.get_balance(checksum_address))
         return Decimal(str(Web3.from_wei(balance_wei, "ether")))
     
     async def get_incoming_transfers(
@@ -269,21 +482,31 @@ class EthereumService:
         addresses: List[str],
         from_block: int,
         to_block: int
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get incoming ETH transfers to monitored addresses.
         Note: For ERC20, would need to filter Transfer events.
+
+        Returns (transfers, last scanned block). The scan stops before the
+        first block the node did not return (not synced that far, or the
+        call failed), so the caller resumes from there instead of skipping it.
         """
         transfers = []
+        monitored = {a.lower() for a in addresses}
+        block_numbers = range(from_block, to_block + 1)
+        last_block = from_block - 1
         
-        for block_num in range(from_block, to_block + 1):
-            block = await self.get_block(block_num)
+        # The whole range in one batch
+        blocks = await self.get_blocks(block_numbers)
+        for block_num, block in zip(block_numbers, blocks):
             if not block:
-                continue
+                logger.warning(f"Block {block_num} not returned, deposit scan stops at {last_block}")
+                break
+            last_block = block_num
             
             for tx in block.get("transactions", []):
                 to_addr = tx.get("to")
-                if to_addr and to_addr.lower() in [a.lower() for a in addresses]:
+                if to_addr and to_addr.lower() in monitored:
                     value = tx.get("value", 0)
                     if value > 0:
                         transfers.append({
@@ -295,5 +518,5 @@ class EthereumService:
                             "block_timestamp": block.get("timestamp")
                         })
         
-        return transfers
+        return transfers, last_block
 
@@ -0,0 +1,202 @@
+"""In-process pub/sub for transaction and deposit status changes.
+
+Status changes are recorded as audit events (TX_STATUS_CHANGED,
+TX_FINALIZED, DEPOSIT_APPROVED, ...). Publishers hand the audit event to
+publish_after_commit; once the session commits it is converted to a
+StreamEvent and delivered to every subscriber watching its wallet. Nothing
+is delivered for a transaction that rolls back.
+
+Stream events are numbered with the audit sequence number, so a client
+that reconnects with the last number it saw is caught up from audit_events
+(replay_events) before live delivery resumes. In ``outbox`` audit chain
+mode sequence numbers are assigned later by the chain hasher: live events
+then carry no number and replay only covers events already chained.
+
+The bus is per process; events committed by standalone pipeline worker
+processes reach streams on those processes only.
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import begin_transaction
+from app.models.audit import AuditEvent, AuditEventType
+
+logger = logging.getLogger(__name__)
+
+# Session.info key for audit events to publish when the session commits
+_PENDING_KEY = "event_stream_pending"
+
+# Audit event type -> (stream event type, status it records)
+STREAM_EVENT_TYPES = {
+    AuditEventType.TX_STATUS_CHANGED: ("tx_status", None),  # Status from payload
+    AuditEventType.TX_FAILED: ("tx_status", "REVERTED"),
+    AuditEventType.TX_FINALIZED: ("tx_status", "FINALIZED"),
+    AuditEventType.DEPOSIT_DETECTED: ("deposit_status", "PENDING_ADMIN"),
+    AuditEventType.DEPOSIT_APPROVED: ("deposit_status", "CREDITED"),
+    AuditEventType.DEPOSIT_REJECTED: ("deposit_status", "REJECTED"),
+}
+
+
+@dataclass
+class StreamEvent:
+    """A status change as delivered to stream subscribers."""
+    type: str  # tx_status or deposit_status
+    entity_id: str
+    wallet_id: Optional[str]
+    status: str
+    timestamp: datetime
+    correlation_id: str
+    sequence: Optional[int] = None  # Audit sequence number
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_audit(cls, audit_event: AuditEvent) -> Optional["StreamEvent"]:
+        """Build the stream event recorded by an audit event, if any."""
+        event_type = AuditEventType(audit_event.event_type)
+        if event_type not in STREAM_EVENT_TYPES:
+            return None
+        stream_type, status = STREAM_EVENT_TYPES[event_type]
+        payload = audit_event.payload or {}
+        refs = audit_event.entity_refs or {}
+
+        if stream_type == "tx_status":
+            entity_id = audit_event.entity_id
+            status = status or payload.get("new_status")
+        else:
+            entity_id = refs.get("deposit_id")
+        if not entity_id or not status:
+            return None
+
+        return cls(
+            type=stream_type,
+            entity_id=entity_id,
+            wallet_id=refs.get("wallet_id"),
+            status=status,
+            timestamp=audit_event.timestamp,
+            correlation_id=audit_event.correlation_id,
+            sequence=audit_event.sequence_number,
+            data=payload,
+        )
+
+    def to_sse(self) -> str:
+        """Encode as a Server-Sent Events message."""
+        body = json.dumps({
+            "type": self.type,
+            "entity_id": self.entity_id,
+            "wallet_id": self.wallet_id,
+            "status": self.status,
+            "timestamp": self.timestamp.isoformat(),
+            "correlation_id": self.correlation_id,
+            "sequence": self.sequence,
+            "data": self.data,
+        }, default=str)
+        event_id = f"id: {self.sequence}\n" if self.sequence is not None else ""
+        return f"{event_id}event: {self.type}\ndata: {body}\n\n"
+
+
+class Subscription:
+    """One subscriber's queue of stream events."""
+
+    def __init__(self, wallet_ids: Optional[Set[str]], max_size: int):
+        self.wallet_ids = wallet_ids  # None: all wallets
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        # Set when events were dropped; the stream recovers them by replay
+        self.overflowed = False
+
+    def wants(self, stream_event: StreamEvent) -> bool:
+        return self.wallet_ids is None or stream_event.wallet_id in self.wallet_ids
+
+
+class EventBus:
+    """Fans committed status changes out to stream subscribers."""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, wallet_ids: Optional[Set[str]] = None) -> Subscription:
+        """Subscribe to events for the given wallets (None for all)."""
+        subscription = Subscription(wallet_ids, get_settings().event_stream_queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+
+    def publish(self, stream_event: StreamEvent):
+        """Deliver an event to matching subscribers without waiting."""
+        for subscription in self._subscriptions:
+            if not subscription.wants(stream_event):
+                continue
+            try:
+                subscription.queue.put_nowait(stream_event)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+
+    def publish_after_commit(self, db: AsyncSession, audit_event: AuditEvent):
+        """Publish the status change recorded by audit_event once db commits."""
+        # So that a rollback discards it even if no SQL ran before it
+        begin_transaction(db.sync_session)
+        db.sync_session.info.setdefault(_PENDING_KEY, []).append(audit_event)
+
+
+event_bus = EventBus()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session):
+    for audit_event in session.info.pop(_PENDING_KEY, ()):
+        try:
+            stream_event = StreamEvent.from_audit(audit_event)
+        except Exception as e:
+            logger.error(f"Could not build stream event for audit event {audit_event.id}: {e}")
+            continue
+        if stream_event:
+            event_bus.publish(stream_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def replay_events(
+    db: AsyncSession,
+    after_sequence: int,
+    wallet_ids: Optional[Set[str]] = None,
+    limit: int = 500
+) -> Tuple[List[StreamEvent], Optional[int]]:
+    """
+    Stream events recorded after an audit sequence number, oldest first.
+
+    Reads at most `limit` audit events and returns the matching stream
+    events with the sequence number of the last audit event read, to resume
+    from; None once caught up.
+    """
+    result = await db.execute(
+        select(AuditEvent)
+        .where(AuditEvent.sequence_number > after_sequence)
+        .where(AuditEvent.event_type.in_(STREAM_EVENT_TYPES))
+        .order_by(AuditEvent.sequence_number.asc())
+        .limit(limit)
+    )
+    audit_events = list(result.scalars().all())
+    stream_events = []
+    for audit_event in audit_events:
+        stream_event = StreamEvent.from_audit(audit_event)
+        if stream_event and (wallet_ids is None or stream_event.wallet_id in wallet_ids):
+            stream_events.append(stream_event)
+    last_sequence = audit_events[-1].sequence_number if len(audit_events) == limit else None
+    return stream_events, last_sequence
@@ -0,0 +1,413 @@
+"""Nonce-pipelined sender for the dev signer hot wallet.
+
+Signing inline sends one transaction per orchestration path and waits for
+nothing else, so a single hot wallet address cannot keep more than a
+handful of transactions in one block. With hot_wallet_sender_enabled the
+orchestrator stops dev signer transactions at SIGN_PENDING, and the sender
+takes them from there in passes:
+
+- track: PENDING versions (see MempoolTx) below the address's mined nonce
+  are resolved from their receipts; the mined version's hash becomes the
+  transaction's, so the chain listener confirms it as usual, and the other
+  versions at that nonce are REPLACED. A mined cancellation moves the
+  transaction to CANCELLED. A nonce mined with no receipt for any of its
+  versions is retried until each version is older than
+  hot_wallet_stuck_after and confirmed missing one by one (a batch answers
+  None for a failed call too); then the versions are DROPPED and the
+  transaction CANCELLED, as it can never be mined
+- unstick: a nonce whose newest version has been unmined for
+  hot_wallet_stuck_after is re-signed with fees bumped by
+  hot_wallet_fee_bump_percent (a replacement) and, after
+  hot_wallet_max_replacements, replaced by a zero-value transfer to self
+  (a cancellation). Fees never go above hot_wallet_max_fee_gwei; past the
+  cap the newest version is rebroadcast as is
+- fill: up to hot_wallet_max_in_flight unmined nonces are kept per
+  address. Free slots are filled with the oldest SIGN_PENDING
+  transactions, claimed with SKIP LOCKED, given consecutive nonces in one
+  NonceAllocator transaction, signed, committed, then broadcast in nonce
+  order
+
+Each pass runs in one session; its status changes are journaled per
+orchestrator step and committed before the next phase.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import select, exists, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from web3 import Web3
+
+from app.config import get_settings
+from app.models.mempool import MempoolTx, MempoolTxKind, MempoolTxStatus
+from app.models.tx_request import TxRequest, TxStatus
+from app.models.wallet import Wallet, CustodyBackend
+from app.services.nonce import NonceAllocator
+from app.services.orchestrator import TxOrchestrator
+from app.services.tx_pipeline import build_orchestrator
+
+logger = logging.getLogger(__name__)
+
+# Statuses a transaction walks through when one of its versions is sent
+_SEND_PATH = [TxStatus.BROADCAST_PENDING, TxStatus.BROADCASTED, TxStatus.CONFIRMING]
+
+
+def _bump(value: Decimal, percent: int) -> int:
+    """value raised by percent, rounded up."""
+    return -(-int(value) * (100 + percent) // 100)
+
+
+class HotWalletSender:
+    """Background service keeping the dev signer's transactions in flight."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[float] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.hot_wallet_poll_interval
+        self._running = False
+
+    async def start(self):
+        """Start the sender."""
+        self._running = True
+        logger.info("Hot wallet sender started")
+
+        while self._running:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Hot wallet sender pass error: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the sender."""
+        self._running = False
+        logger.info("Hot wallet sender stopped")
+
+    async def run_once(self) -> Dict[str, int]:
+        """One pass over the dev signer address, returns counts per outcome."""
+        counts: Dict[str, int] = defaultdict(int)
+        async with self.session_maker() as session:
+            orchestrator = build_orchestrator(session)
+            address = await orchestrator.signing.get_signer_address()
+            try:
+                mined_nonce = await orchestrator.ethereum.get_transaction_count(address, "latest")
+                await self._track(session, orchestrator, address, mined_nonce, counts)
+                await self._unstick(session, orchestrator, address, mined_nonce, counts)
+                await self._fill(session, orchestrator, address, counts)
+            except Exception:
+                await session.rollback()
+                raise
+        return dict(counts)
+
+    async def _pending(self, session: AsyncSession, address: str) -> Dict[int, List[MempoolTx]]:
+        """PENDING versions from address by nonce, oldest version first."""
+        result = await session.execute(
+            select(MempoolTx)
+            .where(MempoolTx.address == address.lower())
+            .where(MempoolTx.status == MempoolTxStatus.PENDING)
+            .order_by(MempoolTx.nonce, MempoolTx.id)
+        )
+        versions: Dict[int, List[MempoolTx]] = defaultdict(list)
+        for version in result.scalars().all():
+            versions[version.nonce].append(version)
+        return versions
+
+    async def _track(
+        self,
+        session: AsyncSession,
+        orchestrator: TxOrchestrator,
+        address: str,
+        mined_nonce: int,
+        counts: Dict[str, int]
+    ):
+        versions = {
+            nonce: group for nonce, group in (await self._pending(session, address)).items()
+            if nonce < mined_nonce
+        }
+        if not versions:
+            return
+
+        flat = [version for group in versions.values() for version in group]
+        receipts = dict(zip(
+            (version.id for version in flat),
+            await orchestrator.ethereum.get_transaction_receipts([version.tx_hash for version in flat]),
+        ))
+        gone_before = datetime.utcnow() - timedelta(seconds=self.settings.hot_wallet_stuck_after)
+        correlation_id = f"hot-wallet-{uuid4()}"
+
+        async with orchestrator.step():
+            for nonce, group in versions.items():
+                mined = next((version for version in group if receipts[version.id]), None)
+                if mined is None:
+                    # Nodes lag on receipts; give up only once every version is old
+                    if not all(version.sent_at < gone_before for version in group):
+                        continue
+                    # Raises on RPC errors: the pass is retried, nothing is dropped
+                    for version in group:
+                        receipts[version.id] = await orchestrator.ethereum.get_transaction_receipt(
+                            version.tx_hash, raise_errors=True
+                        )
+                    mined = next((version for version in group if receipts[version.id]), None)
+                if mined is None:
+                    for version in group:
+                        version.status = MempoolTxStatus.DROPPED
+                    logger.error(
+                        f"Nonce {nonce} of {address} was mined by a transaction "
+                        f"the sender did not sign (tx {group[0].tx_request_id})"
+                    )
+                    tx = await session.get(TxRequest, group[0].tx_request_id)
+                    await orchestrator.advance_status(
+                        tx, _SEND_PATH + [TxStatus.CANCELLED], correlation_id,
+                        {"nonce": nonce, "reason": "Nonce mined by another transaction"}
+                    )
+                    counts["dropped"] += 1
+                    continue
+
+                for version in group:
+                    version.status = MempoolTxStatus.MINED if version is mined else MempoolTxStatus.REPLACED
+                mined.block_number = receipts[mined.id].get("blockNumber")
+
+                tx = await session.get(TxRequest, mined.tx_request_id)
+                payload = {"tx_hash": mined.tx_hash, "nonce": nonce, "versions": len(group)}
+                if mined.kind == MempoolTxKind.CANCELLATION:
+                    await orchestrator.advance_status(
+                        tx, _SEND_PATH + [TxStatus.CANCELLED], correlation_id, payload
+                    )
+                    counts["cancelled"] += 1
+                    continue
+
+                tx.tx_hash, tx.signed_tx = mined.tx_hash, mined.signed_tx
+                await orchestrator.advance_status(tx, _SEND_PATH, correlation_id, payload)
+                counts["replaced" if mined.kind == MempoolTxKind.REPLACEMENT else "mined"] += 1
+        await session.commit()
+
+    async def _unstick(
+        self,
+        session: AsyncSession,
+        orchestrator: TxOrchestrator,
+        address: str,
+        mined_nonce: int,
+        counts: Dict[str, int]
+    ):
+        stuck_before = datetime.utcnow() - timedelta(seconds=self.settings.hot_wallet_stuck_after)
+        stuck = [
+            group for nonce, group in (await self._pending(session, address)).items()
+            if nonce >= mined_nonce and group[-1].sent_at < stuck_before
+        ]
+        if not stuck:
+            return
+
+        chain_id, fees = await asyncio.gather(
+            orchestrator.ethereum.get_chain_id(),
+            orchestrator.ethereum.get_gas_price(),
+        )
+        correlation_id = f"hot-wallet-{uuid4()}"
+
+        async with orchestrator.step():
+            for group in stuck:
+                newest = group[-1]
+                tx = await session.get(TxRequest, newest.tx_request_id)
+                bumped = self._bumped_fees(newest, fees)
+
+                if tx.status == TxStatus.SIGNED or bumped is None:
+                    # Never sent (a pass died before broadcasting), or at the fee cap
+                    if bumped is None:
+                        logger.warning(
+                            f"Tx {tx.id} (nonce {newest.nonce}) stuck at the "
+                            f"{self.settings.hot_wallet_max_fee_gwei} gwei fee cap, rebroadcasting"
+                        )
+                    await self._send(orchestrator, tx, newest, correlation_id)
+                    counts["rebroadcast"] += 1
+                    continue
+
+                replacements = sum(1 for version in group if version.kind != MempoolTxKind.ORIGINAL)
+                if newest.kind == MempoolTxKind.CANCELLATION or replacements >= self.settings.hot_wallet_max_replacements:
+                    kind = MempoolTxKind.CANCELLATION
+                    signed_tx, tx_hash = await orchestrator.signing.sign_cancellation(
+                        tx,
+                        chain_id,
+                        newest.nonce,
+                        bumped["legacy_gas_price"] or 0,
+                        max_fee_per_gas=bumped["max_fee"],
+                        max_priority_fee_per_gas=bumped["max_priority_fee"],
+                        correlation_id=correlation_id,
+                    )
+                else:
+                    kind = MempoolTxKind.REPLACEMENT
+                    signed_tx, tx_hash = await orchestrator.signing.sign_transaction(
+                        tx,
+                        chain_id,
+                        newest.nonce,
+                        bumped["legacy_gas_price"] or 0,
+                        int(tx.gas_limit),
+                        max_fee_per_gas=bumped["max_fee"],
+                        max_priority_fee_per_gas=bumped["max_priority_fee"],
+                        correlation_id=correlation_id,
+                        custody_backend=CustodyBackend.DEV_SIGNER,
+                    )
+
+                version = self._version(tx, address, newest.nonce, kind, signed_tx, tx_hash, bumped)
+                session.add(version)
+                logger.info(
+                    f"Tx {tx.id} stuck at nonce {newest.nonce}: sending {kind.value.lower()} {tx_hash}"
+                )
+                await self._send(orchestrator, tx, version, correlation_id)
+                counts[kind.value.lower()] += 1
+        await session.commit()
+
+    def _bumped_fees(self, version: MempoolTx, current: Dict[str, Optional[int]]) -> Optional[Dict[str, Optional[int]]]:
+        """
+        Fees for a version replacing version: bumped enough for nodes to
+        accept it, and at least the current fees. None above the fee cap.
+        """
+        percent = self.settings.hot_wallet_fee_bump_percent
+        cap = Web3.to_wei(self.settings.hot_wallet_max_fee_gwei, "gwei")
+
+        if version.max_fee_per_gas is not None:
+            tip = max(_bump(version.max_priority_fee_per_gas, percent), current.get("max_priority_fee") or 0)
+            max_fee = max(_bump(version.max_fee_per_gas, percent), current.get("max_fee") or 0, tip)
+            if max_fee > cap:
+                return None
+            return {"max_fee": max_fee, "max_priority_fee": tip, "legacy_gas_price": None}
+
+        gas_price = max(_bump(version.gas_price, percent), current.get("legacy_gas_price") or 0)
+        if gas_price > cap:
+            return None
+        return {"max_fee": None, "max_priority_fee": None, "legacy_gas_price": gas_price}
+
+    @staticmethod
+    def _version(
+        tx: TxRequest,
+        address: str,
+        nonce: int,
+        kind: MempoolTxKind,
+        signed_tx: str,
+        tx_hash: str,
+        fees: Dict[str, Optional[int]]
+    ) -> MempoolTx:
+        eip1559 = bool(fees.get("max_fee") and fees.get("max_priority_fee"))
+        return MempoolTx(
+            tx_request_id=tx.id,
+            address=address.lower(),
+            nonce=nonce,
+            kind=kind,
+            status=MempoolTxStatus.PENDING,
+            tx_hash=tx_hash,
+            signed_tx=signed_tx,
+            max_fee_per_gas=fees["max_fee"] if eip1559 else None,
+            max_priority_fee_per_gas=fees["max_priority_fee"] if eip1559 else None,
+            gas_price=None if eip1559 else fees.get("legacy_gas_price"),
+            sent_at=datetime.utcnow(),
+        )
+
+    async def _send(self, orchestrator: TxOrchestrator, tx: TxRequest, version: MempoolTx, correlation_id: str) -> bool:
+        """Broadcast version, moving tx on to CONFIRMING (or FAILED_BROADCAST)."""
+        if tx.status in (TxStatus.SIGNED, TxStatus.FAILED_BROADCAST):
+            await orchestrator.advance_status(tx, [TxStatus.BROADCAST_PENDING], correlation_id)
+        version.sent_at = datetime.utcnow()
+        try:
+            await orchestrator.ethereum.broadcast_transaction(version.signed_tx, tx.id, correlation_id)
+        except Exception as e:
+            # Stays PENDING: the version is resent (or replaced) once stuck
+            logger.warning(f"Broadcast of {version.tx_hash} (tx {tx.id}, nonce {version.nonce}) failed: {e}")
+            if tx.status == TxStatus.BROADCAST_PENDING:
+                await orchestrator.advance_status(
+                    tx, [TxStatus.FAILED_BROADCAST], correlation_id, {"error": str(e)}
+                )
+            return False
+        await orchestrator.advance_status(tx, _SEND_PATH, correlation_id, {"tx_hash": version.tx_hash})
+        return True
+
+    async def _fill(
+        self,
+        session: AsyncSession,
+        orchestrator: TxOrchestrator,
+        address: str,
+        counts: Dict[str, int]
+    ):
+        in_flight = (await session.execute(
+            select(func.count(func.distinct(MempoolTx.nonce)))
+            .where(MempoolTx.address == address.lower())
+            .where(MempoolTx.status == MempoolTxStatus.PENDING)
+        )).scalar_one()
+        slots = self.settings.hot_wallet_max_in_flight - in_flight
+        if slots <= 0:
+            return
+
+        result = await session.execute(
+            select(TxRequest)
+            .join(Wallet, Wallet.id == TxRequest.wallet_id)
+            .where(TxRequest.status == TxStatus.SIGN_PENDING)
+            .where(Wallet.custody_backend != CustodyBackend.MPC_TECDSA)
+            .where(~exists().where(MempoolTx.tx_request_id == TxRequest.id))
+            .order_by(TxRequest.created_at.asc())
+            .limit(slots)
+            .with_for_update(skip_locked=True, of=TxRequest)
+        )
+        txs = list(result.scalars().all())
+        if not txs:
+            return
+
+        ethereum = orchestrator.ethereum
+        chain_nonce = await ethereum.get_transaction_count(address)
+        chain_id, fees, nonces, *gas_limits = await asyncio.gather(
+            ethereum.get_chain_id(),
+            ethereum.get_gas_price(),
+            NonceAllocator(session.bind).allocate_many(address, [tx.id for tx in txs], chain_nonce),
+            *(
+                ethereum.estimate_gas(
+                    address, tx.to_address, int(tx.amount) if tx.asset == "ETH" else 0, tx.data
+                )
+                for tx in txs
+            ),
+        )
+        correlation_id = f"hot-wallet-{uuid4()}"
+
+        signed = []
+        async with orchestrator.step():
+            for tx, nonce, gas_limit in sorted(zip(txs, nonces, gas_limits), key=lambda item: item[1]):
+                tx.nonce, tx.gas_limit = nonce, gas_limit
+                tx.gas_price = fees.get("legacy_gas_price")
+                try:
+                    signed_tx, tx_hash = await orchestrator.signing.sign_transaction(
+                        tx,
+                        chain_id,
+                        nonce,
+                        fees.get("legacy_gas_price", 0),
+                        gas_limit,
+                        max_fee_per_gas=fees.get("max_fee"),
+                        max_priority_fee_per_gas=fees.get("max_priority_fee"),
+                        correlation_id=correlation_id,
+                        custody_backend=CustodyBackend.DEV_SIGNER,
+                    )
+                except Exception as e:
+                    # Its nonce becomes a gap, reassigned to the next transaction
+                    logger.error(f"Signing failed for tx {tx.id}: {e}")
+                    await orchestrator.advance_status(
+                        tx, [TxStatus.FAILED_SIGN], correlation_id, {"error": str(e)}
+                    )
+                    counts["failed_sign"] += 1
+                    continue
+
+                tx.signed_tx, tx.tx_hash = signed_tx, tx_hash
+                version = self._version(tx, address, nonce, MempoolTxKind.ORIGINAL, signed_tx, tx_hash, fees)
+                session.add(version)
+                await orchestrator.advance_status(tx, [TxStatus.SIGNED], correlation_id, {"nonce": nonce})
+                signed.append((tx, version))
+        # Signed versions are on record before any of them reaches the network
+        await session.commit()
+
+        async with orchestrator.step():
+            for tx, version in signed:
+                sent = await self._send(orchestrator, tx, version, correlation_id)
+                counts["sent" if sent else "failed_broadcast"] += 1
+        await session.commit()
@@ -5,8 +5,9 @@ Supports:
 2. BitOK KYT API integration (optional, enabled via config)
 """
 from datetime import datetime
+import asyncio
 import logging
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -59,9 +60,54 @@ class KYTService:
         Checks both local blacklist/graylist AND BitOK KYT (if enabled).
         The most restrictive result is used.
         """
+        screening = await self._screen_outbound(
+            address, tx_request_id, network, from_address, token_id
+        )
+        return await self._record_outbound(screening, tx_request_id, correlation_id, actor_id)
+
+    async def evaluate_outbound_batch(
+        self,
+        items: List[Tuple[str, str]],
+        correlation_id: str,
+        actor_id: Optional[str] = None,
+        network: str = "ETH",
+    ) -> List[Tuple[str, Optional[KYTCase]]]:
+        """
+        Evaluate many outbound recipients, given as (address, tx_request_id).
+
+        Screening (local lists and BitOK) runs concurrently, bounded by
+        kyt_batch_concurrency; cases and audit events are then recorded in
+        item order on the shared session. Returns (result, case) per item.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.settings.kyt_batch_concurrency))
+
+        async def screen(address: str, tx_request_id: str):
+            async with semaphore:
+                return await self._screen_outbound(address, tx_request_id, network)
+
+        screenings = await asyncio.gather(*(
+            screen(address, tx_request_id) for address, tx_request_id in items
+        ))
+        return [
+            await self._record_outbound(screening, tx_request_id, correlation_id, actor_id)
+            for screening, (_, tx_request_id) in zip(screenings, items)
+        ]
+
+    async def _screen_outbound(
+        self,
+        address: str,
+        tx_request_id: str,
+        network: str = "ETH",
+        from_address: Optional[str] = None,
+        token_id: Optional[str] = None,
+    ) -> Tuple[str, str, Optional[str], Optional[BitOKCheckResponse]]:
+        """
+        Screen an outbound recipient without touching the database.
+
+        Returns (address_lower, result, reason, bitok_response).
+        """
         address_lower = address.lower()
         result = KYTResult.ALLOW
-        case = None
         reason = None
         bitok_response: Optional[BitOKCheckResponse] = None
 
@@ -103,6 +149,19 @@ class KYTService:
                 logger.exception(f"BitOK check failed for outbound to {address_lower}: {e}")
                 # Continue with local-only result if BitOK fails
 
+        return address_lower, result, reason, bitok_response
+
+    async def _record_outbound(
+        self,
+        screening: Tuple[str, str, Optional[str], Optional[BitOKCheckResponse]],
+        tx_request_id: str,
+        correlation_id: str,
+        actor_id: Optional[str] = None,
+    ) -> Tuple[str, Optional[KYTCase]]:
+        """Open a case for REVIEW and log the evaluation of a screened recipient."""
+        address_lower, result, reason, bitok_response = screening
+        case = None
+
         # Create case for REVIEW
         if result == KYTResult.REVIEW:
             case = KYTCase(
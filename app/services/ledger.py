@@ -0,0 +1,374 @@
+"""Wallet ledger: double-entry postings with materialized balances.
+
+Withdrawable balances used to be recomputed by summing every credited
+deposit and withdrawal on each request, which is O(history) and lets two
+concurrent withdrawals both pass the check. Instead every movement of funds
+is posted as a LedgerEntry and applied to the wallet's LedgerBalance row in
+the same transaction:
+
+- deposits: detected (EXTERNAL -> PENDING), then credited
+  (PENDING -> AVAILABLE) or rejected (PENDING -> EXTERNAL)
+- withdrawals: reserved when the request is created (AVAILABLE ->
+  RESERVED), then settled when FINALIZED (RESERVED -> EXTERNAL) or
+  released when they end in any other terminal status
+  (RESERVED -> AVAILABLE)
+
+Amounts are wei, kept as Decimal end to end like the source rows.
+
+Balance rows are locked (SELECT ... FOR UPDATE) before they are checked or
+changed, so withdrawals from one wallet serialize on its balance row.
+Callers locking several balances lock them in sorted order. Withdrawals are
+reserved in a short transaction of their own (reserve_withdrawals), so the
+lock is not held while the request goes through policy, KYT and signing.
+
+LedgerReconciler periodically recomputes each balance from the source rows
+(deposits and tx_requests) and posts ADJUSTMENT entries for any drift. A
+hold whose request has not been committed yet counts as reserved for
+ledger_reservation_grace; after that it is an orphan and is released.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, union, exists
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import Deposit
+from app.models.ledger import LedgerAccount, LedgerBalance, LedgerEntry, LedgerEntryType
+from app.models.tx_request import TxRequest, TxStatus, TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+# Entry type -> (account debited, account credited)
+_POSTINGS = {
+    LedgerEntryType.DEPOSIT_DETECTED: (LedgerAccount.PENDING, LedgerAccount.EXTERNAL),
+    LedgerEntryType.DEPOSIT_CREDITED: (LedgerAccount.AVAILABLE, LedgerAccount.PENDING),
+    LedgerEntryType.DEPOSIT_REJECTED: (LedgerAccount.EXTERNAL, LedgerAccount.PENDING),
+    LedgerEntryType.WITHDRAWAL_RESERVED: (LedgerAccount.RESERVED, LedgerAccount.AVAILABLE),
+    LedgerEntryType.WITHDRAWAL_RELEASED: (LedgerAccount.AVAILABLE, LedgerAccount.RESERVED),
+    LedgerEntryType.WITHDRAWAL_SETTLED: (LedgerAccount.EXTERNAL, LedgerAccount.RESERVED),
+}
+
+# Accounts materialized on LedgerBalance
+_WALLET_ACCOUNTS = (LedgerAccount.AVAILABLE, LedgerAccount.RESERVED, LedgerAccount.PENDING)
+
+
+class InsufficientBalance(Exception):
+    """A withdrawal exceeds the wallet's available balance."""
+
+    def __init__(self, available: Decimal, requested: Decimal):
+        super().__init__(f"Available {available} wei, requested {requested} wei")
+        self.available = available
+        self.requested = requested
+
+
+class LedgerService:
+    """Posts ledger entries and keeps balances, within the caller's transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # Balance rows locked in this transaction
+        self._locked: Dict[Tuple[str, str], LedgerBalance] = {}
+
+    @property
+    def _is_postgres(self) -> bool:
+        return self.db.bind is not None and self.db.bind.dialect.name == "postgresql"
+
+    async def get_balance(self, wallet_id: str, asset: str = "ETH") -> Optional[LedgerBalance]:
+        """Current balance row, without locking it."""
+        return await self.db.get(LedgerBalance, (wallet_id, asset))
+
+    async def lock_balances(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """Lock the (wallet_id, asset) balances in sorted order, creating missing rows."""
+        for key in sorted(set(keys)):
+            await self._lock(*key)
+
+    async def _lock(self, wallet_id: str, asset: str) -> LedgerBalance:
+        key = (wallet_id, asset)
+        if key in self._locked:
+            return self._locked[key]
+
+        if self._is_postgres:
+            await self.db.execute(
+                pg_insert(LedgerBalance)
+                .values(wallet_id=wallet_id, asset=asset, updated_at=datetime.utcnow())
+                .on_conflict_do_nothing(index_elements=["wallet_id", "asset"])
+            )
+        result = await self.db.execute(
+            select(LedgerBalance)
+            .where(LedgerBalance.wallet_id == wallet_id)
+            .where(LedgerBalance.asset == asset)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        balance = result.scalar_one_or_none()
+        if balance is None:
+            balance = LedgerBalance(
+                wallet_id=wallet_id, asset=asset, available=0, reserved=0, pending=0,
+                credited_deposits=0, pending_deposits=0,
+            )
+            self.db.add(balance)
+            await self.db.flush()
+        self._locked[key] = balance
+        return balance
+
+    async def _post(
+        self,
+        wallet_id: str,
+        asset: str,
+        entry_type: LedgerEntryType,
+        amount: Decimal,
+        ref_type: Optional[str] = None,
+        ref_id: Optional[str] = None,
+        accounts: Optional[Tuple[LedgerAccount, LedgerAccount]] = None,
+    ) -> LedgerBalance:
+        debit, credit = accounts or _POSTINGS[entry_type]
+        balance = await self._lock(wallet_id, asset)
+        self.db.add(LedgerEntry(
+            wallet_id=wallet_id,
+            asset=asset,
+            entry_type=entry_type,
+            debit_account=debit,
+            credit_account=credit,
+            amount=amount,
+            ref_type=ref_type,
+            ref_id=ref_id,
+        ))
+        if debit in _WALLET_ACCOUNTS:
+            setattr(balance, debit.value.lower(), balance.amount(debit) + amount)
+        if credit in _WALLET_ACCOUNTS:
+            setattr(balance, credit.value.lower(), balance.amount(credit) - amount)
+        balance.updated_at = datetime.utcnow()
+        return balance
+
+    # Withdrawals
+
+    async def reserve_withdrawals(
+        self, items: List[Tuple[TxRequest, bool]]
+    ) -> List[Optional[InsufficientBalance]]:
+        """
+        Hold new requests' amounts, in a short transaction of its own.
+
+        items are (tx, require_funds) as for reserve_withdrawal; returns the
+        InsufficientBalance of each item refused, None where it was held.
+        The holds are committed before the requests are: a caller whose
+        request then fails calls release_reservations.
+        """
+        errors: List[Optional[InsufficientBalance]] = []
+        async with AsyncSession(self.db.bind, expire_on_commit=False) as session:
+            ledger = LedgerService(session)
+            await ledger.lock_balances((tx.wallet_id, tx.asset) for tx, _ in items)
+            for tx, require_funds in items:
+                try:
+                    await ledger.reserve_withdrawal(tx, require_funds)
+                    errors.append(None)
+                except InsufficientBalance as e:
+                    errors.append(e)
+            await session.commit()
+        return errors
+
+    async def release_reservations(self, txs: Iterable[TxRequest]) -> None:
+        """Release holds taken by reserve_withdrawals for requests that were never committed."""
+        txs = list(txs)
+        async with AsyncSession(self.db.bind, expire_on_commit=False) as session:
+            ledger = LedgerService(session)
+            await ledger.lock_balances((tx.wallet_id, tx.asset) for tx in txs)
+            for tx in txs:
+                await ledger._post(
+                    tx.wallet_id, tx.asset, LedgerEntryType.WITHDRAWAL_RELEASED,
+                    Decimal(tx.amount), "TX_REQUEST", tx.id
+                )
+            await session.commit()
+
+    async def reserve_withdrawal(self, tx: TxRequest, require_funds: bool = True) -> None:
+        """
+        Hold a new request's amount, within the caller's transaction.
+
+        With require_funds, raises InsufficientBalance (posting nothing) if
+        the available balance does not cover it.
+        """
+        amount = Decimal(tx.amount)
+        balance = await self._lock(tx.wallet_id, tx.asset)
+        if require_funds and balance.amount(LedgerAccount.AVAILABLE) < amount:
+            raise InsufficientBalance(balance.amount(LedgerAccount.AVAILABLE), amount)
+        await self._post(
+            tx.wallet_id, tx.asset, LedgerEntryType.WITHDRAWAL_RESERVED, amount, "TX_REQUEST", tx.id
+        )
+
+    async def close_withdrawal(self, tx: TxRequest) -> None:
+        """Settle (FINALIZED) or release (any other terminal status) a request's hold."""
+        entry_type = (
+            LedgerEntryType.WITHDRAWAL_SETTLED if tx.status == TxStatus.FINALIZED
+            else LedgerEntryType.WITHDRAWAL_RELEASED
+        )
+        await self._post(tx.wallet_id, tx.asset, entry_type, Decimal(tx.amount), "TX_REQUEST", tx.id)
+
+    # Deposits
+
+    async def deposit_detected(self, deposit: Deposit) -> None:
+        balance = await self._post(
+            deposit.wallet_id, deposit.asset, LedgerEntryType.DEPOSIT_DETECTED,
+            Decimal(deposit.amount), "DEPOSIT", deposit.id
+        )
+        balance.pending_deposits += 1
+
+    async def deposit_credited(self, deposit: Deposit) -> None:
+        balance = await self._post(
+            deposit.wallet_id, deposit.asset, LedgerEntryType.DEPOSIT_CREDITED,
+            Decimal(deposit.amount), "DEPOSIT", deposit.id
+        )
+        balance.pending_deposits -= 1
+        balance.credited_deposits += 1
+
+    async def deposit_rejected(self, deposit: Deposit) -> None:
+        balance = await self._post(
+            deposit.wallet_id, deposit.asset, LedgerEntryType.DEPOSIT_REJECTED,
+            Decimal(deposit.amount), "DEPOSIT", deposit.id
+        )
+        balance.pending_deposits -= 1
+
+    # Reconciliation
+
+    async def reconcile(self, wallet_id: str, asset: str) -> bool:
+        """
+        Bring one balance in line with the source rows; True if it drifted.
+
+        The balance row is locked before the source rows are read, so
+        postings committed concurrently are either fully seen or not at all.
+        """
+        balance = await self._lock(wallet_id, asset)
+
+        deposit_result = await self.db.execute(
+            select(Deposit.status, Deposit.amount)
+            .where(Deposit.wallet_id == wallet_id)
+            .where(Deposit.asset == asset)
+            .where(Deposit.status.in_(["PENDING_ADMIN", "CREDITED"]))
+        )
+        credited = pending = Decimal(0)
+        credited_count = pending_count = 0
+        for status, amount in deposit_result.all():
+            if status == "CREDITED":
+                credited += Decimal(amount)
+                credited_count += 1
+            else:
+                pending += Decimal(amount)
+                pending_count += 1
+
+        tx_result = await self.db.execute(
+            select(TxRequest.status, TxRequest.amount)
+            .where(TxRequest.wallet_id == wallet_id)
+            .where(TxRequest.asset == asset)
+            .where(TxRequest.status.not_in(TERMINAL_STATUSES - {TxStatus.FINALIZED}))
+        )
+        reserved = withdrawn = Decimal(0)
+        for status, amount in tx_result.all():
+            if status == TxStatus.FINALIZED:
+                withdrawn += Decimal(amount)
+            else:
+                reserved += Decimal(amount)
+
+        # Holds committed ahead of their request (see reserve_withdrawals)
+        released = aliased(LedgerEntry)
+        grace = timedelta(seconds=get_settings().ledger_reservation_grace)
+        held_result = await self.db.execute(
+            select(LedgerEntry.amount)
+            .where(LedgerEntry.wallet_id == wallet_id)
+            .where(LedgerEntry.asset == asset)
+            .where(LedgerEntry.entry_type == LedgerEntryType.WITHDRAWAL_RESERVED)
+            .where(LedgerEntry.created_at >= datetime.utcnow() - grace)
+            .where(~exists().where(TxRequest.id == LedgerEntry.ref_id))
+            .where(~exists().where(
+                released.ref_id == LedgerEntry.ref_id,
+                released.entry_type == LedgerEntryType.WITHDRAWAL_RELEASED,
+            ))
+        )
+        for (amount,) in held_result.all():
+            reserved += Decimal(amount)
+
+        expected = {
+            LedgerAccount.AVAILABLE: credited - reserved - withdrawn,
+            LedgerAccount.RESERVED: reserved,
+            LedgerAccount.PENDING: pending,
+        }
+        drifted = False
+        for account, amount in expected.items():
+            delta = amount - balance.amount(account)
+            if not delta:
+                continue
+            drifted = True
+            accounts = (
+                (account, LedgerAccount.RECONCILIATION) if delta > 0
+                else (LedgerAccount.RECONCILIATION, account)
+            )
+            await self._post(wallet_id, asset, LedgerEntryType.ADJUSTMENT, abs(delta), accounts=accounts)
+
+        if (balance.credited_deposits, balance.pending_deposits) != (credited_count, pending_count):
+            drifted = True
+            balance.credited_deposits = credited_count
+            balance.pending_deposits = pending_count
+
+        if drifted:
+            logger.warning(
+                f"Ledger balance {wallet_id}/{asset} drifted from source rows; adjusted to "
+                f"available={expected[LedgerAccount.AVAILABLE]} reserved={reserved} pending={pending}"
+            )
+        balance.reconciled_at = datetime.utcnow()
+        return drifted
+
+
+class LedgerReconciler:
+    """Background service reconciling ledger balances with deposits and withdrawals."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[int] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.ledger_reconcile_interval
+        self._running = False
+
+    async def start(self):
+        """Start the reconciler."""
+        self._running = True
+        logger.info("Ledger reconciler started")
+
+        while self._running:
+            try:
+                await self.reconcile_all()
+            except Exception as e:
+                logger.error(f"Ledger reconciler error: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the reconciler."""
+        self._running = False
+        logger.info("Ledger reconciler stopped")
+
+    async def reconcile_all(self) -> int:
+        """Reconcile every wallet balance, returns how many had drifted."""
+        async with self.session_maker() as session:
+            result = await session.execute(union(
+                select(Deposit.wallet_id, Deposit.asset),
+                select(TxRequest.wallet_id, TxRequest.asset),
+                select(LedgerBalance.wallet_id, LedgerBalance.asset),
+            ))
+            keys: List[Tuple[str, str]] = sorted(tuple(row) for row in result.all())
+
+        drifted = 0
+        for wallet_id, asset in keys:
+            # One short transaction per balance, to hold each row lock briefly
+            async with self.session_maker() as session:
+                if await LedgerService(session).reconcile(wallet_id, asset):
+                    drifted += 1
+                await session.commit()
+        if drifted:
+            logger.warning(f"Ledger reconciliation adjusted {drifted} of {len(keys)} balances")
+        return drifted
@@ -0,0 +1,168 @@
+"""Database-backed nonce allocation per signer address.
+
+The nonce cache used to live in each EthereumService, one per request, so
+it never outlived the call that made it and two workers signing from one
+hot wallet could pick the same nonce. NonceAllocator keeps the state in
+the database instead, shared by every API and background worker:
+
+- each signer address has a NonceAccount row, locked for the duration of
+  one short allocation transaction (its own, not the caller's, so the lock
+  is not held while the transaction is signed and broadcast)
+- every nonce handed out is recorded as a NonceAllocation for its
+  transaction until the chain's pending nonce passes it; re-signing a
+  transaction gets its nonce back
+- a nonce whose transaction failed (FAILED_SIGN) or whose transaction was
+  never committed (after nonce_orphan_timeout) is a gap, reassigned
+  lowest first, so the chain is not left waiting on a nonce that will
+  never be broadcast
+- the chain's pending nonce is read before every allocation, outside the
+  lock: if the chain is ahead (transactions sent from elsewhere) the
+  account jumps forward; if the account is ahead with nothing in flight
+  above the chain, it falls back. A read below the highest pending nonce
+  seen before (a lagging RPC endpoint) is not trusted: that watermark is
+  the floor, and allocations above it are kept
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config import get_settings
+from app.models.nonce import NonceAccount, NonceAllocation
+from app.models.tx_request import TxRequest, TxStatus, TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+# Transaction statuses that will never put their nonce on the network
+_FAILED_STATUSES = TERMINAL_STATUSES - {TxStatus.FINALIZED}
+
+
+class NonceAllocator:
+    """Hands out nonces for signer addresses, in short transactions of its own."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.settings = get_settings()
+
+    async def _lock(self, session: AsyncSession, address: str) -> NonceAccount:
+        if session.bind.dialect.name == "postgresql":
+            await session.execute(
+                pg_insert(NonceAccount)
+                .values(address=address, next_nonce=0, updated_at=datetime.utcnow())
+                .on_conflict_do_nothing(index_elements=["address"])
+            )
+        result = await session.execute(
+            select(NonceAccount).where(NonceAccount.address == address).with_for_update()
+        )
+        account = result.scalar_one_or_none()
+        if account is None:
+            account = NonceAccount(address=address, next_nonce=0)
+            session.add(account)
+            await session.flush()
+        return account
+
+    async def allocate(self, address: str, tx_request_id: str, chain_nonce: int) -> int:
+        """
+        Nonce for tx_request_id signing from address.
+
+        chain_nonce is the address's pending transaction count, read by the
+        caller just before.
+        """
+        return (await self.allocate_many(address, [tx_request_id], chain_nonce))[0]
+
+    async def allocate_many(self, address: str, tx_request_ids: List[str], chain_nonce: int) -> List[int]:
+        """
+        Nonces for several transactions signing from address, in one
+        transaction; consecutive unless there are gaps to fill.
+        """
+        address = address.lower()
+        now = datetime.utcnow()
+        orphaned_before = now - timedelta(seconds=self.settings.nonce_orphan_timeout)
+
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            account = await self._lock(session, address)
+
+            # Never below what the chain reported before: a lagging endpoint
+            # must not free nonces that are already on the network
+            if account.chain_nonce is not None and chain_nonce < account.chain_nonce:
+                logger.warning(
+                    f"Pending nonce {chain_nonce} for {address} behind the last seen "
+                    f"{account.chain_nonce}, keeping the latter"
+                )
+                chain_nonce = account.chain_nonce
+
+            if chain_nonce > account.next_nonce:
+                logger.warning(
+                    f"Nonce for {address} resynced with the chain: {account.next_nonce} -> {chain_nonce}"
+                )
+                account.next_nonce = chain_nonce
+
+            # The chain has everything below its pending nonce
+            await session.execute(
+                delete(NonceAllocation)
+                .where(NonceAllocation.address == address)
+                .where(NonceAllocation.nonce < chain_nonce)
+            )
+
+            result = await session.execute(
+                select(NonceAllocation, TxRequest.status)
+                .outerjoin(TxRequest, TxRequest.id == NonceAllocation.tx_request_id)
+                .where(NonceAllocation.address == address)
+                .order_by(NonceAllocation.nonce)
+            )
+            allocations: Dict[int, NonceAllocation] = {}
+            held: Dict[str, int] = {}
+            requested = set(tx_request_ids)
+            live: Set[int] = set()
+            for allocation, status in result.all():
+                allocations[allocation.nonce] = allocation
+                held[allocation.tx_request_id] = allocation.nonce
+                failed = status in _FAILED_STATUSES
+                orphaned = status is None and allocation.allocated_at < orphaned_before
+                if not (failed or orphaned) or allocation.tx_request_id in requested:
+                    live.add(allocation.nonce)
+
+            # Free nonces above the last one in flight are not gaps, just unused
+            top = max(live, default=chain_nonce - 1) + 1
+            if account.next_nonce > top:
+                logger.warning(
+                    f"Nonce for {address} ahead of the chain with nothing in flight: "
+                    f"{account.next_nonce} -> {top}"
+                )
+                account.next_nonce = top
+
+            nonces = []
+            for tx_request_id in tx_request_ids:
+                if tx_request_id in held:
+                    # Re-signing: same nonce
+                    nonces.append(held[tx_request_id])
+                    continue
+
+                nonce: Optional[int] = next(
+                    (n for n in range(chain_nonce, account.next_nonce) if n not in live), None
+                )
+                if nonce is None:
+                    nonce = account.next_nonce
+                    account.next_nonce += 1
+                else:
+                    logger.info(f"Nonce {nonce} for {address} reassigned to tx {tx_request_id} (gap)")
+
+                allocation = allocations.get(nonce)
+                if allocation is None:
+                    allocation = allocations[nonce] = NonceAllocation(
+                        address=address, nonce=nonce, tx_request_id=tx_request_id, allocated_at=now
+                    )
+                    session.add(allocation)
+                else:
+                    allocation.tx_request_id = tx_request_id
+                    allocation.allocated_at = now
+                held[tx_request_id] = nonce
+                live.add(nonce)
+                nonces.append(nonce)
+
+            account.chain_nonce, account.synced_at = chain_nonce, now
+            await session.commit()
+            return nonces
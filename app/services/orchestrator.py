@@ -7,20 +7,27 @@ The policy engine evaluates first and determines:
 - Whether approval is required
 - Number of approvals needed
 """
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import AsyncIterator, List, Optional, Tuple, TYPE_CHECKING
 from uuid import uuid4
 import logging
 
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import Web3
 
-from app.models.tx_request import TxRequest, TxType, TxStatus, Approval, VALID_TRANSITIONS
+from app.config import get_settings
+from app.models.tx_request import (
+    TxRequest, TxType, TxStatus, Approval, KYTCase, VALID_TRANSITIONS, TERMINAL_STATUSES,
+    RECOVERABLE_STATUSES, TxPipelineStage, TxPipelineJob,
+)
 from app.models.wallet import Wallet, WalletRoleType, CustodyBackend
-from app.models.audit import AuditEventType, Deposit
+from app.models.audit import AuditEvent, AuditEventType
 from app.models.mpc import SigningPermit
 from app.services.audit import AuditService
 from app.services.kyt import KYTService, KYTResult
@@ -30,6 +37,10 @@ from app.services.group import GroupService
 from app.services.address_book import AddressBookService
 from app.services.signing import SigningService
 from app.services.ethereum import EthereumService
+from app.services.rpc_pool import TRANSPORT_ERRORS
+from app.services.event_stream import event_bus
+from app.services.webhooks import enqueue_webhooks
+from app.services.ledger import LedgerService, InsufficientBalance
 from app.schemas.tx_request import TxRequestCreate
 
 if TYPE_CHECKING:
@@ -38,6 +49,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _JournalEntry:
+    """Run of consecutive status transitions of one transaction, audited as one event."""
+    tx: TxRequest
+    event: AuditEvent
+
+
 class TxOrchestrator:
     """
     Orchestrates the complete transaction lifecycle (v2 flow):
@@ -49,6 +67,10 @@ class TxOrchestrator:
     - Whether approval is required and how many
 
     Supports both DEV_SIGNER and MPC_TECDSA custody backends.
+
+    In ``queue`` pipeline mode the policy, KYT, signing and broadcast stages
+    are not chained inline: each stage enqueues the next as a TxPipelineJob
+    and pipeline workers run it (see app/services/tx_pipeline.py).
     """
 
     def __init__(
@@ -68,12 +90,95 @@ class TxOrchestrator:
         self.signing = signing
         self.ethereum = ethereum
         self.mpc_coordinator = mpc_coordinator
+        self.settings = get_settings()
+        self._journal: Optional[List[_JournalEntry]] = None
+        # Set by pipeline workers with retries left: transient RPC failures
+        # in signing and broadcast raise, so the job is retried with backoff
+        self.raise_transient_errors = False
 
         # Initialize v2 policy engine components
         self.group_service = GroupService(db, audit)
         self.address_book = AddressBookService(db, audit)
         self.policy_v2 = PolicyEngineV2(db, audit, self.group_service, self.address_book)
     
+    @asynccontextmanager
+    async def step(self) -> AsyncIterator["TxOrchestrator"]:
+        """
+        Unit of work for one orchestration step.
+
+        Audit events are buffered as in AuditService.batch, and status
+        transitions are journaled: consecutive transitions of a transaction
+        share one TX_STATUS_CHANGED event listing the path they took, each
+        with its own time and payload. An event logged in between starts a
+        new one, so the chain keeps causal order. Notifications go out and
+        the new states are flushed once when the step exits. Steps may be
+        nested.
+        """
+        if self._journal is not None:
+            yield self
+            return
+        self._journal = []
+        try:
+            async with self.audit.batch():
+                yield self
+                await self._flush_journal()
+        finally:
+            self._journal = None
+
+    async def _flush_journal(self):
+        journal, self._journal = self._journal, []
+        for entry in journal:
+            event_bus.publish_after_commit(self.db, entry.event)
+            await enqueue_webhooks(self.db, entry.event)
+            if TxStatus(entry.event.payload["new_status"]) in TERMINAL_STATUSES:
+                await self.audit.queue_package_cache(entry.tx.id)
+        await self.db.flush()
+
+    async def _journal_transition(
+        self,
+        tx: TxRequest,
+        old_status: TxStatus,
+        new_status: TxStatus,
+        correlation_id: str,
+        actor_id: Optional[str],
+        extra_payload: Optional[dict]
+    ):
+        transition = {"status": new_status.value, "at": tx.updated_at.isoformat()}
+        if extra_payload:
+            transition.update(extra_payload)
+
+        # Extend the transaction's event while nothing was logged after it;
+        # buffered events are hashed only when the batch is written
+        last = self._journal[-1] if self._journal else None
+        if (
+            last is not None
+            and last.tx is tx
+            and last.event.correlation_id == correlation_id
+            and last.event.actor_id == actor_id
+            and self.audit.is_last_pending(last.event)
+        ):
+            last.event.payload["new_status"] = new_status.value
+            last.event.payload["path"].append(new_status.value)
+            last.event.payload["transitions"].append(transition)
+            return
+
+        event = await self.audit.log_event(
+            event_type=AuditEventType.TX_STATUS_CHANGED,
+            correlation_id=correlation_id,
+            actor_id=actor_id,
+            actor_type="SYSTEM" if not actor_id else "USER",
+            entity_type="TX_REQUEST",
+            entity_id=tx.id,
+            entity_refs={"wallet_id": tx.wallet_id},
+            payload={
+                "old_status": old_status.value,
+                "new_status": new_status.value,
+                "path": [old_status.value, new_status.value],
+                "transitions": [transition],
+            }
+        )
+        self._journal.append(_JournalEntry(tx, event))
+
     async def create_tx_request(
         self,
         tx_data: TxRequestCreate,
@@ -82,43 +187,187 @@ class TxOrchestrator:
         idempotency_key: Optional[str] = None
     ) -> TxRequest:
         """Create a new transaction request and start processing."""
-        # Check idempotency
-        if idempotency_key:
-            existing = await self.db.execute(
-                select(TxRequest).where(TxRequest.idempotency_key == idempotency_key)
+        async with self.step():
+            # Check idempotency
+            if idempotency_key:
+                existing = await self.db.execute(
+                    select(TxRequest).where(TxRequest.idempotency_key == idempotency_key)
+                )
+                tx = existing.scalar_one_or_none()
+                if tx:
+                    return tx
+            
+            # Verify wallet exists
+            wallet_result = await self.db.execute(
+                select(Wallet).where(Wallet.id == tx_data.wallet_id)
             )
-            tx = existing.scalar_one_or_none()
-            if tx:
-                return tx
-        
-        # Verify wallet exists
-        wallet_result = await self.db.execute(
-            select(Wallet).where(Wallet.id == tx_data.wallet_id)
+            wallet = wallet_result.scalar_one_or_none()
+            if not wallet:
+                raise ValueError(f"Wallet {tx_data.wallet_id} not found")
+
+            # Create transaction request, holding its amount on the wallet's
+            # ledger (MPC wallets may only spend CREDITED deposits); the hold
+            # commits on its own, so the balance is not locked while we run
+            tx = self._new_tx_request(tx_data, created_by, idempotency_key)
+            ledger = LedgerService(self.db)
+            error = (await ledger.reserve_withdrawals(
+                [(tx, wallet.custody_backend == CustodyBackend.MPC_TECDSA)]
+            ))[0]
+            if error:
+                raise ValueError(self._balance_error(error))
+
+            try:
+                self.db.add(tx)
+                await self.db.flush()
+                await self.db.refresh(tx, ["approvals"])  # Load relationship
+                
+                await self._log_created(tx, wallet, created_by, correlation_id)
+
+                # Start async processing (v2 flow: Policy first)
+                await self._continue(TxPipelineStage.POLICY, tx, wallet, correlation_id, created_by)
+            except BaseException:
+                await ledger.release_reservations([tx])
+                raise
+
+            return tx
+
+    async def create_tx_requests_batch(
+        self,
+        items: List[TxRequestCreate],
+        created_by: str,
+        correlation_id: str,
+        idempotency_key: Optional[str] = None
+    ) -> List[Tuple[Optional[TxRequest], Optional[str]]]:
+        """
+        Create many transaction requests in one unit of work (payout runs).
+
+        Each item goes through the same flow and audit trail as
+        create_tx_request, but wallets, balances and idempotency keys are
+        loaded in one query each, policy is evaluated for the whole batch
+        against one loaded policy set and address book, KYT screening runs
+        concurrently and all audit events go out in one INSERT.
+
+        Returns (tx, error) per item in input order; an item that fails
+        validation gets an error and does not affect the others. With an
+        idempotency key, item i is keyed "<idempotency_key>:<i>".
+        """
+        async with self.step():
+            results: List[Tuple[Optional[TxRequest], Optional[str]]] = [(None, None)] * len(items)
+            keys = [
+                f"{idempotency_key}:{index}" if idempotency_key else None
+                for index in range(len(items))
+            ]
+
+            existing = {}
+            if idempotency_key:
+                existing_result = await self.db.execute(
+                    select(TxRequest)
+                    .options(selectinload(TxRequest.approvals))
+                    .where(TxRequest.idempotency_key.in_(keys))
+                )
+                existing = {tx.idempotency_key: tx for tx in existing_result.scalars().all()}
+
+            wallet_result = await self.db.execute(
+                select(Wallet).where(Wallet.id.in_({tx_data.wallet_id for tx_data in items}))
+            )
+            wallets = {wallet.id: wallet for wallet in wallet_result.scalars().all()}
+            candidates: List[Tuple[int, TxRequest, Wallet]] = []
+            for index, (tx_data, key) in enumerate(zip(items, keys)):
+                if key in existing:
+                    results[index] = (existing[key], None)
+                    continue
+                wallet = wallets.get(tx_data.wallet_id)
+                if not wallet:
+                    results[index] = (None, f"Wallet {tx_data.wallet_id} not found")
+                    continue
+                candidates.append((index, self._new_tx_request(tx_data, created_by, key), wallet))
+
+            # Holds for the whole batch in one short transaction of their own
+            ledger = LedgerService(self.db)
+            errors = await ledger.reserve_withdrawals([
+                (tx, wallet.custody_backend == CustodyBackend.MPC_TECDSA) for _, tx, wallet in candidates
+            ]) if candidates else []
+            created: List[Tuple[int, TxRequest, Wallet]] = []
+            for (index, tx, wallet), error in zip(candidates, errors):
+                if error:
+                    results[index] = (None, self._balance_error(error))
+                    continue
+                created.append((index, tx, wallet))
+
+            if not created:
+                return results
+
+            try:
+                return await self._process_batch(created, results, created_by, correlation_id)
+            except BaseException:
+                await ledger.release_reservations(tx for _, tx, _ in created)
+                raise
+
+    async def _process_batch(
+        self,
+        created: List[Tuple[int, TxRequest, Wallet]],
+        results: List[Tuple[Optional[TxRequest], Optional[str]]],
+        created_by: str,
+        correlation_id: str
+    ) -> List[Tuple[Optional[TxRequest], Optional[str]]]:
+        """Persist, audit and run policy and KYT for the held requests of a batch."""
+        self.db.add_all([tx for _, tx, _ in created])
+        await self.db.flush()
+        for index, tx, wallet in created:
+            set_committed_value(tx, "approvals", [])  # New request, nothing to load
+            await self._log_created(tx, wallet, created_by, correlation_id)
+            await self._transition_status(tx, TxStatus.POLICY_EVAL_PENDING, correlation_id, created_by)
+            results[index] = (tx, None)
+        await self.db.flush()
+
+        # Policy for the whole batch (amounts in ETH, as in _process_policy_v2)
+        policy_results = await self.policy_v2.evaluate_batch(
+            user_id=created_by,
+            items=[
+                (tx.to_address, Decimal(tx.amount) / Decimal(10**18), tx.id)
+                for _, tx, _ in created
+            ],
+            correlation_id=correlation_id,
         )
-        wallet = wallet_result.scalar_one_or_none()
-        if not wallet:
-            raise ValueError(f"Wallet {tx_data.wallet_id} not found")
-
-        # Check ledger balance for MPC wallets (only CREDITED deposits are withdrawable)
-        if wallet.custody_backend == CustodyBackend.MPC_TECDSA:
-            credited_result = await self.db.execute(
-                select(Deposit.amount)
-                .where(Deposit.wallet_id == tx_data.wallet_id)
-                .where(Deposit.status == "CREDITED")
+
+        kyt_pending = []
+        for (_, tx, wallet), policy_result in zip(created, policy_results):
+            if not await self._apply_policy_result(tx, wallet, policy_result, correlation_id, created_by):
+                continue
+            if self.settings.tx_pipeline_mode == "queue":
+                self._enqueue(TxPipelineStage.KYT, tx, correlation_id, created_by)
+                continue
+            await self._transition_status(tx, TxStatus.KYT_PENDING, correlation_id, created_by)
+            kyt_pending.append((tx, wallet, policy_result))
+
+        if kyt_pending:
+            await self.db.flush()
+            kyt_results = await self.kyt.evaluate_outbound_batch(
+                [(tx.to_address, tx.id) for tx, _, _ in kyt_pending],
+                correlation_id,
+                created_by,
             )
-            credited_amounts = credited_result.scalars().all()
-            available_wei = sum(int(amt) for amt in credited_amounts) if credited_amounts else 0
-            available_eth = Decimal(available_wei) / Decimal(10**18)
-
-            requested_wei = Decimal(tx_data.amount)
-            requested_eth = requested_wei / Decimal(10**18)
-            if requested_eth > available_eth:
-                raise ValueError(
-                    f"Insufficient balance. Available: {available_eth} ETH, Requested: {requested_eth} ETH"
+            for (tx, wallet, policy_result), (kyt_result, case) in zip(kyt_pending, kyt_results):
+                await self._apply_kyt_result(
+                    tx, wallet, policy_result, kyt_result, case, correlation_id, created_by
                 )
 
-        # Create transaction request
-        tx = TxRequest(
+        return results
+
+    @staticmethod
+    def _balance_error(e: InsufficientBalance) -> str:
+        """Error message for a request exceeding the available balance."""
+        available_eth = Decimal(e.available) / Decimal(10**18)
+        requested_eth = Decimal(e.requested) / Decimal(10**18)
+        return f"Insufficient balance. Available: {available_eth} ETH, Requested: {requested_eth} ETH"
+
+    @staticmethod
+    def _new_tx_request(
+        tx_data: TxRequestCreate,
+        created_by: str,
+        idempotency_key: Optional[str]
+    ) -> TxRequest:
+        return TxRequest(
             id=str(uuid4()),
             wallet_id=tx_data.wallet_id,
             tx_type=tx_data.tx_type,
@@ -130,12 +379,15 @@ class TxOrchestrator:
             created_by=created_by,
             idempotency_key=idempotency_key
         )
-        
-        self.db.add(tx)
-        await self.db.flush()
-        await self.db.refresh(tx, ["approvals"])  # Load relationship
-        
-        # Log creation
+
+    async def _log_created(
+        self,
+        tx: TxRequest,
+        wallet: Wallet,
+        created_by: str,
+        correlation_id: str
+    ):
+        """Log creation of a transaction request."""
         await self.audit.log_event(
             event_type=AuditEventType.TX_REQUEST_CREATED,
             correlation_id=correlation_id,
@@ -150,12 +402,78 @@ class TxOrchestrator:
                 "amount": str(tx.amount)
             }
         )
+    
+    async def _continue(
+        self,
+        stage: TxPipelineStage,
+        tx: TxRequest,
+        wallet: Wallet,
+        correlation_id: str,
+        actor_id: Optional[str] = None,
+        policy_result: Optional[PolicyEvalResult] = None
+    ):
+        """Run the next stage inline, or enqueue it for the pipeline workers."""
+        if self.settings.tx_pipeline_mode == "queue":
+            self._enqueue(stage, tx, correlation_id, actor_id)
+            await self.db.flush()
+            return
+        await self.run_stage(stage, tx, wallet, correlation_id, actor_id, policy_result)
 
-        # Start async processing (v2 flow: Policy first)
-        await self._process_policy_v2(tx, wallet, created_by, correlation_id)
+    def _enqueue(
+        self,
+        stage: TxPipelineStage,
+        tx: TxRequest,
+        correlation_id: str,
+        actor_id: Optional[str] = None
+    ):
+        self.db.add(TxPipelineJob(
+            tx_request_id=tx.id,
+            stage=stage,
+            correlation_id=correlation_id,
+            actor_id=actor_id,
+        ))
+
+    async def run_stage(
+        self,
+        stage: TxPipelineStage,
+        tx: TxRequest,
+        wallet: Wallet,
+        correlation_id: str,
+        actor_id: Optional[str] = None,
+        policy_result: Optional[PolicyEvalResult] = None
+    ):
+        """Run one pipeline stage for a transaction."""
+        if stage == TxPipelineStage.POLICY:
+            await self._process_policy_v2(tx, wallet, actor_id, correlation_id)
+        elif stage == TxPipelineStage.KYT:
+            await self._process_kyt_v2(
+                tx, wallet, policy_result or self._stored_policy_result(tx), correlation_id, actor_id
+            )
+        elif stage == TxPipelineStage.SIGN:
+            await self._process_signing(tx, wallet, correlation_id, actor_id)
+        elif stage == TxPipelineStage.BROADCAST:
+            await self._process_broadcast(tx, correlation_id, actor_id)
+
+    @staticmethod
+    def _stored_policy_result(tx: TxRequest) -> PolicyEvalResult:
+        """Reconstruct the policy result stored on a transaction."""
+        policy_data = tx.policy_result or {}
+        return PolicyEvalResult(
+            decision=policy_data.get("decision", "ALLOW"),
+            allowed=policy_data.get("allowed", True),
+            matched_rules=policy_data.get("matched_rules", []),
+            reasons=policy_data.get("reasons", []),
+            kyt_required=policy_data.get("kyt_required", True),
+            approval_required=policy_data.get("approval_required", False),
+            approval_count=policy_data.get("approval_count", 0),
+            policy_version=policy_data.get("policy_version", ""),
+            policy_snapshot_hash=policy_data.get("policy_snapshot_hash", ""),
+            group_id=policy_data.get("group_id"),
+            group_name=policy_data.get("group_name"),
+            address_status=policy_data.get("address_status", "unknown"),
+            address_label=policy_data.get("address_label"),
+        )
 
-        return tx
-    
     async def _transition_status(
         self,
         tx: TxRequest,
@@ -164,7 +482,12 @@ class TxOrchestrator:
         actor_id: Optional[str] = None,
         extra_payload: Optional[dict] = None
     ) -> bool:
-        """Transition transaction to new status if valid."""
+        """
+        Transition transaction to new status if valid.
+
+        Within a step the transition is journaled (see step()); otherwise
+        it is audited and flushed immediately.
+        """
         if not tx.can_transition_to(new_status):
             logger.warning(
                 f"Invalid transition for tx {tx.id}: {tx.status} -> {new_status}"
@@ -174,6 +497,14 @@ class TxOrchestrator:
         old_status = tx.status
         tx.status = new_status
         tx.updated_at = datetime.utcnow()
+        if new_status in TERMINAL_STATUSES:
+            await LedgerService(self.db).close_withdrawal(tx)
+        
+        if self._journal is not None:
+            await self._journal_transition(
+                tx, old_status, new_status, correlation_id, actor_id, extra_payload
+            )
+            return True
         
         payload = {
             "old_status": old_status.value,
@@ -182,19 +513,42 @@ class TxOrchestrator:
         if extra_payload:
             payload.update(extra_payload)
         
-        await self.audit.log_event(
+        event = await self.audit.log_event(
             event_type=AuditEventType.TX_STATUS_CHANGED,
             correlation_id=correlation_id,
             actor_id=actor_id,
             actor_type="SYSTEM" if not actor_id else "USER",
             entity_type="TX_REQUEST",
             entity_id=tx.id,
+            entity_refs={"wallet_id": tx.wallet_id},
             payload=payload
         )
+        event_bus.publish_after_commit(self.db, event)
+        await enqueue_webhooks(self.db, event)
+        if new_status in TERMINAL_STATUSES:
+            await self.audit.queue_package_cache(tx.id)
         
         await self.db.flush()
         return True
 
+    async def advance_status(
+        self,
+        tx: TxRequest,
+        path: List[TxStatus],
+        correlation_id: str,
+        extra_payload: Optional[dict] = None
+    ) -> bool:
+        """
+        Move tx along path, from the status after its current one if that
+        is on the path. Stops at the first invalid transition.
+        """
+        if tx.status in path:
+            path = path[path.index(tx.status) + 1:]
+        for status in path:
+            if not await self._transition_status(tx, status, correlation_id, extra_payload=extra_payload):
+                return False
+        return True
+
     async def _process_policy_v2(
         self,
         tx: TxRequest,
@@ -226,6 +580,23 @@ class TxOrchestrator:
             correlation_id=correlation_id,
         )
 
+        if await self._apply_policy_result(tx, wallet, result, correlation_id, actor_id):
+            # Proceed to KYT evaluation
+            await self._continue(TxPipelineStage.KYT, tx, wallet, correlation_id, actor_id, result)
+
+    async def _apply_policy_result(
+        self,
+        tx: TxRequest,
+        wallet: Wallet,
+        result: PolicyEvalResult,
+        correlation_id: str,
+        actor_id: Optional[str] = None
+    ) -> bool:
+        """
+        Record a policy result and advance the transaction.
+
+        Returns True if KYT is required; the caller runs it.
+        """
         # Store full policy result for explainability
         tx.policy_result = {
             "decision": result.decision,
@@ -258,32 +629,32 @@ class TxOrchestrator:
                     "address_status": result.address_status,
                 }
             )
-            return
+            return False
 
         # Policy allowed - check if KYT is required
         if result.kyt_required:
-            # Proceed to KYT evaluation
-            await self._process_kyt_v2(tx, wallet, result, correlation_id, actor_id)
-        else:
-            # Skip KYT - log and proceed to approval check
-            await self._transition_status(tx, TxStatus.KYT_SKIPPED, correlation_id, actor_id)
+            return True
 
-            await self.audit.log_event(
-                event_type=AuditEventType.KYT_SKIPPED,
-                correlation_id=correlation_id,
-                actor_id=actor_id,
-                actor_type="SYSTEM",
-                entity_type="TX_REQUEST",
-                entity_id=tx.id,
-                payload={
-                    "reason": "Policy rule does not require KYT",
-                    "matched_rules": result.matched_rules,
-                    "policy_version": result.policy_version,
-                }
-            )
+        # Skip KYT - log and proceed to approval check
+        await self._transition_status(tx, TxStatus.KYT_SKIPPED, correlation_id, actor_id)
+
+        await self.audit.log_event(
+            event_type=AuditEventType.KYT_SKIPPED,
+            correlation_id=correlation_id,
+            actor_id=actor_id,
+            actor_type="SYSTEM",
+            entity_type="TX_REQUEST",
+            entity_id=tx.id,
+            payload={
+                "reason": "Policy rule does not require KYT",
+                "matched_rules": result.matched_rules,
+                "policy_version": result.policy_version,
+            }
+        )
 
-            # Check if approval is required
-            await self._process_approval_gate(tx, wallet, result, correlation_id, actor_id)
+        # Check if approval is required
+        await self._process_approval_gate(tx, wallet, result, correlation_id, actor_id)
+        return False
 
     async def _process_kyt_v2(
         self,
@@ -304,6 +675,19 @@ class TxOrchestrator:
             actor_id
         )
 
+        await self._apply_kyt_result(tx, wallet, policy_result, result, case, correlation_id, actor_id)
+
+    async def _apply_kyt_result(
+        self,
+        tx: TxRequest,
+        wallet: Wallet,
+        policy_result: PolicyEvalResult,
+        result: str,
+        case: Optional[KYTCase],
+        correlation_id: str,
+        actor_id: Optional[str] = None
+    ):
+        """Record a KYT result and advance the transaction."""
         tx.kyt_result = result
         if case:
             tx.kyt_case_id = case.id
@@ -356,7 +740,7 @@ class TxOrchestrator:
         )
 
         # Proceed to signing
-        await self._process_signing(tx, wallet, correlation_id, actor_id)
+        await self._continue(TxPipelineStage.SIGN, tx, wallet, correlation_id, actor_id)
 
     async def _process_kyt(
         self,
@@ -438,81 +822,81 @@ class TxOrchestrator:
         comment: Optional[str],
         correlation_id: str
     ) -> Tuple[TxRequest, Approval]:
-        """Process an approval or rejection for a transaction."""
-        # Get transaction
-        tx_result = await self.db.execute(
-            select(TxRequest).where(TxRequest.id == tx_request_id)
-        )
-        tx = tx_result.scalar_one_or_none()
-        if not tx:
-            raise ValueError(f"Transaction {tx_request_id} not found")
-        
-        if tx.status != TxStatus.APPROVAL_PENDING:
-            raise ValueError(f"Transaction {tx_request_id} is not pending approval")
-        
-        # SoD: Creator cannot approve their own transaction
-        if tx.created_by == user_id:
-            raise ValueError("Segregation of Duties: Transaction creator cannot be approver")
-        
-        # Check if user already voted
-        existing_result = await self.db.execute(
-            select(Approval)
-            .where(Approval.tx_request_id == tx_request_id)
-            .where(Approval.user_id == user_id)
-        )
-        if existing_result.scalar_one_or_none():
-            raise ValueError("User has already voted on this transaction")
-        
-        # Create approval record
-        approval = Approval(
-            id=str(uuid4()),
-            tx_request_id=tx_request_id,
-            user_id=user_id,
-            decision=decision,
-            comment=comment
-        )
-        self.db.add(approval)
-        await self.db.flush()
-        
-        # Log approval
-        event_type = (
-            AuditEventType.TX_APPROVAL_RECEIVED 
-            if decision == "APPROVED" 
-            else AuditEventType.TX_REJECTION_RECEIVED
-        )
-        await self.audit.log_event(
-            event_type=event_type,
-            correlation_id=correlation_id,
-            actor_id=user_id,
-            entity_type="TX_REQUEST",
-            entity_id=tx_request_id,
-            payload={
-                "decision": decision,
-                "comment": comment
-            }
-        )
-        
-        # Check if we have enough approvals/rejections
-        approvals_result = await self.db.execute(
-            select(Approval).where(Approval.tx_request_id == tx_request_id)
-        )
-        all_approvals = list(approvals_result.scalars().all())
-        
-        approved_count = sum(1 for a in all_approvals if a.decision == "APPROVED")
-        rejected_count = sum(1 for a in all_approvals if a.decision == "REJECTED")
-        
-        if decision == "REJECTED":
-            # Any rejection blocks the transaction
-            await self._transition_status(tx, TxStatus.REJECTED, correlation_id, user_id)
-        elif approved_count >= tx.required_approvals:
-            # Enough approvals, proceed to signing
-            wallet_result = await self.db.execute(
-                select(Wallet).where(Wallet.id == tx.wallet_id)
+        """
+        Process an approval or rejection for a transaction.
+
+        The transaction row is locked with SELECT ... FOR UPDATE and its vote
+        counters are updated under the lock, so concurrent approvers are
+        serialized and exactly one of them reaches the quorum decision.
+        """
+        async with self.step():
+            # Get and lock transaction
+            tx_result = await self.db.execute(
+                select(TxRequest)
+                .where(TxRequest.id == tx_request_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
             )
-            wallet = wallet_result.scalar_one()
-            await self._process_signing(tx, wallet, correlation_id, user_id)
-        
-        return tx, approval
+            tx = tx_result.scalar_one_or_none()
+            if not tx:
+                raise ValueError(f"Transaction {tx_request_id} not found")
+            
+            if tx.status != TxStatus.APPROVAL_PENDING:
+                raise ValueError(f"Transaction {tx_request_id} is not pending approval")
+            
+            # SoD: Creator cannot approve their own transaction
+            if tx.created_by == user_id:
+                raise ValueError("Segregation of Duties: Transaction creator cannot be approver")
+            
+            # Check if user already voted (approvals are loaded with the tx)
+            if any(a.user_id == user_id for a in tx.approvals):
+                raise ValueError("User has already voted on this transaction")
+            
+            # Create approval record
+            approval = Approval(
+                id=str(uuid4()),
+                tx_request_id=tx_request_id,
+                user_id=user_id,
+                decision=decision,
+                comment=comment
+            )
+            tx.approvals.append(approval)
+            if decision == "APPROVED":
+                tx.approved_count += 1
+            else:
+                tx.rejected_count += 1
+            await self.db.flush()
+            
+            # Log approval
+            event_type = (
+                AuditEventType.TX_APPROVAL_RECEIVED 
+                if decision == "APPROVED" 
+                else AuditEventType.TX_REJECTION_RECEIVED
+            )
+            await self.audit.log_event(
+                event_type=event_type,
+                correlation_id=correlation_id,
+                actor_id=user_id,
+                entity_type="TX_REQUEST",
+                entity_id=tx_request_id,
+                payload={
+                    "decision": decision,
+                    "comment": comment
+                }
+            )
+            
+            if decision == "REJECTED":
+                # Any rejection blocks the transaction
+                await self._transition_status(tx, TxStatus.REJECTED, correlation_id, user_id)
+            elif tx.approved_count >= tx.required_approvals:
+                # Enough approvals, proceed to signing
+                wallet_result = await self.db.execute(
+                    select(Wallet).where(Wallet.id == tx.wallet_id)
+                )
+                wallet = wallet_result.scalar_one()
+                await self._continue(TxPipelineStage.SIGN, tx, wallet, correlation_id, user_id)
+            
+            return tx, approval
     
     async def _process_signing(
         self,
@@ -522,7 +906,14 @@ class TxOrchestrator:
         actor_id: Optional[str] = None
     ):
         """Sign the transaction using appropriate custody backend."""
-        await self._transition_status(tx, TxStatus.SIGN_PENDING, correlation_id, actor_id)
+        # Already SIGN_PENDING when recovery re-signs a stranded transaction
+        if tx.status != TxStatus.SIGN_PENDING:
+            await self._transition_status(tx, TxStatus.SIGN_PENDING, correlation_id, actor_id)
+        
+        if wallet.custody_backend != CustodyBackend.MPC_TECDSA and self.settings.hot_wallet_sender_enabled:
+            # The hot wallet sender signs and sends it, nonce-pipelined (see hot_wallet)
+            logger.info(f"Tx {tx.id} ready to sign, left for the hot wallet sender")
+            return
         
         try:
             # Determine signer address based on custody backend
@@ -531,20 +922,21 @@ class TxOrchestrator:
             else:
                 signer_address = await self.signing.get_signer_address()
             
-            # Get gas prices
-            gas_prices = await self.ethereum.get_gas_price()
-            
-            # Estimate gas
+            # Chain ID, nonce, gas estimate and fees are fetched concurrently
             value = Web3.to_wei(tx.amount, "ether") if tx.asset == "ETH" else 0
-            gas_limit = await self.ethereum.estimate_gas(
+            context = await self.ethereum.get_signing_context(
                 signer_address,
                 tx.to_address,
                 value,
-                tx.data
+                tx.data,
+                tx_request_id=tx.id
+            )
+            gas_prices, gas_limit, nonce = context.fees, context.gas_limit, context.nonce
+            logger.info(
+                f"Signing context for tx {tx.id} at block {context.block_number}"
+                f" (fee snapshot {'reused' if context.fee_snapshot_reused else 'fetched'}):"
+                f" {context.latency_ms} ms"
             )
-            
-            # Get nonce
-            nonce = await self.ethereum.get_nonce(signer_address)
             
             # Store tx params for later signing
             tx.gas_limit = gas_limit
@@ -564,7 +956,7 @@ class TxOrchestrator:
             # For DEV_SIGNER: auto-sign immediately
             signed_tx, tx_hash = await self.signing.sign_transaction(
                 tx,
-                self.ethereum.chain_id,
+                context.chain_id,
                 nonce,
                 gas_prices.get("legacy_gas_price", 0),
                 gas_limit,
@@ -581,9 +973,11 @@ class TxOrchestrator:
             await self._transition_status(tx, TxStatus.SIGNED, correlation_id, actor_id)
             
             # Proceed to broadcast
-            await self._process_broadcast(tx, correlation_id, actor_id)
+            await self._continue(TxPipelineStage.BROADCAST, tx, wallet, correlation_id, actor_id)
             
         except Exception as e:
+            if self.raise_transient_errors and isinstance(e, TRANSPORT_ERRORS):
+                raise
             logger.error(f"Signing failed for tx {tx.id}: {e}")
             await self._transition_status(
                 tx, TxStatus.FAILED_SIGN, correlation_id, actor_id,
@@ -612,15 +1006,11 @@ class TxOrchestrator:
         last_audit = await self.audit.get_last_audit_event()
         audit_anchor_hash = last_audit.hash if last_audit else "genesis"
         
-        # Collect approval snapshot
-        approvals_result = await self.db.execute(
-            select(Approval).where(Approval.tx_request_id == tx.id)
-        )
-        approvals = list(approvals_result.scalars().all())
+        # Collect approval snapshot (approvals are loaded with the tx)
         approval_snapshot = {
-            "count": len([a for a in approvals if a.decision == "APPROVED"]),
+            "count": tx.approved_count,
             "required": tx.required_approvals,
-            "approvers": [a.user_id for a in approvals if a.decision == "APPROVED"],
+            "approvers": [a.user_id for a in tx.approvals if a.decision == "APPROVED"],
         }
         
         # Create permit via MPC Coordinator
@@ -677,87 +1067,88 @@ class TxOrchestrator:
         Called when user has decrypted their key share and is ready to participate
         in the 2PC signing protocol.
         """
-        # Get transaction
-        tx_result = await self.db.execute(
-            select(TxRequest).where(TxRequest.id == tx_request_id)
-        )
-        tx = tx_result.scalar_one_or_none()
-        if not tx:
-            raise ValueError(f"Transaction {tx_request_id} not found")
-        
-        if tx.status != TxStatus.SIGN_PENDING:
-            raise ValueError(f"Transaction is not pending signature (status: {tx.status})")
-        
-        # Get wallet
-        wallet_result = await self.db.execute(
-            select(Wallet).where(Wallet.id == tx.wallet_id)
-        )
-        wallet = wallet_result.scalar_one()
-        
-        if wallet.custody_backend != CustodyBackend.MPC_TECDSA:
-            raise ValueError("This endpoint is only for MPC wallets")
-        
-        # Check user has permission on this wallet
-        # (TODO: add proper wallet role check)
-        
-        # Get the valid signing permit
-        permit_result = await self.db.execute(
-            select(SigningPermit).where(
-                SigningPermit.tx_request_id == tx_request_id,
-                SigningPermit.is_used == False,
-                SigningPermit.is_revoked == False,
+        async with self.step():
+            # Get transaction
+            tx_result = await self.db.execute(
+                select(TxRequest).where(TxRequest.id == tx_request_id)
             )
-        )
-        permit = permit_result.scalar_one_or_none()
-        if not permit:
-            raise ValueError("No valid signing permit found. Please re-approve the transaction.")
-        
-        # Check permit not expired
-        from datetime import datetime
-        if permit.expires_at < datetime.utcnow():
-            raise ValueError("Signing permit has expired. Please re-approve the transaction.")
-        
-        try:
-            # Perform MPC signing
-            signer_address = Web3.to_checksum_address(wallet.address)
-            gas_prices = await self.ethereum.get_gas_price()
+            tx = tx_result.scalar_one_or_none()
+            if not tx:
+                raise ValueError(f"Transaction {tx_request_id} not found")
             
-            signed_tx, tx_hash = await self.signing.sign_transaction(
-                tx,
-                self.ethereum.chain_id,
-                tx.nonce,
-                tx.gas_price or gas_prices.get("legacy_gas_price", 0),
-                tx.gas_limit,
-                max_fee_per_gas=gas_prices.get("max_fee"),
-                max_priority_fee_per_gas=gas_prices.get("max_priority_fee"),
-                correlation_id=correlation_id,
-                actor_id=user_id,
-                custody_backend=wallet.custody_backend,
-                signing_permit=permit,
-                keyset_id=wallet.mpc_keyset_id,
-            )
+            if tx.status != TxStatus.SIGN_PENDING:
+                raise ValueError(f"Transaction is not pending signature (status: {tx.status})")
             
-            # Mark permit as used
-            permit.is_used = True
-            permit.used_at = datetime.utcnow()
+            # Get wallet
+            wallet_result = await self.db.execute(
+                select(Wallet).where(Wallet.id == tx.wallet_id)
+            )
+            wallet = wallet_result.scalar_one()
             
-            tx.signed_tx = signed_tx
-            tx.tx_hash = tx_hash
+            if wallet.custody_backend != CustodyBackend.MPC_TECDSA:
+                raise ValueError("This endpoint is only for MPC wallets")
             
-            await self._transition_status(tx, TxStatus.SIGNED, correlation_id, user_id)
+            # Check user has permission on this wallet
+            # (TODO: add proper wallet role check)
             
-            # Proceed to broadcast
-            await self._process_broadcast(tx, correlation_id, user_id)
+            # Get the valid signing permit
+            permit_result = await self.db.execute(
+                select(SigningPermit).where(
+                    SigningPermit.tx_request_id == tx_request_id,
+                    SigningPermit.is_used == False,
+                    SigningPermit.is_revoked == False,
+                )
+            )
+            permit = permit_result.scalar_one_or_none()
+            if not permit:
+                raise ValueError("No valid signing permit found. Please re-approve the transaction.")
             
-            return tx
+            # Check permit not expired
+            from datetime import datetime
+            if permit.expires_at < datetime.utcnow():
+                raise ValueError("Signing permit has expired. Please re-approve the transaction.")
             
-        except Exception as e:
-            logger.error(f"MPC signing failed for tx {tx.id}: {e}")
-            await self._transition_status(
-                tx, TxStatus.FAILED_SIGN, correlation_id, user_id,
-                {"error": str(e)}
-            )
-            raise
+            try:
+                # Perform MPC signing
+                signer_address = Web3.to_checksum_address(wallet.address)
+                gas_prices = await self.ethereum.get_gas_price()
+                
+                signed_tx, tx_hash = await self.signing.sign_transaction(
+                    tx,
+                    await self.ethereum.get_chain_id(),
+                    tx.nonce,
+                    tx.gas_price or gas_prices.get("legacy_gas_price", 0),
+                    tx.gas_limit,
+                    max_fee_per_gas=gas_prices.get("max_fee"),
+                    max_priority_fee_per_gas=gas_prices.get("max_priority_fee"),
+                    correlation_id=correlation_id,
+                    actor_id=user_id,
+                    custody_backend=wallet.custody_backend,
+                    signing_permit=permit,
+                    keyset_id=wallet.mpc_keyset_id,
+                )
+                
+                # Mark permit as used
+                permit.is_used = True
+                permit.used_at = datetime.utcnow()
+                
+                tx.signed_tx = signed_tx
+                tx.tx_hash = tx_hash
+                
+                await self._transition_status(tx, TxStatus.SIGNED, correlation_id, user_id)
+                
+                # Proceed to broadcast
+                await self._continue(TxPipelineStage.BROADCAST, tx, wallet, correlation_id, user_id)
+                
+                return tx
+                
+            except Exception as e:
+                logger.error(f"MPC signing failed for tx {tx.id}: {e}")
+                await self._transition_status(
+                    tx, TxStatus.FAILED_SIGN, correlation_id, user_id,
+                    {"error": str(e)}
+                )
+                raise
     
     async def _process_broadcast(
         self,
@@ -766,7 +1157,9 @@ class TxOrchestrator:
         actor_id: Optional[str] = None
     ):
         """Broadcast the signed transaction."""
-        await self._transition_status(tx, TxStatus.BROADCAST_PENDING, correlation_id, actor_id)
+        # Already BROADCAST_PENDING when recovery rebroadcasts a stranded transaction
+        if tx.status != TxStatus.BROADCAST_PENDING:
+            await self._transition_status(tx, TxStatus.BROADCAST_PENDING, correlation_id, actor_id)
         
         try:
             tx_hash = await self.ethereum.broadcast_transaction(
@@ -782,6 +1175,8 @@ class TxOrchestrator:
             await self._transition_status(tx, TxStatus.CONFIRMING, correlation_id, actor_id)
             
         except Exception as e:
+            if self.raise_transient_errors and isinstance(e, TRANSPORT_ERRORS):
+                raise
             logger.error(f"Broadcast failed for tx {tx.id}: {e}")
             await self._transition_status(
                 tx, TxStatus.FAILED_BROADCAST, correlation_id, actor_id,
@@ -794,72 +1189,73 @@ class TxOrchestrator:
         correlation_id: str
     ) -> TxRequest:
         """Check and update transaction confirmation status."""
-        tx_result = await self.db.execute(
-            select(TxRequest).where(TxRequest.id == tx_request_id)
-        )
-        tx = tx_result.scalar_one_or_none()
-        if not tx:
-            raise ValueError(f"Transaction {tx_request_id} not found")
-        
-        if tx.status != TxStatus.CONFIRMING:
-            return tx
-        
-        if not tx.tx_hash:
-            return tx
-        
-        confirmations = await self.ethereum.check_confirmations(
-            tx.tx_hash,
-            tx.id,
-            correlation_id,
-            self.ethereum.settings.confirmation_blocks
-        )
-        
-        if confirmations is None:
-            return tx  # Still waiting
-        
-        if confirmations == -1:
-            # Transaction failed on-chain
-            await self._transition_status(
-                tx, TxStatus.FAILED_BROADCAST, correlation_id, None,
-                {"reason": "Transaction reverted on-chain"}
+        async with self.step():
+            tx_result = await self.db.execute(
+                select(TxRequest).where(TxRequest.id == tx_request_id)
             )
-            return tx
-        
-        tx.confirmations = confirmations
-        
-        # Get block number from receipt
-        receipt = await self.ethereum.get_transaction_receipt(tx.tx_hash)
-        if receipt:
-            tx.block_number = receipt.get("blockNumber")
-        
-        if confirmations >= self.ethereum.settings.confirmation_blocks:
-            await self._transition_status(tx, TxStatus.CONFIRMED, correlation_id)
+            tx = tx_result.scalar_one_or_none()
+            if not tx:
+                raise ValueError(f"Transaction {tx_request_id} not found")
             
-            # Update daily volume
-            wallet_result = await self.db.execute(
-                select(Wallet).where(Wallet.id == tx.wallet_id)
-            )
-            wallet = wallet_result.scalar_one()
-            await self.policy.update_daily_volume(wallet.id, tx.asset, tx.amount)
+            if tx.status != TxStatus.CONFIRMING:
+                return tx
             
-            # Finalize
-            await self._transition_status(tx, TxStatus.FINALIZED, correlation_id)
+            if not tx.tx_hash:
+                return tx
             
-            await self.audit.log_event(
-                event_type=AuditEventType.TX_FINALIZED,
-                correlation_id=correlation_id,
-                actor_type="SYSTEM",
-                entity_type="TX_REQUEST",
-                entity_id=tx.id,
-                payload={
-                    "tx_hash": tx.tx_hash,
-                    "block_number": tx.block_number,
-                    "confirmations": confirmations
-                }
+            confirmations = await self.ethereum.check_confirmations(
+                tx.tx_hash,
+                tx.id,
+                correlation_id,
+                self.ethereum.settings.confirmation_blocks
             )
-        
-        await self.db.flush()
-        return tx
+            
+            if confirmations is None:
+                return tx  # Still waiting
+            
+            if confirmations == -1:
+                # Transaction failed on-chain
+                await self._transition_status(
+                    tx, TxStatus.REVERTED, correlation_id, None,
+                    {"reason": "Transaction reverted on-chain"}
+                )
+                return tx
+            
+            tx.confirmations = confirmations
+            
+            # Get block number from receipt
+            receipt = await self.ethereum.get_transaction_receipt(tx.tx_hash)
+            if receipt:
+                tx.block_number = receipt.get("blockNumber")
+            
+            if confirmations >= self.ethereum.settings.confirmation_blocks:
+                await self._transition_status(tx, TxStatus.CONFIRMED, correlation_id)
+                
+                # Update daily volume
+                wallet_result = await self.db.execute(
+                    select(Wallet).where(Wallet.id == tx.wallet_id)
+                )
+                wallet = wallet_result.scalar_one()
+                await self.policy.update_daily_volume(wallet.id, tx.asset, tx.amount)
+                
+                # Finalize
+                await self._transition_status(tx, TxStatus.FINALIZED, correlation_id)
+                
+                await self.audit.log_event(
+                    event_type=AuditEventType.TX_FINALIZED,
+                    correlation_id=correlation_id,
+                    actor_type="SYSTEM",
+                    entity_type="TX_REQUEST",
+                    entity_id=tx.id,
+                    payload={
+                        "tx_hash": tx.tx_hash,
+                        "block_number": tx.block_number,
+                        "confirmations": confirmations
+                    }
+                )
+            
+            await self.db.flush()
+            return tx
     
     async def resume_after_kyt_resolution(
         self,
@@ -873,53 +1269,102 @@ class TxOrchestrator:
         - If BLOCK: transition to KYT_BLOCKED
         - If ALLOW: check approval requirement from stored policy result
         """
-        tx_result = await self.db.execute(
-            select(TxRequest).where(TxRequest.id == tx_request_id)
-        )
-        tx = tx_result.scalar_one_or_none()
-        if not tx:
-            raise ValueError(f"Transaction {tx_request_id} not found")
+        async with self.step():
+            tx_result = await self.db.execute(
+                select(TxRequest).where(TxRequest.id == tx_request_id)
+            )
+            tx = tx_result.scalar_one_or_none()
+            if not tx:
+                raise ValueError(f"Transaction {tx_request_id} not found")
+
+            if tx.status != TxStatus.KYT_REVIEW:
+                raise ValueError(f"Transaction is not in KYT_REVIEW status")
+
+            # Check case resolution
+            case = await self.kyt.get_case(tx.kyt_case_id)
+            if not case or case.status == "PENDING":
+                raise ValueError("KYT case is not resolved")
+
+            if case.status == "RESOLVED_BLOCK":
+                await self._transition_status(tx, TxStatus.KYT_BLOCKED, correlation_id)
+                return tx
+
+            # Case resolved with ALLOW - check approval requirement from stored policy
+            wallet_result = await self.db.execute(
+                select(Wallet).where(Wallet.id == tx.wallet_id)
+            )
+            wallet = wallet_result.scalar_one()
 
-        if tx.status != TxStatus.KYT_REVIEW:
-            raise ValueError(f"Transaction is not in KYT_REVIEW status")
+            policy_result = self._stored_policy_result(tx)
 
-        # Check case resolution
-        case = await self.kyt.get_case(tx.kyt_case_id)
-        if not case or case.status == "PENDING":
-            raise ValueError("KYT case is not resolved")
+            # Proceed to approval gate
+            await self._process_approval_gate(tx, wallet, policy_result, correlation_id)
 
-        if case.status == "RESOLVED_BLOCK":
-            await self._transition_status(tx, TxStatus.KYT_BLOCKED, correlation_id)
             return tx
+    
+    async def recover_stuck_tx(
+        self,
+        tx_request_id: str,
+        correlation_id: str
+    ) -> Tuple[str, Optional[TxStatus]]:
+        """
+        Resume a transaction stranded in an in-flight state.
 
-        # Case resolved with ALLOW - check approval requirement from stored policy
-        wallet_result = await self.db.execute(
-            select(Wallet).where(Wallet.id == tx.wallet_id)
-        )
-        wallet = wallet_result.scalar_one()
+        - SIGN_PENDING (dev signer): re-sign, then broadcast
+        - SIGNED: broadcast
+        - BROADCAST_PENDING / FAILED_BROADCAST: re-query the receipt; if the
+          network already has the transaction move on to CONFIRMING (or to
+          the terminal REVERTED if it reverted), otherwise rebroadcast the
+          same signed transaction
 
-        # Reconstruct policy result from stored data
-        policy_data = tx.policy_result or {}
-        policy_result = PolicyEvalResult(
-            decision=policy_data.get("decision", "ALLOW"),
-            allowed=policy_data.get("allowed", True),
-            matched_rules=policy_data.get("matched_rules", []),
-            reasons=policy_data.get("reasons", []),
-            kyt_required=policy_data.get("kyt_required", True),
-            approval_required=policy_data.get("approval_required", False),
-            approval_count=policy_data.get("approval_count", 0),
-            policy_version=policy_data.get("policy_version", ""),
-            policy_snapshot_hash=policy_data.get("policy_snapshot_hash", ""),
-            group_id=policy_data.get("group_id"),
-            group_name=policy_data.get("group_name"),
-            address_status=policy_data.get("address_status", "unknown"),
-            address_label=policy_data.get("address_label"),
-        )
+        Returns (action, resulting status). The row is locked with SKIP
+        LOCKED, so a transaction another worker is recovering is skipped.
+        """
+        async with self.step():
+            tx_result = await self.db.execute(
+                select(TxRequest)
+                .where(TxRequest.id == tx_request_id)
+                .with_for_update(skip_locked=True)
+            )
+            tx = tx_result.scalar_one_or_none()
+            if not tx or tx.status not in RECOVERABLE_STATUSES:
+                return "skipped", tx.status if tx else None
 
-        # Proceed to approval gate
-        await self._process_approval_gate(tx, wallet, policy_result, correlation_id)
+            wallet_result = await self.db.execute(
+                select(Wallet).where(Wallet.id == tx.wallet_id)
+            )
+            wallet = wallet_result.scalar_one()
+
+            if tx.status == TxStatus.SIGN_PENDING:
+                # MPC transactions wait here for the user's signature
+                if wallet.custody_backend == CustodyBackend.MPC_TECDSA:
+                    return "skipped", tx.status
+                await self._process_signing(tx, wallet, correlation_id)
+                return "resign", tx.status
+
+            if tx.status == TxStatus.SIGNED:
+                await self._process_broadcast(tx, correlation_id)
+                return "rebroadcast", tx.status
+
+            receipt = await self.ethereum.get_transaction_receipt(tx.tx_hash) if tx.tx_hash else None
+            if receipt and receipt.get("status") == 0:
+                # Mined and reverted: a rebroadcast can never succeed
+                await self._transition_status(
+                    tx, TxStatus.REVERTED, correlation_id,
+                    extra_payload={"recovered": True, "block_number": receipt.get("blockNumber")}
+                )
+                return "reverted", tx.status
+            if receipt:
+                if tx.status == TxStatus.FAILED_BROADCAST:
+                    await self._transition_status(tx, TxStatus.BROADCAST_PENDING, correlation_id)
+                await self._transition_status(
+                    tx, TxStatus.BROADCASTED, correlation_id, extra_payload={"recovered": True}
+                )
+                await self._transition_status(tx, TxStatus.CONFIRMING, correlation_id)
+                return "receipt", tx.status
 
-        return tx
+            await self._process_broadcast(tx, correlation_id)
+            return "rebroadcast", tx.status
     
     async def get_tx_request(self, tx_request_id: str) -> Optional[TxRequest]:
         """Get transaction request by ID."""
@@ -2,7 +2,7 @@
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Tuple
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -108,44 +108,109 @@ class PolicyEngineV2:
         group = await self.group_service.get_user_primary_group(user_id)
 
         if not group:
-            # No group - use default deny
-            return PolicyEvalResult(
-                decision='BLOCK',
-                allowed=False,
-                matched_rules=['NO_GROUP'],
-                reasons=['User is not assigned to any group'],
-                kyt_required=False,
-                approval_required=False,
-            )
+            return self._no_policy_result(None)
 
         # 2. Get group's active policy set
         policy_set = await self._get_active_policy_set(group.id)
 
         if not policy_set:
-            # No policy - default deny
+            return self._no_policy_result(group)
+
+        # 3. Check address status in group's address book
+        address_status, address_label = await self.address_book.check_address(
+            group.id, to_address
+        )
+
+        # 4. Evaluate rules
+        result = self._evaluate_rules(group, policy_set, address_status, address_label, amount)
+
+        await self._log_evaluation(
+            result=result,
+            tx_request_id=tx_request_id,
+            user_id=user_id,
+            to_address=to_address,
+            amount=amount,
+            correlation_id=correlation_id,
+        )
+
+        return result
+
+    async def evaluate_batch(
+        self,
+        user_id: str,
+        items: List[Tuple[str, Decimal, Optional[str]]],
+        correlation_id: str = "",
+    ) -> List[PolicyEvalResult]:
+        """
+        Evaluate policy for many transactions of one user.
+
+        Items are (to_address, amount, tx_request_id). The group, its policy
+        set and the address book entries are loaded once for the whole
+        batch; results are returned in item order and each evaluation is
+        logged as in evaluate().
+        """
+        group = await self.group_service.get_user_primary_group(user_id)
+        policy_set = await self._get_active_policy_set(group.id) if group else None
+        if not group or not policy_set:
+            return [self._no_policy_result(group) for _ in items]
+
+        statuses = await self.address_book.check_addresses(
+            group.id, [to_address for to_address, _, _ in items]
+        )
+
+        results = []
+        for to_address, amount, tx_request_id in items:
+            address_status, address_label = statuses[to_address.lower()]
+            result = self._evaluate_rules(group, policy_set, address_status, address_label, amount)
+            await self._log_evaluation(
+                result=result,
+                tx_request_id=tx_request_id,
+                user_id=user_id,
+                to_address=to_address,
+                amount=amount,
+                correlation_id=correlation_id,
+            )
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _no_policy_result(group: Optional[Group]) -> PolicyEvalResult:
+        """Default deny when the user has no group or the group no active policy."""
+        if not group:
             return PolicyEvalResult(
                 decision='BLOCK',
                 allowed=False,
-                matched_rules=['NO_POLICY'],
-                reasons=['Group has no active policy assigned'],
-                group_id=group.id,
-                group_name=group.name,
+                matched_rules=['NO_GROUP'],
+                reasons=['User is not assigned to any group'],
                 kyt_required=False,
                 approval_required=False,
             )
-
-        # 3. Check address status in group's address book
-        address_status, address_label = await self.address_book.check_address(
-            group.id, to_address
+        return PolicyEvalResult(
+            decision='BLOCK',
+            allowed=False,
+            matched_rules=['NO_POLICY'],
+            reasons=['Group has no active policy assigned'],
+            group_id=group.id,
+            group_name=group.name,
+            kyt_required=False,
+            approval_required=False,
         )
 
-        # 4. Evaluate rules in priority order (lower priority = higher precedence)
+    def _evaluate_rules(
+        self,
+        group: Group,
+        policy_set: PolicySet,
+        address_status: str,
+        address_label: Optional[str],
+        amount: Decimal,
+    ) -> PolicyEvalResult:
+        """Evaluate rules in priority order (lower priority = higher precedence)."""
         rules = sorted(policy_set.rules, key=lambda r: r.priority)
 
         for rule in rules:
             if rule.matches(amount, address_status):
                 # Rule matched!
-                result = PolicyEvalResult(
+                return PolicyEvalResult(
                     decision=rule.decision.value,
                     allowed=(rule.decision == PolicyDecision.ALLOW),
                     matched_rules=[rule.rule_id],
@@ -162,21 +227,9 @@ class PolicyEngineV2:
                     evaluated_rules_count=rules.index(rule) + 1,
                 )
 
-                # Log evaluation
-                await self._log_evaluation(
-                    result=result,
-                    tx_request_id=tx_request_id,
-                    user_id=user_id,
-                    to_address=to_address,
-                    amount=amount,
-                    correlation_id=correlation_id,
-                )
-
-                return result
-
-        # 5. No rule matched - default behavior based on address status
+        # No rule matched - default behavior based on address status
         if address_status == 'denylist':
-            result = PolicyEvalResult(
+            return PolicyEvalResult(
                 decision='BLOCK',
                 allowed=False,
                 matched_rules=['DEFAULT_DENY'],
@@ -191,8 +244,8 @@ class PolicyEngineV2:
                 address_label=address_label,
                 evaluated_rules_count=len(rules),
             )
-        elif address_status == 'unknown':
-            result = PolicyEvalResult(
+        if address_status == 'unknown':
+            return PolicyEvalResult(
                 decision='BLOCK',
                 allowed=False,
                 matched_rules=['DEFAULT_UNKNOWN'],
@@ -207,36 +260,24 @@ class PolicyEngineV2:
                 address_label=address_label,
                 evaluated_rules_count=len(rules),
             )
-        else:
-            # Allowlist but no matching rule - require full controls
-            result = PolicyEvalResult(
-                decision='ALLOW',
-                allowed=True,
-                matched_rules=['DEFAULT_ALLOW'],
-                reasons=['Address is in allowlist (no specific rule matched, applying defaults)'],
-                kyt_required=True,
-                approval_required=True,
-                approval_count=1,
-                policy_version=policy_set.version_string,
-                policy_snapshot_hash=policy_set.snapshot_hash or "",
-                group_id=group.id,
-                group_name=group.name,
-                address_status=address_status,
-                address_label=address_label,
-                evaluated_rules_count=len(rules),
-            )
-
-        await self._log_evaluation(
-            result=result,
-            tx_request_id=tx_request_id,
-            user_id=user_id,
-            to_address=to_address,
-            amount=amount,
-            correlation_id=correlation_id,
+        # Allowlist but no matching rule - require full controls
+        return PolicyEvalResult(
+            decision='ALLOW',
+            allowed=True,
+            matched_rules=['DEFAULT_ALLOW'],
+            reasons=['Address is in allowlist (no specific rule matched, applying defaults)'],
+            kyt_required=True,
+            approval_required=True,
+            approval_count=1,
+            policy_version=policy_set.version_string,
+            policy_snapshot_hash=policy_set.snapshot_hash or "",
+            group_id=group.id,
+            group_name=group.name,
+            address_status=address_status,
+            address_label=address_label,
+            evaluated_rules_count=len(rules),
         )
 
-        return result
-
     async def _get_active_policy_set(self, group_id: str) -> Optional[PolicySet]:
         """Get the active policy set for a group."""
         result = await self.db.execute(
@@ -0,0 +1,296 @@
+"""Pool of Ethereum RPC endpoints with health scoring and hedged reads.
+
+With a single RPC URL, one slow or rate-limited node stalls signing,
+broadcasting and the chain listener together. RpcPool spreads calls over
+every configured endpoint (eth_rpc_url plus eth_rpc_fallback_urls):
+
+- each endpoint's latency (moving average and recent p95), error rate and
+  head lag (blocks behind the most advanced endpoint) are tracked; an
+  endpoint failing too often, or more than eth_rpc_max_head_lag blocks
+  behind, is unhealthy and only used when no healthy one is left
+- reads go to the healthiest endpoint. If it has not answered within its
+  p95 latency, the read is hedged: sent to the next endpoint as well, and
+  the first answer wins. A transport failure (connection error, timeout,
+  HTTP error status) fails over to the next endpoint
+- a read of a given block (min_head) only goes to endpoints known to have
+  reached it, since a healthy endpoint may still be a few blocks behind
+- broadcasts go to every endpoint and return on the first acceptance, so
+  a transaction reaches the network as long as one node takes it
+- heads are probed every eth_rpc_probe_interval seconds, which is also how
+  an unhealthy endpoint earns its way back; head() reads also update the
+  head of the endpoint that answered
+
+An error answer from a node (a reverted estimate, an unknown transaction)
+is an answer, not an endpoint failure, and is raised without trying other
+endpoints. With a single endpoint, calls go straight to it.
+
+Calls are functions of the endpoint URL, so the pool does not depend on
+any particular client.
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from app.config import get_settings
+
+# A call made against one endpoint, given its URL
+EndpointCall = Callable[[str], Awaitable[Any]]
+
+# Failures that say something about the endpoint rather than the request
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
+
+# Weight of the latest call in the latency and error-rate moving averages
+_ALPHA = 0.2
+# Error rate above which an endpoint is unhealthy (two failures in a row)
+_MAX_ERROR_RATE = 0.25
+# Recent latencies kept per endpoint; the hedge delay is their p95
+_LATENCY_WINDOW = 100
+# Latencies needed before the p95 is trusted over eth_rpc_hedge_delay
+_MIN_LATENCY_SAMPLES = 20
+
+
+def display_url(url: str) -> str:
+    """An endpoint URL without credentials or path (API keys live in either)."""
+    parts = urlsplit(url)
+    port = f":{parts.port}" if parts.port else ""
+    return f"{parts.scheme}://{parts.hostname}{port}"
+
+
+class RpcEndpoint:
+    """Health of one RPC endpoint."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None  # Moving average, seconds
+        self.error_rate = 0.0  # Moving average of failed calls
+        self.head: Optional[int] = None  # Last block number probed
+        self.requests = 0
+        self.errors = 0
+        self.hedged = 0  # Reads hedged away from this endpoint
+        self._latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def record(self, elapsed: float, ok: bool):
+        self.requests += 1
+        self.error_rate += _ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            self.errors += 1
+            return
+        self._latencies.append(elapsed)
+        self.latency = elapsed if self.latency is None else self.latency + _ALPHA * (elapsed - self.latency)
+
+    def p95(self) -> Optional[float]:
+        if len(self._latencies) < _MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+
+class RpcPool:
+    """Routes calls over a set of RPC endpoints by health."""
+
+    def __init__(self, urls: List[str], head_call: EndpointCall):
+        if not urls:
+            raise ValueError("RpcPool needs at least one endpoint")
+        self.settings = get_settings()
+        self.endpoints = [RpcEndpoint(url) for url in urls]
+        self._head_call = head_call
+        self._probed_at = -math.inf
+        self._probe_task: Optional[asyncio.Task] = None
+        # Broadcasts still being delivered to the other endpoints
+        self._background: Set[asyncio.Task] = set()
+        self._hedged_reads = 0
+        self._failovers = 0
+
+    def _best_head(self) -> Optional[int]:
+        heads = [e.head for e in self.endpoints if e.head is not None]
+        return max(heads) if heads else None
+
+    def _head_lag(self, endpoint: RpcEndpoint, best_head: Optional[int]) -> Optional[int]:
+        if endpoint.head is None or best_head is None:
+            return None
+        return best_head - endpoint.head
+
+    def _healthy(self, endpoint: RpcEndpoint, best_head: Optional[int]) -> bool:
+        lag = self._head_lag(endpoint, best_head)
+        return (
+            endpoint.error_rate <= _MAX_ERROR_RATE
+            and (lag is None or lag <= self.settings.eth_rpc_max_head_lag)
+        )
+
+    def ranked(self) -> List[RpcEndpoint]:
+        """Endpoints, healthiest and fastest first; untried ones count as fast."""
+        best_head = self._best_head()
+        return sorted(
+            self.endpoints,
+            key=lambda e: (not self._healthy(e, best_head), e.latency or 0.0),
+        )
+
+    def _hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        p95 = endpoint.p95()
+        if p95 is None:
+            return self.settings.eth_rpc_hedge_delay
+        return max(p95, self.settings.eth_rpc_hedge_min_delay)
+
+    async def _call(self, endpoint: RpcEndpoint, call: EndpointCall) -> Any:
+        started = time.monotonic()
+        try:
+            result = await call(endpoint.url)
+        except TRANSPORT_ERRORS:
+            endpoint.record(time.monotonic() - started, ok=False)
+            raise
+        except asyncio.CancelledError:
+            # Lost a hedge race: it took at least this long
+            endpoint.record(time.monotonic() - started, ok=True)
+            raise
+        except Exception:
+            # The node answered, with an error
+            endpoint.record(time.monotonic() - started, ok=True)
+            raise
+        endpoint.record(time.monotonic() - started, ok=True)
+        if call is self._head_call and isinstance(result, int):
+            endpoint.head = result
+        return result
+
+    def _start(self, endpoint: RpcEndpoint, call: EndpointCall) -> asyncio.Task:
+        return asyncio.ensure_future(self._call(endpoint, call))
+
+    def _forget(self, task: asyncio.Task):
+        """Let a call finish in the background, without leaking its error."""
+        self._background.add(task)
+
+        def done(t: asyncio.Task):
+            self._background.discard(t)
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(done)
+
+    async def read(self, call: EndpointCall, min_head: Optional[int] = None) -> Any:
+        """
+        Make an idempotent call on the healthiest endpoint.
+
+        Hedged once to the next endpoint if slow; fails over through the
+        remaining endpoints on transport errors, raising the last one if
+        every endpoint fails. With min_head, only endpoints whose last
+        known head is at least min_head are used, if there are any.
+        """
+        self._maybe_probe()
+        ranked = self.ranked()
+        if min_head is not None:
+            synced = [e for e in ranked if e.head is not None and e.head >= min_head]
+            ranked = synced or ranked
+        if len(ranked) == 1:
+            return await self._call(ranked[0], call)
+
+        tried = 1
+        pending: Dict[asyncio.Task, RpcEndpoint] = {self._start(ranked[0], call): ranked[0]}
+        hedged = False
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                timeout = None
+                if not hedged and tried < len(ranked):
+                    timeout = self._hedge_delay(ranked[0])
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self._hedged_reads += 1
+                    ranked[0].hedged += 1
+                    pending[self._start(ranked[tried], call)] = ranked[tried]
+                    tried += 1
+                    continue
+                for task in done:
+                    del pending[task]
+                    try:
+                        return task.result()
+                    except TRANSPORT_ERRORS as e:
+                        error = e
+                if not pending and tried < len(ranked):
+                    self._failovers += 1
+                    pending[self._start(ranked[tried], call)] = ranked[tried]
+                    tried += 1
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def head(self) -> int:
+        """Read the head block number, remembering it for the endpoint that answered."""
+        return await self.read(self._head_call)
+
+    async def broadcast(self, call: EndpointCall) -> Tuple[Any, str]:
+        """
+        Make a call on every endpoint; (first successful result, its URL).
+
+        The other endpoints keep receiving the call in the background. If
+        all fail, raises the first error a node answered with (such as
+        "already known"), else the first transport error.
+        """
+        self._maybe_probe()
+        tasks = {self._start(endpoint, call): endpoint for endpoint in self.ranked()}
+        pending = set(tasks)
+        errors: List[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result(), tasks[task].url
+                    errors.append(task.exception())
+        finally:
+            for task in pending:
+                self._forget(task)
+        answered = [e for e in errors if not isinstance(e, TRANSPORT_ERRORS)]
+        raise (answered or errors)[0]
+
+    def _maybe_probe(self):
+        if len(self.endpoints) < 2 or (self._probe_task and not self._probe_task.done()):
+            return
+        if time.monotonic() - self._probed_at >= self.settings.eth_rpc_probe_interval:
+            self._probe_task = asyncio.ensure_future(self.probe())
+
+    async def probe(self):
+        """Read every endpoint's head block, recording latency and errors."""
+        self._probed_at = time.monotonic()
+        heads = await asyncio.gather(
+            *(self._call(endpoint, self._head_call) for endpoint in self.endpoints),
+            return_exceptions=True,
+        )
+        for endpoint, head in zip(self.endpoints, heads):
+            if isinstance(head, int):
+                endpoint.head = head
+
+    def close(self):
+        """Cancel probes and background broadcasts (on shutdown)."""
+        for task in [self._probe_task, *self._background]:
+            if task is not None:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint health and pool counters, for /health."""
+        best_head = self._best_head()
+        endpoints = []
+        for endpoint in self.ranked():
+            p95 = endpoint.p95()
+            endpoints.append({
+                "url": display_url(endpoint.url),
+                "healthy": self._healthy(endpoint, best_head),
+                "latency_ms": round(endpoint.latency * 1000, 1) if endpoint.latency is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "error_rate": round(endpoint.error_rate, 3),
+                "requests": endpoint.requests,
+                "errors": endpoint.errors,
+                "hedged": endpoint.hedged,
+                "head": endpoint.head,
+                "head_lag": self._head_lag(endpoint, best_head),
+            })
+        return {
+            "endpoints": endpoints,
+            "hedged_reads": self._hedged_reads,
+            "failovers": self._failovers,
+        }
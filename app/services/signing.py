@@ -121,6 +121,46 @@ class SigningService:
                 chain_id=chain_id,
             )
     
+    async def sign_cancellation(
+        self,
+        tx_request: TxRequest,
+        chain_id: int,
+        nonce: int,
+        gas_price: int,
+        max_fee_per_gas: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+        correlation_id: str = "",
+    ) -> Tuple[str, str]:
+        """
+        Sign a zero-value transfer from the dev signer to itself at nonce,
+        taking the place of tx_request's transaction in the mempool.
+
+        Returns: (signed_tx_hex, tx_hash)
+        """
+        tx_dict = {
+            "nonce": nonce,
+            "to": self.dev_account.address,
+            "value": 0,
+            "gas": 21000,
+            "chainId": chain_id,
+        }
+        if max_fee_per_gas and max_priority_fee_per_gas:
+            tx_dict["maxFeePerGas"] = max_fee_per_gas
+            tx_dict["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            tx_dict["type"] = 2  # EIP-1559
+        else:
+            tx_dict["gasPrice"] = gas_price
+        
+        return await self._sign_with_dev_signer(
+            tx_dict=tx_dict,
+            tx_request=tx_request,
+            correlation_id=correlation_id,
+            actor_id=None,
+            nonce=nonce,
+            gas_limit=21000,
+            chain_id=chain_id,
+        )
+    
     async def _sign_with_dev_signer(
         self,
         tx_dict: dict,
@@ -0,0 +1,159 @@
+"""Durable job queue and worker pool for orchestrator pipeline stages.
+
+In ``queue`` pipeline mode the API returns as soon as a transaction request
+is SUBMITTED. Policy, KYT, signing and broadcast then run as TxPipelineJob
+rows consumed by pipeline workers:
+
+- a job is claimed with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+  worker loops and worker processes share the queue without running a job
+  twice; throughput scales by adding workers
+- the stage runs in the claiming transaction; its state changes, its audit
+  events, the job for the next stage and the deletion of the claimed job
+  commit together
+- a stage that raises is rolled back to a savepoint and the job is retried
+  with exponential backoff, then kept with status FAILED. Transient RPC
+  failures in signing and broadcast raise while retries are left; on the
+  last attempt they fail the transaction (FAILED_SIGN / FAILED_BROADCAST)
+
+Worker processes can run inside the API (tx_pipeline_workers > 0) or
+standalone via scripts/run_pipeline_workers.py.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.tx_request import TxRequest, TxStatus, TxPipelineJob, TxPipelineStage
+from app.models.wallet import Wallet
+from app.services.audit import AuditService
+from app.services.ethereum import EthereumService
+from app.services.kyt import KYTService
+from app.services.mpc_coordinator import MPCCoordinator
+from app.services.orchestrator import TxOrchestrator
+from app.services.policy import PolicyService
+from app.services.signing import SigningService
+
+logger = logging.getLogger(__name__)
+
+# Statuses a transaction must be in for a stage to run; other jobs are stale
+STAGE_STATUSES = {
+    TxPipelineStage.POLICY: {TxStatus.SUBMITTED},
+    TxPipelineStage.KYT: {TxStatus.POLICY_EVAL_PENDING},
+    TxPipelineStage.SIGN: {TxStatus.APPROVAL_PENDING, TxStatus.APPROVAL_SKIPPED},
+    TxPipelineStage.BROADCAST: {TxStatus.SIGNED},
+}
+
+
+def build_orchestrator(session: AsyncSession) -> TxOrchestrator:
+    """Wire an orchestrator on a session, as the API dependencies do."""
+    audit = AuditService(session)
+    signing = SigningService(session, audit)
+    mpc_coordinator = MPCCoordinator(session, audit)
+    signing.set_mpc_coordinator(mpc_coordinator)
+    return TxOrchestrator(
+        session,
+        audit,
+        KYTService(session, audit),
+        PolicyService(session, audit),
+        signing,
+        EthereumService(session, audit),
+        mpc_coordinator,
+    )
+
+
+class TxPipelineWorkerPool:
+    """Background worker loops consuming the pipeline job queue."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        workers: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.workers = workers or self.settings.tx_pipeline_workers
+        self.poll_interval = poll_interval or self.settings.tx_pipeline_poll_interval
+        self._running = False
+
+    async def start(self):
+        """Start the worker loops."""
+        self._running = True
+        logger.info(f"Transaction pipeline started with {self.workers} workers")
+        await asyncio.gather(*(self._work(i) for i in range(self.workers)))
+
+    async def stop(self):
+        """Stop the worker loops."""
+        self._running = False
+        logger.info("Transaction pipeline stopped")
+
+    async def _work(self, worker_id: int):
+        while self._running:
+            try:
+                ran = await self.run_once()
+            except Exception as e:
+                logger.error(f"Pipeline worker {worker_id} error: {e}", exc_info=True)
+                ran = False
+
+            # Keep draining while jobs are due
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> bool:
+        """Claim and run one due job, returns False if none was due."""
+        async with self.session_maker() as session:
+            result = await session.execute(
+                select(TxPipelineJob)
+                .where(TxPipelineJob.status == "PENDING")
+                .where(TxPipelineJob.run_at <= datetime.utcnow())
+                .order_by(TxPipelineJob.run_at.asc(), TxPipelineJob.id.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = result.scalar_one_or_none()
+            if job is None:
+                return False
+
+            job_id, stage, attempts = job.id, job.stage, job.attempts + 1
+            try:
+                async with session.begin_nested():
+                    await self._run_job(session, job)
+            except Exception as e:
+                # The stage is rolled back; the job row is still locked by us
+                logger.error(f"Pipeline job {job_id} ({stage.value}) failed: {e}", exc_info=True)
+                values = {"attempts": attempts, "last_error": str(e)}
+                if attempts >= self.settings.tx_pipeline_max_attempts:
+                    values["status"] = "FAILED"
+                else:
+                    delay = self.settings.tx_pipeline_retry_delay * 2 ** (attempts - 1)
+                    values["run_at"] = datetime.utcnow() + timedelta(seconds=delay)
+                await session.execute(
+                    update(TxPipelineJob).where(TxPipelineJob.id == job_id).values(**values)
+                )
+            else:
+                await session.execute(delete(TxPipelineJob).where(TxPipelineJob.id == job_id))
+
+            await session.commit()
+            return True
+
+    async def _run_job(self, session: AsyncSession, job: TxPipelineJob):
+        orchestrator = build_orchestrator(session)
+        orchestrator.raise_transient_errors = job.attempts + 1 < self.settings.tx_pipeline_max_attempts
+        async with orchestrator.step():
+            tx = await session.get(TxRequest, job.tx_request_id)
+            if tx is None or tx.status not in STAGE_STATUSES[job.stage]:
+                logger.warning(
+                    f"Dropping stale {job.stage.value} job {job.id} for tx {job.tx_request_id}"
+                    f" in status {tx.status.value if tx else 'missing'}"
+                )
+                return
+
+            wallet_result = await session.execute(
+                select(Wallet).where(Wallet.id == tx.wallet_id)
+            )
+            wallet = wallet_result.scalar_one()
+            await orchestrator.run_stage(job.stage, tx, wallet, job.correlation_id, job.actor_id)
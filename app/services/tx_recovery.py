@@ -0,0 +1,141 @@
+"""Recovery sweeper for transactions stranded mid-flight.
+
+A process restart or an RPC outage during signing or broadcast can leave a
+transaction in SIGN_PENDING, SIGNED, BROADCAST_PENDING or FAILED_BROADCAST
+with nothing left to move it on. The sweeper periodically picks up
+transactions that have sat in one of these states for longer than
+tx_recovery_stuck_after and resumes them through
+TxOrchestrator.recover_stuck_tx:
+
+- candidates are found through ix_tx_requests_status_created; transactions
+  with a queued pipeline job, MPC transactions awaiting the user's
+  signature and transactions owned by the hot wallet sender (see
+  hot_wallet) are not stuck and are left alone
+- recoveries run concurrently, bounded by tx_recovery_concurrency, each in
+  its own session and transaction
+- a transaction whose recovery fails is retried with per-transaction
+  exponential backoff and left for an operator after
+  tx_recovery_max_attempts
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import select, exists, or_
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.models.mempool import MempoolTx, MempoolTxStatus
+from app.models.tx_request import TxRequest, TxStatus, TxPipelineJob, RECOVERABLE_STATUSES
+from app.models.wallet import Wallet, CustodyBackend
+from app.services.tx_pipeline import build_orchestrator
+
+logger = logging.getLogger(__name__)
+
+
+class TxRecoverySweeper:
+    """Background service resuming stuck transactions."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[int] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.tx_recovery_interval
+        self._semaphore = asyncio.Semaphore(self.settings.tx_recovery_concurrency)
+        # tx id -> (failed attempts, earliest next attempt)
+        self._backoff: Dict[str, Tuple[int, datetime]] = {}
+        self._running = False
+
+    async def start(self):
+        """Start the sweeper."""
+        self._running = True
+        logger.info("Transaction recovery sweeper started")
+
+        while self._running:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Transaction recovery sweep error: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the sweeper."""
+        self._running = False
+        logger.info("Transaction recovery sweeper stopped")
+
+    async def sweep(self) -> Dict[str, str]:
+        """Recover the stuck transactions that are due, returns tx id -> action."""
+        now = datetime.utcnow()
+        due = []
+        for tx_id in await self._find_stuck(now):
+            attempts, next_attempt = self._backoff.get(tx_id, (0, now))
+            if attempts < self.settings.tx_recovery_max_attempts and next_attempt <= now:
+                due.append(tx_id)
+
+        actions = await asyncio.gather(*(self._recover(tx_id) for tx_id in due))
+        return dict(zip(due, actions))
+
+    async def _find_stuck(self, now: datetime) -> list:
+        cutoff = now - timedelta(seconds=self.settings.tx_recovery_stuck_after)
+        query = (
+            select(TxRequest.id)
+            .join(Wallet, Wallet.id == TxRequest.wallet_id)
+            .where(TxRequest.status.in_(RECOVERABLE_STATUSES))
+            .where(TxRequest.created_at <= cutoff)
+            .where(TxRequest.updated_at <= cutoff)
+            .where(or_(
+                TxRequest.status != TxStatus.SIGN_PENDING,
+                Wallet.custody_backend != CustodyBackend.MPC_TECDSA,
+            ))
+            .where(~exists().where(TxPipelineJob.tx_request_id == TxRequest.id))
+        )
+        if self.settings.hot_wallet_sender_enabled:
+            # Waiting for a free nonce slot, or being resent and replaced by the sender
+            query = query.where(or_(
+                TxRequest.status != TxStatus.SIGN_PENDING,
+                Wallet.custody_backend == CustodyBackend.MPC_TECDSA,
+            )).where(~exists().where(
+                MempoolTx.tx_request_id == TxRequest.id,
+                MempoolTx.status == MempoolTxStatus.PENDING,
+            ))
+        async with self.session_maker() as session:
+            result = await session.execute(
+                query
+                .order_by(TxRequest.created_at.asc())
+                .limit(self.settings.tx_recovery_batch_size)
+            )
+            return list(result.scalars().all())
+
+    async def _recover(self, tx_id: str) -> str:
+        async with self._semaphore:
+            status = None
+            async with self.session_maker() as session:
+                try:
+                    action, status = await build_orchestrator(session).recover_stuck_tx(
+                        tx_id, f"tx-recovery-{uuid4()}"
+                    )
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    logger.error(f"Recovery of tx {tx_id} failed: {e}", exc_info=True)
+                    action = "error"
+
+        if action == "skipped":
+            return action
+        if status is not None and status not in RECOVERABLE_STATUSES:
+            self._backoff.pop(tx_id, None)
+            logger.info(f"Recovered tx {tx_id} ({action}), now {status.value}")
+            return action
+
+        attempts = self._backoff.get(tx_id, (0, None))[0] + 1
+        delay = self.settings.tx_recovery_retry_delay * 2 ** (attempts - 1)
+        self._backoff[tx_id] = (attempts, datetime.utcnow() + timedelta(seconds=delay))
+        if attempts >= self.settings.tx_recovery_max_attempts:
+            logger.error(f"Giving up on tx {tx_id} after {attempts} recovery attempts")
+        return action
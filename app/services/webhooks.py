@@ -0,0 +1,306 @@
+"""Outbound webhook delivery.
+
+Partners subscribe an endpoint to tx.confirmed, tx.finalized and
+deposit.credited events instead of polling:
+
+- enqueue_webhooks turns the audit event recording a status change into
+  WebhookDelivery rows, one per matching subscription, in the same
+  transaction, so an event is queued if and only if the change commits
+- WebhookDispatcher claims due deliveries (FOR UPDATE SKIP LOCKED), leases
+  them and commits before any HTTP is done, then POSTs each subscription's
+  events in batches of up to webhook_batch_size, subscriptions in parallel
+- every POST is signed with the subscription secret (WebhookSigner); a
+  non-2xx answer or a network error retries the batch's deliveries with
+  exponential backoff until webhook_max_attempts, then marks them FAILED
+
+Request body: {"delivery_id": "...", "events": [{"id", "type", "created_at", "data"}, ...]}.
+Event IDs are stable across retries, so receivers can deduplicate.
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import AuditEvent, AuditEventType
+from app.models.webhook import WebhookSubscription, WebhookDelivery
+
+logger = logging.getLogger(__name__)
+
+# Transaction statuses partners are notified of
+_TX_STATUS_EVENTS = {"CONFIRMED": "tx.confirmed", "FINALIZED": "tx.finalized"}
+
+
+class WebhookSigner:
+    """HMAC-SHA256 signatures for webhook requests.
+
+    The signature is computed as:
+        stringToSign = timestamp + '\\n' + body
+        signature = Base64(HMAC-SHA256(secret, stringToSign))
+    """
+
+    def __init__(self, secret: str):
+        self.secret = secret
+
+    def compute_signature(self, timestamp: int, body: bytes) -> str:
+        """Compute the signature of a request body sent at timestamp (ms)."""
+        signature_bytes = hmac.new(
+            self.secret.encode("utf-8"),
+            f"{timestamp}\n".encode("utf-8") + body,
+            hashlib.sha256,
+        ).digest()
+        return base64.b64encode(signature_bytes).decode("utf-8")
+
+    def get_headers(self, body: bytes, delivery_id: str, timestamp: Optional[int] = None) -> Dict[str, str]:
+        """Headers for a signed webhook POST."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        return {
+            "Content-Type": "application/json",
+            "X-Webhook-Id": delivery_id,
+            "X-Webhook-Timestamp": str(timestamp),
+            "X-Webhook-Signature": self.compute_signature(timestamp, body),
+        }
+
+    def verify(self, body: bytes, timestamp: str, signature: str, tolerance_seconds: int = 300) -> bool:
+        """Check a received signature; receivers can use this as reference."""
+        try:
+            sent_at = int(timestamp)
+        except (TypeError, ValueError):
+            return False
+        if abs(time.time() * 1000 - sent_at) > tolerance_seconds * 1000:
+            return False
+        return hmac.compare_digest(self.compute_signature(sent_at, body), signature or "")
+
+
+def webhook_events(audit_event: AuditEvent) -> List[Tuple[str, Optional[str], dict]]:
+    """(event type, wallet ID, data) for each webhook event an audit event records."""
+    payload = audit_event.payload or {}
+    refs = audit_event.entity_refs or {}
+    wallet_id = refs.get("wallet_id")
+    event_type = AuditEventType(audit_event.event_type)
+
+    if event_type == AuditEventType.TX_STATUS_CHANGED:
+        # Journaled changes list every status passed through after the first
+        statuses = payload["path"][1:] if payload.get("path") else [payload.get("new_status")]
+        return [
+            (_TX_STATUS_EVENTS[status], wallet_id,
+             {"tx_request_id": audit_event.entity_id, "wallet_id": wallet_id, "status": status})
+            for status in statuses if status in _TX_STATUS_EVENTS
+        ]
+    if event_type in (AuditEventType.TX_CONFIRMED, AuditEventType.TX_FINALIZED):
+        status = "CONFIRMED" if event_type == AuditEventType.TX_CONFIRMED else "FINALIZED"
+        return [(_TX_STATUS_EVENTS[status], wallet_id, {
+            "tx_request_id": audit_event.entity_id,
+            "wallet_id": wallet_id,
+            "status": status,
+            "tx_hash": payload.get("tx_hash"),
+            "block_number": payload.get("block_number"),
+        })]
+    if event_type == AuditEventType.DEPOSIT_APPROVED:
+        return [("deposit.credited", wallet_id, {
+            "deposit_id": refs.get("deposit_id"),
+            "wallet_id": wallet_id,
+            "status": "CREDITED",
+            "amount": payload.get("amount"),
+            "asset": payload.get("asset"),
+        })]
+    return []
+
+
+async def enqueue_webhooks(db: AsyncSession, audit_event: AuditEvent) -> int:
+    """Queue deliveries for the webhook events an audit event records."""
+    events = webhook_events(audit_event)
+    if not events:
+        return 0
+
+    result = await db.execute(
+        select(WebhookSubscription).where(WebhookSubscription.is_active == True)  # noqa: E712
+    )
+    subscriptions = list(result.scalars().all())
+
+    deliveries = []
+    for event_type, wallet_id, data in events:
+        event_id = f"{audit_event.id}:{event_type}"
+        payload = {
+            "id": event_id,
+            "type": event_type,
+            "created_at": audit_event.timestamp.isoformat(),
+            "data": data,
+        }
+        for subscription in subscriptions:
+            if event_type not in subscription.event_types:
+                continue
+            if subscription.wallet_ids is not None and wallet_id not in subscription.wallet_ids:
+                continue
+            deliveries.append(WebhookDelivery(
+                subscription_id=subscription.id,
+                event_id=event_id,
+                event_type=event_type,
+                payload=payload,
+            ))
+    db.add_all(deliveries)
+    return len(deliveries)
+
+
+class WebhookDispatcher:
+    """Background service sending queued webhook deliveries."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        poll_interval: Optional[float] = None
+    ):
+        self.session_maker = session_maker
+        self.settings = get_settings()
+        self.poll_interval = poll_interval or self.settings.webhook_poll_interval
+        self._semaphore = asyncio.Semaphore(self.settings.webhook_concurrency)
+        self._running = False
+
+    async def start(self):
+        """Start the dispatcher."""
+        self._running = True
+        logger.info("Webhook dispatcher started")
+
+        while self._running:
+            try:
+                sent = await self.run_once()
+            except Exception as e:
+                logger.error(f"Webhook dispatcher error: {e}", exc_info=True)
+                sent = 0
+
+            # Keep draining while deliveries are due
+            if not sent:
+                await asyncio.sleep(self.poll_interval)
+
+    async def stop(self):
+        """Stop the dispatcher."""
+        self._running = False
+        logger.info("Webhook dispatcher stopped")
+
+    async def run_once(self) -> int:
+        """Send the deliveries that are due, returns how many were attempted."""
+        batches = await self._claim()
+        if not batches:
+            return 0
+
+        async with httpx.AsyncClient(timeout=self.settings.webhook_timeout) as client:
+            outcomes = await asyncio.gather(*(
+                self._send(client, subscription, deliveries)
+                for subscription, deliveries in batches
+            ))
+
+        async with self.session_maker() as session:
+            for (_, deliveries), error in zip(batches, outcomes):
+                await self._record(session, [d["id"] for d in deliveries], error)
+            await session.commit()
+        return sum(len(deliveries) for _, deliveries in batches)
+
+    async def _claim(self) -> List[Tuple[WebhookSubscription, List[dict]]]:
+        """Lease due deliveries and group them into per-subscription batches."""
+        now = datetime.utcnow()
+        async with self.session_maker() as session:
+            result = await session.execute(
+                select(WebhookDelivery)
+                .where(WebhookDelivery.status == "PENDING")
+                .where(WebhookDelivery.next_attempt_at <= now)
+                .order_by(WebhookDelivery.id.asc())
+                .limit(self.settings.webhook_claim_limit)
+                .with_for_update(skip_locked=True)
+            )
+            deliveries = list(result.scalars().all())
+            if not deliveries:
+                return []
+
+            grouped: Dict[str, List[dict]] = {}
+            for delivery in deliveries:
+                grouped.setdefault(delivery.subscription_id, []).append(
+                    {"id": delivery.id, "payload": delivery.payload}
+                )
+            size = self.settings.webhook_batch_size
+            batch_count = sum(-(-len(items) // size) for items in grouped.values())
+
+            # Other dispatchers skip leased rows until the sends below are
+            # recorded. Only webhook_concurrency batches are in flight at a
+            # time, so the lease covers the later batches' wait as well
+            rounds = -(-batch_count // self.settings.webhook_concurrency)
+            lease = now + timedelta(seconds=self.settings.webhook_timeout * (rounds + 1))
+            await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_([d.id for d in deliveries]))
+                .values(next_attempt_at=lease)
+            )
+
+            subscription_result = await session.execute(
+                select(WebhookSubscription).where(
+                    WebhookSubscription.id.in_({d.subscription_id for d in deliveries})
+                )
+            )
+            subscriptions = {s.id: s for s in subscription_result.scalars().all()}
+            await session.commit()
+
+        return [
+            (subscriptions[subscription_id], items[i:i + size])
+            for subscription_id, items in grouped.items()
+            for i in range(0, len(items), size)
+        ]
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        subscription: WebhookSubscription,
+        deliveries: List[dict]
+    ) -> Optional[str]:
+        """POST one batch, returns an error message or None on success."""
+        if not subscription.is_active:
+            return "Subscription is inactive"
+
+        delivery_id = str(uuid4())
+        body = json.dumps(
+            {"delivery_id": delivery_id, "events": [d["payload"] for d in deliveries]},
+            separators=(",", ":"),
+            default=str,
+        ).encode("utf-8")
+        headers = WebhookSigner(subscription.secret).get_headers(body, delivery_id)
+
+        async with self._semaphore:
+            try:
+                response = await client.post(subscription.url, content=body, headers=headers)
+            except httpx.HTTPError as e:
+                return f"{type(e).__name__}: {e}"
+        if response.is_success:
+            return None
+        return f"HTTP {response.status_code}"
+
+    async def _record(self, session: AsyncSession, delivery_ids: List[int], error: Optional[str]):
+        now = datetime.utcnow()
+        if error is None:
+            await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_(delivery_ids))
+                .values(status="DELIVERED", delivered_at=now, last_error=None)
+            )
+            return
+
+        result = await session.execute(
+            select(WebhookDelivery).where(WebhookDelivery.id.in_(delivery_ids))
+        )
+        for delivery in result.scalars().all():
+            delivery.attempts += 1
+            delivery.last_error = error
+            if delivery.attempts >= self.settings.webhook_max_attempts:
+                delivery.status = "FAILED"
+                logger.error(f"Webhook delivery {delivery.id} failed permanently: {error}")
+            else:
+                delay = self.settings.webhook_retry_delay * 2 ** (delivery.attempts - 1)
+                delivery.next_attempt_at = now + timedelta(seconds=delay)
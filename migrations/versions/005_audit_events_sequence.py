@@ -0,0 +1,37 @@
+"""Back audit_events.sequence_number with a database sequence
+
+Revision ID: 005_audit_events_sequence
+Revises: 004_seed_retail_group
+Create Date: 2026-10-16
+
+Audit writers previously computed max(sequence_number) + 1 per event.
+Sequence numbers are now drawn from audit_events_seq while the chain
+advisory lock is held (see AuditService.flush).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS audit_events_seq OWNED BY audit_events.sequence_number")
+    # Continue numbering after existing events
+    op.execute(
+        "SELECT setval('audit_events_seq', "
+        "COALESCE((SELECT MAX(sequence_number) FROM audit_events), 0) + 1, false)"
+    )
+    op.execute(
+        "ALTER TABLE audit_events ALTER COLUMN sequence_number "
+        "SET DEFAULT nextval('audit_events_seq')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE audit_events ALTER COLUMN sequence_number DROP DEFAULT")
+    op.execute("DROP SEQUENCE IF EXISTS audit_events_seq")
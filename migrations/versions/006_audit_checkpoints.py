@@ -0,0 +1,38 @@
+"""Add signed audit verification checkpoints
+
+Revision ID: 006_audit_checkpoints
+Revises: 005_audit_events_sequence
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_checkpoints',
+        sa.Column('id', postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column('sequence_number', sa.Integer(), nullable=False),
+        sa.Column('event_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('hash', sa.String(64), nullable=False),
+        sa.Column('events_verified', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('verified_at', sa.DateTime(), nullable=False),
+        sa.Column('verified_by', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('signature', sa.String(64), nullable=False),
+    )
+    op.create_index('ix_audit_checkpoints_sequence_number', 'audit_checkpoints', ['sequence_number'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_checkpoints_sequence_number', table_name='audit_checkpoints')
+    op.drop_table('audit_checkpoints')
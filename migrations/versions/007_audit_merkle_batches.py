@@ -0,0 +1,36 @@
+"""Add Merkle batch roots over audit events
+
+Revision ID: 007_audit_merkle_batches
+Revises: 006_audit_checkpoints
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_merkle_batches',
+        sa.Column('id', postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column('from_sequence', sa.Integer(), nullable=False, unique=True),
+        sa.Column('to_sequence', sa.Integer(), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False),
+        sa.Column('root', sa.String(64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_audit_merkle_batches_to_sequence', 'audit_merkle_batches', ['to_sequence'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_merkle_batches_to_sequence', table_name='audit_merkle_batches')
+    op.drop_table('audit_merkle_batches')
@@ -0,0 +1,155 @@
+"""Partition audit_events by month and add archive segment manifests
+
+Revision ID: 008_partition_audit_events
+Revises: 007_audit_merkle_batches
+Create Date: 2026-10-16
+
+audit_events becomes a table partitioned by RANGE (timestamp) with one
+partition per month (audit_events_pYYYYMM). Appends only touch the indexes
+of the current partition, and old partitions can be sealed into archive
+segment files and detached (see app/services/audit_archive.py).
+
+Unique constraints on a partitioned table must include the partition key,
+so the primary key becomes (id, timestamp) and sequence_number/hash get
+plain indexes. Sequence numbers still come from audit_events_seq under the
+chain advisory lock, and hash uniqueness follows from the chain itself.
+
+audit_events_ensure_partition(month) creates a month's partition if it
+does not exist yet; the archiver keeps a few months pre-created. Rows for
+a month without a partition land in audit_events_default instead of
+failing the insert, and ensure_partition moves them into the month's
+partition when it is created.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns) of indexes on the partitioned parent, cascaded to partitions
+AUDIT_EVENT_INDEXES = [
+    ('ix_audit_events_sequence_number', ['sequence_number']),
+    ('ix_audit_events_timestamp', ['timestamp']),
+    ('ix_audit_events_event_type', ['event_type']),
+    ('ix_audit_events_actor_id', ['actor_id']),
+    ('ix_audit_events_entity_id', ['entity_id']),
+    ('ix_audit_events_correlation_id', ['correlation_id']),
+    ('ix_audit_events_hash', ['hash']),
+    ('ix_audit_events_entity', ['entity_type', 'entity_id']),
+    ('ix_audit_events_timestamp_type', ['timestamp', 'event_type']),
+]
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_legacy")
+    op.execute(
+        "CREATE TABLE audit_events (LIKE audit_events_legacy INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("ALTER TABLE audit_events ADD PRIMARY KEY (id, timestamp)")
+    # Catches events for months whose partition does not exist yet
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit_events_ensure_partition(month_start date)
+        RETURNS text AS $$
+        DECLARE
+            start_at date := date_trunc('month', month_start)::date;
+            partition_name text := 'audit_events_p' || to_char(start_at, 'YYYYMM');
+            end_at date := (start_at + interval '1 month')::date;
+        BEGIN
+            IF to_regclass(partition_name) IS NULL THEN
+                -- A new range may not overlap rows in the default partition:
+                -- build the partition from them, then attach it
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE audit_events INCLUDING DEFAULTS)', partition_name
+                );
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM audit_events_default ' ||
+                    'WHERE timestamp >= %L AND timestamp < %L RETURNING *) ' ||
+                    'INSERT INTO %I SELECT * FROM moved',
+                    start_at, end_at, partition_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE audit_events ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, start_at, end_at
+                );
+            END IF;
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Partitions from the oldest event through two months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month date := date_trunc('month', COALESCE(
+                (SELECT MIN(timestamp) FROM audit_events_legacy), now()
+            ))::date;
+        BEGIN
+            WHILE month <= (date_trunc('month', now()) + interval '2 months')::date LOOP
+                PERFORM audit_events_ensure_partition(month);
+                month := (month + interval '1 month')::date;
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("INSERT INTO audit_events SELECT * FROM audit_events_legacy")
+
+    # Keep the sequence when the legacy table goes away
+    op.execute("ALTER SEQUENCE audit_events_seq OWNED BY NONE")
+    op.execute("DROP TABLE audit_events_legacy")
+    op.execute("ALTER SEQUENCE audit_events_seq OWNED BY audit_events.sequence_number")
+
+    for name, columns in AUDIT_EVENT_INDEXES:
+        op.create_index(name, 'audit_events', columns)
+
+    op.create_table(
+        'audit_archive_segments',
+        sa.Column('id', postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column('partition_name', sa.String(63), nullable=False, unique=True),
+        sa.Column('from_time', sa.DateTime(), nullable=False),
+        sa.Column('to_time', sa.DateTime(), nullable=False),
+        sa.Column('from_sequence', sa.Integer(), nullable=False),
+        sa.Column('to_sequence', sa.Integer(), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False),
+        sa.Column('first_prev_hash', sa.String(64), nullable=True),
+        sa.Column('last_hash', sa.String(64), nullable=False),
+        sa.Column('last_timestamp', sa.DateTime(), nullable=False),
+        sa.Column('data_path', sa.String(1024), nullable=False),
+        sa.Column('data_sha256', sa.String(64), nullable=False),
+        sa.Column('index_path', sa.String(1024), nullable=False),
+        sa.Column('index_sha256', sa.String(64), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_audit_archive_segments_to_sequence', 'audit_archive_segments', ['to_sequence'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_archive_segments_to_sequence', table_name='audit_archive_segments')
+    op.drop_table('audit_archive_segments')
+
+    # Archived (detached) partitions are not merged back
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_partitioned")
+    op.execute(
+        "CREATE TABLE audit_events (LIKE audit_events_partitioned INCLUDING DEFAULTS)"
+    )
+    op.execute("INSERT INTO audit_events SELECT * FROM audit_events_partitioned")
+    op.execute("ALTER SEQUENCE audit_events_seq OWNED BY NONE")
+    op.execute("DROP TABLE audit_events_partitioned CASCADE")
+    op.execute("ALTER SEQUENCE audit_events_seq OWNED BY audit_events.sequence_number")
+    op.execute("DROP FUNCTION IF EXISTS audit_events_ensure_partition(date)")
+
+    op.execute("ALTER TABLE audit_events ADD PRIMARY KEY (id)")
+    op.create_unique_constraint('audit_events_sequence_number_key', 'audit_events', ['sequence_number'])
+    for name, columns in AUDIT_EVENT_INDEXES:
+        if name != 'ix_audit_events_sequence_number':
+            op.create_index(name, 'audit_events', columns)
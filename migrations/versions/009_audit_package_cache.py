@@ -0,0 +1,33 @@
+"""Add persisted audit package cache for terminal transactions
+
+Revision ID: 009_audit_package_cache
+Revises: 008_partition_audit_events
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_package_cache',
+        sa.Column('tx_request_id', postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column('last_sequence_number', sa.Integer(), nullable=False),
+        sa.Column('package', postgresql.JSONB(), nullable=False),
+        sa.Column('package_hash', sa.String(64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('audit_package_cache')
@@ -0,0 +1,39 @@
+"""Add audit outbox for asynchronous chain hashing
+
+Revision ID: 010_audit_outbox
+Revises: 009_audit_package_cache
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_outbox',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('event_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('event_type', postgresql.ENUM(name='auditeventtype', create_type=False), nullable=False),
+        sa.Column('actor_id', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('actor_type', sa.String(50), nullable=True),
+        sa.Column('entity_type', sa.String(50), nullable=True),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('entity_refs', postgresql.JSONB(), nullable=True),
+        sa.Column('payload', postgresql.JSONB(), nullable=True),
+        sa.Column('correlation_id', sa.String(255), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('audit_outbox')
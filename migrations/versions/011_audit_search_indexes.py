@@ -0,0 +1,41 @@
+"""Add audit_events indexes for trace reconstruction and search
+
+Revision ID: 011_audit_search_indexes
+Revises: 010_audit_outbox
+Create Date: 2026-10-16
+
+Trace and search endpoints page with keyset pagination on sequence_number:
+(correlation_id, sequence_number) serves a trace page as a single index
+range scan, and a GIN index with jsonb_path_ops serves payload containment
+(@>) predicates. Both are created on the partitioned parent and cascade to
+every attached partition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_audit_events_correlation_sequence',
+        'audit_events',
+        ['correlation_id', 'sequence_number']
+    )
+    op.create_index(
+        'ix_audit_events_payload',
+        'audit_events',
+        ['payload'],
+        postgresql_using='gin',
+        postgresql_ops={'payload': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_events_payload', table_name='audit_events')
+    op.drop_index('ix_audit_events_correlation_sequence', table_name='audit_events')
@@ -0,0 +1,46 @@
+"""Add durable job queue for orchestrator pipeline stages
+
+Revision ID: 012_tx_pipeline_jobs
+Revises: 011_audit_search_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    txpipelinestage = postgresql.ENUM('POLICY', 'KYT', 'SIGN', 'BROADCAST', name='txpipelinestage')
+    txpipelinestage.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'tx_pipeline_jobs',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('tx_request_id', postgresql.UUID(as_uuid=False), sa.ForeignKey('tx_requests.id'), nullable=False),
+        sa.Column('stage', postgresql.ENUM(name='txpipelinestage', create_type=False), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='PENDING'),
+        sa.Column('correlation_id', sa.String(255), nullable=False),
+        sa.Column('actor_id', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('run_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_tx_pipeline_jobs_tx_request_id', 'tx_pipeline_jobs', ['tx_request_id'])
+    op.create_index('ix_tx_pipeline_jobs_due', 'tx_pipeline_jobs', ['status', 'run_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_pipeline_jobs_due', table_name='tx_pipeline_jobs')
+    op.drop_index('ix_tx_pipeline_jobs_tx_request_id', table_name='tx_pipeline_jobs')
+    op.drop_table('tx_pipeline_jobs')
+    postgresql.ENUM(name='txpipelinestage').drop(op.get_bind(), checkfirst=True)
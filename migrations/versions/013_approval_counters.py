@@ -0,0 +1,41 @@
+"""Add approval quorum counters to tx_requests
+
+Revision ID: 013_approval_counters
+Revises: 012_tx_pipeline_jobs
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tx_requests', sa.Column('approved_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tx_requests', sa.Column('rejected_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing votes
+    op.execute("""
+        UPDATE tx_requests SET
+            approved_count = (
+                SELECT count(*) FROM approvals
+                WHERE approvals.tx_request_id = tx_requests.id AND approvals.decision = 'APPROVED'
+            ),
+            rejected_count = (
+                SELECT count(*) FROM approvals
+                WHERE approvals.tx_request_id = tx_requests.id AND approvals.decision = 'REJECTED'
+            )
+        WHERE EXISTS (SELECT 1 FROM approvals WHERE approvals.tx_request_id = tx_requests.id)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('tx_requests', 'rejected_count')
+    op.drop_column('tx_requests', 'approved_count')
@@ -0,0 +1,63 @@
+"""Add webhook subscriptions and delivery queue
+
+Revision ID: 014_webhooks
+Revises: 013_approval_counters
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TYPE auditeventtype ADD VALUE IF NOT EXISTS 'WEBHOOK_SUBSCRIPTION_CREATED'")
+    op.execute("ALTER TYPE auditeventtype ADD VALUE IF NOT EXISTS 'WEBHOOK_SUBSCRIPTION_DELETED'")
+
+    op.create_table(
+        'webhook_subscriptions',
+        sa.Column('id', postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('url', sa.String(2048), nullable=False),
+        sa.Column('secret', sa.String(255), nullable=False),
+        sa.Column('event_types', sa.JSON(), nullable=False),
+        sa.Column('wallet_ids', sa.JSON(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('created_by', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        'webhook_deliveries',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('subscription_id', postgresql.UUID(as_uuid=False), sa.ForeignKey('webhook_subscriptions.id'), nullable=False),
+        sa.Column('event_id', sa.String(100), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='PENDING'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_webhook_deliveries_due', 'webhook_deliveries', ['status', 'next_attempt_at', 'id'])
+    op.create_index(
+        'ix_webhook_deliveries_subscription_event', 'webhook_deliveries',
+        ['subscription_id', 'event_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_webhook_deliveries_subscription_event', table_name='webhook_deliveries')
+    op.drop_index('ix_webhook_deliveries_due', table_name='webhook_deliveries')
+    op.drop_table('webhook_deliveries')
+    op.drop_table('webhook_subscriptions')
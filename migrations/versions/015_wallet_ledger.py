@@ -0,0 +1,125 @@
+"""Add double-entry wallet ledger with materialized balances
+
+Balances are backfilled from deposits and tx_requests, each opened with
+ADJUSTMENT entries, so withdrawals on existing wallets are checked against
+their history from the start.
+
+Revision ID: 015_wallet_ledger
+Revises: 014_webhooks
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    from sqlalchemy.dialects.postgresql import ENUM as pgENUM
+
+    ledgeraccount = pgENUM(
+        'AVAILABLE', 'RESERVED', 'PENDING', 'EXTERNAL', 'RECONCILIATION',
+        name='ledgeraccount', create_type=False
+    )
+    ledgerentrytype = pgENUM(
+        'DEPOSIT_DETECTED', 'DEPOSIT_CREDITED', 'DEPOSIT_REJECTED',
+        'WITHDRAWAL_RESERVED', 'WITHDRAWAL_RELEASED', 'WITHDRAWAL_SETTLED', 'ADJUSTMENT',
+        name='ledgerentrytype', create_type=False
+    )
+    ledgeraccount.create(op.get_bind(), checkfirst=True)
+    ledgerentrytype.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'ledger_entries',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('wallet_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('asset', sa.String(50), nullable=False),
+        sa.Column('entry_type', ledgerentrytype, nullable=False),
+        sa.Column('debit_account', ledgeraccount, nullable=False),
+        sa.Column('credit_account', ledgeraccount, nullable=False),
+        sa.Column('amount', sa.Numeric(78, 18), nullable=False),
+        sa.Column('ref_type', sa.String(50), nullable=True),
+        sa.Column('ref_id', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_ledger_entries_wallet_asset', 'ledger_entries', ['wallet_id', 'asset', 'id'])
+    op.create_index('ix_ledger_entries_ref', 'ledger_entries', ['ref_id', 'entry_type'], unique=True)
+
+    op.create_table(
+        'ledger_balances',
+        sa.Column('wallet_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('asset', sa.String(50), nullable=False),
+        sa.Column('available', sa.Numeric(78, 18), nullable=False, server_default='0'),
+        sa.Column('reserved', sa.Numeric(78, 18), nullable=False, server_default='0'),
+        sa.Column('pending', sa.Numeric(78, 18), nullable=False, server_default='0'),
+        sa.Column('credited_deposits', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pending_deposits', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reconciled_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('wallet_id', 'asset'),
+    )
+
+    # Backfill, as LedgerService.reconcile computes a balance (terminal
+    # statuses other than FINALIZED hold nothing)
+    op.execute("""
+        INSERT INTO ledger_balances (
+            wallet_id, asset, available, reserved, pending,
+            credited_deposits, pending_deposits, reconciled_at, updated_at
+        )
+        SELECT
+            wallet_id, asset,
+            SUM(credited) - SUM(reserved) - SUM(withdrawn), SUM(reserved), SUM(pending),
+            SUM(credited_count), SUM(pending_count), now(), now()
+        FROM (
+            SELECT
+                wallet_id, asset,
+                SUM(CASE WHEN status = 'CREDITED' THEN amount::numeric ELSE 0 END) AS credited,
+                SUM(CASE WHEN status = 'PENDING_ADMIN' THEN amount::numeric ELSE 0 END) AS pending,
+                COUNT(*) FILTER (WHERE status = 'CREDITED') AS credited_count,
+                COUNT(*) FILTER (WHERE status = 'PENDING_ADMIN') AS pending_count,
+                0 AS reserved, 0 AS withdrawn
+            FROM deposits
+            WHERE status IN ('PENDING_ADMIN', 'CREDITED')
+            GROUP BY wallet_id, asset
+            UNION ALL
+            SELECT
+                wallet_id, asset, 0, 0, 0, 0,
+                SUM(CASE WHEN status <> 'FINALIZED' THEN amount ELSE 0 END),
+                SUM(CASE WHEN status = 'FINALIZED' THEN amount ELSE 0 END)
+            FROM tx_requests
+            WHERE status NOT IN ('POLICY_BLOCKED', 'KYT_BLOCKED', 'REJECTED', 'FAILED_SIGN')
+            GROUP BY wallet_id, asset
+        ) sources
+        GROUP BY wallet_id, asset
+    """)
+    # Each backfilled amount enters the ledger as an adjustment against RECONCILIATION
+    for account in ('available', 'reserved', 'pending'):
+        op.execute(f"""
+            INSERT INTO ledger_entries (
+                wallet_id, asset, entry_type, debit_account, credit_account, amount, created_at
+            )
+            SELECT
+                wallet_id, asset, 'ADJUSTMENT',
+                CASE WHEN {account} > 0 THEN '{account.upper()}' ELSE 'RECONCILIATION' END::ledgeraccount,
+                CASE WHEN {account} > 0 THEN 'RECONCILIATION' ELSE '{account.upper()}' END::ledgeraccount,
+                ABS({account}), now()
+            FROM ledger_balances
+            WHERE {account} <> 0
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table('ledger_balances')
+    op.drop_index('ix_ledger_entries_ref', table_name='ledger_entries')
+    op.drop_index('ix_ledger_entries_wallet_asset', table_name='ledger_entries')
+    op.drop_table('ledger_entries')
+    op.execute("DROP TYPE IF EXISTS ledgerentrytype")
+    op.execute("DROP TYPE IF EXISTS ledgeraccount")
@@ -0,0 +1,48 @@
+"""Add database-backed nonce allocation per signer address
+
+Accounts start empty; each one is synced from the chain's pending nonce on
+its first allocation.
+
+Revision ID: 016_nonce_allocator
+Revises: 015_wallet_ledger
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'nonce_accounts',
+        sa.Column('address', sa.String(42), primary_key=True),
+        sa.Column('next_nonce', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('chain_nonce', sa.BigInteger(), nullable=True),
+        sa.Column('synced_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        'nonce_allocations',
+        sa.Column('address', sa.String(42), nullable=False),
+        sa.Column('nonce', sa.BigInteger(), nullable=False),
+        sa.Column('tx_request_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('allocated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('address', 'nonce'),
+    )
+    op.create_index('ix_nonce_allocations_tx', 'nonce_allocations', ['tx_request_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_nonce_allocations_tx', table_name='nonce_allocations')
+    op.drop_table('nonce_allocations')
+    op.drop_table('nonce_accounts')
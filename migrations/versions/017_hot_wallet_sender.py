@@ -0,0 +1,58 @@
+"""Add mempool state for the hot wallet sender and the CANCELLED status
+
+Revision ID: 017_hot_wallet_sender
+Revises: 016_nonce_allocator
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE txstatus ADD VALUE IF NOT EXISTS 'CANCELLED'")
+
+    mempooltxkind = postgresql.ENUM('ORIGINAL', 'REPLACEMENT', 'CANCELLATION', name='mempooltxkind')
+    mempooltxkind.create(op.get_bind(), checkfirst=True)
+    mempooltxstatus = postgresql.ENUM('PENDING', 'MINED', 'REPLACED', 'DROPPED', name='mempooltxstatus')
+    mempooltxstatus.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'mempool_txs',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('tx_request_id', postgresql.UUID(as_uuid=False), sa.ForeignKey('tx_requests.id'), nullable=False),
+        sa.Column('address', sa.String(42), nullable=False),
+        sa.Column('nonce', sa.BigInteger(), nullable=False),
+        sa.Column('kind', postgresql.ENUM(name='mempooltxkind', create_type=False), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='mempooltxstatus', create_type=False), nullable=False),
+        sa.Column('tx_hash', sa.String(66), nullable=False, unique=True),
+        sa.Column('signed_tx', sa.Text(), nullable=False),
+        sa.Column('max_fee_per_gas', sa.Numeric(36, 0), nullable=True),
+        sa.Column('max_priority_fee_per_gas', sa.Numeric(36, 0), nullable=True),
+        sa.Column('gas_price', sa.Numeric(36, 0), nullable=True),
+        sa.Column('block_number', sa.BigInteger(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_mempool_txs_tx_request_id', 'mempool_txs', ['tx_request_id'])
+    op.create_index('ix_mempool_txs_address_status_nonce', 'mempool_txs', ['address', 'status', 'nonce'])
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; CANCELLED stays in txstatus
+    op.drop_index('ix_mempool_txs_address_status_nonce', table_name='mempool_txs')
+    op.drop_index('ix_mempool_txs_tx_request_id', table_name='mempool_txs')
+    op.drop_table('mempool_txs')
+    postgresql.ENUM(name='mempooltxstatus').drop(op.get_bind(), checkfirst=True)
+    postgresql.ENUM(name='mempooltxkind').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""Add the terminal REVERTED transaction status
+
+Revision ID: 018_tx_reverted_status
+Revises: 017_hot_wallet_sender
+Create Date: 2026-10-16
+
+A transaction mined with a failed receipt used to go back to
+FAILED_BROADCAST, which the recovery sweeper rebroadcasts forever.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE txstatus ADD VALUE IF NOT EXISTS 'REVERTED'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; REVERTED stays in txstatus
+    pass
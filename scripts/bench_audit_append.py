@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Audit append throughput benchmark.
+
+Simulates concurrent submitters each writing the audit trail of one
+create_tx_request (TX_REQUEST_CREATED, policy evaluation and a handful of
+status changes) and reports committed events/sec for:
+
+- per-event: every log_event() is written on its own (legacy call pattern)
+- batched:   events of one unit of work are flushed via AuditService.batch()
+
+Requires PostgreSQL (advisory locks + audit_events_seq, i.e. `alembic upgrade head`).
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... python3 scripts/bench_audit_append.py \\
+        [--submitters 50] [--units 20] [--events-per-unit 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models.audit import AuditEventType  # noqa: E402
+from app.services.audit import AuditService  # noqa: E402
+
+
+async def _write_unit(audit: AuditService, events_per_unit: int) -> None:
+    """Log the events produced by one simulated transaction request."""
+    tx_id = str(uuid4())
+    correlation_id = f"bench-{uuid4()}"
+    await audit.log_event(
+        event_type=AuditEventType.TX_REQUEST_CREATED,
+        correlation_id=correlation_id,
+        entity_type="TX_REQUEST",
+        entity_id=tx_id,
+        payload={"amount": "1000000000000000", "asset": "ETH"},
+    )
+    for i in range(events_per_unit - 1):
+        await audit.log_event(
+            event_type=AuditEventType.TX_STATUS_CHANGED,
+            correlation_id=correlation_id,
+            actor_type="SYSTEM",
+            entity_type="TX_REQUEST",
+            entity_id=tx_id,
+            payload={"step": i},
+        )
+
+
+async def _submitter(session_maker, units: int, events_per_unit: int, batched: bool) -> None:
+    for _ in range(units):
+        async with session_maker() as session:
+            audit = AuditService(session)
+            if batched:
+                async with audit.batch():
+                    await _write_unit(audit, events_per_unit)
+            else:
+                await _write_unit(audit, events_per_unit)
+            await session.commit()
+
+
+async def run(args) -> None:
+    engine = create_async_engine(
+        os.getenv("DATABASE_URL", get_settings().database_url),
+        pool_size=args.submitters,
+        max_overflow=0,
+    )
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    total_events = args.submitters * args.units * args.events_per_unit
+    print(f"{args.submitters} submitters x {args.units} units x {args.events_per_unit} events")
+
+    for mode, batched in (("per-event", False), ("batched", True)):
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            _submitter(session_maker, args.units, args.events_per_unit, batched)
+            for _ in range(args.submitters)
+        ])
+        elapsed = time.perf_counter() - start
+        print(f"{mode:>10}: {total_events} events in {elapsed:.2f}s -> {total_events / elapsed:,.0f} events/sec")
+
+    verify_session = session_maker()
+    async with verify_session:
+        result = await AuditService(verify_session).verify_chain()
+        print(f"chain valid: {result.is_valid} ({result.total_events} events)")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit append throughput benchmark")
+    parser.add_argument("--submitters", type=int, default=50)
+    parser.add_argument("--units", type=int, default=20)
+    parser.add_argument("--events-per-unit", type=int, default=8)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
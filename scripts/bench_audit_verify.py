@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Audit chain re-hash benchmark.
+
+Builds a synthetic hash chain in memory and times verification of it:
+
+- serial:   every segment re-hashed inline (verify_chain default)
+- parallel: segments re-hashed in a ProcessPoolExecutor and stitched at
+            their boundaries (verify_chain(parallel=True))
+
+No database is needed; this measures the CPU-bound part of verify_chain.
+
+Usage:
+    python3 scripts/bench_audit_verify.py [--events 200000] [--segment-size 5000] [--workers 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.audit import AuditEvent  # noqa: E402
+from app.services.audit_verify import verify_segment  # noqa: E402
+
+
+def build_chain(count: int) -> list:
+    """Build rows in audit_verify.SEGMENT_COLUMNS order."""
+    rows = []
+    prev_hash = None
+    start = datetime(2026, 1, 1)
+    for seq in range(1, count + 1):
+        event_id = str(uuid4())
+        timestamp = start + timedelta(milliseconds=seq)
+        entity_id = str(uuid4())
+        payload = {"amount": str(seq * 1000), "asset": "ETH", "step": seq % 8}
+        event_hash = AuditEvent.compute_hash(
+            event_id=event_id,
+            timestamp=timestamp,
+            event_type="TX_STATUS_CHANGED",
+            actor_id=None,
+            entity_type="TX_REQUEST",
+            entity_id=entity_id,
+            payload=payload,
+            prev_hash=prev_hash,
+        )
+        rows.append((
+            event_id, seq, timestamp, "TX_STATUS_CHANGED", None,
+            "TX_REQUEST", entity_id, payload, prev_hash, event_hash,
+        ))
+        prev_hash = event_hash
+    return rows
+
+
+def stitch(segments) -> int:
+    """Check segment boundaries, return the number of errors."""
+    errors = 0
+    prev_hash = None
+    for segment in segments:
+        if segment.first_prev_hash != prev_hash:
+            errors += 1
+        errors += len(segment.errors)
+        prev_hash = segment.last_hash
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit chain re-hash benchmark")
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--segment-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=0, help="0 = CPU count")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"Building {args.events} event chain...")
+    rows = build_chain(args.events)
+    segments = [rows[i:i + args.segment_size] for i in range(0, len(rows), args.segment_size)]
+
+    start = time.perf_counter()
+    errors = stitch(verify_segment(segment) for segment in segments)
+    serial = time.perf_counter() - start
+    print(f"  serial: {serial:.2f}s -> {args.events / serial:,.0f} events/sec (errors: {errors})")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Warm up the workers so process start-up is not timed
+        list(pool.map(verify_segment, [segments[0]] * workers))
+        start = time.perf_counter()
+        errors = stitch(pool.map(verify_segment, segments))
+        parallel = time.perf_counter() - start
+    print(f"parallel: {parallel:.2f}s -> {args.events / parallel:,.0f} events/sec "
+          f"({workers} workers, errors: {errors})")
+    print(f" speedup: {serial / parallel:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
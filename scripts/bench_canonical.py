@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Canonical encoding microbenchmark.
+
+Compares the legacy json.dumps(..., sort_keys=True, default=str) hashing of
+audit events and policy snapshots with app.canonical over payloads shaped
+like the ones logged by the orchestrator and KYT service, and checks that
+both produce identical hashes.
+
+Usage:
+    python3 scripts/bench_canonical.py [--iterations 200000]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.audit import AuditEvent, AuditEventType  # noqa: E402
+from app.models.policy_set import PolicyDecision, PolicyRule, PolicySet  # noqa: E402
+
+
+PAYLOADS = {
+    "TX_REQUEST_CREATED": {
+        "tx_type": "WITHDRAW",
+        "to_address": "0x742d35cc6634c0532925a3b844bc454e4438f44e",
+        "asset": "ETH",
+        "amount": str(Decimal("1.250000000000000000")),
+    },
+    "TX_STATUS_CHANGED": {"from_status": "SUBMITTED", "to_status": "POLICY_EVAL_PENDING"},
+    "TX_POLICY_EVALUATED": {
+        "decision": "ALLOW",
+        "matched_rules": ["RET-01", "RET-03"],
+        "policy_version": "Retail Policy v3",
+        "kyt_required": True,
+        "approval_required": True,
+        "approval_count": 1,
+    },
+    "TX_KYT_EVALUATED": {
+        "address": "0x742d35cc6634c0532925a3b844bc454e4438f44e",
+        "direction": "OUTBOUND",
+        "result": "ALLOW",
+        "reason": "Address not on any list",
+        "case_id": None,
+        "bitok_enabled": False,
+    },
+    "TX_CONFIRMED": {"tx_hash": "0x" + "ab" * 32, "block_number": 19000123, "confirmations": 3},
+}
+
+
+def _legacy_hash(event_id, timestamp, event_type, actor_id, entity_type, entity_id, payload, prev_hash):
+    data = {
+        "event_id": event_id,
+        "timestamp": timestamp.isoformat(),
+        "event_type": event_type,
+        "actor_id": actor_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "payload": payload,
+        "prev_hash": prev_hash,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _legacy_snapshot_hash(policy_set):
+    rules_data = [
+        {
+            "rule_id": r.rule_id,
+            "priority": r.priority,
+            "conditions": r.conditions,
+            "decision": r.decision.value,
+            "kyt_required": r.kyt_required,
+            "approval_required": r.approval_required,
+            "approval_count": r.approval_count,
+        }
+        for r in sorted(policy_set.rules, key=lambda x: x.priority)
+    ]
+    return hashlib.sha256(json.dumps(rules_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _policy_set():
+    rules = [
+        PolicyRule(
+            rule_id=f"RET-{i:02d}",
+            priority=i,
+            conditions={"amount_gt": str(Decimal(i) * 1000), "address_in": ["whitelist"]},
+            decision=PolicyDecision.ALLOW,
+            kyt_required=i % 2 == 0,
+            approval_required=i > 2,
+            approval_count=1 if i > 2 else 0,
+        )
+        for i in range(1, 7)
+    ]
+    return PolicySet(name="Retail Policy", version=3, rules=rules)
+
+
+def _report(name, legacy, fast, number):
+    legacy_time = min(timeit.repeat(legacy, number=number, repeat=3))
+    fast_time = min(timeit.repeat(fast, number=number, repeat=3))
+    print(f"{name:>22}: legacy {legacy_time / number * 1e6:6.2f} us  "
+          f"canonical {fast_time / number * 1e6:6.2f} us  "
+          f"speedup {legacy_time / fast_time:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical encoding microbenchmark")
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    timestamp = datetime.utcnow()
+    for event_type, payload in PAYLOADS.items():
+        args_ = (
+            str(uuid4()), timestamp, AuditEventType(event_type).value, str(uuid4()),
+            "TX_REQUEST", str(uuid4()), payload, "cd" * 32,
+        )
+        assert _legacy_hash(*args_) == AuditEvent.compute_hash(*args_), event_type
+        _report(
+            event_type,
+            lambda: _legacy_hash(*args_),
+            lambda: AuditEvent.compute_hash(*args_),
+            args.iterations,
+        )
+
+    policy_set = _policy_set()
+    assert _legacy_snapshot_hash(policy_set) == policy_set.compute_snapshot_hash()
+    _report(
+        "policy snapshot",
+        lambda: _legacy_snapshot_hash(policy_set),
+        policy_set.compute_snapshot_hash,
+        args.iterations // 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Ethereum RPC client latency benchmark.
+
+Runs concurrent simulated API requests against a local JSON-RPC stand-in
+(tests/rpc_stub.py, answering every HTTP request after --rpc-latency ms).
+Each request makes the RPC calls of a confirmation check plus a balance
+read (receipt, block number, balance). Reports p50/p99 request latency and
+the worst event loop stall for:
+
+- legacy: sync Web3(HTTPProvider), with a new ThreadPoolExecutor per
+          receipt/block call and get_balance blocking the loop (the
+          EthereumService call pattern before the async client)
+- async:  EthereumService on the shared AsyncWeb3 client and its keep-alive
+          connection pool
+
+No database or real node is needed.
+
+Usage:
+    python3 scripts/bench_rpc_client.py [--requests 400] [--concurrency 50] [--rpc-latency 20]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web3 import Web3  # noqa: E402
+from web3.exceptions import TransactionNotFound  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.services import ethereum  # noqa: E402
+from app.services.ethereum import EthereumService  # noqa: E402
+from tests.rpc_stub import RpcStub  # noqa: E402
+
+ADDRESS = "0x" + "1" * 40
+TX_HASH = "0x" + "ab" * 32
+
+
+class LegacyClient:
+    """The pre-async EthereumService call pattern."""
+
+    def __init__(self, rpc_url: str):
+        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+
+    async def _in_new_executor(self, fn):
+        loop = asyncio.get_event_loop()
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return await loop.run_in_executor(executor, fn)
+
+    async def get_transaction_receipt(self, tx_hash):
+        try:
+            return await self._in_new_executor(lambda: self.web3.eth.get_transaction_receipt(tx_hash))
+        except TransactionNotFound:
+            return None
+
+    async def get_block_number(self):
+        return await self._in_new_executor(lambda: self.web3.eth.block_number)
+
+    async def get_balance(self, address):
+        return self.web3.eth.get_balance(Web3.to_checksum_address(address))
+
+
+async def handle_request(client) -> float:
+    started = time.perf_counter()
+    await client.get_transaction_receipt(TX_HASH)
+    await client.get_block_number()
+    await client.get_balance(ADDRESS)
+    return time.perf_counter() - started
+
+
+async def loop_lag(stop: asyncio.Event, lags: list):
+    """Record how late a 10 ms timer fires; blocking calls show up here."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+
+
+async def run(mode: str, stub: RpcStub, requests: int, concurrency: int):
+    rpc_url = stub.url
+    stub.connections.clear()
+    semaphore = asyncio.Semaphore(concurrency)
+    legacy = LegacyClient(rpc_url) if mode == "legacy" else None
+
+    async def one():
+        async with semaphore:
+            # The API builds a new EthereumService per request
+            client = legacy or EthereumService(None, None)
+            return await handle_request(client)
+
+    stop = asyncio.Event()
+    lags: list = []
+    lag_task = asyncio.create_task(loop_lag(stop, lags))
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await lag_task
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(
+        f"{mode:>7}: p50 {p50:7.1f} ms  p99 {p99:7.1f} ms  "
+        f"{requests / elapsed:7.0f} req/s  max loop stall {max(lags, default=0) * 1000:6.1f} ms  "
+        f"{len(stub.connections)} connections"
+    )
+
+
+async def main_async(args):
+    with RpcStub(latency=args.rpc_latency / 1000) as stub:
+        settings = get_settings()
+        settings.eth_rpc_url = stub.url
+        print(
+            f"{args.requests} requests, {args.concurrency} concurrent, "
+            f"3 RPC calls each, {args.rpc_latency} ms RPC latency"
+        )
+        for mode in ("legacy", "async"):
+            await run(mode, stub, args.requests, args.concurrency)
+        await ethereum.close_async_web3()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ethereum RPC client latency benchmark")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rpc-latency", type=float, default=20.0, help="Milliseconds per RPC response")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Standalone transaction pipeline worker process.
+
+Consumes the orchestrator stage queue (tx_pipeline_jobs) with the given
+number of worker loops. Jobs are claimed with FOR UPDATE SKIP LOCKED, so
+throughput scales by starting more of these processes. Requires
+TX_PIPELINE_MODE=queue on the API nodes.
+
+Usage:
+    python3 scripts/run_pipeline_workers.py [--workers 4] [--poll-interval 0.5]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import async_session_maker  # noqa: E402
+from app.services.tx_pipeline import TxPipelineWorkerPool  # noqa: E402
+
+
+async def main(workers: int, poll_interval: float):
+    pool = TxPipelineWorkerPool(async_session_maker, workers, poll_interval)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(pool.stop()))
+    # Loops finish their current job and exit once stopped
+    await pool.start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None, help="Worker loops (default: tx_pipeline_workers)")
+    parser.add_argument("--poll-interval", type=float, default=None, help="Idle poll interval in seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(main(args.workers, args.poll_interval))
@@ -0,0 +1,129 @@
+"""Local JSON-RPC endpoint standing in for an Ethereum node."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class RpcStub:
+    """
+    Answers the eth_* calls EthereumService makes, on 127.0.0.1.
+
+    Every HTTP request is answered after `latency` seconds; JSON-RPC batches
+    (arrays) are answered in one response. `requests` records the methods
+    of each HTTP request and `connections` the client ports seen, so tests
+    can check batching and connection reuse. Blocks and receipts put in
+    `blocks` (by number) and `receipts` (by tx hash), as the node's JSON,
+    are served; anything else is null. Use as a context manager.
+
+    Faults can be injected at any time: `latency` slows the node down,
+    `status` answers every request with that HTTP status (503 for a node
+    that is down, 429 for rate limiting), `block_number` set behind the
+    other nodes makes it lag, and `send_error` rejects raw transactions
+    with that JSON-RPC error message. Raw transactions received are kept
+    in `raw_transactions`.
+    """
+
+    def __init__(self, latency: float = 0.0, block_number: int = 100, chain_id: int = 11155111):
+        self.latency = latency
+        self.block_number = block_number
+        self.chain_id = chain_id
+        self.status = 200
+        self.send_error: Optional[str] = None
+        self.raw_transactions: List[str] = []
+        self.nonces: Dict[str, int] = {}
+        self.blocks: Dict[int, Dict[str, Any]] = {}
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[List[str]] = []
+        self.connections: set = set()
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+            # Headers and body are separate writes; without this, Nagle and
+            # delayed ACKs add ~40 ms to each response on a kept-alive connection
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                calls = body if isinstance(body, list) else [body]
+                with stub._lock:
+                    stub.requests.append([call["method"] for call in calls])
+                    stub.connections.add(self.client_address[1])
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if stub.status != 200:
+                    self.send_response(stub.status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                responses = [stub._respond(call) for call in calls]
+                payload = json.dumps(responses if isinstance(body, list) else responses[0]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def _result(self, method: str, params: List[Any]) -> Optional[Any]:
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_gasPrice":
+            return hex(30_000_000_000)
+        if method == "eth_feeHistory":
+            return {
+                "oldestBlock": hex(self.block_number),
+                "baseFeePerGas": [hex(10_000_000_000), hex(11_000_000_000)],
+                "gasUsedRatio": [0.5],
+                "reward": [[hex(1_000_000_000), hex(2_000_000_000), hex(3_000_000_000)]],
+            }
+        if method == "eth_estimateGas":
+            return hex(21000)
+        if method == "eth_getTransactionCount":
+            with self._lock:
+                return hex(self.nonces.get(params[0].lower(), 0))
+        if method == "eth_getBalance":
+            return hex(10**18)
+        if method == "eth_sendRawTransaction":
+            with self._lock:
+                self.raw_transactions.append(params[0])
+            if self.send_error:
+                raise ValueError(self.send_error)
+            return "0x" + "ab" * 32
+        if method == "eth_getBlockByNumber":
+            return self.blocks.get(int(params[0], 16))
+        if method == "eth_getTransactionReceipt":
+            return self.receipts.get(params[0])
+        raise KeyError(method)
+
+    def _respond(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return {"jsonrpc": "2.0", "id": call["id"], "result": self._result(call["method"], call.get("params", []))}
+        except KeyError:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": str(e)}}
+
+    def __enter__(self) -> "RpcStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
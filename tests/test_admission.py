@@ -0,0 +1,87 @@
+"""Tests for transaction intake admission control."""
+import asyncio
+import pytest
+
+from app.config import get_settings
+from app.services.admission import AdmissionController, AdmissionRejected
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "tx_admission_max_concurrent", 2)
+    monkeypatch.setattr(settings, "tx_admission_max_per_tenant", 2)
+    monkeypatch.setattr(settings, "tx_admission_max_per_wallet", 1)
+    monkeypatch.setattr(settings, "tx_admission_max_queue", 1)
+    monkeypatch.setattr(settings, "tx_admission_queue_timeout", 0.2)
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_requests_queue_then_are_rejected_when_saturated(limits):
+    """Test that requests over a limit wait for a slot and are rejected once the queue is full."""
+    controller = AdmissionController("test")
+    release = asyncio.Event()
+    order = []
+
+    async def request(name, tenant, wallet):
+        async with controller.admit(tenant, [wallet]):
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(request("first", "t1", "w1"))
+    await asyncio.sleep(0)
+    # Same wallet: queued behind the first
+    second = asyncio.create_task(request("second", "t2", "w1"))
+    await asyncio.sleep(0)
+    assert controller.stats()["in_flight"] == 1
+    assert controller.stats()["queued"] == 1
+
+    # Queue full: rejected at once with a retry hint
+    with pytest.raises(AdmissionRejected) as exc_info:
+        async with controller.admit("t3", ["w1"]):
+            pass
+    assert exc_info.value.retry_after >= 1
+
+    # Other wallets still run while w1 is busy
+    async with controller.admit("t3", ["w2"]):
+        assert controller.stats()["in_flight"] == 2
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert order == ["first", "second"]
+    assert controller.stats()["in_flight"] == 0
+    assert controller.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_request_times_out(limits):
+    """Test that a request waiting longer than the queue timeout is rejected."""
+    controller = AdmissionController("test")
+    async with controller.admit("t1", ["w1"]):
+        with pytest.raises(AdmissionRejected):
+            async with controller.admit("t2", ["w1"]):
+                pass
+    stats = controller.stats()
+    assert (stats["queued"], stats["timed_out"], stats["in_flight"]) == (0, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_saturated_intake_returns_429(client, monkeypatch):
+    """Test that the API answers 429 with Retry-After and reports queue depth on /health."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "tx_admission_max_concurrent", 0)
+    monkeypatch.setattr(settings, "tx_admission_max_queue", 0)
+
+    response = await client.post("/v1/tx-requests", json={
+        "wallet_id": "00000000-0000-0000-0000-000000000000",
+        "tx_type": "TRANSFER",
+        "to_address": "0x" + "a" * 40,
+        "amount": "1",
+    })
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    health = (await client.get("/health")).json()
+    assert health["tx_admission"]["queued"] == 0
+    assert health["tx_admission"]["rejected"] >= 1
@@ -1,9 +1,28 @@
 """Unit tests for Audit hash chain."""
+import gzip
+import hashlib
+import json
 import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
 from uuid import uuid4
 
-from app.models.audit import AuditEvent, AuditEventType
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.audit import AuditEvent, AuditEventType, AuditArchiveSegment, AuditPackageCache
+from app.models.tx_request import TxRequest, TxStatus, TxType
 from app.services.audit import AuditService
+from app.services.audit_archive import INDEX_RECORD, _SegmentWriter, verify_index_file
+from app.services.audit_export import (
+    build_export_query,
+    export_values,
+    get_anchor,
+    stream_ndjson,
+    stream_columnar,
+)
+from app.services.audit_merkle import verify_inclusion
+from app.services.audit_verify import shutdown_verify_pool
 
 
 @pytest.mark.asyncio
@@ -53,6 +72,10 @@ async def test_audit_hash_chain_prev_hash(db_session):
         payload={"test": 1}
     )
     
+    # Chained when flushed (or right before the session commits)
+    assert event1.hash is None
+    await audit.flush()
+    
     # First event should have no prev_hash
     assert event1.prev_hash is None
     assert event1.hash is not None
@@ -66,6 +89,7 @@ async def test_audit_hash_chain_prev_hash(db_session):
         entity_id=str(uuid4()),
         payload={"test": 2}
     )
+    await db_session.commit()
     
     # Second event should reference first event's hash
     assert event2.prev_hash == event1.hash
@@ -121,3 +145,446 @@ async def test_audit_hash_computation(db_session):
     
     assert hash3 != hash1
 
+
+
+@pytest.mark.asyncio
+async def test_audit_batch_writes_chained_events(db_session):
+    """Test that events logged inside a batch are chained and written on exit."""
+    audit = AuditService(db_session)
+    correlation_id = f"test-{uuid4()}"
+    
+    first = await audit.log_event(
+        event_type=AuditEventType.TX_REQUEST_CREATED,
+        correlation_id=correlation_id,
+        entity_type="TX_REQUEST",
+        entity_id=str(uuid4()),
+    )
+    
+    async with audit.batch():
+        batched = []
+        for i in range(3):
+            batched.append(await audit.log_event(
+                event_type=AuditEventType.TX_STATUS_CHANGED,
+                correlation_id=correlation_id,
+                entity_type="TX_REQUEST",
+                entity_id=str(uuid4()),
+                payload={"step": i}
+            ))
+        # Nothing is hashed until the unit of work completes
+        assert all(e.hash is None for e in batched)
+    
+    assert batched[0].prev_hash == first.hash
+    assert batched[1].prev_hash == batched[0].hash
+    assert batched[2].prev_hash == batched[1].hash
+    assert [e.sequence_number for e in batched] == sorted(e.sequence_number for e in batched)
+    
+    await db_session.commit()
+    
+    result = await audit.verify_chain()
+    assert result.is_valid
+    assert result.total_events == 4
+
+
+@pytest.mark.asyncio
+async def test_audit_unbatched_events_are_discarded_on_rollback(db_session):
+    """Test that an event logged before a rollback is not written by a later commit."""
+    audit = AuditService(db_session)
+    
+    # No SQL runs between the event and the rollback
+    await audit.log_event(event_type=AuditEventType.WALLET_CREATED, correlation_id="rolled-back")
+    await db_session.rollback()
+    await audit.log_event(event_type=AuditEventType.WALLET_CREATED, correlation_id="kept")
+    await db_session.commit()
+    
+    result = await db_session.execute(select(AuditEvent.correlation_id).order_by(AuditEvent.sequence_number))
+    assert result.scalars().all() == ["kept"]
+    assert (await audit.verify_chain()).is_valid
+
+
+@pytest.mark.asyncio
+async def test_audit_incremental_verification_resumes_from_checkpoint(db_session):
+    """Test that incremental verification only walks events after the last checkpoint."""
+    audit = AuditService(db_session)
+    correlation_id = f"test-{uuid4()}"
+    
+    for i in range(3):
+        await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": i}
+        )
+    
+    # Full walk records a checkpoint at the tail
+    full = await audit.verify_chain(incremental=True)
+    assert full.is_valid
+    assert full.total_events == 3
+    assert full.checkpoint_id is not None
+    
+    for i in range(2):
+        await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": 3 + i}
+        )
+    
+    delta = await audit.verify_chain(incremental=True)
+    assert delta.is_valid
+    assert delta.total_events == 2
+    assert delta.resumed_from_sequence == full.last_sequence_number
+    
+    # Forged checkpoints are rejected and the chain is walked from genesis
+    checkpoint = await audit.get_latest_checkpoint()
+    checkpoint.signature = "0" * 64
+    await db_session.flush()
+    
+    forged = await audit.verify_chain(incremental=True)
+    assert not forged.is_valid
+    assert forged.total_events == 5
+    assert "invalid signature" in forged.errors[0]
+
+
+@pytest.mark.asyncio
+async def test_audit_parallel_verification_detects_boundary_tampering(db_session, monkeypatch):
+    """Test that parallel verification stitches segments and catches broken links."""
+    audit = AuditService(db_session)
+    monkeypatch.setattr(audit.settings, "audit_verify_chunk_size", 2)
+    correlation_id = f"test-{uuid4()}"
+    
+    events = []
+    for i in range(5):
+        events.append(await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": i}
+        ))
+    
+    try:
+        serial = await audit.verify_chain()
+        parallel = await audit.verify_chain(parallel=True)
+        assert parallel.is_valid
+        assert parallel.total_events == serial.total_events == 5
+        assert parallel.last_event_id == events[-1].id
+        
+        # Event 3 opens the second segment; break its link to event 2
+        await db_session.execute(
+            update(AuditEvent).where(AuditEvent.id == events[2].id).values(prev_hash="0" * 64)
+        )
+        
+        tampered = await audit.verify_chain(parallel=True)
+        assert not tampered.is_valid
+        assert any(events[2].id in e and "prev_hash mismatch" in e for e in tampered.errors)
+    finally:
+        shutdown_verify_pool()
+
+
+@pytest.mark.asyncio
+async def test_audit_merkle_batches_prove_event_inclusion(db_session, monkeypatch):
+    """Test that anchored events carry inclusion proofs verifiable against batch roots."""
+    audit = AuditService(db_session)
+    monkeypatch.setattr(audit.settings, "audit_merkle_batch_size", 4)
+    correlation_id = f"test-{uuid4()}"
+    
+    events = []
+    for i in range(7):
+        events.append(await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": i}
+        ))
+    
+    # Only the full batch is due; the trailing 3 events are still recent
+    assert await audit.seal_merkle_batches(force=True, max_batches=0) == []
+    batches = await audit.seal_merkle_batches()
+    assert [b.event_count for b in batches] == [4]
+    
+    batches += await audit.seal_merkle_batches(force=True)
+    assert [b.event_count for b in batches] == [4, 3]
+    
+    proofs = await audit.get_inclusion_proofs(events)
+    assert [p.event_id for p in proofs] == [e.id for e in events]
+    for proof in proofs:
+        path = [step.model_dump() for step in proof.path]
+        assert len(path) <= 2
+        assert verify_inclusion(proof.event_hash, path, proof.merkle_root)
+    
+    # A proof does not transfer to a different event
+    other = [step.model_dump() for step in proofs[0].path]
+    assert not verify_inclusion(events[1].hash, other, proofs[0].merkle_root)
+
+
+@pytest.mark.asyncio
+async def test_audit_export_is_verifiable_offline(db_engine, db_session):
+    """Test that exported events can be re-hashed and chained without the database."""
+    audit = AuditService(db_session)
+    correlation_id = f"test-{uuid4()}"
+    for i in range(5):
+        await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": i, "amount": "1.5"}
+        )
+    await db_session.commit()
+    
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    query = build_export_query(from_sequence=2)
+    anchor = await get_anchor(db_session, query)
+    
+    lines = b"".join([c async for c in stream_ndjson(session_maker, query, chunk_size=2)])
+    rows = [json.loads(line) for line in lines.splitlines()]
+    assert [r["sequence_number"] for r in rows] == [2, 3, 4, 5]
+    
+    prev_hash = anchor["hash"]
+    for row in rows:
+        assert row["prev_hash"] == prev_hash
+        canonical = json.dumps({
+            "event_id": row["event_id"],
+            "timestamp": row["timestamp"],
+            "event_type": row["event_type"],
+            "actor_id": row["actor_id"],
+            "entity_type": row["entity_type"],
+            "entity_id": row["entity_id"],
+            "payload": row["payload"],
+            "prev_hash": row["prev_hash"],
+        }, sort_keys=True)
+        assert hashlib.sha256(canonical.encode()).hexdigest() == row["hash"]
+        prev_hash = row["hash"]
+    
+    # Columnar export carries the same events
+    data = b"".join([c async for c in stream_columnar(session_maker, query, chunk_size=2)])
+    blocks = [json.loads(line) for line in gzip.decompress(data).splitlines()]
+    assert [b["count"] for b in blocks] == [2, 2]
+    assert sum((b["columns"]["hash"] for b in blocks), []) == [r["hash"] for r in rows]
+
+
+@pytest.mark.asyncio
+async def test_audit_archived_segment_anchors_live_chain(db_session, tmp_path):
+    """Test that sealed segments verify offline and anchor verification of the live table."""
+    audit = AuditService(db_session)
+    correlation_id = f"test-{uuid4()}"
+    for i in range(4):
+        await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+            payload={"index": i}
+        )
+    
+    await audit.flush()
+    
+    # Seal the first two events the way the archiver does
+    result = await db_session.execute(build_export_query(to_sequence=2))
+    writer = _SegmentWriter(str(tmp_path / "seg.ndjson.gz"), str(tmp_path / "seg.idx"), None)
+    writer.write_chunk([export_values(row) for row in result.all()])
+    writer.close()
+    data_sha256, index_sha256 = writer.verify()
+    
+    await db_session.execute(delete(AuditEvent).where(AuditEvent.sequence_number <= 2))
+    db_session.add(AuditArchiveSegment(
+        partition_name="audit_events_p202601",
+        from_time=datetime(2026, 1, 1),
+        to_time=datetime(2026, 2, 1),
+        from_sequence=writer.first_sequence,
+        to_sequence=writer.last_sequence,
+        event_count=writer.count,
+        first_prev_hash=None,
+        last_hash=writer.prev_hash,
+        last_timestamp=datetime.fromisoformat(writer.last_timestamp),
+        data_path=writer.data_path,
+        data_sha256=data_sha256,
+        index_path=writer.index_path,
+        index_sha256=index_sha256,
+    ))
+    await db_session.flush()
+    
+    live = await audit.verify_chain()
+    assert live.is_valid
+    assert live.total_events == 2
+    
+    # Queries reaching into the archived range say so
+    assert await audit.archived_through() == 2
+    assert await audit.archived_through(after_sequence=2) is None
+    assert await audit.archived_through(from_time=datetime(2026, 2, 1)) is None
+    
+    # Tampering with the index breaks the mmap continuity check
+    with open(writer.index_path, "r+b") as f:
+        f.seek(INDEX_RECORD.size + 8)
+        f.write(b"\xff")
+    with pytest.raises(ValueError, match="prev_hash mismatch"):
+        verify_index_file(writer.index_path, None)
+
+
+@pytest.mark.asyncio
+async def test_audit_timestamps_never_decrease_along_chain(db_session):
+    """Test that events stamped before the chain tail are clamped to it."""
+    audit = AuditService(db_session)
+    correlation_id = f"test-{uuid4()}"
+    
+    async with audit.batch():
+        later = await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+        )
+        earlier = await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=correlation_id,
+        )
+        earlier.timestamp = later.timestamp - timedelta(minutes=5)
+    
+    assert earlier.timestamp == later.timestamp
+    assert (await audit.verify_chain()).is_valid
+
+
+@pytest.mark.asyncio
+async def test_audit_package_cached_for_terminal_tx(db_session):
+    """Test that terminal tx packages are cached and rebuilt only when new events appear."""
+    audit = AuditService(db_session)
+    tx = TxRequest(
+        id=str(uuid4()),
+        wallet_id=str(uuid4()),
+        tx_type=TxType.TRANSFER,
+        to_address="0x" + "c" * 40,
+        asset="ETH",
+        amount=Decimal("1.0"),
+        status=TxStatus.POLICY_BLOCKED,
+        created_by=str(uuid4())
+    )
+    db_session.add(tx)
+    
+    async with audit.batch():
+        await audit.log_event(
+            event_type=AuditEventType.TX_POLICY_EVALUATED,
+            correlation_id=f"test-{uuid4()}",
+            entity_type="TX_REQUEST",
+            entity_id=tx.id,
+            payload={"decision": "BLOCK"}
+        )
+        await audit.queue_package_cache(tx.id)
+    
+    cached = await db_session.get(AuditPackageCache, tx.id)
+    assert cached is not None
+    
+    first = await audit.get_audit_package(tx.id, "c1")
+    second = await audit.get_audit_package(tx.id, "c2")
+    assert first.package_hash == second.package_hash == cached.package_hash
+    
+    # A late event for the tx invalidates the cached package
+    await audit.log_event(
+        event_type=AuditEventType.TX_STATUS_CHANGED,
+        correlation_id=f"test-{uuid4()}",
+        entity_type="TX_REQUEST",
+        entity_id=tx.id,
+    )
+    rebuilt = await audit.get_audit_package(tx.id, "c3")
+    assert rebuilt.package_hash != first.package_hash
+    assert len(rebuilt.audit_events) == 2
+    
+    # Sealing the events into a Merkle batch drops the proofless package
+    assert rebuilt.inclusion_proofs == []
+    assert await audit.seal_merkle_batches(force=True)
+    result = await db_session.execute(select(AuditPackageCache).where(AuditPackageCache.tx_request_id == tx.id))
+    assert result.scalar_one_or_none() is None
+    anchored = await audit.get_audit_package(tx.id, "c4")
+    assert len(anchored.inclusion_proofs) == 2
+
+
+@pytest.mark.asyncio
+async def test_audit_outbox_mode_defers_chaining_to_hasher(db_session, monkeypatch):
+    """Test that outbox-mode events are chained by the hasher and reported until then."""
+    audit = AuditService(db_session)
+    monkeypatch.setattr(audit.settings, "audit_chain_mode", "outbox")
+    correlation_id = f"test-{uuid4()}"
+    
+    async with audit.batch():
+        for i in range(5):
+            event = await audit.log_event(
+                event_type=AuditEventType.WALLET_CREATED,
+                correlation_id=correlation_id,
+                entity_type="WALLET",
+                entity_id=str(uuid4()),
+                payload={"index": i}
+            )
+    assert event.hash is None
+    
+    pending = await audit.verify_chain()
+    assert pending.is_valid
+    assert pending.total_events == 0
+    assert pending.pending_outbox_events == 5
+    
+    assert await audit.drain_outbox(limit=3) == 3
+    assert await audit.drain_outbox(limit=3) == 2
+    
+    drained = await audit.verify_chain()
+    assert drained.is_valid
+    assert drained.total_events == 5
+    assert drained.pending_outbox_events == 0
+
+
+@pytest.mark.asyncio
+async def test_audit_trace_pages_by_sequence(client, db_session):
+    """Test trace reconstruction across entities and keyset search pagination."""
+    audit = AuditService(db_session)
+    correlation_id = f"trace-{uuid4()}"
+    tx_id, case_id = str(uuid4()), str(uuid4())
+    
+    async with audit.batch():
+        await audit.log_event(
+            event_type=AuditEventType.TX_REQUEST_CREATED,
+            correlation_id=correlation_id,
+            entity_type="TX_REQUEST",
+            entity_id=tx_id,
+        )
+        await audit.log_event(
+            event_type=AuditEventType.WALLET_CREATED,
+            correlation_id=f"other-{uuid4()}",
+            entity_type="WALLET",
+            entity_id=str(uuid4()),
+        )
+        await audit.log_event(
+            event_type=AuditEventType.KYT_CASE_CREATED,
+            correlation_id=correlation_id,
+            entity_type="KYT_CASE",
+            entity_id=case_id,
+        )
+        await audit.log_event(
+            event_type=AuditEventType.TX_STATUS_CHANGED,
+            correlation_id=correlation_id,
+            entity_type="TX_REQUEST",
+            entity_id=tx_id,
+        )
+    await db_session.commit()
+    
+    response = await client.get(f"/v1/audit/traces/{correlation_id}", params={"limit": 2})
+    assert response.status_code == 200
+    first = response.json()["data"]
+    assert [e["event_type"] for e in first["events"]] == ["TX_REQUEST_CREATED", "KYT_CASE_CREATED"]
+    assert first["entities"] == {"TX_REQUEST": [tx_id], "KYT_CASE": [case_id]}
+    assert first["has_more"]
+    
+    response = await client.get(
+        f"/v1/audit/traces/{correlation_id}",
+        params={"limit": 2, "after_sequence": first["next_after_sequence"]}
+    )
+    second = response.json()["data"]
+    assert [e["event_type"] for e in second["events"]] == ["TX_STATUS_CHANGED"]
+    assert not second["has_more"]
+    assert second["next_after_sequence"] is None
+    
+    response = await client.get("/v1/audit/events", params={
+        "trace_id": correlation_id,
+        "event_type": ["TX_REQUEST_CREATED", "TX_STATUS_CHANGED"],
+    })
+    assert [e["entity_id"] for e in response.json()["data"]["items"]] == [tx_id, tx_id]
+    
+    response = await client.get("/v1/audit/events", params={"payload": "[1]"})
+    assert response.status_code == 400
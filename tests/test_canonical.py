@@ -0,0 +1,60 @@
+"""Unit tests for canonical JSON encoding."""
+import enum
+import hashlib
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from app.canonical import RecordEncoder, canonical_dumps
+from app.models.audit import AuditEvent, AuditEventType
+
+
+class _Level(int, enum.Enum):
+    LOW = 1
+
+
+SAMPLE_VALUES = [
+    None, True, False, 0, -17, 2**70, 1.5, float("inf"), "plain", "ünïcødé \"quoted\"\n",
+    Decimal("1000000000000000.000000001"), datetime(2026, 1, 2, 3, 4, 5, 678901),
+    AuditEventType.TX_SIGNED, _Level.LOW, uuid4(),
+    {"b": [1, {"z": None, "a": Decimal("0.1")}], "a": "x"}, [], {},
+]
+
+
+def _reference(obj) -> str:
+    return json.dumps(obj, sort_keys=True, default=str)
+
+
+def test_canonical_dumps_matches_json_dumps():
+    """Test that canonical_dumps is byte-identical to json.dumps(sort_keys, default=str)."""
+    for value in SAMPLE_VALUES:
+        assert canonical_dumps(value) == _reference(value)
+    assert canonical_dumps(SAMPLE_VALUES) == _reference(SAMPLE_VALUES)
+
+
+def test_record_encoder_matches_json_dumps():
+    """Test that the fixed-key fast path is byte-identical for any value types."""
+    keys = ("prev_hash", "event_id", "payload", "actor_id", "Zeta", "ünï")
+    encoder = RecordEncoder(*keys)
+    for i, value in enumerate(SAMPLE_VALUES):
+        values = [SAMPLE_VALUES[(i + k) % len(SAMPLE_VALUES)] for k in range(len(keys))]
+        assert encoder.encode(*values) == _reference(dict(zip(keys, values)))
+    assert RecordEncoder().encode() == _reference({})
+
+
+def test_audit_hash_unchanged():
+    """Test that compute_hash still hashes the legacy json.dumps encoding."""
+    fields = {
+        "event_id": str(uuid4()),
+        "timestamp": datetime(2026, 10, 16, 12, 0, 0, 123456),
+        "event_type": AuditEventType.TX_KYT_EVALUATED.value,
+        "actor_id": None,
+        "entity_type": "TX_REQUEST",
+        "entity_id": str(uuid4()),
+        "payload": {"amount": Decimal("1.25"), "matched_rules": ["R1", "R2"], "bitok_enabled": False},
+        "prev_hash": "ab" * 32,
+    }
+    legacy = dict(fields, timestamp=fields["timestamp"].isoformat())
+    expected = hashlib.sha256(_reference(legacy).encode()).hexdigest()
+    assert AuditEvent.compute_hash(**fields) == expected
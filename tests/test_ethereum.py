@@ -0,0 +1,232 @@
+"""Tests for the Ethereum RPC service."""
+import asyncio
+import time
+
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.tx_request import TxRequest, TxType, TxStatus
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.services import ethereum
+from app.services.audit import AuditService
+from app.services.chain_listener import ChainListener
+from app.services.ethereum import EthereumService
+from tests.rpc_stub import RpcStub
+
+SIGNER = "0x" + "1" * 40
+RECIPIENT = "0x" + "c" * 40
+RPC_DELAY = 0.2
+
+
+class SlowEth:
+    """Stand-in for AsyncWeb3.eth answering every call after RPC_DELAY."""
+
+    def __init__(self):
+        self.block = 100
+        self.calls = []
+
+    async def _call(self, name, result):
+        self.calls.append(name)
+        await asyncio.sleep(RPC_DELAY)
+        return result
+
+    @property
+    def chain_id(self):
+        return self._call("chain_id", 1)
+
+    @property
+    def block_number(self):
+        return self._call("block_number", self.block)
+
+    @property
+    def gas_price(self):
+        return self._call("gas_price", 30)
+
+    def fee_history(self, blocks, newest, percentiles):
+        return self._call("fee_history", {"baseFeePerGas": [10], "reward": [[1, 2, 3]]})
+
+    def estimate_gas(self, tx):
+        return self._call("estimate_gas", 21000)
+
+    def get_transaction_count(self, address, block):
+        return self._call("get_transaction_count", 7)
+
+
+class SlowWeb3:
+    def __init__(self):
+        self.eth = SlowEth()
+
+
+@pytest.mark.asyncio
+async def test_signing_context_fetches_concurrently_and_reuses_fees(db_session, monkeypatch):
+    """Test that signing data is fetched concurrently and fees once per block."""
+    monkeypatch.setattr(ethereum, "_chain_ids", {})
+    monkeypatch.setattr(ethereum, "_fee_snapshots", {})
+    web3 = SlowWeb3()
+
+    async def get_async_web3(rpc_url):
+        return web3
+
+    monkeypatch.setattr(ethereum, "get_async_web3", get_async_web3)
+    service = EthereumService(db_session, None)
+
+    started = time.perf_counter()
+    context = await service.get_signing_context(SIGNER, RECIPIENT, 1, tx_request_id=str(uuid4()))
+    elapsed = time.perf_counter() - started
+
+    # Two rounds (chain ID/nonce/estimate/block, then fee history/gas price)
+    assert elapsed < 4 * RPC_DELAY
+    assert context.chain_id == 1
+    assert context.nonce == 7
+    assert context.gas_limit == 25200
+    assert context.block_number == 100
+    assert context.fees["max_fee"] == 22
+    assert context.fee_snapshot_reused is False
+    assert set(context.latency_ms) == {"chain_id", "nonce", "estimate_gas", "block_number", "fees"}
+
+    # Same block: fees come from the snapshot, chain ID from the cache
+    web3.eth.calls.clear()
+    context = await service.get_signing_context(SIGNER, RECIPIENT, 1, tx_request_id=str(uuid4()))
+    assert context.fee_snapshot_reused is True
+    assert context.nonce == 8
+    assert sorted(web3.eth.calls) == ["block_number", "estimate_gas", "get_transaction_count"]
+
+    # New block: fees are fetched again
+    web3.eth.block = 101
+    context = await service.get_signing_context(SIGNER, RECIPIENT, 1, tx_request_id=str(uuid4()))
+    assert context.fee_snapshot_reused is False
+    assert context.block_number == 101
+
+
+@pytest.mark.asyncio
+async def test_services_share_one_pooled_async_client(db_session, monkeypatch):
+    """Test that per-request services reuse one client and its keep-alive connections."""
+    with RpcStub(latency=0.1) as stub:
+        monkeypatch.setattr(get_settings(), "eth_rpc_url", stub.url)
+        monkeypatch.setattr(get_settings(), "eth_rpc_pool_size", 4)
+        monkeypatch.setattr(ethereum, "_clients", {})
+        try:
+            services = [EthereumService(db_session, None) for _ in range(3)]
+            assert len({id(service.pool) for service in services}) == 1
+            assert await ethereum.get_async_web3(stub.url) is await ethereum.get_async_web3(stub.url)
+
+            started = time.perf_counter()
+            blocks = await asyncio.gather(*(
+                service.get_block_number() for service in services for _ in range(8)
+            ))
+            elapsed = time.perf_counter() - started
+
+            assert blocks == [100] * 24
+            # Calls overlap on the event loop, over at most pool-size connections
+            assert elapsed < 24 * stub.latency / 2
+            assert len(stub.connections) <= 4
+        finally:
+            await ethereum.close_async_web3()
+
+
+def stub_block(number, transactions=()):
+    """A block as the node's JSON, with full transactions."""
+    return {
+        "number": hex(number),
+        "hash": "0x" + f"{number:064x}",
+        "timestamp": hex(1_700_000_000 + number * 12),
+        "transactions": [
+            {
+                "hash": "0x" + f"{number:02x}{i:02x}" * 16,
+                "from": "0x" + "f" * 40,
+                "to": to,
+                "value": hex(value),
+                "blockNumber": hex(number),
+            }
+            for i, (to, value) in enumerate(transactions)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_block_scan_is_one_batched_round_trip(db_session, monkeypatch):
+    """Test that a deposit scan fetches its whole block range in one JSON-RPC batch."""
+    with RpcStub() as stub:
+        monkeypatch.setattr(get_settings(), "eth_rpc_url", stub.url)
+        monkeypatch.setattr(ethereum, "_clients", {})
+        stub.blocks = {n: stub_block(n) for n in range(91, 101)}
+        stub.blocks[93] = stub_block(93, [(SIGNER, 5), (RECIPIENT, 7)])
+        stub.blocks[97] = stub_block(97, [(SIGNER.upper().replace("0X", "0x"), 9), (SIGNER, 0)])
+        try:
+            service = EthereumService(db_session, None)
+            transfers, last_block = await service.get_incoming_transfers([SIGNER], 91, 100)
+
+            assert stub.requests == [["eth_getBlockByNumber"] * 10]
+            assert last_block == 100
+            assert [(t["block_number"], t["value"]) for t in transfers] == [(93, 5), (97, 9)]
+            assert transfers[0]["tx_hash"] == "0x" + "5d00" * 16
+            assert transfers[0]["block_timestamp"] == 1_700_000_000 + 93 * 12
+
+            # A block the node does not have ends the scan before it
+            del stub.blocks[97]
+            transfers, last_block = await service.get_incoming_transfers([SIGNER], 91, 100)
+            assert ([t["block_number"] for t in transfers], last_block) == ([93], 96)
+
+            # Larger ranges are split into batches of eth_rpc_batch_size
+            monkeypatch.setattr(get_settings(), "eth_rpc_batch_size", 4)
+            stub.requests.clear()
+            assert len(await service.get_blocks(range(91, 101))) == 10
+            assert sorted(len(r) for r in stub.requests) == [2, 4, 4]
+        finally:
+            await ethereum.close_async_web3()
+
+
+@pytest.mark.asyncio
+async def test_confirmation_check_batches_receipts(db_engine, db_session, test_user, monkeypatch):
+    """Test that the chain listener fetches all receipts in one batch and the head once."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address=SIGNER,
+        wallet_type=WalletType.RETAIL,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    txs = [
+        TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address=RECIPIENT,
+            asset="ETH",
+            amount=Decimal(1000),
+            status=TxStatus.CONFIRMING,
+            tx_hash="0x" + f"{i:02x}" * 32,
+            created_by=test_user.id,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all([wallet, *txs])
+    await db_session.commit()
+
+    with RpcStub(block_number=100) as stub:
+        monkeypatch.setattr(get_settings(), "eth_rpc_url", stub.url)
+        monkeypatch.setattr(get_settings(), "confirmation_blocks", 3)
+        monkeypatch.setattr(ethereum, "_clients", {})
+        # Deep enough, one confirmation short, not mined
+        stub.receipts[txs[0].tx_hash] = {"status": "0x1", "blockNumber": hex(90), "gasUsed": hex(21000)}
+        stub.receipts[txs[1].tx_hash] = {"status": "0x1", "blockNumber": hex(99), "gasUsed": hex(21000)}
+        try:
+            listener = ChainListener(async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False))
+            audit = AuditService(db_session)
+            async with audit.batch():
+                await listener._check_confirmations(db_session, audit, EthereumService(db_session, audit))
+            await db_session.commit()
+        finally:
+            await ethereum.close_async_web3()
+
+    assert stub.requests == [["eth_getTransactionReceipt"] * 3, ["eth_blockNumber"]]
+    assert [(tx.status, tx.confirmations, tx.block_number) for tx in txs] == [
+        (TxStatus.FINALIZED, 11, 90),
+        (TxStatus.CONFIRMING, 2, 99),
+        (TxStatus.CONFIRMING, 0, None),
+    ]
@@ -0,0 +1,65 @@
+"""Tests for the status event stream."""
+import pytest
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from app.models.audit import AuditEvent, AuditEventType
+from app.services.audit import AuditService
+from app.services.event_stream import event_bus, replay_events
+
+WALLET_A = str(uuid4())
+WALLET_B = str(uuid4())
+
+
+async def log_status(audit, wallet_id, new_status):
+    return await audit.log_event(
+        event_type=AuditEventType.TX_STATUS_CHANGED,
+        correlation_id=f"test-{uuid4()}",
+        actor_type="SYSTEM",
+        entity_type="TX_REQUEST",
+        entity_id=str(uuid4()),
+        entity_refs={"wallet_id": wallet_id},
+        payload={"old_status": "SIGNED", "new_status": new_status},
+    )
+
+
+@pytest.mark.asyncio
+async def test_events_publish_on_commit_and_replay_by_sequence(db_session):
+    """Test that subscribers get committed changes for their wallets and can replay."""
+    audit = AuditService(db_session)
+    subscription = event_bus.subscribe({WALLET_A})
+    try:
+        # Rolled back before any SQL ran: neither delivered nor chained
+        event_bus.publish_after_commit(db_session, await log_status(audit, WALLET_A, "BROADCAST_PENDING"))
+        await db_session.rollback()
+
+        first = await log_status(audit, WALLET_A, "CONFIRMING")
+        event_bus.publish_after_commit(db_session, first)
+        event_bus.publish_after_commit(db_session, await log_status(audit, WALLET_B, "CONFIRMING"))
+        assert subscription.queue.empty()
+        await db_session.commit()
+
+        assert subscription.queue.qsize() == 1
+        stream_event = subscription.queue.get_nowait()
+        assert stream_event.type == "tx_status"
+        assert stream_event.status == "CONFIRMING"
+        assert stream_event.wallet_id == WALLET_A
+        assert stream_event.sequence == first.sequence_number
+        assert stream_event.to_sse().startswith(f"id: {first.sequence_number}\nevent: tx_status\n")
+    finally:
+        event_bus.unsubscribe(subscription)
+
+    second = await log_status(audit, WALLET_A, "FINALIZED")
+    await db_session.commit()
+
+    result = await db_session.execute(select(AuditEvent.payload).order_by(AuditEvent.sequence_number))
+    assert [p["new_status"] for p in result.scalars().all()] == ["CONFIRMING", "CONFIRMING", "FINALIZED"]
+
+    events, cursor = await replay_events(db_session, first.sequence_number, {WALLET_A})
+    assert [(e.status, e.sequence) for e in events] == [("FINALIZED", second.sequence_number)]
+    assert cursor is None
+
+    events, cursor = await replay_events(db_session, 0, None, limit=2)
+    assert [e.status for e in events] == ["CONFIRMING", "CONFIRMING"]
+    assert cursor == events[-1].sequence
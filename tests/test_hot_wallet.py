@@ -0,0 +1,214 @@
+"""Tests for the nonce-pipelined hot wallet sender."""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.mempool import MempoolTx, MempoolTxKind, MempoolTxStatus
+from app.models.tx_request import TxRequest, TxType, TxStatus
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.services.ethereum import EthereumService
+from app.services.hot_wallet import HotWalletSender
+
+GWEI = 10**9
+
+
+@pytest.mark.asyncio
+async def test_sender_pipelines_nonces_and_unsticks(db_engine, db_session, test_user, monkeypatch):
+    """Test that the sender keeps K nonces in flight, bumps stuck ones, then cancels them."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    db_session.add(wallet)
+    txs = [
+        TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            asset="ETH",
+            amount=Decimal("1000"),
+            status=TxStatus.SIGN_PENDING,
+            created_by=test_user.id,
+            created_at=datetime.utcnow() - timedelta(minutes=3 - i),
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(txs)
+    await db_session.commit()
+
+    chain = {"latest": 0, "mined": set(), "sent": []}
+
+    async def transaction_count(self, address, block="pending"):
+        return chain["latest"]
+
+    async def chain_id(self):
+        return 1
+
+    async def gas_price(self):
+        return {"base_fee": 10 * GWEI, "max_priority_fee": GWEI, "max_fee": 21 * GWEI, "legacy_gas_price": 11 * GWEI}
+
+    async def estimate_gas(self, from_address, to_address, value, data=None):
+        return 21000
+
+    async def broadcast(self, signed_tx, tx_request_id, correlation_id):
+        chain["sent"].append(tx_request_id)
+        return "0x" + "0" * 64
+
+    async def receipts(self, tx_hashes):
+        return [{"blockNumber": 7} if h in chain["mined"] else None for h in tx_hashes]
+
+    monkeypatch.setattr(EthereumService, "get_transaction_count", transaction_count)
+    monkeypatch.setattr(EthereumService, "get_chain_id", chain_id)
+    monkeypatch.setattr(EthereumService, "get_gas_price", gas_price)
+    monkeypatch.setattr(EthereumService, "estimate_gas", estimate_gas)
+    monkeypatch.setattr(EthereumService, "broadcast_transaction", broadcast)
+    monkeypatch.setattr(EthereumService, "get_transaction_receipts", receipts)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "hot_wallet_max_in_flight", 2)
+    monkeypatch.setattr(settings, "hot_wallet_max_replacements", 1)
+
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    sender = HotWalletSender(session_maker)
+
+    async def versions():
+        async with session_maker() as session:
+            result = await session.execute(select(MempoolTx).order_by(MempoolTx.id))
+            return result.scalars().all()
+
+    async def status(tx):
+        async with session_maker() as session:
+            return (await session.get(TxRequest, tx.id)).status
+
+    # Two slots: the two oldest go out with consecutive nonces, the third waits
+    assert await sender.run_once() == {"sent": 2}
+    first = await versions()
+    assert [(v.nonce, v.kind) for v in first] == [(0, MempoolTxKind.ORIGINAL), (1, MempoolTxKind.ORIGINAL)]
+    assert [await status(tx) for tx in txs] == [TxStatus.CONFIRMING, TxStatus.CONFIRMING, TxStatus.SIGN_PENDING]
+    assert await sender.run_once() == {}
+
+    # Nonce 0 is mined, nonce 1 is stuck: it is re-signed with higher fees and the third fills the slot
+    monkeypatch.setattr(settings, "hot_wallet_stuck_after", 0)
+    chain["latest"], chain["mined"] = 1, {first[0].tx_hash}
+    assert await sender.run_once() == {"mined": 1, "replacement": 1, "sent": 1}
+    replacement = (await versions())[2]
+    assert (replacement.nonce, replacement.kind) == (1, MempoolTxKind.REPLACEMENT)
+    assert replacement.max_fee_per_gas >= first[1].max_fee_per_gas * Decimal("1.12")
+    assert replacement.max_priority_fee_per_gas >= first[1].max_priority_fee_per_gas * Decimal("1.12")
+    assert (await versions())[3].nonce == 2
+
+    # Past the replacement limit the stuck nonce is cancelled
+    counts = await sender.run_once()
+    assert counts == {"cancellation": 1, "replacement": 1}
+    cancellation = next(v for v in await versions() if v.kind == MempoolTxKind.CANCELLATION)
+    assert cancellation.nonce == 1
+    assert chain["sent"].count(txs[1].id) == 3
+
+    # The cancellation is mined: the transaction is CANCELLED, its other versions REPLACED
+    monkeypatch.setattr(settings, "hot_wallet_stuck_after", 3600)
+    chain["latest"], chain["mined"] = 2, {cancellation.tx_hash}
+    assert await sender.run_once() == {"cancelled": 1}
+    assert await status(txs[1]) == TxStatus.CANCELLED
+    at_nonce_1 = {v.kind: v.status for v in await versions() if v.nonce == 1}
+    assert at_nonce_1 == {
+        MempoolTxKind.ORIGINAL: MempoolTxStatus.REPLACED,
+        MempoolTxKind.REPLACEMENT: MempoolTxStatus.REPLACED,
+        MempoolTxKind.CANCELLATION: MempoolTxStatus.MINED,
+    }
+
+    # A mined replacement becomes the transaction's hash for the chain listener
+    bumped = next(v for v in await versions() if v.nonce == 2 and v.kind == MempoolTxKind.REPLACEMENT)
+    chain["latest"], chain["mined"] = 3, {bumped.tx_hash}
+    assert await sender.run_once() == {"replaced": 1}
+    async with session_maker() as session:
+        tx = await session.get(TxRequest, txs[2].id)
+        assert (tx.status, tx.tx_hash, tx.nonce) == (TxStatus.CONFIRMING, bumped.tx_hash, 2)
+
+
+@pytest.mark.asyncio
+async def test_unknown_receipts_are_retried_before_a_nonce_is_dropped(db_engine, db_session, test_user, monkeypatch):
+    """Test that a missing batch receipt is confirmed one by one before the transaction is given up."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    tx = TxRequest(
+        id=str(uuid4()),
+        wallet_id=wallet.id,
+        tx_type=TxType.TRANSFER,
+        to_address="0x" + "c" * 40,
+        asset="ETH",
+        amount=Decimal("1000"),
+        status=TxStatus.SIGN_PENDING,
+        created_by=test_user.id,
+    )
+    db_session.add_all([wallet, tx])
+    await db_session.commit()
+
+    chain = {"latest": 0, "rpc_down": True}
+
+    async def transaction_count(self, address, block="pending"):
+        return chain["latest"]
+
+    async def chain_id(self):
+        return 1
+
+    async def gas_price(self):
+        return {"base_fee": 10 * GWEI, "max_priority_fee": GWEI, "max_fee": 21 * GWEI, "legacy_gas_price": 11 * GWEI}
+
+    async def estimate_gas(self, from_address, to_address, value, data=None):
+        return 21000
+
+    async def broadcast(self, signed_tx, tx_request_id, correlation_id):
+        return "0x" + "0" * 64
+
+    async def receipts(self, tx_hashes):
+        return [None for _ in tx_hashes]
+
+    async def receipt(self, tx_hash, raise_errors=False):
+        if chain["rpc_down"] and raise_errors:
+            raise ConnectionError("RPC unavailable")
+        return None
+
+    monkeypatch.setattr(EthereumService, "get_transaction_count", transaction_count)
+    monkeypatch.setattr(EthereumService, "get_chain_id", chain_id)
+    monkeypatch.setattr(EthereumService, "get_gas_price", gas_price)
+    monkeypatch.setattr(EthereumService, "estimate_gas", estimate_gas)
+    monkeypatch.setattr(EthereumService, "broadcast_transaction", broadcast)
+    monkeypatch.setattr(EthereumService, "get_transaction_receipts", receipts)
+    monkeypatch.setattr(EthereumService, "get_transaction_receipt", receipt)
+
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    sender = HotWalletSender(session_maker)
+    assert await sender.run_once() == {"sent": 1}
+
+    # Nonce 0 is mined, but no version has a receipt: unknown while the RPC fails
+    monkeypatch.setattr(get_settings(), "hot_wallet_stuck_after", 0)
+    chain["latest"] = 1
+    with pytest.raises(ConnectionError):
+        await sender.run_once()
+    async with session_maker() as session:
+        version = (await session.execute(select(MempoolTx))).scalar_one()
+        assert version.status == MempoolTxStatus.PENDING
+        assert (await session.get(TxRequest, tx.id)).status == TxStatus.CONFIRMING
+
+    # Confirmed missing: dropped, and the transaction leaves CONFIRMING
+    chain["rpc_down"] = False
+    assert await sender.run_once() == {"dropped": 1}
+    async with session_maker() as session:
+        version = (await session.execute(select(MempoolTx))).scalar_one()
+        assert version.status == MempoolTxStatus.DROPPED
+        assert (await session.get(TxRequest, tx.id)).status == TxStatus.CANCELLED
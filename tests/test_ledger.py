@@ -0,0 +1,132 @@
+"""Tests for the wallet ledger."""
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import Deposit
+from app.models.ledger import LedgerBalance, LedgerEntry, LedgerEntryType
+from app.models.tx_request import TxRequest, TxType, TxStatus
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.services.auth import pwd_context
+from app.services.ledger import InsufficientBalance, LedgerReconciler, LedgerService
+
+ETH = 10**18
+
+
+@pytest.mark.asyncio
+async def test_postings_keep_balance_and_reconcile_with_source_rows(db_engine, db_session):
+    """Test that deposits and withdrawals move the balance and reconciliation repairs drift."""
+    user = User(
+        id=str(uuid4()),
+        username="ledger",
+        email="ledger@example.com",
+        password_hash=pwd_context.hash("password"),
+        role=UserRole.OPERATOR
+    )
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.RETAIL,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    db_session.add_all([user, wallet])
+    await db_session.flush()
+
+    def withdrawal(amount):
+        return TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            asset="ETH",
+            amount=Decimal(amount),
+            status=TxStatus.SUBMITTED,
+            created_by=user.id,
+        )
+
+    ledger = LedgerService(db_session)
+    deposit = Deposit(
+        id=str(uuid4()), wallet_id=wallet.id, tx_hash="0x" + "a" * 64,
+        from_address="0x" + "f" * 40, asset="ETH", amount=str(ETH), block_number=1,
+    )
+    db_session.add(deposit)
+    await ledger.deposit_detected(deposit)
+    balance = await ledger.get_balance(wallet.id)
+    assert (balance.available, balance.pending, balance.pending_deposits) == (0, ETH, 1)
+
+    deposit.status = "CREDITED"
+    await ledger.deposit_credited(deposit)
+    assert (balance.available, balance.pending, balance.credited_deposits) == (ETH, 0, 1)
+
+    first = withdrawal(6 * ETH // 10)
+    await ledger.reserve_withdrawal(first)
+    db_session.add(first)
+    with pytest.raises(InsufficientBalance) as exc_info:
+        await ledger.reserve_withdrawal(withdrawal(6 * ETH // 10))
+    assert exc_info.value.available == 4 * ETH // 10
+    assert (balance.available, balance.reserved) == (4 * ETH // 10, 6 * ETH // 10)
+
+    # Rejected: the hold is released; finalized: it leaves the wallet
+    first.status = TxStatus.REJECTED
+    await ledger.close_withdrawal(first)
+    second = withdrawal(ETH // 2)
+    await ledger.reserve_withdrawal(second)
+    db_session.add(second)
+    second.status = TxStatus.FINALIZED
+    await ledger.close_withdrawal(second)
+    assert (balance.available, balance.reserved) == (ETH // 2, 0)
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    reconciler = LedgerReconciler(session_maker)
+    assert await reconciler.reconcile_all() == 0
+
+    # Drift is corrected with an adjustment entry
+    balance.available += ETH // 10
+    await db_session.commit()
+    assert await reconciler.reconcile_all() == 1
+    async with session_maker() as session:
+        repaired = await session.get(LedgerBalance, (wallet.id, "ETH"))
+        assert (repaired.available, repaired.reserved) == (ETH // 2, 0)
+        adjustments = (await session.execute(
+            select(LedgerEntry).where(LedgerEntry.entry_type == LedgerEntryType.ADJUSTMENT)
+        )).scalars().all()
+        assert [int(a.amount) for a in adjustments] == [ETH // 10]
+
+
+@pytest.mark.asyncio
+async def test_holds_commit_on_their_own_and_orphans_are_released(db_engine, db_session, monkeypatch):
+    """Test that a hold is exact, committed before its request, and released once orphaned."""
+    wallet_id = str(uuid4())
+    tx = TxRequest(
+        id=str(uuid4()),
+        wallet_id=wallet_id,
+        tx_type=TxType.TRANSFER,
+        to_address="0x" + "c" * 40,
+        asset="ETH",
+        amount=Decimal("1500.5"),
+        status=TxStatus.SUBMITTED,
+        created_by=str(uuid4()),
+    )
+    assert await LedgerService(db_session).reserve_withdrawals([(tx, False)]) == [None]
+
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        balance = await session.get(LedgerBalance, (wallet_id, "ETH"))
+        assert (balance.reserved, balance.available) == (Decimal("1500.5"), Decimal("-1500.5"))
+
+    # The request was never committed: held through the grace period, then released
+    reconciler = LedgerReconciler(session_maker)
+    assert await reconciler.reconcile_all() == 0
+    monkeypatch.setattr(get_settings(), "ledger_reservation_grace", 0)
+    assert await reconciler.reconcile_all() == 1
+    async with session_maker() as session:
+        balance = await session.get(LedgerBalance, (wallet_id, "ETH"))
+        assert (balance.reserved, balance.available) == (0, 0)
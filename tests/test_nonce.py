@@ -0,0 +1,156 @@
+"""Tests for the database-backed nonce allocator."""
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.models.nonce import NonceAccount, NonceAllocation
+from app.models.tx_request import TxRequest, TxType, TxStatus
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.services.nonce import NonceAllocator
+
+SIGNER = "0x" + "Ab" * 20
+
+
+@pytest.mark.asyncio
+async def test_allocations_are_shared_and_fill_gaps(db_engine, db_session, test_user, monkeypatch):
+    """Test that workers share nonces, re-signs keep theirs and failed signings leave reusable gaps."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address=SIGNER.lower(),
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    db_session.add(wallet)
+
+    async def new_tx(status=TxStatus.SIGN_PENDING):
+        tx = TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            asset="ETH",
+            amount=Decimal("0.1"),
+            status=status,
+            created_by=test_user.id,
+        )
+        db_session.add(tx)
+        await db_session.commit()
+        return tx
+
+    # Two workers, one database
+    first, second = NonceAllocator(db_engine), NonceAllocator(db_engine)
+    a, b, c = await new_tx(), await new_tx(), await new_tx()
+    assert await first.allocate(SIGNER, a.id, 5) == 5
+    assert await second.allocate(SIGNER, b.id, 5) == 6
+    assert await first.allocate(SIGNER.lower(), c.id, 5) == 7
+    # Re-signing keeps the nonce
+    assert await second.allocate(SIGNER, a.id, 5) == 5
+
+    # b failed to sign: its nonce is the lowest gap and is reused
+    b.status = TxStatus.FAILED_SIGN
+    await db_session.commit()
+    d = await new_tx()
+    assert await first.allocate(SIGNER, d.id, 5) == 6
+    assert await first.allocate(SIGNER, (await new_tx()).id, 5) == 8
+
+    # A nonce held for a transaction that was never committed is reclaimed after the timeout
+    monkeypatch.setattr(get_settings(), "nonce_orphan_timeout", 0)
+    assert await first.allocate(SIGNER, str(uuid4()), 5) == 9
+    assert await first.allocate(SIGNER, (await new_tx()).id, 5) == 9
+
+    # The chain is ahead (sent from elsewhere): jump forward, forget what it has
+    assert await second.allocate(SIGNER, (await new_tx()).id, 20) == 20
+    allocations = (await db_session.execute(select(NonceAllocation))).scalars().all()
+    assert [allocation.nonce for allocation in allocations] == [20]
+
+    account = await db_session.get(NonceAccount, SIGNER.lower())
+    await db_session.refresh(account)
+    assert (account.next_nonce, account.chain_nonce) == (21, 20)
+
+    # A lagging endpoint reads an old pending nonce: the watermark holds
+    assert await first.allocate(SIGNER, (await new_tx()).id, 12) == 21
+    allocations = (await db_session.execute(select(NonceAllocation))).scalars().all()
+    assert sorted(allocation.nonce for allocation in allocations) == [20, 21]
+
+
+@pytest.mark.asyncio
+async def test_allocator_falls_back_to_chain_when_nothing_is_in_flight(db_engine, db_session, test_user):
+    """Test that an account ahead of the chain with only failed transactions resyncs down."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address=SIGNER.lower(),
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    db_session.add(wallet)
+    txs = [
+        TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            asset="ETH",
+            amount=Decimal("0.1"),
+            status=TxStatus.SIGN_PENDING,
+            created_by=test_user.id,
+        )
+        for _ in range(4)
+    ]
+    db_session.add_all(txs)
+    await db_session.commit()
+
+    allocator = NonceAllocator(db_engine)
+    assert [await allocator.allocate(SIGNER, tx.id, 3) for tx in txs[:3]] == [3, 4, 5]
+    for tx in txs[:3]:
+        tx.status = TxStatus.FAILED_SIGN
+    await db_session.commit()
+
+    assert await allocator.allocate(SIGNER, txs[3].id, 3) == 3
+    account = await db_session.get(NonceAccount, SIGNER.lower())
+    await db_session.refresh(account)
+    assert account.next_nonce == 4
+
+
+@pytest.mark.asyncio
+async def test_allocate_many_is_consecutive_and_keeps_held_nonces(db_engine, db_session, test_user):
+    """Test that a batch gets consecutive nonces in one transaction, filling gaps first."""
+    wallet = Wallet(
+        id=str(uuid4()),
+        address=SIGNER.lower(),
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.LOW,
+        key_ref="test:key"
+    )
+    db_session.add(wallet)
+    txs = [
+        TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            asset="ETH",
+            amount=Decimal("0.1"),
+            status=TxStatus.SIGN_PENDING,
+            created_by=test_user.id,
+        )
+        for _ in range(6)
+    ]
+    db_session.add_all(txs)
+    await db_session.commit()
+
+    allocator = NonceAllocator(db_engine)
+    assert await allocator.allocate_many(SIGNER, [tx.id for tx in txs[:3]], 10) == [10, 11, 12]
+
+    # 11 failed; a held nonce comes back, the gap is filled, then the batch continues
+    txs[1].status = TxStatus.FAILED_SIGN
+    await db_session.commit()
+    ids = [txs[0].id] + [tx.id for tx in txs[3:]]
+    assert await allocator.allocate_many(SIGNER, ids, 10) == [10, 11, 13, 14]
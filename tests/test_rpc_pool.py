@@ -0,0 +1,166 @@
+"""Tests for the multi-endpoint RPC pool, against local fake nodes with injected faults."""
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import pytest
+from web3 import Web3
+
+from app.config import get_settings
+from app.main import health_check
+from app.services import ethereum
+from app.services.audit import AuditService
+from app.services.ethereum import EthereumService
+from app.services.rpc_pool import RpcEndpoint
+from tests.rpc_stub import RpcStub
+
+SIGNED_TX = "0x" + "02" * 40
+
+
+@asynccontextmanager
+async def fake_nodes(monkeypatch, count):
+    """count local nodes configured as the primary and fallback endpoints."""
+    async with AsyncExitStack() as stack:
+        stubs = [stack.enter_context(RpcStub()) for _ in range(count)]
+        settings = get_settings()
+        monkeypatch.setattr(settings, "eth_rpc_url", stubs[0].url)
+        monkeypatch.setattr(settings, "eth_rpc_fallback_urls", ",".join(stub.url for stub in stubs[1:]))
+        monkeypatch.setattr(settings, "eth_rpc_hedge_delay", 0.05)
+        monkeypatch.setattr(ethereum, "_clients", {})
+        monkeypatch.setattr(ethereum, "_pools", {})
+        stack.push_async_callback(ethereum.close_async_web3)
+        yield stubs
+
+
+def calls(stub, method):
+    return sum(methods.count(method) for methods in stub.requests)
+
+
+def test_hedge_delay_is_recent_p95():
+    """Test that an endpoint's p95 is only used once it has enough samples."""
+    endpoint = RpcEndpoint("http://127.0.0.1:1")
+    for ms in range(1, 20):
+        endpoint.record(ms / 1000, ok=True)
+    assert endpoint.p95() is None
+    endpoint.record(0.02, ok=True)
+    assert endpoint.p95() == 0.019
+    endpoint.record(0.0, ok=False)
+    assert endpoint.errors == 1 and endpoint.error_rate == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_reads_fail_over_from_a_down_node_until_it_recovers(db_session, monkeypatch):
+    """Test that a node answering 503 is failed over, marked unhealthy, then probed back."""
+    async with fake_nodes(monkeypatch, 2) as (primary, fallback):
+        service = EthereumService(db_session, None)
+        pool = service.pool
+        fallback.latency = 0.02
+        await pool.probe()
+        assert pool.ranked()[0].url == primary.url
+
+        primary.status, fallback.latency = 503, 0.0
+        assert await service.get_block_number() == 100
+        assert calls(primary, "eth_blockNumber") == 2 and calls(fallback, "eth_blockNumber") == 2
+        assert pool.stats()["failovers"] == 1
+
+        # A second failure (the probe) makes it unhealthy; reads stop going there
+        await pool.probe()
+        assert [e["healthy"] for e in pool.stats()["endpoints"]] == [True, False]
+        primary.requests.clear()
+        for _ in range(5):
+            assert await service.get_block_number() == 100
+        assert primary.requests == []
+
+        health = await health_check()
+        assert health["rpc_pool"]["endpoints"][1]["url"] == primary.url
+        assert health["rpc_pool"]["endpoints"][1]["errors"] == 2
+
+        # Successful probes bring it back
+        primary.status = 200
+        for _ in range(3):
+            await pool.probe()
+        assert all(e["healthy"] for e in pool.stats()["endpoints"])
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_are_hedged_and_routed_away(db_session, monkeypatch):
+    """Test that a read slower than the hedge delay is answered by the next endpoint."""
+    async with fake_nodes(monkeypatch, 2) as (primary, fallback):
+        service = EthereumService(db_session, None)
+        pool = service.pool
+        # Rank the primary first, then slow it down
+        fallback.latency = 0.02
+        await pool.probe()
+        assert pool.ranked()[0].url == primary.url
+        primary.latency, fallback.latency = 0.5, 0.0
+
+        started = time.perf_counter()
+        assert await service.get_block_number() == 100
+        assert time.perf_counter() - started < 0.3
+        assert calls(primary, "eth_blockNumber") == 2 and calls(fallback, "eth_blockNumber") == 2
+        assert pool.stats()["hedged_reads"] == 1
+
+        # Lost hedges count against the primary's latency until the fallback leads
+        for _ in range(5):
+            await service.get_block_number()
+        assert pool.ranked()[0].url == fallback.url
+        fallback.requests.clear()
+        await service.get_block_number()
+        assert fallback.requests == [["eth_blockNumber"]]
+
+
+@pytest.mark.asyncio
+async def test_lagging_node_is_unhealthy(db_session, monkeypatch):
+    """Test that a node behind the best head by more than eth_rpc_max_head_lag is avoided."""
+    monkeypatch.setattr(get_settings(), "eth_rpc_max_head_lag", 3)
+    async with fake_nodes(monkeypatch, 2) as (primary, fallback):
+        primary.block_number = 90
+        service = EthereumService(db_session, None)
+        await service.pool.probe()
+
+        stats = {e["url"]: e for e in service.pool.stats()["endpoints"]}
+        assert (stats[primary.url]["head_lag"], stats[primary.url]["healthy"]) == (10, False)
+        assert (stats[fallback.url]["head_lag"], stats[fallback.url]["healthy"]) == (0, True)
+        assert await service.get_block_number() == 100
+
+
+@pytest.mark.asyncio
+async def test_block_reads_go_to_a_node_at_that_height(db_session, monkeypatch):
+    """Test that blocks are not read from a healthy node that has not reached them."""
+    monkeypatch.setattr(get_settings(), "eth_rpc_max_head_lag", 3)
+    async with fake_nodes(monkeypatch, 2) as (primary, fallback):
+        primary.block_number = 98
+        fallback.latency = 0.02
+        fallback.blocks = {
+            n: {"number": hex(n), "hash": "0x" + f"{n:064x}", "timestamp": hex(n), "transactions": []}
+            for n in range(95, 101)
+        }
+        service = EthereumService(db_session, None)
+        await service.pool.probe()
+        assert service.pool.ranked()[0].url == primary.url
+
+        blocks = await service.get_blocks(range(95, 101))
+        assert [b["number"] for b in blocks] == list(range(95, 101))
+        assert calls(primary, "eth_getBlockByNumber") == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_goes_to_every_node(db_session, monkeypatch):
+    """Test that a transaction is sent to all nodes and one acceptance is enough."""
+    async with fake_nodes(monkeypatch, 3) as (primary, down, rejecting):
+        down.status = 503
+        rejecting.send_error = "already known"
+        service = EthereumService(db_session, AuditService(db_session))
+        await service.pool.probe()
+
+        tx_hash = await service.broadcast_transaction(SIGNED_TX, "tx-1", "corr-1")
+        assert tx_hash == "0x" + "ab" * 32
+        # The slower nodes still receive it
+        await asyncio.sleep(0.1)
+        assert primary.raw_transactions == rejecting.raw_transactions == [SIGNED_TX]
+        assert calls(down, "eth_sendRawTransaction") == 1
+
+        # Nobody accepts, but a node already holds it: that is the answer
+        primary.send_error = "already known"
+        tx_hash = await service.broadcast_transaction(SIGNED_TX, "tx-1", "corr-2")
+        assert tx_hash == Web3.keccak(hexstr=SIGNED_TX).hex()
@@ -156,6 +156,9 @@ async def test_sod_different_user_can_approve(db_session):
     
     assert approval.decision == "APPROVED"
     assert approval.user_id == approver_id
+    assert tx_result.approved_count == 1
+    assert tx_result.rejected_count == 0
+    assert tx_result.status == TxStatus.APPROVAL_PENDING  # 1 of 2
 
 
 @pytest.mark.asyncio
@@ -236,4 +239,4 @@ async def test_sod_no_double_voting(db_session):
         )
     
     assert "already voted" in str(exc_info.value)
-
+    assert tx.approved_count == 1
@@ -0,0 +1,101 @@
+"""Tests for bulk transaction submission."""
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select, func
+
+from app.config import get_settings
+from app.models.audit import AuditEvent, AuditEventType
+from app.models.group import Group, GroupMember, GroupAddressBook, GroupPolicy, AddressKind
+from app.models.policy_set import PolicySet
+from app.models.tx_request import TxType, TxStatus
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.schemas.tx_request import TxRequestCreate
+from app.services.auth import pwd_context
+from app.services.audit import AuditService
+from app.services.kyt import KYTService, KYTResult
+from app.services.policy import PolicyService
+from app.services.signing import SigningService
+from app.services.ethereum import EthereumService
+from app.services.orchestrator import TxOrchestrator
+
+ALLOWED = "0x" + "b" * 40
+GRAYLISTED = "0x1234567890123456789012345678901234567890"
+DENIED = "0x" + "d" * 40
+UNKNOWN = "0x" + "e" * 40
+
+
+@pytest.mark.asyncio
+async def test_batch_submission_reports_per_item_results(db_session, monkeypatch):
+    """Test that a batch runs each item through policy and KYT with per-item errors."""
+    monkeypatch.setattr(get_settings(), "kyt_graylist", GRAYLISTED)
+    
+    user = User(
+        id=str(uuid4()),
+        username="payouts",
+        email="payouts@example.com",
+        password_hash=pwd_context.hash("password"),
+        role=UserRole.OPERATOR
+    )
+    group = Group(id=str(uuid4()), name="Payouts", is_default=False)
+    policy_set = PolicySet(id=str(uuid4()), name="Payout Policy", version=1)
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.HIGH,
+        key_ref="test:key"
+    )
+    db_session.add_all([user, group, policy_set, wallet])
+    await db_session.flush()
+    db_session.add_all([
+        GroupMember(id=str(uuid4()), group_id=group.id, user_id=user.id),
+        GroupPolicy(id=str(uuid4()), group_id=group.id, policy_set_id=policy_set.id),
+        GroupAddressBook(id=str(uuid4()), group_id=group.id, address=ALLOWED, kind=AddressKind.ALLOW),
+        GroupAddressBook(id=str(uuid4()), group_id=group.id, address=GRAYLISTED, kind=AddressKind.ALLOW),
+        GroupAddressBook(id=str(uuid4()), group_id=group.id, address=DENIED, kind=AddressKind.DENY),
+    ])
+    await db_session.flush()
+    
+    audit = AuditService(db_session)
+    kyt = KYTService(db_session, audit)
+    policy = PolicyService(db_session, audit)
+    signing = SigningService(db_session, audit)
+    ethereum = EthereumService(db_session, audit)
+    orchestrator = TxOrchestrator(db_session, audit, kyt, policy, signing, ethereum)
+    
+    def item(to_address, wallet_id=wallet.id):
+        return TxRequestCreate(
+            wallet_id=wallet_id,
+            tx_type=TxType.TRANSFER,
+            to_address=to_address,
+            amount=Decimal("1000"),
+        )
+    
+    items = [item(ALLOWED), item(GRAYLISTED), item(DENIED), item(UNKNOWN), item(ALLOWED, str(uuid4()))]
+    results = await orchestrator.create_tx_requests_batch(items, user.id, "batch-test", "payout-1")
+    
+    statuses = [tx.status if tx else error for tx, error in results]
+    assert statuses[:4] == [
+        TxStatus.APPROVAL_PENDING,
+        TxStatus.KYT_REVIEW,
+        TxStatus.POLICY_BLOCKED,
+        TxStatus.POLICY_BLOCKED,
+    ]
+    assert "not found" in statuses[4]
+    assert results[1][0].kyt_result == KYTResult.REVIEW
+    assert results[1][0].kyt_case_id is not None
+    
+    result = await db_session.execute(
+        select(func.count()).select_from(AuditEvent)
+        .where(AuditEvent.event_type == AuditEventType.TX_POLICY_EVALUATED)
+    )
+    assert result.scalar() == 4
+    assert (await audit.verify_chain()).is_valid
+    
+    # A retried payout file returns the same requests
+    retried = await orchestrator.create_tx_requests_batch(items, user.id, "batch-test", "payout-1")
+    assert [tx.id for tx, _ in retried[:4]] == [tx.id for tx, _ in results[:4]]
@@ -0,0 +1,181 @@
+"""Tests for the queued transaction pipeline."""
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import AuditEvent, AuditEventType
+from app.models.group import Group, GroupMember, GroupAddressBook, GroupPolicy, AddressKind
+from app.models.policy_set import PolicySet
+from app.models.tx_request import TxRequest, TxType, TxStatus, TxPipelineJob, TxPipelineStage
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.schemas.tx_request import TxRequestCreate
+from app.services.auth import pwd_context
+from app.services.ethereum import EthereumService
+from app.services.orchestrator import TxOrchestrator
+from app.services.tx_pipeline import TxPipelineWorkerPool, build_orchestrator
+
+RECIPIENT = "0x" + "c" * 40
+
+
+@pytest.mark.asyncio
+async def test_queue_mode_runs_stages_on_workers(db_engine, db_session, monkeypatch):
+    """Test that the request returns SUBMITTED and workers advance it stage by stage."""
+    monkeypatch.setattr(get_settings(), "tx_pipeline_mode", "queue")
+    
+    user = User(
+        id=str(uuid4()),
+        username="queued",
+        email="queued@example.com",
+        password_hash=pwd_context.hash("password"),
+        role=UserRole.OPERATOR
+    )
+    group = Group(id=str(uuid4()), name="Queued", is_default=False)
+    policy_set = PolicySet(id=str(uuid4()), name="Queued Policy", version=1)
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.HIGH,
+        key_ref="test:key"
+    )
+    db_session.add_all([user, group, policy_set, wallet])
+    await db_session.flush()
+    db_session.add_all([
+        GroupMember(id=str(uuid4()), group_id=group.id, user_id=user.id),
+        GroupPolicy(id=str(uuid4()), group_id=group.id, policy_set_id=policy_set.id),
+        GroupAddressBook(id=str(uuid4()), group_id=group.id, address=RECIPIENT, kind=AddressKind.ALLOW),
+    ])
+    await db_session.flush()
+    
+    orchestrator = build_orchestrator(db_session)
+    tx = await orchestrator.create_tx_request(
+        TxRequestCreate(
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address=RECIPIENT,
+            amount=Decimal("1000"),
+        ),
+        user.id,
+        "pipeline-test"
+    )
+    await db_session.commit()
+    assert tx.status == TxStatus.SUBMITTED
+    
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    pool = TxPipelineWorkerPool(session_maker, workers=1)
+    
+    async def stages():
+        async with session_maker() as session:
+            result = await session.execute(select(TxPipelineJob.stage).order_by(TxPipelineJob.id))
+            return list(result.scalars().all())
+    
+    async def status():
+        async with session_maker() as session:
+            return (await session.get(TxRequest, tx.id)).status
+    
+    assert await stages() == [TxPipelineStage.POLICY]
+    assert await pool.run_once()
+    assert await status() == TxStatus.POLICY_EVAL_PENDING
+    assert await stages() == [TxPipelineStage.KYT]
+    
+    # A failing stage is rolled back and retried later
+    async def broken(*args, **kwargs):
+        raise RuntimeError("KYT provider unavailable")
+    
+    with monkeypatch.context() as m:
+        m.setattr(TxOrchestrator, "run_stage", broken)
+        assert await pool.run_once()
+    async with session_maker() as session:
+        job = (await session.execute(select(TxPipelineJob))).scalar_one()
+        assert job.attempts == 1
+        assert job.last_error == "KYT provider unavailable"
+        job.run_at = job.created_at
+        await session.commit()
+    
+    assert await pool.run_once()
+    assert await status() == TxStatus.APPROVAL_PENDING
+    assert await stages() == []
+    assert not await pool.run_once()
+    
+    # Consecutive transitions share one status event, in chain order with
+    # the events logged between them
+    async with session_maker() as session:
+        result = await session.execute(
+            select(AuditEvent.event_type, AuditEvent.payload)
+            .where(AuditEvent.entity_id == tx.id)
+            .order_by(AuditEvent.sequence_number)
+        )
+        events = result.all()
+    payloads = [payload for event_type, payload in events if event_type == AuditEventType.TX_STATUS_CHANGED]
+    paths = [payload["path"] for payload in payloads]
+    assert paths[0] == ["SUBMITTED", "POLICY_EVAL_PENDING"]
+    assert paths[-1][-1] == "APPROVAL_PENDING"
+    assert all(path[0] == previous[-1] for previous, path in zip(paths, paths[1:]))
+    assert all(
+        [t["status"] for t in payload["transitions"]] == payload["path"][1:] for payload in payloads
+    )
+    # The policy decision precedes the transitions it caused
+    policy_at = next(i for i, (event_type, _) in enumerate(events) if event_type == AuditEventType.TX_POLICY_EVALUATED)
+    decided_at = next(
+        i for i, (event_type, payload) in enumerate(events)
+        if event_type == AuditEventType.TX_STATUS_CHANGED and payload["new_status"] != "POLICY_EVAL_PENDING"
+    )
+    assert policy_at < decided_at
+
+
+@pytest.mark.asyncio
+async def test_transient_broadcast_errors_are_retried_by_the_worker(db_engine, db_session, test_user, monkeypatch):
+    """Test that an RPC outage retries the broadcast job, failing the tx only on the last attempt."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "tx_pipeline_mode", "queue")
+    monkeypatch.setattr(settings, "tx_pipeline_max_attempts", 2)
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.HIGH,
+        key_ref="test:key"
+    )
+    tx = TxRequest(
+        id=str(uuid4()),
+        wallet_id=wallet.id,
+        tx_type=TxType.TRANSFER,
+        to_address=RECIPIENT,
+        amount=Decimal("1000"),
+        status=TxStatus.SIGNED,
+        signed_tx="0x" + "ab" * 40,
+        created_by=test_user.id,
+    )
+    db_session.add_all([wallet, tx])
+    await db_session.flush()
+    db_session.add(TxPipelineJob(tx_request_id=tx.id, stage=TxPipelineStage.BROADCAST, correlation_id="retry-test"))
+    await db_session.commit()
+
+    async def unreachable(self, signed_tx, tx_request_id, correlation_id):
+        raise ConnectionError("RPC unavailable")
+
+    monkeypatch.setattr(EthereumService, "broadcast_transaction", unreachable)
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    pool = TxPipelineWorkerPool(session_maker, workers=1)
+
+    # First attempt: rolled back, the tx is still SIGNED and the job waits
+    assert await pool.run_once()
+    async with session_maker() as session:
+        assert (await session.get(TxRequest, tx.id)).status == TxStatus.SIGNED
+        job = (await session.execute(select(TxPipelineJob))).scalar_one()
+        assert (job.attempts, job.last_error) == (1, "RPC unavailable")
+        job.run_at = job.created_at
+        await session.commit()
+
+    # Last attempt: the failure is recorded on the tx
+    assert await pool.run_once()
+    async with session_maker() as session:
+        assert (await session.get(TxRequest, tx.id)).status == TxStatus.FAILED_BROADCAST
+        assert (await session.execute(select(TxPipelineJob))).scalar_one_or_none() is None
@@ -0,0 +1,95 @@
+"""Tests for the stuck transaction recovery sweeper."""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.tx_request import TxRequest, TxType, TxStatus
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet, WalletType, RiskProfile
+from app.services.auth import pwd_context
+from app.services.ethereum import EthereumService
+from app.services.tx_recovery import TxRecoverySweeper
+
+
+@pytest.mark.asyncio
+async def test_sweeper_resumes_stranded_broadcasts(db_engine, db_session, monkeypatch):
+    """Test that stuck transactions are rebroadcast or confirmed, with backoff on failure."""
+    user = User(
+        id=str(uuid4()),
+        username="recovery",
+        email="recovery@example.com",
+        password_hash=pwd_context.hash("password"),
+        role=UserRole.OPERATOR
+    )
+    wallet = Wallet(
+        id=str(uuid4()),
+        address="0x" + "1" * 40,
+        wallet_type=WalletType.TREASURY,
+        subject_id="org-123",
+        risk_profile=RiskProfile.HIGH,
+        key_ref="test:key"
+    )
+    db_session.add_all([user, wallet])
+    await db_session.flush()
+
+    stale = datetime.utcnow() - timedelta(hours=1)
+
+    def stranded(status, tx_hash, updated_at=stale):
+        return TxRequest(
+            id=str(uuid4()),
+            wallet_id=wallet.id,
+            tx_type=TxType.TRANSFER,
+            to_address="0x" + "c" * 40,
+            amount=Decimal("1000"),
+            status=status,
+            signed_tx="0x" + tx_hash[2:] * 2,
+            tx_hash=tx_hash,
+            created_by=user.id,
+            created_at=stale,
+            updated_at=updated_at,
+        )
+
+    signed = stranded(TxStatus.SIGNED, "0x" + "a" * 64)
+    mined = stranded(TxStatus.FAILED_BROADCAST, "0x" + "b" * 64)
+    reverted = stranded(TxStatus.FAILED_BROADCAST, "0x" + "f" * 64)
+    failing = stranded(TxStatus.BROADCAST_PENDING, "0x" + "d" * 64)
+    recent = stranded(TxStatus.SIGNED, "0x" + "e" * 64, updated_at=datetime.utcnow())
+    db_session.add_all([signed, mined, reverted, failing, recent])
+    await db_session.commit()
+
+    async def broadcast(self, signed_tx, tx_request_id, correlation_id):
+        if tx_request_id == failing.id:
+            raise ConnectionError("RPC unavailable")
+        return "0x" + signed_tx[2:66]
+
+    async def receipt(self, tx_hash):
+        receipts = {mined.tx_hash: {"blockNumber": 1, "status": 1}, reverted.tx_hash: {"blockNumber": 1, "status": 0}}
+        return receipts.get(tx_hash)
+
+    monkeypatch.setattr(EthereumService, "broadcast_transaction", broadcast)
+    monkeypatch.setattr(EthereumService, "get_transaction_receipt", receipt)
+
+    # SQLite has no advisory lock to serialize concurrent audit chain appends
+    monkeypatch.setattr(get_settings(), "tx_recovery_concurrency", 1)
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    sweeper = TxRecoverySweeper(session_maker)
+
+    actions = await sweeper.sweep()
+    assert actions == {
+        signed.id: "rebroadcast", mined.id: "receipt", reverted.id: "reverted", failing.id: "rebroadcast"
+    }
+
+    async with session_maker() as session:
+        assert (await session.get(TxRequest, signed.id)).status == TxStatus.CONFIRMING
+        assert (await session.get(TxRequest, mined.id)).status == TxStatus.CONFIRMING
+        assert (await session.get(TxRequest, reverted.id)).status == TxStatus.REVERTED
+        assert (await session.get(TxRequest, failing.id)).status == TxStatus.FAILED_BROADCAST
+        assert (await session.get(TxRequest, recent.id)).status == TxStatus.SIGNED
+
+    # The failed one is backed off rather than retried on the next sweep
+    assert sweeper._backoff[failing.id][0] == 1
+    assert await sweeper.sweep() == {}
@@ -0,0 +1,104 @@
+"""Tests for outbound webhook delivery."""
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.audit import AuditEventType
+from app.models.webhook import WebhookSubscription, WebhookDelivery
+from app.services.audit import AuditService
+from app.services.webhooks import WebhookDispatcher, WebhookSigner, enqueue_webhooks
+from tests.webhook_receiver import WebhookReceiver
+
+WALLET_A = str(uuid4())
+WALLET_B = str(uuid4())
+
+
+async def log_path(audit, wallet_id, path):
+    return await audit.log_event(
+        event_type=AuditEventType.TX_STATUS_CHANGED,
+        correlation_id=f"test-{uuid4()}",
+        actor_type="SYSTEM",
+        entity_type="TX_REQUEST",
+        entity_id=str(uuid4()),
+        entity_refs={"wallet_id": wallet_id},
+        payload={"old_status": path[0], "new_status": path[-1], "path": path},
+    )
+
+
+def test_signature_round_trip():
+    """Test that signatures verify only for the signed body and a fresh timestamp."""
+    signer = WebhookSigner("secret")
+    headers = signer.get_headers(b'{"a":1}', "delivery-1")
+    timestamp = headers["X-Webhook-Timestamp"]
+    assert signer.verify(b'{"a":1}', timestamp, headers["X-Webhook-Signature"])
+    assert not signer.verify(b'{"a":2}', timestamp, headers["X-Webhook-Signature"])
+    assert not WebhookSigner("other").verify(b'{"a":1}', timestamp, headers["X-Webhook-Signature"])
+    stale = signer.get_headers(b'{"a":1}', "delivery-1", timestamp=1)
+    assert not signer.verify(b'{"a":1}', "1", stale["X-Webhook-Signature"])
+
+
+@pytest.mark.asyncio
+async def test_deliveries_are_batched_signed_and_retried(db_engine, db_session, monkeypatch):
+    """Test that queued events are POSTed in signed batches and retried with backoff."""
+    monkeypatch.setattr(get_settings(), "webhook_batch_size", 2)
+    audit = AuditService(db_session)
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    dispatcher = WebhookDispatcher(session_maker)
+
+    with WebhookReceiver(secret="s3cret") as receiver:
+        subscription = WebhookSubscription(
+            name="partner",
+            url=receiver.url,
+            secret="s3cret",
+            event_types=["tx.confirmed", "tx.finalized"],
+            wallet_ids=[WALLET_A],
+        )
+        db_session.add(subscription)
+        await db_session.flush()
+
+        # One confirmed+finalized step, one finalize, one unrelated wallet
+        assert await enqueue_webhooks(
+            db_session, await log_path(audit, WALLET_A, ["CONFIRMING", "CONFIRMED", "FINALIZED"])
+        ) == 2
+        assert await enqueue_webhooks(
+            db_session, await log_path(audit, WALLET_A, ["CONFIRMED", "FINALIZED"])
+        ) == 1
+        assert await enqueue_webhooks(
+            db_session, await log_path(audit, WALLET_B, ["CONFIRMED", "FINALIZED"])
+        ) == 0
+        await db_session.commit()
+
+        assert await dispatcher.run_once() == 3
+        assert len(receiver.requests) == 2  # Batches of two events
+        assert all(r.signature_valid for r in receiver.requests)
+        events = [e for r in receiver.requests for e in r.body["events"]]
+        assert [e["type"] for e in events] == ["tx.confirmed", "tx.finalized", "tx.finalized"]
+        assert all(e["data"]["wallet_id"] == WALLET_A for e in events)
+        assert await dispatcher.run_once() == 0
+
+        # A failed POST is retried after the backoff delay
+        await enqueue_webhooks(db_session, await log_path(audit, WALLET_A, ["CONFIRMING", "CONFIRMED"]))
+        await db_session.commit()
+        receiver.fail_next = 1
+        assert await dispatcher.run_once() == 1
+        assert await dispatcher.run_once() == 0
+
+        async with session_maker() as session:
+            delivery = (await session.execute(
+                select(WebhookDelivery).where(WebhookDelivery.status == "PENDING")
+            )).scalar_one()
+            assert delivery.attempts == 1
+            assert delivery.last_error == "HTTP 500"
+            assert delivery.next_attempt_at > datetime.utcnow()
+            delivery.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+            await session.commit()
+
+        assert await dispatcher.run_once() == 1
+        assert receiver.requests[-1].body["events"][0]["id"] == delivery.event_id
+        async with session_maker() as session:
+            statuses = (await session.execute(select(WebhookDelivery.status))).scalars().all()
+            assert set(statuses) == {"DELIVERED"}
@@ -0,0 +1,69 @@
+"""Local HTTP endpoint standing in for a partner's webhook receiver."""
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from app.services.webhooks import WebhookSigner
+
+
+@dataclass
+class ReceivedRequest:
+    body: dict
+    signature_valid: bool
+
+
+class WebhookReceiver:
+    """
+    Records signed webhook POSTs on 127.0.0.1.
+
+    Use as a context manager; `url` is the endpoint to subscribe. Set
+    `fail_next` to answer that many requests with HTTP 500.
+    """
+
+    def __init__(self, secret: str = ""):
+        self.secret = secret
+        self.requests: List[ReceivedRequest] = []
+        self.fail_next = 0
+        self._lock = threading.Lock()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with receiver._lock:
+                    if receiver.fail_next:
+                        receiver.fail_next -= 1
+                        self.send_response(500)
+                        self.end_headers()
+                        return
+                    receiver.requests.append(ReceivedRequest(
+                        body=json.loads(body),
+                        signature_valid=WebhookSigner(receiver.secret).verify(
+                            body,
+                            self.headers.get("X-Webhook-Timestamp"),
+                            self.headers.get("X-Webhook-Signature"),
+                        ),
+                    ))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/hooks"
+
+    def __enter__(self) -> "WebhookReceiver":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()